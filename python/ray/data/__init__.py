@@ -41,6 +41,7 @@ from ray.data.read_api import (  # noqa: F401
     from_torch,
     range,
     range_tensor,
+    read_arrow_ipc,
     read_avro,
     read_bigquery,
     read_binary_files,
@@ -133,6 +134,7 @@ __all__ = [
     "from_huggingface",
     "range",
     "range_tensor",
+    "read_arrow_ipc",
     "read_avro",
     "read_text",
     "read_binary_files",
@@ -25,18 +25,37 @@ class _AggregateOnKeyBase(AggregateFn):
 
 
 class Count(AggregateFn):
-    """Defines count aggregation."""
+    """Defines count aggregation.
+
+    If ``on`` is specified, counts the non-null values of the column. Otherwise,
+    counts the rows.
+    """
+
+    def __init__(self, on: Optional[str] = None, alias_name: Optional[str] = None):
+        self._key_fn = on
+
+        if on is None:
+
+            def accumulate_block(a: int, block: Block) -> int:
+                return a + BlockAccessor.for_block(block).num_rows()
+
+        else:
+
+            def accumulate_block(a: int, block: Block) -> int:
+                # The count is None for empty blocks.
+                return a + (BlockAccessor.for_block(block).count(on) or 0)
 
-    def __init__(self):
         super().__init__(
             init=lambda k: 0,
-            accumulate_block=(
-                lambda a, block: a + BlockAccessor.for_block(block).num_rows()
-            ),
+            accumulate_block=accumulate_block,
             merge=lambda a1, a2: a1 + a2,
-            name="count()",
+            name=alias_name or f"count({on or ''})",
         )
 
+    def _validate(self, schema: Optional[Union[type, "pa.lib.Schema"]]) -> None:
+        if self._key_fn is not None:
+            SortKey(self._key_fn).validate_schema(schema)
+
 
 class Sum(_AggregateOnKeyBase):
     """Defines sum aggregation."""
@@ -48,6 +67,7 @@ class Sum(_AggregateOnKeyBase):
         alias_name: Optional[str] = None,
     ):
         self._set_key_fn(on)
+        self._ignore_nulls = ignore_nulls
         if alias_name:
             self._rs_name = alias_name
         else:
@@ -78,6 +98,7 @@ class Min(_AggregateOnKeyBase):
         alias_name: Optional[str] = None,
     ):
         self._set_key_fn(on)
+        self._ignore_nulls = ignore_nulls
         if alias_name:
             self._rs_name = alias_name
         else:
@@ -108,6 +129,7 @@ class Max(_AggregateOnKeyBase):
         alias_name: Optional[str] = None,
     ):
         self._set_key_fn(on)
+        self._ignore_nulls = ignore_nulls
         if alias_name:
             self._rs_name = alias_name
         else:
@@ -138,6 +160,7 @@ class Mean(_AggregateOnKeyBase):
         alias_name: Optional[str] = None,
     ):
         self._set_key_fn(on)
+        self._ignore_nulls = ignore_nulls
         if alias_name:
             self._rs_name = alias_name
         else:
@@ -192,6 +215,7 @@ class Std(_AggregateOnKeyBase):
         alias_name: Optional[str] = None,
     ):
         self._set_key_fn(on)
+        self._ignore_nulls = ignore_nulls
         if alias_name:
             self._rs_name = alias_name
         else:
@@ -261,6 +285,7 @@ class AbsMax(_AggregateOnKeyBase):
         alias_name: Optional[str] = None,
     ):
         self._set_key_fn(on)
+        self._ignore_nulls = ignore_nulls
         on_fn = _to_on_fn(on)
         if alias_name:
             self._rs_name = alias_name
@@ -298,6 +323,7 @@ class Quantile(_AggregateOnKeyBase):
         alias_name: Optional[str] = None,
     ):
         self._set_key_fn(on)
+        self._ignore_nulls = ignore_nulls
         self._q = q
         if alias_name:
             self._rs_name = alias_name
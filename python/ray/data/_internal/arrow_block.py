@@ -24,7 +24,11 @@ from ray.air.util.tensor_extensions.arrow import (
     convert_list_to_pyarrow_array,
     pyarrow_table_from_pydict,
 )
-from ray.data._internal.arrow_ops import transform_polars, transform_pyarrow
+from ray.data._internal.arrow_ops import (
+    hash_aggregate,
+    transform_polars,
+    transform_pyarrow,
+)
 from ray.data._internal.numpy_support import (
     convert_udf_returns_to_numpy,
     validate_numpy_batch,
@@ -553,7 +557,18 @@ class ArrowBlockAccessor(TableBlockAccessor):
                 except StopIteration:
                     break
 
+        if key is not None and DataContext.get_current().use_arrow_hash_aggregate:
+            table = hash_aggregate.hash_combine(
+                self._table,
+                key if isinstance(key, list) else [key],
+                aggs,
+                self._resolve_agg_names(aggs),
+            )
+            if table is not None:
+                return table
+
         builder = ArrowBlockBuilder()
+
         for group_key, group_view in iter_groups():
             # Aggregate.
             accumulators = [agg.init(group_key) for agg in aggs]
@@ -590,6 +605,20 @@ class ArrowBlockAccessor(TableBlockAccessor):
     def _munge_conflict(name, count):
         return f"{name}_{count+1}"
 
+    @staticmethod
+    def _resolve_agg_names(aggs: Tuple["AggregateFn"]) -> List[str]:
+        """Return the output column name of each aggregation."""
+        names = []
+        count = collections.defaultdict(int)
+        for agg in aggs:
+            name = agg.name
+            # Check for conflicts with existing aggregation name.
+            if count[name] > 0:
+                name = ArrowBlockAccessor._munge_conflict(name, count[name])
+            count[name] += 1
+            names.append(name)
+        return names
+
     @staticmethod
     def merge_sorted_blocks(
         blocks: List[Block], sort_key: "SortKey"
@@ -644,6 +673,15 @@ class ArrowBlockAccessor(TableBlockAccessor):
         # Handle blocks of different types.
         blocks = TableBlockAccessor.normalize_block_types(blocks, "arrow")
 
+        if key is not None and DataContext.get_current().use_arrow_hash_aggregate:
+            ret = ArrowBlockAccessor._hash_aggregate_combined_blocks(
+                blocks, keys, aggs, finalize
+            )
+            if ret is not None:
+                return ret, ArrowBlockAccessor(ret).get_metadata(
+                    exec_stats=stats.build()
+                )
+
         iter = heapq.merge(
             *[
                 ArrowBlockAccessor(block).iter_rows(public_row_format=False)
@@ -718,6 +756,30 @@ class ArrowBlockAccessor(TableBlockAccessor):
         ret = builder.build()
         return ret, ArrowBlockAccessor(ret).get_metadata(exec_stats=stats.build())
 
+    @staticmethod
+    def _hash_aggregate_combined_blocks(
+        blocks: List[Block],
+        keys: List[str],
+        aggs: Tuple["AggregateFn"],
+        finalize: bool,
+    ) -> Optional[Block]:
+        """Aggregate partially combined blocks with `pyarrow.Table.group_by`.
+
+        Returns None if the aggregations can't be vectorized.
+        """
+        blocks = [block for block in blocks if block.num_rows > 0]
+        if not blocks or any(block.schema != blocks[0].schema for block in blocks):
+            # The accumulator types differ if, e.g., some blocks only have empty
+            # accumulators.
+            return None
+        return hash_aggregate.hash_aggregate_combined(
+            transform_pyarrow.concat(blocks),
+            keys,
+            aggs,
+            ArrowBlockAccessor._resolve_agg_names(aggs),
+            finalize,
+        )
+
     def block_type(self) -> BlockType:
         return BlockType.ARROW
 
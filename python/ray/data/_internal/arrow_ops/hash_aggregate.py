@@ -0,0 +1,382 @@
+"""Vectorized groupby aggregations of Arrow blocks.
+
+The built-in `Count`, `Sum`, `Min`, `Max`, `Mean` and `Std` aggregations are computed
+with `pyarrow.Table.group_by().aggregate()`, instead of calling the aggregations'
+Python callbacks for each group. The output columns are built from the grouped
+columns with Arrow compute functions. The partially combined blocks have the same
+accumulators as the ones built by `AggregateFn.accumulate_block`, so they can be
+merged with the blocks that were combined in Python (e.g., pandas blocks), and
+finalized with `AggregateFn.finalize`.
+
+The functions return `None` if the aggregations or the blocks aren't supported, in
+which case the caller falls back to the Python implementation.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from packaging.version import parse as parse_version
+
+from ray._private.utils import _get_pyarrow_version
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+if TYPE_CHECKING:
+    from ray.data.aggregate import AggregateFn
+
+# `pyarrow.Table.group_by` was added in 7.0.0.
+MIN_PYARROW_VERSION_HASH_AGGREGATE = parse_version("7.0.0")
+
+# An Arrow aggregation: (column name, function name, options).
+_ArrowAggregation = Tuple[str, str, Any]
+
+
+def hash_combine(
+    table: "pyarrow.Table",
+    keys: List[str],
+    aggs: Tuple["AggregateFn"],
+    agg_names: List[str],
+) -> Optional["pyarrow.Table"]:
+    """Combine the rows with the same keys into accumulators.
+
+    Args:
+        table: The table to aggregate.
+        keys: The names of the key columns.
+        aggs: The aggregations to do.
+        agg_names: The output column name of each aggregation.
+
+    Returns:
+        A table of [k_1, ..., k_m, v_1, ..., v_n] columns sorted by the keys, where
+        v_i is the partially combined accumulator of the ith aggregation. `None` if
+        the aggregations can't be vectorized.
+    """
+    import pyarrow.compute as pc
+
+    from ray.data._internal.aggregate import Count
+
+    if not _is_supported(aggs, include_std=True) or table.num_rows == 0:
+        return None
+    for agg in aggs:
+        if isinstance(agg, Count):
+            if agg._key_fn is not None and agg._key_fn not in table.column_names:
+                return None
+        elif not _is_numeric(table, agg._key_fn):
+            return None
+
+    columns = {key: table.column(key) for key in keys}
+    arrow_aggs: List[_ArrowAggregation] = []
+    for i, agg in enumerate(aggs):
+        if isinstance(agg, Count):
+            if agg._key_fn is None:
+                arrow_aggs.append(
+                    _add_column(columns, f"{i}_all", table.column(keys[0]), "count_all")
+                )
+            else:
+                # `Count(on=...)` counts the non-null values of the column.
+                column = table.column(agg._key_fn)
+                arrow_aggs.append(_add_column(columns, f"{i}_all", column, "count"))
+            continue
+        column = table.column(agg._key_fn)
+        arrow_aggs.append(_add_column(columns, f"{i}_valid", column, "count"))
+        arrow_aggs.append(_add_column(columns, f"{i}_all", column, "count_all"))
+        arrow_aggs.extend(
+            _add_column(columns, f"{i}_{func}", column, func)
+            for func in _combine_functions(agg)
+        )
+
+    groups = _group_by(pyarrow.table(columns), keys, arrow_aggs)
+    if groups is None:
+        return None
+
+    out = {key: groups.column(key) for key in keys}
+    for i, (agg, name) in enumerate(zip(aggs, agg_names)):
+        num_all = groups.column(f"__agg_{i}_all_count")
+        if isinstance(agg, Count):
+            out[name] = num_all
+            continue
+        num_valid = groups.column(f"__agg_{i}_valid_count")
+        # Groups with some nulls propagate them. Groups with only nulls are the same
+        # as empty groups.
+        is_none = None if agg._ignore_nulls else pc.less(num_valid, num_all)
+        is_empty = pc.equal(num_valid, 0)
+        values = _to_accumulator(agg, groups, f"__agg_{i}", num_valid)
+        out[name] = _wrap(agg, values, is_empty, is_none)
+    return pyarrow.table(out)
+
+
+def hash_aggregate_combined(
+    table: "pyarrow.Table",
+    keys: List[str],
+    aggs: Tuple["AggregateFn"],
+    agg_names: List[str],
+    finalize: bool,
+) -> Optional["pyarrow.Table"]:
+    """Merge the accumulators of the rows with the same keys.
+
+    Args:
+        table: The concatenated, partially combined blocks.
+        keys: The names of the key columns.
+        aggs: The aggregations to do.
+        agg_names: The column name of each aggregation.
+        finalize: Whether to finalize the merged accumulators.
+
+    Returns:
+        A table of [k_1, ..., k_m, v_1, ..., v_n] columns sorted by the keys, where
+        v_i is the merged accumulator or the result of the ith aggregation. `None`
+        if the aggregations can't be vectorized.
+    """
+    from ray.data._internal.aggregate import Count
+
+    # `Std` accumulators are merged with a non-linear formula, which can't be
+    # expressed with Arrow aggregations.
+    if not _is_supported(aggs, include_std=False) or table.num_rows == 0:
+        return None
+
+    import pyarrow.compute as pc
+
+    columns = {key: table.column(key) for key in keys}
+    arrow_aggs: List[_ArrowAggregation] = []
+    for i, (agg, name) in enumerate(zip(aggs, agg_names)):
+        column = table.column(name)
+        if isinstance(agg, Count):
+            arrow_aggs.append(_add_column(columns, f"{i}_count", column, "sum"))
+            continue
+        if not pyarrow.types.is_list(column.type):
+            return None
+        # Accumulators are [v_1, ..., v_k, has_data] lists, or nulls if a null was
+        # propagated.
+        merge_functions = _merge_functions(agg)
+        has_data = pc.equal(pc.list_element(column, len(merge_functions)), 1)
+        is_none = pc.cast(pc.is_null(column), "int64")
+        arrow_aggs.append(_add_column(columns, f"{i}_none", is_none, "sum"))
+        num_data = pc.cast(pc.fill_null(has_data, False), "int64")
+        arrow_aggs.append(_add_column(columns, f"{i}_data", num_data, "sum"))
+        for j, func in enumerate(merge_functions):
+            # Mask out the values of the empty accumulators.
+            values = pc.list_element(column, j)
+            values = pc.if_else(has_data, values, pyarrow.scalar(None, values.type))
+            arrow_aggs.append(_add_column(columns, f"{i}_{j}", values, func))
+
+    groups = _group_by(pyarrow.table(columns), keys, arrow_aggs)
+    if groups is None:
+        return None
+
+    out = {key: groups.column(key) for key in keys}
+    for i, (agg, name) in enumerate(zip(aggs, agg_names)):
+        if isinstance(agg, Count):
+            out[name] = groups.column(f"__agg_{i}_count_sum")
+            continue
+        is_none = (
+            None
+            if agg._ignore_nulls
+            else pc.greater(groups.column(f"__agg_{i}_none_sum"), 0)
+        )
+        is_empty = pc.equal(groups.column(f"__agg_{i}_data_sum"), 0)
+        values = [
+            groups.column(f"__agg_{i}_{j}_{func}")
+            for j, func in enumerate(_merge_functions(agg))
+        ]
+        if finalize:
+            out[name] = _finalize(agg, values, is_empty, is_none)
+        else:
+            out[name] = _wrap(agg, values, is_empty, is_none)
+    return pyarrow.table(out)
+
+
+def _is_supported(aggs: Tuple["AggregateFn"], include_std: bool) -> bool:
+    from ray.data._internal.aggregate import Count, Max, Mean, Min, Std, Sum
+
+    if not _is_pyarrow_version_supported():
+        return False
+
+    supported_types = (Sum, Min, Max, Mean) + ((Std,) if include_std else ())
+    for agg in aggs:
+        if type(agg) is Count:
+            continue
+        if type(agg) not in supported_types or not isinstance(agg._key_fn, str):
+            return False
+    return True
+
+
+def _is_pyarrow_version_supported() -> bool:
+    pyarrow_version = _get_pyarrow_version()
+    return (
+        pyarrow_version is None
+        or parse_version(pyarrow_version) >= MIN_PYARROW_VERSION_HASH_AGGREGATE
+    )
+
+
+def _is_numeric(table: "pyarrow.Table", column: str) -> bool:
+    if column not in table.column_names:
+        return False
+    column_type = table.schema.field(column).type
+    return pyarrow.types.is_integer(column_type) or pyarrow.types.is_floating(
+        column_type
+    )
+
+
+def _combine_functions(agg: "AggregateFn") -> List[str]:
+    """The Arrow functions that compute the accumulator of a group."""
+    from ray.data._internal.aggregate import Max, Mean, Min, Std, Sum
+
+    return {
+        Sum: ["sum"],
+        Min: ["min"],
+        Max: ["max"],
+        Mean: ["sum"],
+        # The sum of squared differences from the mean is variance * count.
+        Std: ["sum", "variance"],
+    }[type(agg)]
+
+
+def _merge_functions(agg: "AggregateFn") -> List[str]:
+    """The Arrow functions that merge each value of the accumulators of a group."""
+    from ray.data._internal.aggregate import Max, Mean, Min, Sum
+
+    return {
+        Sum: ["sum"],
+        Min: ["min"],
+        Max: ["max"],
+        Mean: ["sum", "sum"],
+    }[type(agg)]
+
+
+def _to_accumulator(
+    agg: "AggregateFn", groups: "pyarrow.Table", prefix: str, count: Any
+) -> List[Any]:
+    """Build the values of the accumulators of the groups from the outputs of
+    `_combine_functions`."""
+    import pyarrow.compute as pc
+
+    from ray.data._internal.aggregate import Mean, Std
+
+    if isinstance(agg, Mean):
+        return [groups.column(f"{prefix}_sum_sum"), count]
+    if isinstance(agg, Std):
+        sum_ = pc.cast(groups.column(f"{prefix}_sum_sum"), pyarrow.float64())
+        variance = groups.column(f"{prefix}_variance_variance")
+        return [pc.multiply(variance, count), pc.divide(sum_, count), count]
+    (func,) = _combine_functions(agg)
+    return [groups.column(f"{prefix}_{func}_{func}")]
+
+
+def _wrap(
+    agg: "AggregateFn", values: List[Any], is_empty: Any, is_none: Optional[Any]
+) -> "pyarrow.ListArray":
+    """Build the `[v_1, ..., v_k, has_data]` accumulators of the groups, like
+    `_wrap_acc` does.
+
+    Args:
+        agg: The aggregation.
+        values: The arrays of the values v_1, ..., v_k of the accumulators.
+        is_empty: Whether each group is empty, in which case its accumulator is
+            the initial one of the aggregation.
+        is_none: Whether each group propagates a null, in which case its
+            accumulator is null. `None` if no group does.
+    """
+    import pyarrow.compute as pc
+
+    # The values of a list have the same type, which is a double if any value
+    # isn't an integer, like the type inferred for the accumulators built in Python.
+    init = agg.init(None)[:-1]
+    has_empty = pc.any(is_empty).as_py()
+    has_data = not pc.all(is_empty).as_py()
+    is_integer = (
+        not has_data or all(pyarrow.types.is_integer(v.type) for v in values)
+    ) and (not has_empty or all(isinstance(v, int) for v in init))
+    value_type = pyarrow.int64() if is_integer else pyarrow.float64()
+    children = [pc.cast(value, value_type) for value in values]
+    if has_empty:
+        children = [
+            pc.if_else(is_empty, pyarrow.scalar(init_value, value_type), child)
+            for child, init_value in zip(children, init)
+        ]
+    children.append(pc.cast(pc.if_else(is_empty, 0, 1), value_type))
+
+    # Interleave the values of the groups into the lists.
+    num_groups = len(is_empty)
+    num_values = len(children)
+    flat = pyarrow.concat_arrays([_combine_chunks(child) for child in children])
+    indices = np.arange(num_groups)[:, None] + num_groups * np.arange(num_values)
+    offsets = np.arange(0, num_groups * num_values + 1, num_values, dtype=np.int32)
+    accumulators = pyarrow.ListArray.from_arrays(
+        pyarrow.array(offsets), flat.take(pyarrow.array(indices.ravel()))
+    )
+    if is_none is not None:
+        accumulators = pc.if_else(
+            is_none, pyarrow.scalar(None, accumulators.type), accumulators
+        )
+    return accumulators
+
+
+def _finalize(
+    agg: "AggregateFn", values: List[Any], is_empty: Any, is_none: Optional[Any]
+) -> Any:
+    """Finalize the merged accumulators of the groups, like `agg.finalize` does.
+
+    See `_wrap` for the arguments.
+    """
+    import pyarrow.compute as pc
+
+    from ray.data._internal.aggregate import Mean
+
+    if isinstance(agg, Mean):
+        sum_, count = values
+        result = pc.divide(pc.cast(sum_, pyarrow.float64()), count)
+    else:
+        (result,) = values
+    # Empty groups and propagated nulls are finalized to nulls.
+    is_null = is_empty if is_none is None else pc.or_(is_empty, is_none)
+    return pc.if_else(is_null, pyarrow.scalar(None, result.type), result)
+
+
+def _combine_chunks(column: Any) -> "pyarrow.Array":
+    if isinstance(column, pyarrow.ChunkedArray):
+        return column.combine_chunks()
+    return column
+
+
+def _add_column(
+    columns: Dict[str, Any], name: str, column: Any, func: str
+) -> _ArrowAggregation:
+    """Add an input column of an Arrow aggregation.
+
+    Each aggregation gets its own column, so that the output column names, which are
+    `f"{column}_{func}"`, are unique.
+    """
+    import pyarrow.compute as pc
+
+    name = f"__agg_{name}"
+    columns[name] = column
+    if func == "count":
+        return (name, "count", pc.CountOptions(mode="only_valid"))
+    if func == "count_all":
+        return (name, "count", pc.CountOptions(mode="all"))
+    if func == "variance":
+        return (name, "variance", pc.VarianceOptions(ddof=0))
+    return (name, func, None)
+
+
+def _group_by(
+    table: "pyarrow.Table", keys: List[str], aggs: List[_ArrowAggregation]
+) -> Optional["pyarrow.Table"]:
+    """Aggregate the groups, and return them sorted by the keys."""
+    import pyarrow.compute as pc
+
+    try:
+        groups = table.group_by(keys).aggregate(
+            [
+                (column, func) if options is None else (column, func, options)
+                for column, func, options in aggs
+            ]
+        )
+    except (pyarrow.ArrowNotImplementedError, pyarrow.ArrowTypeError):
+        # E.g., the key columns have nested types.
+        return None
+    # The order of the groups isn't deterministic with multiple threads.
+    indices = pc.sort_indices(groups, sort_keys=[(key, "ascending") for key in keys])
+    return groups.take(indices)
@@ -1,9 +1,18 @@
 import collections
+import threading
+import warnings
 from contextlib import nullcontext
-from typing import Any, Callable, Dict, Iterator, Optional
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Union
+
+import numpy as np
 
 import ray
-from ray.data._internal.block_batching.interfaces import Batch, BlockPrefetcher
+from ray.data._internal.block_batching.interfaces import (
+    Batch,
+    BlockPrefetcher,
+    CollatedBatch,
+)
 from ray.data._internal.block_batching.util import (
     ActorBlockPrefetcher,
     WaitBlockPrefetcher,
@@ -22,6 +31,24 @@ from ray.data.block import Block, DataBatch
 from ray.data.context import DataContext
 from ray.types import ObjectRef
 
+if TYPE_CHECKING:
+    import torch
+
+
+@dataclass
+class TensorBufferOptions:
+    """Options to collate batches into a ring of reused Torch tensor buffers.
+
+    Attributes:
+        dtypes: The Torch dtype(s) of the tensors; if None, the dtypes are inferred
+            from the NumPy batches.
+        pin_memory: Whether to allocate the buffers in pinned memory, for faster
+            host to device copies. Ignored if CUDA isn't available.
+    """
+
+    dtypes: Optional[Union["torch.dtype", Dict[str, "torch.dtype"]]] = None
+    pin_memory: bool = False
+
 
 def iter_batches(
     ref_bundles: Iterator[RefBundle],
@@ -37,6 +64,7 @@ def iter_batches(
     shuffle_seed: Optional[int] = None,
     ensure_copy: bool = False,
     prefetch_batches: int = 1,
+    tensor_buffers: Optional[TensorBufferOptions] = None,
 ) -> Iterator[DataBatch]:
     """Create formatted batches of data from an iterator of block object references and
     corresponding metadata.
@@ -103,12 +131,28 @@ def iter_batches(
             the specified amount of formatted batches from blocks. This improves
             performance for non-CPU bound UDFs, allowing batch fetching compute and
             formatting to be overlapped with the UDF. Defaults to 1.
+        tensor_buffers: If set, NumPy batches are collated into Torch tensors by
+            copying them into a ring of preallocated buffers, instead of allocating
+            new tensors for each batch. The buffers of a batch are reused once the
+            finalized batch doesn't reference them (e.g., it was copied to a GPU),
+            or else once the next batch is requested. Can't be used with
+            ``collate_fn``.
 
     Returns:
         An iterator over record batches.
     """
     context = DataContext.get_current()
 
+    if tensor_buffers is not None:
+        if collate_fn is not None:
+            raise ValueError("`collate_fn` can't be used with `tensor_buffers`.")
+        # Enough slots for all the batches that can be in flight: being collated in
+        # the threadpool or waiting to be reordered, in the queues, and held by the
+        # consumer. If there's no free slot anyway, new tensors are allocated.
+        tensor_buffer_ring = TensorBufferRing(2 * prefetch_batches + 4, tensor_buffers)
+    else:
+        tensor_buffer_ring = None
+
     if (
         prefetch_batches > 0
         and context.actor_prefetcher_enabled
@@ -153,6 +197,7 @@ def iter_batches(
             batch_format=batch_format,
             collate_fn=collate_fn,
             num_threadpool_workers=prefetch_batches,
+            tensor_buffer_ring=tensor_buffer_ring,
         )
 
         # Step 5: Finalize each batch.
@@ -160,6 +205,8 @@ def iter_batches(
             batch_iter = finalize_batches(
                 batch_iter, finalize_fn=finalize_fn, stats=stats
             )
+        if tensor_buffer_ring is not None:
+            batch_iter = tensor_buffer_ring.release_copied_batches(batch_iter)
 
         # Step 6: Restore original order.
         batch_iter: Iterator[Batch] = restore_original_order(batch_iter)
@@ -172,6 +219,8 @@ def iter_batches(
         ref_bundles, fn=_async_iter_batches, num_workers=1
     )
 
+    # The batches are yielded in order of their indices.
+    batch_idx = 0
     while True:
         with stats.iter_total_blocked_s.timer() if stats else nullcontext():
             try:
@@ -180,6 +229,10 @@ def iter_batches(
                 break
         with stats.iter_user_s.timer() if stats else nullcontext():
             yield next_batch
+        if tensor_buffer_ring is not None:
+            # The consumer requested the next batch, so it's done with this one.
+            tensor_buffer_ring.release(batch_idx)
+        batch_idx += 1
 
 
 def _format_in_threadpool(
@@ -188,6 +241,7 @@ def _format_in_threadpool(
     batch_format: Optional[str],
     collate_fn: Optional[Callable[[DataBatch], Any]],
     num_threadpool_workers: int,
+    tensor_buffer_ring: Optional["TensorBufferRing"] = None,
 ) -> Iterator[Batch]:
     """Executes the batching, formatting, and collation logic in a threadpool.
 
@@ -202,6 +256,8 @@ def _format_in_threadpool(
             as batches.
         collate_fn: A function to apply to each data batch before returning it.
         num_threadpool_workers: The number of threads to use in the threadpool.
+        tensor_buffer_ring: If set, the ring of tensor buffers to collate the
+            batches into.
     """
 
     def threadpool_computations_format_collate(
@@ -217,6 +273,10 @@ def _format_in_threadpool(
             formatted_batch_iter = collate(
                 formatted_batch_iter, collate_fn=collate_fn, stats=stats
             )
+        elif tensor_buffer_ring is not None:
+            formatted_batch_iter = tensor_buffer_ring.collate_batches(
+                formatted_batch_iter, stats=stats
+            )
         yield from formatted_batch_iter
 
     if num_threadpool_workers > 0:
@@ -320,3 +380,144 @@ def restore_original_order(batch_iter: Iterator[Batch]) -> Iterator[Batch]:
     while next_index_required in buffer:
         yield buffer.pop(next_index_required)
         next_index_required += 1
+
+
+class TensorBufferRing:
+    """A ring of preallocated Torch tensor buffers that batches are collated into.
+
+    Each slot of the ring holds a buffer for each column. A NumPy batch is copied
+    into the buffers of a free slot, which are only reallocated if the batch has
+    more rows, or a different dtype or row shape, than the buffer. Columns that
+    aren't fixed-shape numeric tensors, and batches collated when no slot is free,
+    fall back to allocating new tensors.
+    """
+
+    def __init__(self, num_slots: int, options: TensorBufferOptions):
+        import torch
+
+        self._dtypes = options.dtypes
+        self._pin_memory = options.pin_memory and torch.cuda.is_available()
+        self._lock = threading.Lock()
+        self._free_slots: List[Dict[Optional[str], "torch.Tensor"]] = [
+            {} for _ in range(num_slots)
+        ]
+        # The slots used by each batch index, with the views of their buffers
+        # returned in the batch.
+        self._used_slots: Dict[int, Any] = {}
+
+    def collate_batches(
+        self, batch_iter: Iterator[Batch], stats: Optional[DatasetStats] = None
+    ) -> Iterator[CollatedBatch]:
+        """Collate the NumPy batches into Torch tensor batches."""
+        for batch in batch_iter:
+            with stats.iter_collate_batch_s.timer() if stats else nullcontext():
+                collated_batch = self._collate(batch.batch_idx, batch.data)
+            yield CollatedBatch(batch.batch_idx, collated_batch)
+
+    def release_copied_batches(
+        self, batch_iter: Iterator[CollatedBatch]
+    ) -> Iterator[CollatedBatch]:
+        """Release the slots of the finalized batches that don't reference their
+        buffers anymore, e.g., because they were copied to a GPU."""
+        for batch in batch_iter:
+            with self._lock:
+                used_slot = self._used_slots.get(batch.batch_idx)
+            if used_slot is not None:
+                _, views = used_slot
+                if isinstance(batch.data, dict):
+                    tensors = list(batch.data.values())
+                else:
+                    tensors = [batch.data]
+                if not any(t is view for t in tensors for view in views):
+                    self.release(batch.batch_idx)
+            yield batch
+
+    def release(self, batch_idx: int) -> None:
+        """Release the slot used by the batch, if it's not released yet."""
+        with self._lock:
+            used_slot = self._used_slots.pop(batch_idx, None)
+            if used_slot is not None:
+                self._free_slots.append(used_slot[0])
+
+    def _collate(
+        self, batch_idx: int, batch: Union[np.ndarray, Dict[str, np.ndarray]]
+    ) -> Union["torch.Tensor", Dict[str, "torch.Tensor"]]:
+        from ray.air._internal.torch_utils import (
+            convert_ndarray_batch_to_torch_tensor_batch,
+        )
+
+        dtypes = self._dtypes
+        single_tensor = isinstance(batch, np.ndarray)
+        if single_tensor and isinstance(dtypes, dict):
+            if len(dtypes) != 1:
+                # Let the default conversion raise the error.
+                return convert_ndarray_batch_to_torch_tensor_batch(batch, dtypes)
+            dtypes = next(iter(dtypes.values()))
+
+        with self._lock:
+            slot = self._free_slots.pop() if self._free_slots else None
+        if slot is None:
+            return convert_ndarray_batch_to_torch_tensor_batch(batch, dtypes)
+
+        views = []
+        if single_tensor:
+            result = self._copy_to_buffer(slot, None, batch, dtypes, views)
+        else:
+            result = {
+                name: self._copy_to_buffer(
+                    slot,
+                    name,
+                    ndarray,
+                    dtypes.get(name) if isinstance(dtypes, dict) else dtypes,
+                    views,
+                )
+                for name, ndarray in batch.items()
+            }
+        with self._lock:
+            self._used_slots[batch_idx] = (slot, views)
+        return result
+
+    def _copy_to_buffer(
+        self,
+        slot: Dict[Optional[str], "torch.Tensor"],
+        name: Optional[str],
+        ndarray: np.ndarray,
+        dtype: Optional["torch.dtype"],
+        views: List["torch.Tensor"],
+    ) -> "torch.Tensor":
+        import torch
+
+        from ray.air._internal.torch_utils import convert_ndarray_to_torch_tensor
+        from ray.air.util.data_batch_conversion import (
+            _unwrap_ndarray_object_type_if_needed,
+        )
+
+        ndarray = _unwrap_ndarray_object_type_if_needed(ndarray)
+        if ndarray.ndim == 0 or ndarray.dtype.kind not in "biufc":
+            # E.g., ragged tensors.
+            return convert_ndarray_to_torch_tensor(ndarray, dtype=dtype)
+        try:
+            # The array isn't always writeable, since it can come from the object
+            # store. We don't write to it, so suppress the warning.
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                source = torch.from_numpy(ndarray)
+        except (TypeError, ValueError):
+            # The dtype or strides aren't supported by Torch.
+            return convert_ndarray_to_torch_tensor(ndarray, dtype=dtype)
+        if dtype is None:
+            dtype = source.dtype
+
+        buffer = slot.get(name)
+        if (
+            buffer is None
+            or buffer.dtype != dtype
+            or buffer.shape[1:] != source.shape[1:]
+            or len(buffer) < len(source)
+        ):
+            buffer = torch.empty(source.shape, dtype=dtype, pin_memory=self._pin_memory)
+            slot[name] = buffer
+        view = buffer[: len(source)]
+        view.copy_(source)
+        views.append(view)
+        return view
@@ -0,0 +1,229 @@
+import collections
+import logging
+import os
+import tempfile
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import ray
+from ray.data._internal.execution.interfaces import RefBundle
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+from ray.types import ObjectRef
+from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _CacheEntry:
+    """A cached block."""
+
+    # The position of the block in the outputs of the dataset.
+    index: int
+    metadata: BlockMetadata
+    # The block, if it's in the object store.
+    block_ref: Optional[ObjectRef[Block]] = None
+    # The (node ID, path) of the block, if it's spilled to disk.
+    spill_ref: Optional[ObjectRef[Tuple[str, str]]] = None
+
+    @property
+    def size_bytes(self) -> int:
+        return self.metadata.size_bytes or 0
+
+
+class BlockCache:
+    """A cache of the blocks of a dataset, shared by all of its executions.
+
+    The cache lives on the driver, in the logical `Cache` operator. The first
+    execution that consumes all of the blocks of the input writes them to the cache.
+    Later executions read the blocks from the cache, instead of executing the
+    upstream operators again.
+
+    Depending on `storage`, blocks are kept in:
+
+    * "memory": the object store. When the cached blocks exceed `max_bytes`, the
+      least recently used blocks are evicted.
+    * "memory_and_disk": the object store. When the cached blocks exceed
+      `max_bytes`, the least recently used blocks are spilled to the local disk of
+      the node that produced them, in the Arrow IPC format.
+    * "disk": the local disks of the nodes. When the spilled blocks exceed
+      `max_bytes`, the least recently used blocks are evicted.
+
+    If a block was evicted, the cache is incomplete, and the next execution
+    recomputes the dataset. If a spilled block can't be read, e.g., because it was
+    lost with its node, the execution that reads it fails and clears the cache, so
+    the next execution recomputes the dataset.
+    """
+
+    STORAGE_TYPES = ("memory", "memory_and_disk", "disk")
+
+    def __init__(self, storage: str, max_bytes: Optional[int]):
+        if storage not in self.STORAGE_TYPES:
+            raise ValueError(
+                f"`storage` must be one of {self.STORAGE_TYPES}, but got: {storage!r}."
+            )
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError(f"`max_bytes` must be non-negative, but got: {max_bytes}.")
+        self._storage = storage
+        self._max_bytes = max_bytes if max_bytes is not None else float("inf")
+        self._lock = threading.RLock()
+        self._entries: List[_CacheEntry] = []
+        self._entries_by_ref: Dict[ObjectRef, _CacheEntry] = {}
+        # The entries that count towards `max_bytes`, from the least to the most
+        # recently used.
+        self._lru: "collections.OrderedDict[int, _CacheEntry]" = (
+            collections.OrderedDict()
+        )
+        self._used_bytes = 0
+        self._complete = False
+        self._num_evicted = 0
+        # Each write uses a new spill directory, so that the files of a previous
+        # write that are deleted asynchronously don't conflict.
+        self._spill_dir_name = None
+
+    @property
+    def storage(self) -> str:
+        return self._storage
+
+    def is_complete(self) -> bool:
+        """Whether all blocks of the dataset were written to the cache.
+
+        This is called when planning, so it doesn't wait for the spill tasks or
+        check the nodes of the spilled blocks. `CacheOperator` clears the cache if a
+        spilled block can't be read.
+        """
+        with self._lock:
+            return self._complete
+
+    def start_write(self) -> None:
+        with self._lock:
+            self.clear()
+            self._spill_dir_name = uuid.uuid4().hex
+
+    def add(self, bundle: RefBundle) -> None:
+        with self._lock:
+            for block_ref, metadata in bundle.blocks:
+                entry = _CacheEntry(len(self._entries), metadata, block_ref=block_ref)
+                self._entries.append(entry)
+                if self._storage == "disk":
+                    self._spill(entry)
+                self._lru[entry.index] = entry
+                self._used_bytes += entry.size_bytes
+            self._enforce_budget()
+
+    def finish_write(self) -> None:
+        with self._lock:
+            self._complete = self._num_evicted == 0
+            logger.debug(
+                f"Cached {len(self._entries)} blocks ({self._storage}), "
+                f"{sum(1 for e in self._entries if e.spill_ref is not None)} "
+                f"spilled to disk, {self._num_evicted} evicted."
+            )
+
+    def get_bundles(self) -> List[RefBundle]:
+        """Return a bundle per cached block, for `CacheOperator.add_input`.
+
+        The blocks of the bundles are the `ObjectRef`s of the cached blocks, or of
+        their spill locations.
+        """
+        with self._lock:
+            assert self._complete
+            bundles = []
+            self._entries_by_ref = {}
+            for entry in self._entries:
+                if entry.block_ref is not None:
+                    ref = entry.block_ref
+                else:
+                    ref = entry.spill_ref
+                self._entries_by_ref[ref] = entry
+                bundles.append(RefBundle([(ref, entry.metadata)], owns_blocks=False))
+            return bundles
+
+    def get_entry(self, ref: ObjectRef) -> _CacheEntry:
+        with self._lock:
+            entry = self._entries_by_ref[ref]
+            if entry.index in self._lru:
+                self._lru.move_to_end(entry.index)
+            return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            spill_refs = [e.spill_ref for e in self._entries if e.spill_ref is not None]
+            if spill_refs:
+                _delete_spilled_blocks(spill_refs)
+            self._entries = []
+            self._entries_by_ref = {}
+            self._lru.clear()
+            self._used_bytes = 0
+            self._complete = False
+            self._num_evicted = 0
+
+    def _enforce_budget(self) -> None:
+        while self._used_bytes > self._max_bytes and self._lru:
+            _, entry = self._lru.popitem(last=False)
+            self._used_bytes -= entry.size_bytes
+            if self._storage == "memory_and_disk":
+                self._spill(entry)
+            else:
+                # Evict the block.
+                if entry.spill_ref is not None:
+                    _delete_spilled_blocks([entry.spill_ref])
+                entry.block_ref = None
+                entry.spill_ref = None
+                self._num_evicted += 1
+
+    def _spill(self, entry: _CacheEntry) -> None:
+        # The task holds a reference to the block until it's spilled.
+        spill_fn = cached_remote_fn(_spill_block, num_cpus=0)
+        entry.spill_ref = spill_fn.remote(
+            entry.block_ref, self._spill_dir_name, entry.index
+        )
+        entry.block_ref = None
+
+
+def _spill_block(block: Block, dir_name: str, index: int) -> Tuple[str, str]:
+    import pyarrow as pa
+
+    directory = os.path.join(tempfile.gettempdir(), "ray_data_cache", dir_name)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{index}.arrow")
+    table = BlockAccessor.for_block(block).to_arrow()
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return ray.get_runtime_context().get_node_id(), path
+
+
+def _read_spilled_block(path: str) -> Tuple[Block, BlockMetadata]:
+    import pyarrow as pa
+
+    stats = BlockExecStats.builder()
+    with pa.memory_map(path, "r") as source:
+        # Copy the table, so that it doesn't reference the memory-mapped file.
+        table = pa.ipc.open_file(source).read_all()
+        block = BlockAccessor.for_block(table).slice(0, table.num_rows, copy=True)
+    return block, BlockAccessor.for_block(block).get_metadata(exec_stats=stats.build())
+
+
+def _delete_spilled_block(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _delete_spilled_blocks(spill_refs: List[ObjectRef[Tuple[str, str]]]) -> None:
+    """Delete the spilled files on a best-effort basis."""
+    ready, _ = ray.wait(spill_refs, num_returns=len(spill_refs), timeout=0)
+    delete_fn = cached_remote_fn(_delete_spilled_block, num_cpus=0)
+    for spill_ref in ready:
+        try:
+            node_id, path = ray.get(spill_ref)
+        except Exception:
+            continue
+        delete_fn.options(
+            scheduling_strategy=NodeAffinitySchedulingStrategy(node_id, soft=True)
+        ).remote(path)
@@ -0,0 +1,163 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ray.data._internal.aggregate import Count, Max, Mean, Min, Std
+from ray.data.aggregate import AggregateFn, ApproxCountDistinct, ApproxQuantile
+
+if TYPE_CHECKING:
+    from ray.data import Dataset
+
+# The statistics computed by `Dataset.summary()`.
+SUMMARY_STATS = [
+    "count",
+    "null_count",
+    "min",
+    "max",
+    "mean",
+    "std",
+    "approx_distinct",
+    "approx_quantiles",
+]
+# The statistics computed by default for each kind of column.
+NUMERIC_STATS = SUMMARY_STATS
+ORDERED_STATS = ["count", "null_count", "min", "max", "approx_distinct"]
+OTHER_STATS = ["count", "null_count"]
+
+# The name of the aggregation that counts the rows of the dataset.
+_NUM_ROWS = "__summary_num_rows"
+
+
+def get_default_stats(column_type: Any) -> List[str]:
+    """Return the statistics to compute by default for a column of the given type.
+
+    Args:
+        column_type: The Arrow type of the column, or ``object`` or ``None`` if the
+            column doesn't have an Arrow type.
+    """
+    import pyarrow as pa
+
+    if not isinstance(column_type, pa.DataType):
+        return OTHER_STATS
+    if pa.types.is_integer(column_type) or pa.types.is_floating(column_type):
+        return NUMERIC_STATS
+    if (
+        pa.types.is_boolean(column_type)
+        or pa.types.is_string(column_type)
+        or pa.types.is_large_string(column_type)
+        or pa.types.is_temporal(column_type)
+    ):
+        return ORDERED_STATS
+    return OTHER_STATS
+
+
+def compute_summary(
+    dataset: "Dataset",
+    columns: Optional[List[str]],
+    stats: Optional[List[str]],
+    quantiles: List[float],
+    ddof: int,
+) -> Dict[str, Dict[str, Any]]:
+    """Compute the statistics of the columns of the dataset in a single pass.
+
+    See :meth:`~ray.data.Dataset.summary` for the arguments.
+    """
+    if stats is not None:
+        unknown = [stat for stat in stats if stat not in SUMMARY_STATS]
+        if unknown:
+            raise ValueError(
+                f"Unknown statistics {unknown}. Supported statistics: "
+                f"{SUMMARY_STATS}."
+            )
+
+    if columns is not None and stats is not None:
+        # The schema isn't needed, so don't execute the dataset to fetch it. The
+        # columns are validated by the aggregations.
+        column_stats = {col: stats for col in columns}
+    else:
+        schema = dataset.schema(fetch_if_missing=True)
+        all_columns = list(schema.names) if schema is not None else []
+        column_types = dict(zip(all_columns, schema.types)) if schema else {}
+        if columns is None:
+            columns = all_columns
+        missing = [col for col in columns if col not in all_columns]
+        if missing:
+            raise ValueError(
+                f"Columns {missing} don't exist in the dataset. Existing columns: "
+                f"{all_columns}."
+            )
+        column_stats = {
+            col: stats if stats is not None else get_default_stats(column_types[col])
+            for col in columns
+        }
+    aggs = get_summary_aggregates(column_stats, quantiles, ddof)
+    result = dataset.aggregate(*aggs)
+    return parse_summary(column_stats, result, quantiles)
+
+
+def get_summary_aggregates(
+    column_stats: Dict[str, List[str]],
+    quantiles: Optional[List[float]] = None,
+    ddof: int = 1,
+) -> List[AggregateFn]:
+    """Return the aggregations that compute the given statistics of each column.
+
+    The aggregations are named ``<stat>(<column>)``, so that their results can be
+    parsed by :func:`parse_summary`.
+    """
+    aggs = [Count(alias_name=_NUM_ROWS)]
+    for col, stats in column_stats.items():
+        if "count" in stats or "null_count" in stats:
+            aggs.append(Count(col, alias_name=f"count({col})"))
+        if "min" in stats:
+            aggs.append(Min(col, alias_name=f"min({col})"))
+        if "max" in stats:
+            aggs.append(Max(col, alias_name=f"max({col})"))
+        if "mean" in stats:
+            aggs.append(Mean(col, alias_name=f"mean({col})"))
+        if "std" in stats:
+            aggs.append(Std(col, ddof=ddof, alias_name=f"std({col})"))
+        if "approx_distinct" in stats:
+            aggs.append(ApproxCountDistinct(col, alias_name=f"approx_distinct({col})"))
+        if "approx_quantiles" in stats and quantiles:
+            aggs.append(
+                ApproxQuantile(
+                    col, q=list(quantiles), alias_name=f"approx_quantiles({col})"
+                )
+            )
+    return aggs
+
+
+def parse_summary(
+    column_stats: Dict[str, List[str]],
+    result: Optional[Dict[str, Any]],
+    quantiles: Optional[List[float]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Parse the results of the aggregations into the statistics of each column."""
+    if result is None:
+        # The dataset is empty.
+        result = {}
+    if quantiles is None:
+        quantiles = []
+
+    summary = {}
+    for col, stats in column_stats.items():
+        col_summary = {}
+        for stat in stats:
+            if stat == "count":
+                col_summary[stat] = result.get(f"count({col})", 0)
+            elif stat == "null_count":
+                col_summary[stat] = result.get(_NUM_ROWS, 0) - result.get(
+                    f"count({col})", 0
+                )
+            elif stat == "approx_quantiles":
+                values = result.get(f"approx_quantiles({col})")
+                for i, q in enumerate(quantiles):
+                    col_summary[_quantile_name(q)] = values[i] if values else None
+            else:
+                col_summary[stat] = result.get(f"{stat}({col})")
+        summary[col] = col_summary
+    return summary
+
+
+def _quantile_name(q: float) -> str:
+    # E.g., "25%" for the 0.25 quantile, like `pandas.DataFrame.describe()`.
+    return f"{q * 100:g}%"
@@ -0,0 +1,75 @@
+from typing import TYPE_CHECKING, Iterator, List, Union
+
+from ray.data.block import Block
+from ray.data.context import DataContext
+from ray.data.datasource.file_based_datasource import FileBasedDatasource
+
+if TYPE_CHECKING:
+    import pyarrow
+
+
+class ArrowIPCDatasource(FileBasedDatasource):
+    """Arrow IPC datasource, for reading Arrow IPC (Feather V2) files.
+
+    Files on the local filesystem are memory-mapped, so the blocks reference the
+    mapped pages instead of copies of the file data. This only avoids copies for
+    uncompressed files, since compressed buffers are decompressed into memory.
+    """
+
+    _FILE_EXTENSIONS = ["arrow", "feather", "ipc"]
+
+    def __init__(
+        self,
+        paths: Union[str, List[str]],
+        memory_map: bool = True,
+        **file_based_datasource_kwargs,
+    ):
+        super().__init__(paths, **file_based_datasource_kwargs)
+
+        self._memory_map = memory_map
+
+    def _open_input_source(
+        self,
+        filesystem: "pyarrow.fs.FileSystem",
+        path: str,
+        **open_args,
+    ) -> "pyarrow.NativeFile":
+        import pyarrow as pa
+
+        # The IPC file format requires random access to read the footer, so open
+        # the file instead of a sequential stream.
+        if self._memory_map and filesystem.type_name == "local":
+            return pa.memory_map(path, "r")
+        return filesystem.open_input_file(path)
+
+    def _read_stream(self, f: "pyarrow.NativeFile", path: str) -> Iterator[Block]:
+        import pyarrow as pa
+
+        try:
+            reader = pa.ipc.open_file(f)
+            batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+        except pa.ArrowInvalid:
+            # Not in the IPC file format, so try the IPC streaming format.
+            f.seek(0)
+            reader = pa.ipc.open_stream(f)
+            batches = iter(reader)
+
+        # Combine the record batches into blocks of up to the target max block size.
+        # Building tables from record batches doesn't copy the data, so the blocks
+        # still reference the memory-mapped file.
+        target_max_block_size = DataContext.get_current().target_max_block_size
+        buffer = []
+        buffer_size = 0
+        for batch in batches:
+            if (
+                buffer
+                and target_max_block_size is not None
+                and buffer_size + batch.nbytes > target_max_block_size
+            ):
+                yield pa.Table.from_batches(buffer, schema=reader.schema)
+                buffer = []
+                buffer_size = 0
+            buffer.append(batch)
+            buffer_size += batch.nbytes
+        if buffer:
+            yield pa.Table.from_batches(buffer, schema=reader.schema)
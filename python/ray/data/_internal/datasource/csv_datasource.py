@@ -1,7 +1,9 @@
+import copy
 from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
 
 from ray.data.block import Block
 from ray.data.datasource.file_based_datasource import FileBasedDatasource
+from ray.data.datasource.partitioning import PathPartitionParser
 
 if TYPE_CHECKING:
     import pyarrow
@@ -11,6 +13,7 @@ class CSVDatasource(FileBasedDatasource):
     """CSV datasource, for reading and writing CSV files."""
 
     _FILE_EXTENSIONS = ["csv"]
+    _SUPPORTS_PROJECTION_PUSHDOWN = True
 
     def __init__(
         self,
@@ -41,12 +44,16 @@ class CSVDatasource(FileBasedDatasource):
                 self.parse_options.invalid_row_handler
             )
 
+        arrow_csv_args = self.arrow_csv_args
+        if self._columns is not None:
+            arrow_csv_args = self._get_projected_arrow_csv_args(path)
+
         try:
             reader = csv.open_csv(
                 f,
                 read_options=self.read_options,
                 parse_options=self.parse_options,
-                **self.arrow_csv_args,
+                **arrow_csv_args,
             )
             schema = None
             while True:
@@ -65,3 +72,29 @@ class CSVDatasource(FileBasedDatasource):
                 "file with 'partition_filter' field. See read_csv() documentation for "
                 "more details."
             ) from e
+
+    def _get_projected_arrow_csv_args(self, path: str) -> Dict[str, Any]:
+        """Return the CSV args that only convert the projected columns of `path`.
+
+        Partition columns and the `path` column are added after reading, so they
+        aren't requested from the CSV reader.
+        """
+        from pyarrow import csv
+
+        convert_options = self.arrow_csv_args.get("convert_options")
+        if convert_options is not None and convert_options.include_columns:
+            # Respect the user's column selection. The projected columns are
+            # selected after reading.
+            return self.arrow_csv_args
+
+        added_columns = set()
+        if self._partitioning is not None:
+            added_columns.update(PathPartitionParser(self._partitioning)(path))
+        if self._include_paths:
+            added_columns.add("path")
+
+        convert_options = copy.copy(convert_options or csv.ConvertOptions())
+        convert_options.include_columns = [
+            column for column in self._columns if column not in added_columns
+        ]
+        return {**self.arrow_csv_args, "convert_options": convert_options}
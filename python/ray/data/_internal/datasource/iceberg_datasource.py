@@ -2,6 +2,7 @@
 Module to read an iceberg table into a Ray Dataset, by using the Ray Datasource API.
 """
 
+import copy
 import heapq
 import itertools
 import logging
@@ -18,6 +19,8 @@ if TYPE_CHECKING:
     from pyiceberg.manifest import DataFile, DataFileContent
     from pyiceberg.table import DataScan, FileScanTask, Schema
 
+    from ray.data.expressions import Expr
+
 logger = logging.getLogger(__name__)
 
 
@@ -104,6 +107,32 @@ class IcebergDatasource(Datasource):
 
         return data_scan
 
+    def supports_predicate_pushdown(self, predicate: "Expr") -> bool:
+        from pyiceberg.expressions.parser import parse
+
+        try:
+            parse(predicate.to_sql())
+        except Exception:
+            # E.g., PyIceberg doesn't support arithmetic in row filters.
+            return False
+        return True
+
+    def apply_predicate(self, predicate: "Expr") -> "IcebergDatasource":
+        # PyIceberg uses the row filter to prune manifests and data files based on
+        # partition values and column statistics during scan planning.
+        from pyiceberg.expressions import And
+        from pyiceberg.expressions.parser import parse
+
+        existing_filter = self._row_filter
+        if isinstance(existing_filter, str):
+            existing_filter = parse(existing_filter)
+
+        datasource = copy.copy(self)
+        datasource._row_filter = And(existing_filter, parse(predicate.to_sql()))
+        # The planned files depend on the row filter, so they need to be re-planned.
+        datasource._plan_files = None
+        return datasource
+
     def estimate_inmemory_data_size(self) -> Optional[int]:
         # Approximate the size by using the plan files - this will not
         # incorporate the deletes, but that's a reasonable approximation
@@ -16,6 +16,9 @@ class JSONDatasource(FileBasedDatasource):
     """JSON datasource, for reading and writing JSON and JSONL files."""
 
     _FILE_EXTENSIONS = ["json", "jsonl"]
+    # PyArrow's JSON reader can't skip fields, so projected columns are selected
+    # right after parsing, in the read task.
+    _SUPPORTS_PROJECTION_PUSHDOWN = True
 
     def __init__(
         self,
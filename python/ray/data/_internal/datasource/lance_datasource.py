@@ -1,3 +1,4 @@
+import copy
 import logging
 from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
 
@@ -11,6 +12,8 @@ from ray.data.datasource.datasource import Datasource, ReadTask
 if TYPE_CHECKING:
     import pyarrow
 
+    from ray.data.expressions import Expr
+
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +71,10 @@ class LanceDatasource(Datasource):
                 data_file.path() for f in fragments for data_file in f.data_files()
             ]
 
+            # If there is a filter, the resulting row count is unknown.
+            if self.scanner_options.get("filter") is not None:
+                num_rows = None
+
             # TODO(chengsu): Take column projection into consideration for schema.
             metadata = BlockMetadata(
                 num_rows=num_rows,
@@ -97,6 +104,28 @@ class LanceDatasource(Datasource):
         # TODO(chengsu): Add memory size estimation to improve auto-tune of parallelism.
         return None
 
+    def supports_predicate_pushdown(self, predicate: "Expr") -> bool:
+        # Pushed predicates are combined with the user-specified filter as SQL.
+        if not isinstance(self.scanner_options.get("filter"), (str, type(None))):
+            return False
+        try:
+            predicate.to_sql()
+        except ValueError:
+            return False
+        return True
+
+    def apply_predicate(self, predicate: "Expr") -> "LanceDatasource":
+        # Lance evaluates SQL filters in its scanner, using its scalar indices and
+        # fragment statistics to skip data that can't match.
+        pushed_filter = predicate.to_sql()
+        existing_filter = self.scanner_options.get("filter")
+        if existing_filter is not None:
+            pushed_filter = f"({existing_filter}) AND {pushed_filter}"
+
+        datasource = copy.copy(self)
+        datasource.scanner_options = {**self.scanner_options, "filter": pushed_filter}
+        return datasource
+
 
 def _read_fragments_with_retry(
     fragment_ids,
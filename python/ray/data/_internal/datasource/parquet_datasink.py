@@ -1,6 +1,5 @@
 import logging
-import posixpath
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
 
 from ray.data._internal.execution.interfaces import TaskContext
 from ray.data._internal.util import call_with_retry
@@ -9,6 +8,7 @@ from ray.data.context import DataContext
 from ray.data.datasource.file_based_datasource import _resolve_kwargs
 from ray.data.datasource.file_datasink import _FileDatasink
 from ray.data.datasource.filename_provider import FilenameProvider
+from ray.data.datasource.partitioning import Partitioning
 
 if TYPE_CHECKING:
     import pyarrow
@@ -32,6 +32,9 @@ class ParquetDatasink(_FileDatasink):
         open_stream_args: Optional[Dict[str, Any]] = None,
         filename_provider: Optional[FilenameProvider] = None,
         dataset_uuid: Optional[str] = None,
+        min_rows_per_file: Optional[int] = None,
+        target_file_bytes: Optional[int] = None,
+        partitioning: Optional[Partitioning] = None,
     ):
         if arrow_parquet_args_fn is None:
             arrow_parquet_args_fn = lambda: {}  # noqa: E731
@@ -41,7 +44,9 @@ class ParquetDatasink(_FileDatasink):
 
         self.arrow_parquet_args_fn = arrow_parquet_args_fn
         self.arrow_parquet_args = arrow_parquet_args
-        self.num_rows_per_file = num_rows_per_file
+
+        if num_rows_per_file is not None:
+            min_rows_per_file = num_rows_per_file
 
         super().__init__(
             path,
@@ -51,6 +56,9 @@ class ParquetDatasink(_FileDatasink):
             filename_provider=filename_provider,
             dataset_uuid=dataset_uuid,
             file_format="parquet",
+            min_rows_per_file=min_rows_per_file,
+            target_file_bytes=target_file_bytes,
+            partitioning=partitioning,
         )
 
     def write(
@@ -58,20 +66,27 @@ class ParquetDatasink(_FileDatasink):
         blocks: Iterable[Block],
         ctx: TaskContext,
     ) -> None:
-        import pyarrow.parquet as pq
-
-        blocks = list(blocks)
-
-        if all(BlockAccessor.for_block(block).num_rows() == 0 for block in blocks):
-            return
-
-        filename = self.filename_provider.get_filename_for_block(
-            blocks[0], ctx.task_idx, 0
-        )
-        write_path = posixpath.join(self.path, filename)
         write_kwargs = _resolve_kwargs(
             self.arrow_parquet_args_fn, **self.arrow_parquet_args
         )
+        block_index = 0
+        for partition_dir, file_blocks in self._group_blocks_into_files(blocks):
+            if all(
+                BlockAccessor.for_block(block).num_rows() == 0 for block in file_blocks
+            ):
+                continue
+
+            filename = self.filename_provider.get_filename_for_block(
+                file_blocks[0], ctx.task_idx, block_index
+            )
+            write_path = self._get_write_path(partition_dir, filename)
+            self._write_file(file_blocks, write_path, write_kwargs)
+            block_index += 1
+
+    def _write_file(
+        self, blocks: List[Block], write_path: str, write_kwargs: Dict[str, Any]
+    ) -> None:
+        import pyarrow.parquet as pq
 
         def write_blocks_to_path():
             with self.open_output_stream(write_path) as file:
@@ -89,7 +104,3 @@ class ParquetDatasink(_FileDatasink):
             max_attempts=WRITE_FILE_MAX_ATTEMPTS,
             max_backoff_s=WRITE_FILE_RETRY_MAX_BACKOFF_SECONDS,
         )
-
-    @property
-    def num_rows_per_write(self) -> Optional[int]:
-        return self.num_rows_per_file
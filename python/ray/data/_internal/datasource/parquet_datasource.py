@@ -1,3 +1,4 @@
+import copy
 import logging
 from dataclasses import dataclass
 from typing import (
@@ -9,6 +10,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    Set,
     Union,
 )
 
@@ -18,6 +20,7 @@ from packaging.version import parse as parse_version
 import ray
 import ray.cloudpickle as cloudpickle
 from ray._private.utils import _get_pyarrow_version
+from ray.data._internal.file_metadata_cache import FileMetadataCache
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.util import (
@@ -50,6 +53,8 @@ if TYPE_CHECKING:
     import pyarrow
     from pyarrow.dataset import ParquetFileFragment
 
+    from ray.data.expressions import Expr
+
 
 logger = logging.getLogger(__name__)
 
@@ -198,8 +203,14 @@ class ParquetDatasource(Datasource):
 
         # HACK: PyArrow's `ParquetDataset` errors if input paths contain non-parquet
         # files. To avoid this, we expand the input paths with the default metadata
-        # provider and then apply the partition filter or file extensions.
-        if partition_filter is not None or file_extensions is not None:
+        # provider and then apply the partition filter or file extensions. If the
+        # file metadata cache is enabled, we also expand the input paths so that the
+        # cached directory listings are used instead of listing them with PyArrow.
+        if (
+            partition_filter is not None
+            or file_extensions is not None
+            or FileMetadataCache.get_current() is not None
+        ):
             default_meta_provider = DefaultFileMetadataProvider()
             expanded_paths, _ = map(
                 list, zip(*default_meta_provider.expand_paths(paths, filesystem))
@@ -294,10 +305,18 @@ class ParquetDatasource(Datasource):
         # network calls when `_ParquetDatasourceReader` is serialized. See
         # `_SerializedFragment()` implementation for more details.
         self._pq_fragments = [SerializedFragment(p) for p in pq_ds.fragments]
+        # Columns stored in the files, as opposed to partition columns or the
+        # `path` column, which are added by Ray Data after reading.
+        self._file_column_names = set(pq_ds.schema.names)
         self._pq_paths = [p.path for p in pq_ds.fragments]
         self._meta_provider = meta_provider
         self._block_udf = _block_udf
         self._to_batches_kwargs = to_batch_kwargs
+        # Columns referenced by the filters pushed down by the optimizer, or None if
+        # the user passed an opaque filter through `to_batch_kwargs`.
+        self._filter_columns: Optional[Set[str]] = (
+            set() if to_batch_kwargs.get("filter") is None else None
+        )
         self._columns = columns
         self._read_schema = read_schema
         self._schema = schema
@@ -417,6 +436,67 @@ class ParquetDatasource(Datasource):
         """
         return "Parquet"
 
+    def supports_predicate_pushdown(self, predicate: "Expr") -> bool:
+        # The predicate is evaluated by the Arrow scanner before Ray Data adds
+        # partition columns and applies `_block_udf`, so it can only reference
+        # columns that are stored in the files and that are part of the read schema.
+        if self._block_udf is not None:
+            return False
+        readable_columns = self._file_column_names
+        if self._read_schema is not None:
+            readable_columns = readable_columns & set(self._read_schema.names)
+        return predicate.columns().issubset(readable_columns)
+
+    def apply_predicate(self, predicate: "Expr") -> "ParquetDatasource":
+        # Arrow uses the filter to skip row groups based on their statistics, and
+        # only decodes the remaining row groups.
+        pushed_filter = predicate.to_pyarrow()
+        existing_filter = self._to_batches_kwargs.get("filter")
+        if existing_filter is not None:
+            pushed_filter = existing_filter & pushed_filter
+
+        datasource = copy.copy(self)
+        datasource._to_batches_kwargs = {
+            **self._to_batches_kwargs,
+            "filter": pushed_filter,
+        }
+        if self._filter_columns is not None:
+            datasource._filter_columns = self._filter_columns | predicate.columns()
+        return datasource
+
+    def supports_projection_pushdown(self, columns: List[str]) -> bool:
+        # We can't tell which columns an opaque user filter or `_block_udf` needs.
+        if self._block_udf is not None or self._filter_columns is None:
+            return False
+        # `read_fragments` always appends the `path` column.
+        if self._include_paths or len(set(columns)) != len(columns):
+            return False
+        return set(columns).issubset(self._schema.names)
+
+    def apply_projection(self, columns: List[str]) -> "ParquetDatasource":
+        import pyarrow as pa
+
+        # Columns that pushed down filters reference must still be read, even if
+        # they aren't part of the output. `read_fragments` drops them again.
+        base_read_schema = self._read_schema or self._schema
+        filter_only_columns = [
+            column
+            for column in base_read_schema.names
+            if column in self._filter_columns and column not in columns
+        ]
+
+        datasource = copy.copy(self)
+        datasource._columns = list(columns)
+        datasource._schema = pa.schema(
+            [self._schema.field(column) for column in columns], self._schema.metadata
+        )
+        datasource._read_schema = pa.schema(
+            [self._schema.field(column) for column in columns]
+            + [base_read_schema.field(column) for column in filter_only_columns],
+            self._schema.metadata,
+        )
+        return datasource
+
     @property
     def supports_distributed_reads(self) -> bool:
         return self._supports_distributed_reads
@@ -448,6 +528,13 @@ def read_fragments(
     logger.debug(f"Reading {len(fragments)} parquet fragments")
     use_threads = to_batches_kwargs.pop("use_threads", False)
     batch_size = to_batches_kwargs.pop("batch_size", default_read_batch_size_rows)
+    # The read schema can contain columns that are only read to evaluate a pushed
+    # down filter. They aren't part of the output.
+    output_schema = schema
+    if schema is not None and columns is not None and schema.names != columns:
+        output_schema = pa.schema(
+            [schema.field(column) for column in columns], schema.metadata
+        )
     for fragment in fragments:
         partitions = {}
         if partitioning is not None:
@@ -477,7 +564,7 @@ def read_fragments(
         for batch in iterate_with_retry(
             get_batch_iterable, "load batch", match=ctx.retried_io_errors
         ):
-            table = pa.Table.from_batches([batch], schema=schema)
+            table = pa.Table.from_batches([batch], schema=output_schema)
             if include_paths:
                 table = table.append_column("path", [[fragment.path]] * len(table))
             if partitions:
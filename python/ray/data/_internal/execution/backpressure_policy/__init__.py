@@ -1,6 +1,9 @@
 from typing import TYPE_CHECKING
 
 import ray
+from .adaptive_concurrency_backpressure_policy import (
+    AdaptiveConcurrencyBackpressurePolicy,
+)
 from .backpressure_policy import BackpressurePolicy
 from .concurrency_cap_backpressure_policy import ConcurrencyCapBackpressurePolicy
 
@@ -25,6 +28,7 @@ def get_backpressure_policies(topology: "Topology"):
 
 
 __all__ = [
+    "AdaptiveConcurrencyBackpressurePolicy",
     "BackpressurePolicy",
     "ConcurrencyCapBackpressurePolicy",
     "ENABLED_BACKPRESSURE_POLICIES_CONFIG_KEY",
@@ -0,0 +1,116 @@
+import logging
+import math
+import time
+from typing import TYPE_CHECKING, Dict, Optional
+
+from .backpressure_policy import BackpressurePolicy
+from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
+
+if TYPE_CHECKING:
+    from ray.data._internal.execution.interfaces.physical_operator import (
+        PhysicalOperator,
+    )
+    from ray.data._internal.execution.resource_manager import ResourceManager
+    from ray.data._internal.execution.streaming_executor_state import Topology
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyBackpressurePolicy(BackpressurePolicy):
+    """A backpressure policy that adapts the concurrency of each operator to the
+    object store pressure.
+
+    Operators start uncapped. Every `UPDATE_INTERVAL_S`, the policy compares the
+    global object store usage with the global limit, and adjusts the concurrency
+    caps in an additive-increase/multiplicative-decrease fashion:
+
+    * Under high pressure, an operator whose unconsumed outputs grew in the last
+      interval is producing faster than its downstream operators consume. Its cap
+      is scaled down by the ratio of the consumed to the produced bytes, but by at
+      most `DECREASE_FACTOR` per interval and never below 1 task.
+    * Under low pressure, the cap of an operator that is running at its cap, and
+      whose unconsumed outputs didn't grow, is incremented by 1.
+
+    This keeps fast operators (e.g., reads) from flooding the object store when a
+    downstream operator (e.g., a GPU map) is slower, without static concurrency
+    caps. The caps are reported as the `concurrency_cap` metric of each operator.
+
+    This policy isn't enabled by default. To enable it, add it to the
+    `ENABLED_BACKPRESSURE_POLICIES_CONFIG_KEY` config with
+    `DataContext.set_config`.
+    """
+
+    # The interval between 2 updates of the concurrency caps.
+    UPDATE_INTERVAL_S = 1.0
+    # Object store usage fractions above which the caps are decreased, and below
+    # which they are increased.
+    HIGH_PRESSURE_THRESHOLD = 0.8
+    LOW_PRESSURE_THRESHOLD = 0.5
+    # The min factor by which a cap is decreased in an update.
+    DECREASE_FACTOR = 0.5
+
+    def __init__(self, topology: "Topology"):
+        self._concurrency_caps: Dict["PhysicalOperator", float] = {}
+        # The outputs usage and the generated output bytes of each operator at the
+        # last update.
+        self._last_outputs_usage: Dict["PhysicalOperator", int] = {}
+        self._last_bytes_generated: Dict["PhysicalOperator", int] = {}
+        for op in topology:
+            if isinstance(op, InputDataBuffer):
+                continue
+            self._concurrency_caps[op] = float("inf")
+            self._last_outputs_usage[op] = 0
+            self._last_bytes_generated[op] = 0
+        self._last_update_time = time.time()
+
+    def on_usages_updated(self, resource_manager: "ResourceManager") -> None:
+        now = time.time()
+        if now - self._last_update_time < self.UPDATE_INTERVAL_S:
+            return
+        self._last_update_time = now
+
+        limit = resource_manager.get_global_limits().object_store_memory
+        if not limit:
+            return
+        pressure = resource_manager.get_global_usage().object_store_memory / limit
+
+        for op, cap in self._concurrency_caps.items():
+            outputs_usage = resource_manager.get_op_outputs_object_store_usage(op)
+            bytes_generated = op.metrics.bytes_task_outputs_generated
+            outputs_growth = outputs_usage - self._last_outputs_usage[op]
+            produced = bytes_generated - self._last_bytes_generated[op]
+            self._last_outputs_usage[op] = outputs_usage
+            self._last_bytes_generated[op] = bytes_generated
+            if op.throttling_disabled():
+                continue
+
+            num_running = op.metrics.num_tasks_running
+            new_cap: Optional[float] = None
+            if (
+                pressure >= self.HIGH_PRESSURE_THRESHOLD
+                and outputs_growth > 0
+                and produced > 0
+                and num_running > 0
+            ):
+                consumed = max(produced - outputs_growth, 0)
+                factor = max(consumed / produced, self.DECREASE_FACTOR)
+                new_cap = max(1, math.floor(min(cap, num_running) * factor))
+            elif (
+                pressure < self.LOW_PRESSURE_THRESHOLD
+                and outputs_growth <= 0
+                and num_running >= cap
+            ):
+                new_cap = cap + 1
+
+            if new_cap is not None and new_cap != cap:
+                logger.debug(
+                    f"Updated the concurrency cap of {op.name} from {cap} to "
+                    f"{new_cap}, object store usage: {pressure:.0%}."
+                )
+                self._concurrency_caps[op] = new_cap
+                op.metrics.on_concurrency_cap_updated(new_cap)
+
+    def can_add_input(self, op: "PhysicalOperator") -> bool:
+        return op.metrics.num_tasks_running < self._concurrency_caps.get(
+            op, float("inf")
+        )
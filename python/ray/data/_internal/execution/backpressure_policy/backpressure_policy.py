@@ -5,6 +5,7 @@ if TYPE_CHECKING:
     from ray.data._internal.execution.interfaces.physical_operator import (
         PhysicalOperator,
     )
+    from ray.data._internal.execution.resource_manager import ResourceManager
     from ray.data._internal.execution.streaming_executor_state import Topology
 
 
@@ -26,3 +27,12 @@ class BackpressurePolicy(ABC):
         backpressured if any of the policies returns False.
         """
         return True
+
+    def on_usages_updated(self, resource_manager: "ResourceManager") -> None:
+        """Callback after the executor updates the resource usages, once per
+        scheduling loop step.
+
+        Policies that adapt to runtime conditions can override this method to
+        update their state.
+        """
+        pass
@@ -0,0 +1,218 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
+import ray
+from ray._private.internal_api import get_memory_info_reply, get_state_from_address
+from ray.data._internal.execution.operators.map_operator import MapOperator
+from ray.data.context import DataContext
+
+if TYPE_CHECKING:
+    from ray.data._internal.execution.interfaces.physical_operator import (
+        PhysicalOperator,
+    )
+    from ray.data._internal.execution.resource_manager import ResourceManager
+    from ray.data._internal.execution.streaming_executor_state import Topology
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _OutputSnapshot:
+    """The output metrics of an operator at an update of the autotuner."""
+
+    num_blocks: int
+    num_bytes: int
+    block_generation_time_s: float
+
+    @classmethod
+    def of(cls, op: "PhysicalOperator") -> "_OutputSnapshot":
+        return cls(
+            num_blocks=op.metrics.num_task_outputs_generated,
+            num_bytes=op.metrics.bytes_task_outputs_generated,
+            block_generation_time_s=op.metrics.block_generation_time,
+        )
+
+
+class BlockSizeAutotuner:
+    """Adjusts the target max block size of the map operators during execution.
+
+    Every `UPDATE_INTERVAL_S`, the autotuner compares the output blocks that each
+    map operator generated since the last update with its current target:
+
+    * If the object store is under pressure, or objects were spilled since the
+      last update, the target of an operator whose blocks reach the target is
+      decreased by `DECREASE_FACTOR`. Smaller blocks free the object store sooner,
+      and reduce the peak heap memory of the tasks.
+    * If the object store isn't under pressure, and an operator generates blocks
+      that reach the target in less than `MIN_BLOCK_GENERATION_TIME_S` each, the
+      target is increased by `INCREASE_FACTOR`, because the per-block scheduling
+      and metadata overheads dominate.
+
+    Operators whose blocks don't reach the target aren't adjusted, since their
+    block sizes are bound by their inputs. The targets stay between
+    `DataContext.target_min_block_size` and `MAX_TARGET_FACTOR` times the initial
+    target. New tasks use the updated target to split their outputs, so reads and
+    maps that are already running aren't affected.
+
+    The targets are reported as the `autotuned_target_max_block_size` metric of
+    each operator. To enable the autotuner, set
+    `DataContext.enable_block_size_autotuning`.
+    """
+
+    # The interval between 2 updates of the targets.
+    UPDATE_INTERVAL_S = 5.0
+    # Object store usage fractions above which the targets are decreased, and
+    # below which they can be increased.
+    HIGH_PRESSURE_THRESHOLD = 0.8
+    LOW_PRESSURE_THRESHOLD = 0.5
+    # The factors by which the targets are decreased and increased in an update.
+    DECREASE_FACTOR = 0.5
+    INCREASE_FACTOR = 2
+    # The max target, as a multiple of the initial target of the operator.
+    MAX_TARGET_FACTOR = 4
+    # The min number of blocks an operator must generate between 2 updates for
+    # its target to be adjusted.
+    MIN_BLOCKS_PER_UPDATE = 4
+    # Blocks whose average size is at least this fraction of the target are
+    # considered to reach the target.
+    FULL_BLOCK_FRACTION = 0.5
+    # Blocks generated faster than this are considered too small.
+    MIN_BLOCK_GENERATION_TIME_S = 0.1
+
+    def __init__(
+        self,
+        topology: "Topology",
+        get_bytes_spilled: Optional[Callable[[], Optional[int]]] = None,
+    ):
+        """Create a BlockSizeAutotuner.
+
+        Args:
+            topology: The topology of the execution.
+            get_bytes_spilled: Returns the bytes spilled by the object stores of the
+                cluster so far, or None if unknown. Defaults to the latest sample
+                of a `_SpilledBytesSampler`.
+        """
+        self._spilled_bytes_sampler: Optional[_SpilledBytesSampler] = None
+        if get_bytes_spilled is None:
+            self._spilled_bytes_sampler = _SpilledBytesSampler(self.UPDATE_INTERVAL_S)
+            get_bytes_spilled = self._spilled_bytes_sampler.get
+        self._get_bytes_spilled = get_bytes_spilled
+        self._min_target = DataContext.get_current().target_min_block_size
+        self._initial_targets: Dict["PhysicalOperator", int] = {}
+        self._last_snapshots: Dict["PhysicalOperator", _OutputSnapshot] = {}
+        for op in topology:
+            if not isinstance(op, MapOperator):
+                continue
+            self._initial_targets[op] = op.actual_target_max_block_size
+            self._last_snapshots[op] = _OutputSnapshot.of(op)
+        self._last_bytes_spilled = self._get_bytes_spilled()
+        self._last_update_time = time.time()
+
+    def shutdown(self) -> None:
+        if self._spilled_bytes_sampler is not None:
+            self._spilled_bytes_sampler.stop()
+
+    def on_usages_updated(self, resource_manager: "ResourceManager") -> None:
+        now = time.time()
+        if now - self._last_update_time < self.UPDATE_INTERVAL_S:
+            return
+        self._last_update_time = now
+
+        limit = resource_manager.get_global_limits().object_store_memory
+        pressure = 0.0
+        if limit:
+            pressure = resource_manager.get_global_usage().object_store_memory / limit
+        bytes_spilled = self._get_bytes_spilled()
+        spilled = (
+            bytes_spilled is not None
+            and self._last_bytes_spilled is not None
+            and bytes_spilled > self._last_bytes_spilled
+        )
+        self._last_bytes_spilled = bytes_spilled
+
+        for op, initial_target in self._initial_targets.items():
+            snapshot = _OutputSnapshot.of(op)
+            last_snapshot = self._last_snapshots[op]
+            num_blocks = snapshot.num_blocks - last_snapshot.num_blocks
+            if num_blocks < self.MIN_BLOCKS_PER_UPDATE:
+                continue
+            self._last_snapshots[op] = snapshot
+
+            target = op.actual_target_max_block_size
+            block_size = (snapshot.num_bytes - last_snapshot.num_bytes) / num_blocks
+            if block_size < target * self.FULL_BLOCK_FRACTION:
+                continue
+            block_generation_time_s = (
+                snapshot.block_generation_time_s - last_snapshot.block_generation_time_s
+            ) / num_blocks
+
+            new_target: Optional[int] = None
+            if spilled or pressure >= self.HIGH_PRESSURE_THRESHOLD:
+                new_target = max(self._min_target, int(target * self.DECREASE_FACTOR))
+            elif (
+                pressure < self.LOW_PRESSURE_THRESHOLD
+                and block_generation_time_s < self.MIN_BLOCK_GENERATION_TIME_S
+            ):
+                new_target = min(
+                    initial_target * self.MAX_TARGET_FACTOR,
+                    int(target * self.INCREASE_FACTOR),
+                )
+
+            if new_target is not None and new_target != target:
+                logger.debug(
+                    f"Updated the target max block size of {op.name} from {target} "
+                    f"to {new_target} bytes, object store usage: {pressure:.0%}, "
+                    f"spilled: {spilled}, average block size: {block_size:.0f} "
+                    f"bytes, average block generation time: "
+                    f"{block_generation_time_s:.3f}s."
+                )
+                # Report the update before applying it, so that the metrics can
+                # compare it with the current target.
+                op.metrics.on_target_max_block_size_updated(new_target)
+                op.set_target_max_block_size(new_target)
+
+
+class _SpilledBytesSampler:
+    """Samples the bytes spilled by the object stores of the cluster in a
+    background thread.
+
+    Getting the memory info of the cluster is an RPC that fans out to every node, so
+    it isn't done on the scheduling thread of the executor. The connection to the
+    GCS is reused between samples.
+    """
+
+    def __init__(self, interval_s: float):
+        self._interval_s = interval_s
+        self._bytes_spilled: Optional[int] = None
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="SpilledBytesSampler", daemon=True
+        )
+        self._thread.start()
+
+    def get(self) -> Optional[int]:
+        """The bytes spilled at the latest sample, or None if unknown."""
+        return self._bytes_spilled
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _run(self) -> None:
+        state = None
+        while not self._stopped.is_set():
+            try:
+                if state is None:
+                    state = get_state_from_address(
+                        ray.get_runtime_context().gcs_address
+                    )
+                reply = get_memory_info_reply(state)
+                self._bytes_spilled = int(reply.store_stats.spilled_bytes_total)
+            except Exception as e:
+                logger.debug(f"Failed to get the spilled bytes: {e}")
+                self._bytes_spilled = None
+            self._stopped.wait(self._interval_s)
+        if state is not None:
+            state.disconnect()
@@ -304,6 +304,14 @@ class OpRuntimeMetrics(metaclass=OpRuntimesMetricsMeta):
         metrics_group=MetricsGroup.OBJECT_STORE_MEMORY,
         map_only=True,
     )
+    obj_store_mem_shuffle_buffer: int = metric_field(
+        default=0,
+        description=(
+            "Byte size of shuffled blocks buffered by the operator for its reduce "
+            "tasks."
+        ),
+        metrics_group=MetricsGroup.OBJECT_STORE_MEMORY,
+    )
     obj_store_mem_used: int = metric_field(
         default=0,
         description="Byte size of used memory in object store.",
@@ -312,6 +320,34 @@ class OpRuntimeMetrics(metaclass=OpRuntimesMetricsMeta):
 
     # === Miscellaneous metrics ===
     # Use "metrics_group: "misc" in the metadata for new metrics in this section.
+    concurrency_cap: int = metric_field(
+        default=0,
+        description=(
+            "Max number of concurrently running tasks set by adaptive backpressure, "
+            "or 0 if not capped."
+        ),
+        metrics_group=MetricsGroup.MISC,
+    )
+    num_concurrency_cap_decreases: int = metric_field(
+        default=0,
+        description="Number of times adaptive backpressure decreased the cap.",
+        metrics_group=MetricsGroup.MISC,
+    )
+    autotuned_target_max_block_size: int = metric_field(
+        default=0,
+        description=(
+            "Target max block size set by block size autotuning, or 0 if not "
+            "adjusted."
+        ),
+        metrics_group=MetricsGroup.MISC,
+        map_only=True,
+    )
+    num_target_max_block_size_decreases: int = metric_field(
+        default=0,
+        description="Number of times block size autotuning decreased the target.",
+        metrics_group=MetricsGroup.MISC,
+        map_only=True,
+    )
 
     def __init__(self, op: "PhysicalOperator"):
         from ray.data._internal.execution.operators.map_operator import MapOperator
@@ -483,6 +519,19 @@ class OpRuntimeMetrics(metaclass=OpRuntimesMetricsMeta):
             output_size,
         )
 
+    def on_shuffle_blocks_buffered(self, size_bytes: int):
+        """Callback when the operator buffers shuffled blocks for its reduce tasks."""
+        self.obj_store_mem_shuffle_buffer += size_bytes
+
+    def on_shuffle_blocks_released(self, size_bytes: int):
+        """Callback when buffered shuffled blocks are passed to reduce tasks."""
+        self.obj_store_mem_shuffle_buffer -= size_bytes
+        assert self.obj_store_mem_shuffle_buffer >= 0, (
+            self._op,
+            self.obj_store_mem_shuffle_buffer,
+            size_bytes,
+        )
+
     def on_toggle_task_submission_backpressure(self, in_backpressure):
         if in_backpressure and self._task_submission_backpressure_start_time == -1:
             # backpressure starting, start timer
@@ -494,6 +543,19 @@ class OpRuntimeMetrics(metaclass=OpRuntimesMetricsMeta):
             )
             self._task_submission_backpressure_start_time = -1
 
+    def on_concurrency_cap_updated(self, cap: Optional[int]):
+        """Callback when adaptive backpressure updates the concurrency cap."""
+        cap = cap or 0
+        if cap and (not self.concurrency_cap or cap < self.concurrency_cap):
+            self.num_concurrency_cap_decreases += 1
+        self.concurrency_cap = cap
+
+    def on_target_max_block_size_updated(self, target_max_block_size: int):
+        """Callback when block size autotuning updates the target max block size."""
+        if target_max_block_size < self._op.actual_target_max_block_size:
+            self.num_target_max_block_size_decreases += 1
+        self.autotuned_target_max_block_size = target_max_block_size
+
     def on_output_taken(self, output: RefBundle):
         """Callback when an output is taken from the operator."""
         self.num_outputs_taken += 1
@@ -0,0 +1,156 @@
+import collections
+import functools
+import logging
+from typing import Deque, Dict, List, Optional
+
+import ray
+from ray.data._internal.block_cache import BlockCache, _CacheEntry, _read_spilled_block
+from ray.data._internal.execution.interfaces import (
+    ExecutionOptions,
+    PhysicalOperator,
+    RefBundle,
+)
+from ray.data._internal.execution.interfaces.physical_operator import (
+    MetadataOpTask,
+    OpTask,
+)
+from ray.data._internal.execution.operators.base_physical_operator import (
+    OneToOneOperator,
+)
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.stats import StatsDict
+from ray.data.block import BlockMetadata
+from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
+
+logger = logging.getLogger(__name__)
+
+
+class CacheOperator(OneToOneOperator):
+    """Physical operator for `Dataset.cache()`.
+
+    If `read_from_cache` is False, the operator passes its inputs through and writes
+    them to the cache. Otherwise, its input is an `InputDataBuffer` of the bundles
+    returned by `BlockCache.get_bundles`. The blocks in the object store are output
+    as is, and the spilled blocks are read by tasks on the nodes that spilled them.
+    Outputs keep the order of the inputs.
+    """
+
+    def __init__(
+        self,
+        input_op: PhysicalOperator,
+        cache: BlockCache,
+        read_from_cache: bool,
+    ):
+        self._cache = cache
+        self._read_from_cache = read_from_cache
+        # Output bundles in the order of the inputs. The bundles of spilled blocks
+        # are None until they are read.
+        self._outputs: Deque[List[Optional[RefBundle]]] = collections.deque()
+        self._read_tasks: Dict[int, MetadataOpTask] = {}
+        self._next_task_index = 0
+        self._output_metadata: List[BlockMetadata] = []
+        super().__init__("Cache", input_op, target_max_block_size=None)
+
+    def start(self, options: ExecutionOptions) -> None:
+        if not self._read_from_cache:
+            self._cache.start_write()
+        super().start(options)
+
+    def _add_input_inner(self, refs: RefBundle, input_index: int) -> None:
+        assert input_index == 0, input_index
+        if not self._read_from_cache:
+            self._cache.add(refs)
+            # The cache keeps the blocks, so the downstream operators must not free
+            # them.
+            self._add_output(RefBundle(refs.blocks, owns_blocks=False))
+            return
+
+        for ref, metadata in refs.blocks:
+            entry = self._cache.get_entry(ref)
+            if entry.block_ref is not None:
+                self._add_output(
+                    RefBundle([(entry.block_ref, metadata)], owns_blocks=False)
+                )
+            else:
+                self._submit_read_task(entry)
+
+    def _add_output(self, bundle: RefBundle) -> None:
+        self._outputs.append([bundle])
+        self._output_metadata.extend(bundle.metadata)
+        self._metrics.on_output_queued(bundle)
+
+    def _submit_read_task(self, entry: _CacheEntry) -> None:
+        task_index = self._next_task_index
+        self._next_task_index += 1
+        input_bundle = RefBundle([(entry.spill_ref, entry.metadata)], owns_blocks=False)
+        self._metrics.on_task_submitted(task_index, input_bundle)
+        output: List[Optional[RefBundle]] = [None]
+        self._outputs.append(output)
+
+        def _task_done_callback(block_ref, metadata_ref):
+            self._read_tasks.pop(task_index)
+            try:
+                metadata = ray.get(metadata_ref)
+            except Exception as e:
+                self._on_read_failed(e)
+            bundle = RefBundle([(block_ref, metadata)], owns_blocks=True)
+            output[0] = bundle
+            self._output_metadata.append(metadata)
+            self._metrics.on_task_output_generated(task_index, bundle)
+            self._metrics.on_task_finished(task_index, None)
+            self._metrics.on_output_queued(bundle)
+
+        def _location_ready_callback():
+            # The spill task is done, so getting its result doesn't block.
+            try:
+                node_id, path = ray.get(entry.spill_ref)
+            except Exception as e:
+                self._on_read_failed(e)
+            read_fn = cached_remote_fn(_read_spilled_block, num_cpus=0, num_returns=2)
+            block_ref, metadata_ref = read_fn.options(
+                scheduling_strategy=NodeAffinitySchedulingStrategy(node_id, soft=False)
+            ).remote(path)
+            self._read_tasks[task_index] = MetadataOpTask(
+                task_index,
+                metadata_ref,
+                functools.partial(_task_done_callback, block_ref, metadata_ref),
+            )
+
+        # The read task is submitted on the node of the spilled block once its
+        # location is known, without blocking the scheduling loop on the spill task.
+        self._read_tasks[task_index] = MetadataOpTask(
+            task_index, entry.spill_ref, _location_ready_callback
+        )
+
+    def _on_read_failed(self, error: Exception) -> None:
+        self._cache.clear()
+        raise RuntimeError(
+            "Failed to read a spilled block of the dataset cache. The cache has been "
+            "cleared, and the next execution will recompute the dataset."
+        ) from error
+
+    def all_inputs_done(self) -> None:
+        super().all_inputs_done()
+        if not self._read_from_cache:
+            self._cache.finish_write()
+
+    def has_next(self) -> bool:
+        return len(self._outputs) > 0 and self._outputs[0][0] is not None
+
+    def _get_next_inner(self) -> RefBundle:
+        bundle = self._outputs.popleft()[0]
+        self._metrics.on_output_dequeued(bundle)
+        return bundle
+
+    def get_active_tasks(self) -> List[OpTask]:
+        return list(self._read_tasks.values())
+
+    def get_stats(self) -> StatsDict:
+        return {self._name: self._output_metadata}
+
+    def throttling_disabled(self) -> bool:
+        # Writes don't launch tasks.
+        return not self._read_from_cache
+
+    def implements_accurate_memory_accounting(self) -> bool:
+        return True
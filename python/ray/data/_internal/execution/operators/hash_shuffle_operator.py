@@ -0,0 +1,275 @@
+import collections
+import functools
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union
+
+import ray
+from ray.data._internal.execution.interfaces import (
+    ExecutionResources,
+    PhysicalOperator,
+    RefBundle,
+)
+from ray.data._internal.execution.interfaces.physical_operator import (
+    DataOpTask,
+    MetadataOpTask,
+    OpTask,
+)
+from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.stats import StatsDict
+from ray.data.block import Block, BlockAccessor, BlockMetadata
+
+
+class HashShuffleOperator(PhysicalOperator):
+    """A streaming shuffle operator.
+
+    Unlike `AllToAllOperator`, this operator doesn't wait for all of its inputs
+    before it starts shuffling. It works in 3 steps:
+
+    * Map: as soon as an input block arrives, a map task splits it into
+      `num_partitions` partitions with `ExchangeTaskSpec.map`. The partitions must
+      not depend on other blocks, e.g. they are based on the hash of the key
+      columns.
+    * Merge: once `MERGE_FACTOR` map outputs of a partition are buffered, a merge
+      task combines them with a partial `ExchangeTaskSpec.reduce`. This bounds the
+      number of buffered objects, and overlaps reduce work with the upstream
+      operators.
+    * Reduce: once all map tasks have finished, a reduce task per partition combines
+      the remaining map and merge outputs with `ExchangeTaskSpec.reduce`.
+
+    Map tasks are submitted when the executor adds inputs, so they are throttled by
+    the `ResourceManager` like the tasks of other operators. Buffered partitions
+    can't be released before all inputs are shuffled, so they are reported
+    separately, as `obj_store_mem_shuffle_buffer`, instead of counting towards the
+    operator's budget. Ray spills them to disk if they don't fit in the object
+    store.
+    """
+
+    # The number of buffered map outputs of a partition that triggers a merge task.
+    MERGE_FACTOR = 8
+
+    def __init__(
+        self,
+        input_op: PhysicalOperator,
+        exchange_spec: ExchangeTaskSpec,
+        num_partitions: int,
+        name: str = "HashShuffle",
+        target_max_block_size: Optional[int] = None,
+        ray_remote_args: Optional[Dict[str, Any]] = None,
+    ):
+        """Create a HashShuffleOperator.
+
+        Args:
+            input_op: Operator generating input data for this op.
+            exchange_spec: The map and reduce functions of the shuffle.
+            num_partitions: The number of partitions, which is also the number of
+                output blocks.
+            name: The name of this operator.
+            target_max_block_size: The target maximum number of bytes to
+                include in an output block.
+            ray_remote_args: Customize the ray remote args of the shuffle tasks.
+        """
+        assert num_partitions >= 1, num_partitions
+        self._exchange_spec = exchange_spec
+        self._num_partitions = num_partitions
+        self._ray_remote_args = {"num_cpus": 1, **(ray_remote_args or {})}
+        # Map and merge outputs of each partition that haven't been passed to a
+        # merge or reduce task.
+        self._unmerged_blocks: List[List[ray.ObjectRef]] = [
+            [] for _ in range(num_partitions)
+        ]
+        self._merged_blocks: List[List[ray.ObjectRef]] = [
+            [] for _ in range(num_partitions)
+        ]
+        # The bytes of each partition in `obj_store_mem_shuffle_buffer`.
+        self._buffered_bytes: List[int] = [0] * num_partitions
+        self._num_map_tasks_submitted = 0
+        self._map_tasks: Dict[int, MetadataOpTask] = {}
+        self._merge_tasks: Dict[int, MetadataOpTask] = {}
+        self._reduce_tasks: Dict[int, DataOpTask] = {}
+        self._reduce_tasks_submitted = False
+        self._next_task_idx = 0
+        self._output_queue: Deque[RefBundle] = collections.deque()
+        self._map_metadata: List[BlockMetadata] = []
+        self._output_metadata: List[BlockMetadata] = []
+        super().__init__(name, [input_op], target_max_block_size)
+
+    def num_outputs_total(self) -> int:
+        return self._num_partitions
+
+    def _add_input_inner(self, refs: RefBundle, input_index: int) -> None:
+        assert input_index == 0, input_index
+        for block_ref, meta in refs.blocks:
+            self._submit_map_task(RefBundle([(block_ref, meta)], refs.owns_blocks))
+
+    def all_inputs_done(self) -> None:
+        super().all_inputs_done()
+        self._try_submit_reduce_tasks()
+
+    def _submit_map_task(self, bundle: RefBundle) -> None:
+        map_fn = cached_remote_fn(_shuffle_map)
+        refs = map_fn.options(
+            **self._ray_remote_args,
+            num_returns=self._num_partitions + 1,
+            name=f"{self.name}.map",
+        ).remote(
+            self._exchange_spec.map,
+            self._num_map_tasks_submitted,
+            bundle.block_refs[0],
+            self._num_partitions,
+            *self._exchange_spec._map_args,
+        )
+        self._num_map_tasks_submitted += 1
+        task_index = self._submit_task(bundle)
+        self._map_tasks[task_index] = MetadataOpTask(
+            task_index,
+            refs[-1],
+            functools.partial(
+                self._on_map_task_finished, task_index, refs[:-1], refs[-1]
+            ),
+        )
+
+    def _on_map_task_finished(
+        self,
+        task_index: int,
+        partition_refs: List[ray.ObjectRef],
+        meta_ref: ray.ObjectRef,
+    ) -> None:
+        meta, partition_sizes = ray.get(meta_ref)
+        self._map_metadata.append(meta)
+        self._map_tasks.pop(task_index)
+        self._metrics.on_shuffle_blocks_buffered(sum(partition_sizes))
+        self._metrics.on_task_finished(task_index, None)
+
+        for i, partition_ref in enumerate(partition_refs):
+            self._buffered_bytes[i] += partition_sizes[i]
+            self._unmerged_blocks[i].append(partition_ref)
+            if len(self._unmerged_blocks[i]) >= self.MERGE_FACTOR:
+                self._submit_merge_task(i)
+        self._try_submit_reduce_tasks()
+
+    def _submit_merge_task(self, partition: int) -> None:
+        blocks = self._unmerged_blocks[partition]
+        self._unmerged_blocks[partition] = []
+        merge_fn = cached_remote_fn(self._exchange_spec.reduce)
+        block_ref, meta_ref = merge_fn.options(
+            **self._ray_remote_args,
+            num_returns=2,
+            name=f"{self.name}.merge",
+        ).remote(*self._exchange_spec._reduce_args, *blocks, partial_reduce=True)
+        self._merged_blocks[partition].append(block_ref)
+
+        task_index = self._submit_task(RefBundle([], owns_blocks=False))
+
+        def _task_done_callback():
+            self._merge_tasks.pop(task_index)
+            self._metrics.on_task_finished(task_index, None)
+
+        self._merge_tasks[task_index] = MetadataOpTask(
+            task_index, meta_ref, _task_done_callback
+        )
+
+    def _try_submit_reduce_tasks(self) -> None:
+        if not self._inputs_complete or self._map_tasks or self._reduce_tasks_submitted:
+            return
+        self._reduce_tasks_submitted = True
+
+        reduce_fn = cached_remote_fn(_shuffle_reduce, num_returns="streaming")
+        for i in range(self._num_partitions):
+            blocks = self._merged_blocks[i] + self._unmerged_blocks[i]
+            self._merged_blocks[i] = []
+            self._unmerged_blocks[i] = []
+            if not blocks:
+                continue
+            gen = reduce_fn.options(
+                **self._ray_remote_args, name=f"{self.name}.reduce"
+            ).remote(
+                self._exchange_spec.reduce, self._exchange_spec._reduce_args, *blocks
+            )
+            self._submit_reduce_task(i, gen)
+
+    def _submit_reduce_task(self, partition: int, gen) -> None:
+        task_index = self._submit_task(RefBundle([], owns_blocks=False))
+
+        def _output_ready_callback(output: RefBundle):
+            self._metrics.on_task_output_generated(task_index, output)
+            self._metrics.on_output_queued(output)
+            self._output_metadata.extend(output.metadata)
+            self._output_queue.append(output)
+
+        def _task_done_callback(exception: Optional[Exception]):
+            self._reduce_tasks.pop(task_index)
+            self._metrics.on_task_finished(task_index, exception)
+            self._metrics.on_shuffle_blocks_released(self._buffered_bytes[partition])
+            self._buffered_bytes[partition] = 0
+
+        self._reduce_tasks[task_index] = DataOpTask(
+            task_index, gen, _output_ready_callback, _task_done_callback
+        )
+
+    def _submit_task(self, inputs: RefBundle) -> int:
+        task_index = self._next_task_idx
+        self._next_task_idx += 1
+        self._metrics.on_task_submitted(task_index, inputs)
+        return task_index
+
+    def has_next(self) -> bool:
+        return len(self._output_queue) > 0
+
+    def _get_next_inner(self) -> RefBundle:
+        bundle = self._output_queue.popleft()
+        self._metrics.on_output_dequeued(bundle)
+        return bundle
+
+    def get_active_tasks(self) -> List[OpTask]:
+        return [
+            *self._map_tasks.values(),
+            *self._merge_tasks.values(),
+            *self._reduce_tasks.values(),
+        ]
+
+    def shutdown(self) -> None:
+        for task in self.get_active_tasks():
+            ray.cancel(task.get_waitable())
+        super().shutdown()
+
+    def current_processor_usage(self) -> ExecutionResources:
+        num_active_tasks = self.num_active_tasks()
+        return ExecutionResources(
+            cpu=self._ray_remote_args.get("num_cpus", 0) * num_active_tasks,
+            gpu=self._ray_remote_args.get("num_gpus", 0) * num_active_tasks,
+        )
+
+    def incremental_resource_usage(self) -> ExecutionResources:
+        # A map task outputs about as many bytes as its input block.
+        return ExecutionResources(
+            cpu=self._ray_remote_args.get("num_cpus", 0),
+            gpu=self._ray_remote_args.get("num_gpus", 0),
+            object_store_memory=self._metrics.average_bytes_inputs_per_task or 0,
+        )
+
+    def implements_accurate_memory_accounting(self) -> bool:
+        return True
+
+    def get_stats(self) -> StatsDict:
+        return {
+            ExchangeTaskSpec.MAP_SUB_PROGRESS_BAR_NAME: self._map_metadata,
+            ExchangeTaskSpec.REDUCE_SUB_PROGRESS_BAR_NAME: self._output_metadata,
+        }
+
+
+def _shuffle_map(
+    map_fn: Callable[..., List[Union[Block, BlockMetadata]]], *map_args: Any
+) -> List[Union[Block, Tuple[BlockMetadata, List[int]]]]:
+    """Run `map_fn`, and return the size in bytes of each partition along with the
+    metadata of the input block."""
+    *partitions, meta = map_fn(*map_args)
+    partition_sizes = [BlockAccessor.for_block(p).size_bytes() for p in partitions]
+    return partitions + [(meta, partition_sizes)]
+
+
+def _shuffle_reduce(
+    reduce_fn: Callable[..., Any], reduce_args: List[Any], *mapper_outputs: Block
+) -> Iterator[Union[Block, BlockMetadata]]:
+    block, meta = reduce_fn(*reduce_args, *mapper_outputs)
+    yield block
+    yield meta
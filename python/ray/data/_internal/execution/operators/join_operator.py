@@ -0,0 +1,311 @@
+import collections
+import functools
+from typing import TYPE_CHECKING, Deque, Dict, Iterator, List, Optional, Union
+
+import ray
+from ray._raylet import ObjectRefGenerator
+from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
+from ray.data._internal.execution.interfaces import PhysicalOperator, RefBundle
+from ray.data._internal.execution.interfaces.physical_operator import DataOpTask, OpTask
+from ray.data._internal.planner.exchange.join_task_spec import (
+    BROADCAST_JOIN_TYPES,
+    JoinTaskSpec,
+    join_blocks,
+)
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.stats import StatsDict
+from ray.data._internal.util import unify_block_metadata_schema
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+from ray.data.context import DataContext
+
+if TYPE_CHECKING:
+    import pyarrow
+
+
+class JoinOperator(PhysicalOperator):
+    """An operator that joins its two inputs on key columns.
+
+    The join runs in one of two modes:
+
+    * Broadcast join: if the right input is small enough (see
+      ``DataContext.broadcast_join_threshold_bytes``) and the join type doesn't need
+      the unmatched rows of the right input, the right input is combined into a
+      single block, which is joined with every block of the left input. Left blocks
+      are joined as soon as they arrive, so the left input is streamed.
+    * Hash join: otherwise, once both inputs are complete, both inputs are hash
+      partitioned on their key columns and each pair of co-partitioned blocks is
+      joined, as described by ``JoinTaskSpec``.
+
+    If both inputs are already range-partitioned on their key columns with the same
+    ranges (e.g., both are sorted with the same boundaries), block ``i`` of the left
+    input is joined with block ``i`` of the right input, without a shuffle.
+    """
+
+    def __init__(
+        self,
+        left_input_op: PhysicalOperator,
+        right_input_op: PhysicalOperator,
+        join_spec: JoinTaskSpec,
+        num_partitions: Optional[int] = None,
+        broadcast: Optional[bool] = None,
+        co_partitioned: bool = False,
+    ):
+        """Create a JoinOperator.
+
+        Args:
+            left_input_op: The input operator at left hand side.
+            right_input_op: The input operator at right hand side.
+            join_spec: The join to perform.
+            num_partitions: The number of partitions for a hash join. If None, uses
+                the number of blocks of the larger input.
+            broadcast: Whether to broadcast the right input. If None, the right
+                input is broadcast if it's smaller than
+                ``DataContext.broadcast_join_threshold_bytes``, unless the inputs
+                are co-partitioned.
+            co_partitioned: Whether block ``i`` of both inputs holds the same range
+                of keys, for all ``i``. If so, ``num_partitions`` is ignored.
+        """
+        self._join_spec = join_spec
+        self._join_type = join_spec._reduce_args[0]
+        self._num_partitions = num_partitions
+        self._broadcast = broadcast
+        self._co_partitioned = co_partitioned
+        self._left_buffer: List[RefBundle] = []
+        self._right_buffer: List[RefBundle] = []
+        # The right input combined into a single block, once it's broadcast.
+        self._broadcast_block_ref: Optional[ray.ObjectRef] = None
+        self._output_buffer: Deque[RefBundle] = collections.deque()
+        self._data_tasks: Dict[int, DataOpTask] = {}
+        self._next_task_idx = 0
+        self._output_metadata: List[BlockMetadata] = []
+        super().__init__(
+            "Join", [left_input_op, right_input_op], target_max_block_size=None
+        )
+
+    def _add_input_inner(self, refs: RefBundle, input_index: int) -> None:
+        assert not self.completed()
+        assert input_index == 0 or input_index == 1, input_index
+        if input_index == 1:
+            self._right_buffer.append(refs)
+        elif self._broadcast_block_ref is not None:
+            self._submit_broadcast_join_task(refs)
+        else:
+            self._left_buffer.append(refs)
+
+    def input_done(self, input_index: int) -> None:
+        if input_index != 1 or not self._should_broadcast():
+            return
+        # Combine the right input into a single block once, instead of passing all
+        # of its blocks to every join task.
+        combine_blocks = cached_remote_fn(_combine_blocks)
+        self._broadcast_block_ref = combine_blocks.remote(
+            *[ref for bundle in self._right_buffer for ref in bundle.block_refs]
+        )
+        self._right_buffer.clear()
+        for bundle in self._left_buffer:
+            self._submit_broadcast_join_task(bundle)
+        self._left_buffer.clear()
+
+    def all_inputs_done(self) -> None:
+        if self._broadcast_block_ref is None:
+            self._submit_hash_join_tasks()
+        super().all_inputs_done()
+
+    def _should_broadcast(self) -> bool:
+        if self._broadcast is not None:
+            return self._broadcast
+        if self._join_type not in BROADCAST_JOIN_TYPES or self._co_partitioned:
+            return False
+        right_size_bytes = sum(bundle.size_bytes() for bundle in self._right_buffer)
+        threshold = DataContext.get_current().broadcast_join_threshold_bytes
+        return right_size_bytes <= threshold
+
+    def _submit_broadcast_join_task(self, bundle: RefBundle) -> None:
+        broadcast_join = cached_remote_fn(_broadcast_join, num_returns="streaming")
+        gen = broadcast_join.options(name=self.name).remote(
+            self._join_spec._reduce_args,
+            self._broadcast_block_ref,
+            *bundle.block_refs,
+        )
+        self._submit_data_task(gen, bundle)
+
+    def _submit_hash_join_tasks(self) -> None:
+        if self._co_partitioned and self._submit_co_partitioned_join_tasks():
+            return
+
+        left_blocks = [ref for b in self._left_buffer for ref in b.block_refs]
+        right_blocks = [ref for b in self._right_buffer for ref in b.block_refs]
+        self._left_buffer.clear()
+        self._right_buffer.clear()
+
+        num_partitions = self._num_partitions or max(
+            len(left_blocks), len(right_blocks), 1
+        )
+        if num_partitions == 1:
+            # All rows end up in the same partition, so there's nothing to shuffle.
+            left_partitions = [[block] for block in left_blocks]
+            right_partitions = [[block] for block in right_blocks]
+        else:
+            join_map = cached_remote_fn(self._join_spec.map)
+            left_partitions = [
+                join_map.options(num_returns=num_partitions + 1).remote(
+                    i, block, num_partitions, self._join_spec.left_key_columns
+                )[:-1]
+                for i, block in enumerate(left_blocks)
+            ]
+            right_partitions = [
+                join_map.options(num_returns=num_partitions + 1).remote(
+                    i, block, num_partitions, self._join_spec.right_key_columns
+                )[:-1]
+                for i, block in enumerate(right_blocks)
+            ]
+
+        join_reduce = cached_remote_fn(_hash_join_reduce, num_returns="streaming")
+        for j in range(num_partitions):
+            gen = join_reduce.options(name=self.name).remote(
+                self._join_spec._reduce_args,
+                len(left_partitions),
+                *[partitions[j] for partitions in left_partitions],
+                *[partitions[j] for partitions in right_partitions],
+            )
+            self._submit_data_task(gen, RefBundle([], owns_blocks=False))
+
+    def _submit_co_partitioned_join_tasks(self) -> bool:
+        """Join block ``i`` of the left input with block ``i`` of the right input.
+
+        Returns:
+            Whether the tasks were submitted. If not, e.g., if an input is empty and
+            has no blocks, the inputs must be shuffled.
+        """
+        left_blocks = [ref for b in self._left_buffer for ref in b.block_refs]
+        right_blocks = [ref for b in self._right_buffer for ref in b.block_refs]
+        left_schema = _get_arrow_schema(self._left_buffer)
+        right_schema = _get_arrow_schema(self._right_buffer)
+        if (
+            len(left_blocks) != len(right_blocks)
+            or left_schema is None
+            or right_schema is None
+        ):
+            return False
+        self._left_buffer.clear()
+        self._right_buffer.clear()
+
+        join_reduce = cached_remote_fn(
+            _co_partitioned_join_reduce, num_returns="streaming"
+        )
+        for left_block, right_block in zip(left_blocks, right_blocks):
+            gen = join_reduce.options(name=self.name).remote(
+                self._join_spec._reduce_args,
+                left_schema,
+                right_schema,
+                left_block,
+                right_block,
+            )
+            self._submit_data_task(gen, RefBundle([], owns_blocks=False))
+        return True
+
+    def _submit_data_task(self, gen: ObjectRefGenerator, inputs: RefBundle) -> None:
+        task_index = self._next_task_idx
+        self._next_task_idx += 1
+        self._metrics.on_task_submitted(task_index, inputs)
+
+        def _output_ready_callback(task_index: int, output: RefBundle):
+            self._metrics.on_task_output_generated(task_index, output)
+            self._output_metadata.extend(output.metadata)
+            self._output_buffer.append(output)
+
+        def _task_done_callback(task_index: int, exception: Optional[Exception]):
+            self._metrics.on_task_finished(task_index, exception)
+            self._data_tasks.pop(task_index)
+
+        self._data_tasks[task_index] = DataOpTask(
+            task_index,
+            gen,
+            functools.partial(_output_ready_callback, task_index),
+            functools.partial(_task_done_callback, task_index),
+        )
+
+    def has_next(self) -> bool:
+        return len(self._output_buffer) > 0
+
+    def _get_next_inner(self) -> RefBundle:
+        return self._output_buffer.popleft()
+
+    def get_active_tasks(self) -> List[OpTask]:
+        return list(self._data_tasks.values())
+
+    def shutdown(self) -> None:
+        for task in self._data_tasks.values():
+            ray.cancel(task.get_waitable())
+        super().shutdown()
+
+    def get_stats(self) -> StatsDict:
+        return {self._name: self._output_metadata}
+
+
+def _combine_blocks(*blocks: Block) -> Optional[Block]:
+    # An empty input has no schema, so it's represented as None.
+    if not blocks:
+        return None
+    builder = DelegatingBlockBuilder()
+    for block in blocks:
+        builder.add_block(block)
+    return builder.build()
+
+
+def _broadcast_join(
+    reduce_args: List, broadcast_block: Optional[Block], *blocks: Block
+) -> Iterator[Union[Block, BlockMetadata]]:
+    """Join `blocks` of the left input with the broadcast right input."""
+    stats = BlockExecStats.builder()
+    result = join_blocks(
+        list(blocks),
+        [broadcast_block] if broadcast_block is not None else [],
+        *reduce_args,
+    )
+    yield result
+    yield BlockAccessor.for_block(result).get_metadata(exec_stats=stats.build())
+
+
+def _hash_join_reduce(
+    reduce_args: List, num_left_blocks: int, *mapper_outputs: Block
+) -> Iterator[Union[Block, BlockMetadata]]:
+    result, meta = JoinTaskSpec.reduce(*reduce_args, num_left_blocks, *mapper_outputs)
+    yield result
+    yield meta
+
+
+def _co_partitioned_join_reduce(
+    reduce_args: List,
+    left_schema: "pyarrow.Schema",
+    right_schema: "pyarrow.Schema",
+    left_block: Block,
+    right_block: Block,
+) -> Iterator[Union[Block, BlockMetadata]]:
+    """Join a left block with the right block that holds the same range of keys."""
+    stats = BlockExecStats.builder()
+    result = join_blocks(
+        [_with_schema(left_block, left_schema)],
+        [_with_schema(right_block, right_schema)],
+        *reduce_args,
+    )
+    yield result
+    yield BlockAccessor.for_block(result).get_metadata(exec_stats=stats.build())
+
+
+def _with_schema(block: Block, schema: "pyarrow.Schema") -> Block:
+    # Empty range partitions don't have a schema.
+    if BlockAccessor.for_block(block).num_rows() == 0:
+        return schema.empty_table()
+    return block
+
+
+def _get_arrow_schema(bundles: List[RefBundle]) -> Optional["pyarrow.Schema"]:
+    """The unified Arrow schema of the blocks, or None if it's unknown or the blocks
+    aren't Arrow blocks."""
+    import pyarrow
+
+    schema = unify_block_metadata_schema(
+        [meta for bundle in bundles for meta in bundle.metadata]
+    )
+    return schema if isinstance(schema, pyarrow.Schema) else None
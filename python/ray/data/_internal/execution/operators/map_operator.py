@@ -58,6 +58,7 @@ class MapOperator(OneToOneOperator, ABC):
         supports_fusion: bool,
         ray_remote_args_fn: Optional[Callable[[], Dict[str, Any]]],
         ray_remote_args: Optional[Dict[str, Any]],
+        min_bytes_per_bundle: Optional[int] = None,
     ):
         # NOTE: This constructor should not be called directly; use MapOperator.create()
         # instead.
@@ -70,8 +71,11 @@ class MapOperator(OneToOneOperator, ABC):
         self._ray_remote_args_factory_actor_locality = None
         self._remote_args_for_metrics = copy.deepcopy(self._ray_remote_args)
 
-        # Bundles block references up to the min_rows_per_bundle target.
-        self._block_ref_bundler = _BlockRefBundler(min_rows_per_bundle)
+        # Bundles block references up to the min_rows_per_bundle and
+        # min_bytes_per_bundle targets.
+        self._block_ref_bundler = _BlockRefBundler(
+            min_rows_per_bundle, min_bytes_per_bundle
+        )
 
         # Queue for task outputs, either ordered or unordered (this is set by start()).
         self._output_queue: _OutputQueue = None
@@ -121,6 +125,7 @@ class MapOperator(OneToOneOperator, ABC):
         supports_fusion: bool = True,
         ray_remote_args_fn: Optional[Callable[[], Dict[str, Any]]] = None,
         ray_remote_args: Optional[Dict[str, Any]] = None,
+        min_bytes_per_bundle: Optional[int] = None,
     ) -> "MapOperator":
         """Create a MapOperator.
 
@@ -149,6 +154,10 @@ class MapOperator(OneToOneOperator, ABC):
                 always override the args in ``ray_remote_args``. Note: this is an
                 advanced, experimental feature.
             ray_remote_args: Customize the ray remote args for this op's tasks.
+            min_bytes_per_bundle: The number of bytes to gather per batch passed to
+                the transform_fn, or None to not consider the number of bytes. If
+                both this and ``min_rows_per_bundle`` are set, a bundle is passed once
+                it reaches both targets.
         """
         if compute_strategy is None:
             compute_strategy = TaskPoolStrategy()
@@ -168,6 +177,7 @@ class MapOperator(OneToOneOperator, ABC):
                 supports_fusion=supports_fusion,
                 ray_remote_args_fn=ray_remote_args_fn,
                 ray_remote_args=ray_remote_args,
+                min_bytes_per_bundle=min_bytes_per_bundle,
             )
         elif isinstance(compute_strategy, ActorPoolStrategy):
             from ray.data._internal.execution.operators.actor_pool_map_operator import (
@@ -184,6 +194,7 @@ class MapOperator(OneToOneOperator, ABC):
                 supports_fusion=supports_fusion,
                 ray_remote_args_fn=ray_remote_args_fn,
                 ray_remote_args=ray_remote_args,
+                min_bytes_per_bundle=min_bytes_per_bundle,
             )
         else:
             raise ValueError(f"Unsupported execution strategy {compute_strategy}")
@@ -473,61 +484,90 @@ def _map_task(
 
 
 class _BlockRefBundler:
-    """Rebundles RefBundles to get them close to a particular number of rows."""
+    """Rebundles RefBundles to get them close to a particular number of rows and
+    bytes."""
 
-    def __init__(self, min_rows_per_bundle: Optional[int]):
+    def __init__(
+        self,
+        min_rows_per_bundle: Optional[int],
+        min_bytes_per_bundle: Optional[int] = None,
+    ):
         """Creates a BlockRefBundler.
 
         Args:
             min_rows_per_bundle: The target number of rows per bundle. Note that we
                 bundle up to this target, but only exceed it if not doing so would
                 result in an empty bundle.
+            min_bytes_per_bundle: The target number of bytes per bundle. Bundles
+                must reach both targets, and are bundled up to both of them.
         """
         self._min_rows_per_bundle = min_rows_per_bundle
+        self._min_bytes_per_bundle = min_bytes_per_bundle
         self._bundle_buffer: List[RefBundle] = []
         self._bundle_buffer_size = 0
+        self._bundle_buffer_size_bytes = 0
         self._finalized = False
 
     def add_bundle(self, bundle: RefBundle):
         """Add a bundle to the bundler."""
         self._bundle_buffer.append(bundle)
         self._bundle_buffer_size += self._get_bundle_size(bundle)
+        self._bundle_buffer_size_bytes += bundle.size_bytes()
 
     def has_bundle(self) -> bool:
         """Returns whether the bundler has a bundle."""
         return self._bundle_buffer and (
-            self._min_rows_per_bundle is None
-            or self._bundle_buffer_size >= self._min_rows_per_bundle
+            (
+                (
+                    self._min_rows_per_bundle is None
+                    or self._bundle_buffer_size >= self._min_rows_per_bundle
+                )
+                and (
+                    self._min_bytes_per_bundle is None
+                    or self._bundle_buffer_size_bytes >= self._min_bytes_per_bundle
+                )
+            )
             or (self._finalized and self._bundle_buffer_size > 0)
         )
 
     def get_next_bundle(self) -> RefBundle:
         """Gets the next bundle."""
         assert self.has_bundle()
-        if self._min_rows_per_bundle is None:
-            # Short-circuit if no bundle row target was defined.
+        if self._min_rows_per_bundle is None and self._min_bytes_per_bundle is None:
+            # Short-circuit if no bundle target was defined.
             assert len(self._bundle_buffer) == 1
             bundle = self._bundle_buffer[0]
             self._bundle_buffer = []
             self._bundle_buffer_size = 0
+            self._bundle_buffer_size_bytes = 0
             return bundle
         leftover = []
         output_buffer = []
         output_buffer_size = 0
+        output_buffer_size_bytes = 0
         buffer_filled = False
         for bundle in self._bundle_buffer:
             bundle_size = self._get_bundle_size(bundle)
+            bundle_size_bytes = bundle.size_bytes()
             if buffer_filled:
                 # Buffer has been filled, save it in the leftovers.
                 leftover.append(bundle)
-            elif (
-                output_buffer_size + bundle_size <= self._min_rows_per_bundle
-                or output_buffer_size == 0
+            elif output_buffer_size == 0 or (
+                (
+                    self._min_rows_per_bundle is None
+                    or output_buffer_size + bundle_size <= self._min_rows_per_bundle
+                )
+                and (
+                    self._min_bytes_per_bundle is None
+                    or output_buffer_size_bytes + bundle_size_bytes
+                    <= self._min_bytes_per_bundle
+                )
             ):
                 # Bundle fits in buffer, or bundle doesn't fit but the buffer still
                 # needs a non-empty bundle.
                 output_buffer.append(bundle)
                 output_buffer_size += bundle_size
+                output_buffer_size_bytes += bundle_size_bytes
             else:
                 # Bundle doesn't fit in a buffer that already has at least one non-empty
                 # bundle, so we add it to the leftovers.
@@ -538,6 +578,7 @@ class _BlockRefBundler:
         self._bundle_buffer_size = sum(
             self._get_bundle_size(bundle) for bundle in leftover
         )
+        self._bundle_buffer_size_bytes = sum(bundle.size_bytes() for bundle in leftover)
         return _merge_ref_bundles(*output_buffer)
 
     def done_adding_bundles(self):
@@ -175,7 +175,9 @@ class MapTransformer:
             self_init_fn()
             other_init_fn()
 
-        fused_transform_fns = self._transform_fns + other._transform_fns
+        fused_transform_fns = _fuse_transform_fns(
+            self._transform_fns, other._transform_fns
+        )
         transformer = MapTransformer(fused_transform_fns, init_fn=fused_init_fn)
         transformer.set_target_max_block_size(target_max_block_size)
         return transformer
@@ -184,6 +186,26 @@ class MapTransformer:
         return self._udf_time
 
 
+def _fuse_transform_fns(
+    upstream: List[MapTransformFn], downstream: List[MapTransformFn]
+) -> List[MapTransformFn]:
+    # If the upstream transform ends with an Arrow batch transform and the downstream
+    # one starts with another, pass the Arrow tables directly instead of building
+    # blocks from them and converting the blocks back into tables.
+    if (
+        len(upstream) >= 2
+        and isinstance(upstream[-2], ArrowBatchMapTransformFn)
+        and isinstance(upstream[-1], BuildOutputBlocksMapTransformFn)
+        and len(downstream) >= 2
+        and isinstance(downstream[0], BlocksToBatchesMapTransformFn)
+        and downstream[0].batch_size is None
+        and downstream[0].batch_format == "pyarrow"
+        and isinstance(downstream[1], ArrowBatchMapTransformFn)
+    ):
+        return upstream[:-1] + downstream[1:]
+    return upstream + downstream
+
+
 def create_map_transformer_from_block_fn(
     block_fn: MapTransformCallable[Block, Block],
     init_fn: Optional[Callable[[], None]] = None,
@@ -239,6 +261,20 @@ class BatchMapTransformFn(MapTransformFn):
         return f"BatchMapTransformFn({self._batch_fn})"
 
 
+class ArrowBatchMapTransformFn(BatchMapTransformFn):
+    """A batch-to-batch MapTransformFn that maps Arrow tables to Arrow tables.
+
+    This is used for transforms evaluated with Arrow compute, such as expression
+    filters. The input batches must be Arrow tables, i.e., the transform must follow
+    a `BlocksToBatchesMapTransformFn` with the "pyarrow" batch format or another
+    `ArrowBatchMapTransformFn`. When `MapTransformer`s are fused, adjacent
+    transforms of this type are chained without building blocks in between.
+    """
+
+    def __repr__(self) -> str:
+        return f"ArrowBatchMapTransformFn({self._batch_fn})"
+
+
 class BlockMapTransformFn(MapTransformFn):
     """A block-to-block MapTransformFn."""
 
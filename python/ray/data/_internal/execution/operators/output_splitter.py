@@ -1,4 +1,5 @@
 import math
+import threading
 import time
 from collections import deque
 from typing import Any, Dict, List, Optional, Tuple
@@ -22,7 +23,10 @@ class OutputSplitter(PhysicalOperator):
     The output bundles of this operator will have a `bundle.output_split_idx` attr
     set to an integer from [0..n-1]. This operator tries to divide the rows evenly
     across output splits. If the `equal` option is set, the operator will furthermore
-    guarantee an exact split of rows across outputs, truncating the Dataset.
+    guarantee an exact split of rows across outputs, truncating the Dataset. If the
+    `work_stealing` option is set instead, a consumer that has nothing queued for its
+    output split can take bundles queued for other splits, so that a slow consumer
+    doesn't bound the throughput of the others.
 
     Implementation wise, this operator keeps an internal buffer of bundles. The buffer
     has a minimum size calculated to enable a good locality hit rate, as well as ensure
@@ -37,11 +41,16 @@ class OutputSplitter(PhysicalOperator):
         n: int,
         equal: bool,
         locality_hints: Optional[List[NodeIdStr]] = None,
+        work_stealing: bool = False,
     ):
-        super().__init__(
-            f"split({n}, equal={equal})", [input_op], target_max_block_size=None
-        )
+        if equal and work_stealing:
+            raise ValueError("Work stealing is not supported with `equal=True`.")
+        name = f"split({n}, equal={equal})"
+        if work_stealing:
+            name = f"split({n}, work_stealing=True)"
+        super().__init__(name, [input_op], target_max_block_size=None)
         self._equal = equal
+        self.work_stealing = work_stealing
         # Buffer of bundles not yet assigned to output splits.
         self._buffer: List[RefBundle] = []
         # The outputted bundles with output_split attribute set.
@@ -50,6 +59,12 @@ class OutputSplitter(PhysicalOperator):
         self._num_output: List[int] = [0 for _ in range(n)]
         # The time of the overhead for the output splitter (operator level)
         self._output_splitter_overhead_time = 0
+        # The number of rows consumed by each consumer, and the number of bundles
+        # they stole from other output splits. Updated from the consumer threads.
+        self._num_consumed: List[int] = [0 for _ in range(n)]
+        self._num_stolen: List[int] = [0 for _ in range(n)]
+        self._consumer_stats_lock = threading.Lock()
+        self._start_time: Optional[float] = None
 
         if locality_hints is not None:
             if n != len(locality_hints):
@@ -80,6 +95,7 @@ class OutputSplitter(PhysicalOperator):
 
     def start(self, options: ExecutionOptions) -> None:
         super().start(options)
+        self._start_time = time.perf_counter()
         # Force disable locality optimization.
         if not options.actor_locality_enabled:
             self._locality_hints = None
@@ -110,8 +126,31 @@ class OutputSplitter(PhysicalOperator):
         for i, num in enumerate(self._num_output):
             stats[f"num_output_{i}"] = num
         stats["output_splitter_overhead_time"] = self._output_splitter_overhead_time
+        elapsed = 0
+        if self._start_time is not None:
+            elapsed = time.perf_counter() - self._start_time
+        with self._consumer_stats_lock:
+            for i, num in enumerate(self._num_consumed):
+                stats[f"num_consumed_{i}"] = num
+                stats[f"consumer_throughput_rows_per_s_{i}"] = (
+                    num / elapsed if elapsed > 0 else 0
+                )
+                if self.work_stealing:
+                    stats[f"num_stolen_{i}"] = self._num_stolen[i]
         return stats
 
+    def on_output_consumed(self, bundle: RefBundle, stolen_from: Optional[int]):
+        """Called from a consumer thread when it takes an output bundle.
+
+        Args:
+            bundle: The bundle, with `output_split_idx` set to the consumer.
+            stolen_from: If the bundle was stolen, the split it was queued for.
+        """
+        with self._consumer_stats_lock:
+            self._num_consumed[bundle.output_split_idx] += bundle.num_rows()
+            if stolen_from is not None:
+                self._num_stolen[bundle.output_split_idx] += 1
+
     def _add_input_inner(self, bundle, input_index) -> None:
         if bundle.num_rows() is None:
             raise ValueError("OutputSplitter requires bundles with known row count")
@@ -27,6 +27,7 @@ class TaskPoolMapOperator(MapOperator):
         supports_fusion: bool = True,
         ray_remote_args_fn: Optional[Callable[[], Dict[str, Any]]] = None,
         ray_remote_args: Optional[Dict[str, Any]] = None,
+        min_bytes_per_bundle: Optional[int] = None,
     ):
         """Create an TaskPoolMapOperator instance.
 
@@ -50,6 +51,8 @@ class TaskPoolMapOperator(MapOperator):
                 always override the args in ``ray_remote_args``. Note: this is an
                 advanced, experimental feature.
             ray_remote_args: Customize the ray remote args for this op's tasks.
+            min_bytes_per_bundle: The number of bytes to gather per batch passed to
+                the transform_fn, or None to not consider the number of bytes.
         """
         super().__init__(
             map_transformer,
@@ -60,6 +63,7 @@ class TaskPoolMapOperator(MapOperator):
             supports_fusion,
             ray_remote_args_fn,
             ray_remote_args,
+            min_bytes_per_bundle,
         )
         self._concurrency = concurrency
 
@@ -164,7 +164,13 @@ class ResourceManager:
 
             # Update operator's object store usage, which is used by
             # DatasetStats and updated on the Ray Data dashboard.
-            op._metrics.obj_store_mem_used = op_usage.object_store_memory
+            # Shuffled blocks buffered by the operator are included here, but not in
+            # the usages used for budgeting. They can only be released after all
+            # inputs of the operator are shuffled, so throttling the operator on them
+            # would stall the execution. Ray spills them to disk instead.
+            op._metrics.obj_store_mem_used = (
+                op_usage.object_store_memory + op.metrics.obj_store_mem_shuffle_buffer
+            )
 
         if self._op_resource_allocator is not None:
             self._op_resource_allocator.update_usages()
@@ -220,6 +226,9 @@ class ResourceManager:
         usage_str += (
             f", {self._op_running_usages[op].object_store_memory_str()} object store"
         )
+        shuffle_buffer = op.metrics.obj_store_mem_shuffle_buffer
+        if shuffle_buffer:
+            usage_str += f", {memory_string(shuffle_buffer)} shuffle buffer"
         if self._debug:
             usage_str += (
                 f" (in={memory_string(self._mem_op_internal[op])},"
@@ -235,6 +244,11 @@ class ResourceManager:
                 usage_str += f",object store={budget.object_store_memory_str()})"
         return usage_str
 
+    def get_op_outputs_object_store_usage(self, op: PhysicalOperator) -> int:
+        """Return the object store memory usage of the blocks that have been taken
+        out of the given operator, but not consumed by the downstream operators."""
+        return self._mem_op_outputs[op]
+
     def get_downstream_fraction(self, op: PhysicalOperator) -> float:
         """Return the downstream fraction of the given operator."""
         return self._downstream_fraction[op]
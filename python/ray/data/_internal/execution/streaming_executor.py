@@ -9,6 +9,7 @@ from ray.data._internal.execution.backpressure_policy import (
     BackpressurePolicy,
     get_backpressure_policies,
 )
+from ray.data._internal.execution.block_size_autotuner import BlockSizeAutotuner
 from ray.data._internal.execution.interfaces import (
     ExecutionOptions,
     ExecutionResources,
@@ -27,6 +28,7 @@ from ray.data._internal.execution.streaming_executor_state import (
     select_operator_to_run,
     update_operator_states,
 )
+from ray.data._internal.execution.timeline import ExecutionTimeline
 from ray.data._internal.logging import get_log_directory
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.stats import DatasetStats, StatsManager
@@ -72,6 +74,9 @@ class StreamingExecutor(Executor, threading.Thread):
         self._topology: Optional[Topology] = None
         self._output_node: Optional[OpState] = None
         self._backpressure_policies: List[BackpressurePolicy] = []
+        self._block_size_autotuner: Optional[BlockSizeAutotuner] = None
+        # The execution timeline, if `DataContext.execution_timeline_dir` is set.
+        self._timeline: Optional[ExecutionTimeline] = None
 
         self._dataset_tag = dataset_tag
         # Stores if an operator is completed,
@@ -128,6 +133,8 @@ class StreamingExecutor(Executor, threading.Thread):
             lambda: self._autoscaler.get_total_resources(),
         )
         self._backpressure_policies = get_backpressure_policies(self._topology)
+        if DataContext.get_current().enable_block_size_autotuning:
+            self._block_size_autotuner = BlockSizeAutotuner(self._topology)
         self._autoscaler = create_autoscaler(
             self._topology,
             self._resource_manager,
@@ -135,6 +142,8 @@ class StreamingExecutor(Executor, threading.Thread):
         )
 
         self._has_op_completed = {op: False for op in self._topology}
+        if DataContext.get_current().execution_timeline_dir is not None:
+            self._timeline = ExecutionTimeline(self._topology, self._dataset_tag)
 
         self._output_node: OpState = self._topology[dag]
         StatsManager.register_dataset_to_stats_actor(
@@ -184,6 +193,8 @@ class StreamingExecutor(Executor, threading.Thread):
             self._shutdown = True
             # Give the scheduling loop some time to finish processing.
             self.join(timeout=2.0)
+            if self._block_size_autotuner is not None:
+                self._block_size_autotuner.shutdown()
             self._update_stats_metrics(
                 state="FINISHED" if execution_completed else "FAILED",
                 force_update=True,
@@ -195,6 +206,8 @@ class StreamingExecutor(Executor, threading.Thread):
             )
             # Freeze the stats and save it.
             self._final_stats = self._generate_stats()
+            if self._timeline is not None:
+                self._write_timeline(context.execution_timeline_dir)
             stats_summary_string = self._final_stats.to_summary().to_string(
                 include_parent=False
             )
@@ -253,6 +266,18 @@ class StreamingExecutor(Executor, threading.Thread):
         else:
             return self._generate_stats()
 
+    def _write_timeline(self, directory: str) -> None:
+        self._timeline.finish()
+        try:
+            path = self._timeline.write(directory, self._execution_id)
+        except Exception:
+            logger.warning(
+                f"Failed to write the execution timeline to {directory}.",
+                exc_info=True,
+            )
+            return
+        logger.info(f"Execution timeline written to {path}")
+
     def _generate_stats(self) -> DatasetStats:
         """Create a new stats object reflecting execution status so far."""
         stats = self._initial_stats or DatasetStats(metadata={}, parent=None)
@@ -294,6 +319,13 @@ class StreamingExecutor(Executor, threading.Thread):
         self._num_errored_blocks += num_errored_blocks
 
         self._resource_manager.update_usages()
+        if self._timeline is not None:
+            # Record the task completions before dispatching new tasks.
+            self._timeline.update(topology, self._resource_manager)
+        for policy in self._backpressure_policies:
+            policy.on_usages_updated(self._resource_manager)
+        if self._block_size_autotuner is not None:
+            self._block_size_autotuner.on_usages_updated(self._resource_manager)
         # Dispatch as many operators as we can for completed tasks.
         self._report_current_usage()
         op = select_operator_to_run(
@@ -321,6 +353,8 @@ class StreamingExecutor(Executor, threading.Thread):
 
         update_operator_states(topology)
         self._refresh_progress_bars(topology)
+        if self._timeline is not None:
+            self._timeline.update(topology, self._resource_manager)
 
         self._update_stats_metrics(state="RUNNING")
         if time.time() - self._last_debug_log_time >= DEBUG_LOG_INTERVAL_SECONDS:
@@ -30,6 +30,7 @@ from ray.data._internal.execution.operators.base_physical_operator import (
     AllToAllOperator,
 )
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
+from ray.data._internal.execution.operators.output_splitter import OutputSplitter
 from ray.data._internal.execution.resource_manager import ResourceManager
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data.context import DataContext
@@ -134,6 +135,43 @@ class OpBufferQueue:
                 self._num_per_split[ret.output_split_idx] -= 1
         return ret
 
+    def steal(self, output_split_idx: int, min_queued: int) -> Optional[RefBundle]:
+        """Pop a RefBundle queued for another output split.
+
+        The RefBundle is taken from the back of the split with the most queued
+        RefBundles, so that the owner of that split still gets the RefBundles at the
+        front.
+
+        Args:
+            output_split_idx: The output split that steals the RefBundle.
+            min_queued: Only steal from splits with at least this many queued
+                RefBundles.
+        Returns:
+            A RefBundle if available, otherwise None. Its `output_split_idx` is still
+            the split it was queued for.
+        """
+        with self._lock:
+            while len(self._queue) > 0:
+                ref = self._queue.popleft()
+                self._outputs_by_split[ref.output_split_idx].append(ref)
+            victims = [
+                i
+                for i, split_queue in self._outputs_by_split.items()
+                if i != output_split_idx and len(split_queue) >= min_queued
+            ]
+            if not victims:
+                return None
+            victim = max(victims, key=lambda i: len(self._outputs_by_split[i]))
+            try:
+                ret = self._outputs_by_split[victim].pop()
+            except IndexError:
+                # The owner of the split popped the last RefBundle concurrently.
+                return None
+            self._memory_usage -= ret.size_bytes()
+            self._num_blocks -= len(ret.blocks)
+            self._num_per_split[victim] -= 1
+        return ret
+
     def clear(self):
         with self._lock:
             self._queue.clear()
@@ -293,6 +331,10 @@ class OpState:
     def get_output_blocking(self, output_split_idx: Optional[int]) -> RefBundle:
         """Get an item from this node's output queue, blocking as needed.
 
+        If this node is an `OutputSplitter` with work stealing enabled, and nothing is
+        queued for the given output split, a bundle queued for another split is
+        returned instead.
+
         Returns:
             The RefBundle from the output queue, or an error / end of stream indicator.
 
@@ -300,15 +342,32 @@ class OpState:
             StopIteration: If all outputs are already consumed.
             Exception: If there was an exception raised during execution.
         """
+        is_splitter = isinstance(self.op, OutputSplitter)
+        work_stealing = (
+            output_split_idx is not None and is_splitter and self.op.work_stealing
+        )
         while True:
             # Check if StreamingExecutor has caught an exception or is done execution.
             if self._exception is not None:
                 raise self._exception
-            elif self._finished and not self.outqueue.has_next(output_split_idx):
-                raise StopIteration()
+            # Read the flag before popping, so that no output queued before the end
+            # of execution is missed.
+            finished = self._finished
             ref = self.outqueue.pop(output_split_idx)
+            stolen_from = None
+            if ref is None and work_stealing:
+                # While execution is running, leave at least one queued bundle to the
+                # owner of each split, so that it doesn't go idle.
+                ref = self.outqueue.steal(output_split_idx, 1 if finished else 2)
+                if ref is not None:
+                    stolen_from = ref.output_split_idx
+                    ref.output_split_idx = output_split_idx
             if ref is not None:
+                if is_splitter:
+                    self.op.on_output_consumed(ref, stolen_from)
                 return ref
+            elif finished:
+                raise StopIteration()
             time.sleep(0.01)
 
     def inqueue_memory_usage(self) -> int:
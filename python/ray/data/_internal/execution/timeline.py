@@ -0,0 +1,277 @@
+import json
+import logging
+import os
+import re
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ray.data._internal.execution.interfaces import PhysicalOperator
+from ray.data._internal.execution.interfaces.physical_operator import OpTask
+
+if TYPE_CHECKING:
+    from ray.data._internal.execution.resource_manager import ResourceManager
+    from ray.data._internal.execution.streaming_executor_state import Topology
+
+logger = logging.getLogger(__name__)
+
+# The Chrome trace process ID of the executor-wide events. Operator `i` of the
+# topology uses process ID `i + 1`.
+EXECUTOR_PID = 0
+
+# The Chrome trace thread IDs of the backpressure spans of each operator. Task spans
+# use the thread IDs after them, one for each task slot.
+SUBMISSION_BACKPRESSURE_TID = 0
+OUTPUT_BACKPRESSURE_TID = 1
+FIRST_TASK_SLOT_TID = 2
+
+
+class ExecutionTimeline:
+    """Records a timeline of a streaming execution in the Chrome trace format.
+
+    The timeline is updated by `StreamingExecutor` at each scheduling loop step, and
+    contains, for each operator:
+
+    * A span for each task, from its submission to its completion as observed by the
+      executor. Concurrent tasks are laid out on separate task slot tracks.
+    * Spans during which the operator is in task submission backpressure (with the
+      reason, i.e., resource limits or backpressure policies), or in task output
+      backpressure.
+    * Counters of the queued blocks, active tasks and object store memory usage.
+
+    As well as counters of the global resource usage. The written JSON file can be
+    loaded in ``chrome://tracing`` or https://ui.perfetto.dev.
+    """
+
+    # Min interval between two samples of the counters, to bound the trace size.
+    COUNTER_SAMPLE_INTERVAL_S = 0.05
+    # Max number of recorded events. Later events are dropped.
+    MAX_NUM_EVENTS = 1_000_000
+
+    def __init__(self, topology: "Topology", dataset_tag: str):
+        self._start_time = time.perf_counter()
+        self._dataset_tag = dataset_tag
+        self._events: List[Dict[str, Any]] = []
+        self._num_dropped_events = 0
+        self._last_counter_sample_time: Optional[float] = None
+        self._op_pids: Dict[PhysicalOperator, int] = {}
+        # The active tasks of each operator, mapped to their task slot and start time.
+        self._active_tasks: Dict[PhysicalOperator, Dict[OpTask, Any]] = {}
+        self._num_task_slots: Dict[PhysicalOperator, int] = {}
+        # The start time and name of the ongoing backpressure spans, keyed by
+        # (operator, thread ID).
+        self._backpressure_spans: Dict[Any, Any] = {}
+
+        self._add_metadata(EXECUTOR_PID, None, "process_name", f"Dataset {dataset_tag}")
+        self._add_metadata(EXECUTOR_PID, None, "process_sort_index", EXECUTOR_PID)
+        for i, op in enumerate(topology):
+            pid = i + 1
+            self._op_pids[op] = pid
+            self._active_tasks[op] = {}
+            self._num_task_slots[op] = 0
+            self._add_metadata(pid, None, "process_name", f"{op.name}{i}")
+            self._add_metadata(pid, None, "process_sort_index", pid)
+            self._add_metadata(
+                pid,
+                SUBMISSION_BACKPRESSURE_TID,
+                "thread_name",
+                "Submission backpressure",
+            )
+            self._add_metadata(
+                pid, OUTPUT_BACKPRESSURE_TID, "thread_name", "Output backpressure"
+            )
+
+    def update(self, topology: "Topology", resource_manager: "ResourceManager") -> None:
+        """Record the task and backpressure state changes since the last update,
+        and sample the counters."""
+        now = self._now_us()
+        for op, state in topology.items():
+            self._update_tasks(op, now)
+            self._update_backpressure(op, state, now)
+
+        if (
+            self._last_counter_sample_time is not None
+            and time.perf_counter() - self._last_counter_sample_time
+            < self.COUNTER_SAMPLE_INTERVAL_S
+        ):
+            return
+        self._last_counter_sample_time = time.perf_counter()
+        for op, state in topology.items():
+            pid = self._op_pids[op]
+            self._add_counter(
+                pid,
+                "Queued blocks",
+                now,
+                {
+                    "input": sum(q.num_blocks for q in state.inqueues),
+                    "output": state.outqueue_num_blocks(),
+                },
+            )
+            self._add_counter(
+                pid, "Active tasks", now, {"tasks": op.num_active_tasks()}
+            )
+            self._add_counter(
+                pid,
+                "Object store memory",
+                now,
+                {"bytes": resource_manager.get_op_usage(op).object_store_memory},
+            )
+        usage = resource_manager.get_global_usage()
+        self._add_counter(EXECUTOR_PID, "CPU", now, {"cpu": usage.cpu})
+        self._add_counter(EXECUTOR_PID, "GPU", now, {"gpu": usage.gpu})
+        self._add_counter(
+            EXECUTOR_PID,
+            "Object store memory",
+            now,
+            {"bytes": usage.object_store_memory},
+        )
+
+    def finish(self) -> None:
+        """Close the spans that are still open, e.g., if the execution was
+        cancelled."""
+        now = self._now_us()
+        for op, tasks in self._active_tasks.items():
+            for task, (slot, start) in list(tasks.items()):
+                self._add_task_span(op, task, slot, start, now, finished=False)
+            tasks.clear()
+        for (op, tid), (start, name) in list(self._backpressure_spans.items()):
+            self._add_span(self._op_pids[op], tid, name, "backpressure", start, now)
+        self._backpressure_spans.clear()
+
+    def to_chrome_trace(self) -> List[Dict[str, Any]]:
+        """Return the recorded events in the Chrome trace format."""
+        return list(self._events)
+
+    def write(self, directory: str, execution_id: str) -> str:
+        """Write the timeline to a JSON file in `directory`, and return its path."""
+        os.makedirs(directory, exist_ok=True)
+        file_name = re.sub(r"[^\w.-]", "_", f"{self._dataset_tag}_{execution_id}")
+        path = os.path.join(directory, f"timeline_{file_name}.json")
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+        if self._num_dropped_events > 0:
+            logger.warning(
+                f"The execution timeline has more than {self.MAX_NUM_EVENTS} "
+                f"events, {self._num_dropped_events} events were dropped."
+            )
+        return path
+
+    def _update_tasks(self, op: PhysicalOperator, now: float) -> None:
+        active_tasks = self._active_tasks[op]
+        current_tasks = set(op.get_active_tasks())
+        for task in list(active_tasks):
+            if task not in current_tasks:
+                slot, start = active_tasks.pop(task)
+                self._add_task_span(op, task, slot, start, now, finished=True)
+        used_slots = {slot for slot, _ in active_tasks.values()}
+        for task in current_tasks:
+            if task in active_tasks:
+                continue
+            # Use the first free task slot.
+            slot = 0
+            while slot in used_slots:
+                slot += 1
+            used_slots.add(slot)
+            active_tasks[task] = (slot, now)
+            if slot == self._num_task_slots[op]:
+                self._num_task_slots[op] += 1
+                self._add_metadata(
+                    self._op_pids[op],
+                    FIRST_TASK_SLOT_TID + slot,
+                    "thread_name",
+                    f"Task slot {slot}",
+                )
+
+    def _update_backpressure(self, op: PhysicalOperator, state, now: float) -> None:
+        if op._in_task_submission_backpressure:
+            if state._scheduling_status.under_resource_limits:
+                name = "Backpressure policies"
+            else:
+                name = "Resource limits"
+        else:
+            name = None
+        self._update_backpressure_span(op, SUBMISSION_BACKPRESSURE_TID, name, now)
+
+        name = "Output backpressure" if op._in_task_output_backpressure else None
+        self._update_backpressure_span(op, OUTPUT_BACKPRESSURE_TID, name, now)
+
+    def _update_backpressure_span(
+        self, op: PhysicalOperator, tid: int, name: Optional[str], now: float
+    ) -> None:
+        """Close the ongoing span of the track if its name changed, and open a new
+        span with `name` if it's not None."""
+        key = (op, tid)
+        ongoing = self._backpressure_spans.get(key)
+        if ongoing is not None:
+            start, ongoing_name = ongoing
+            if ongoing_name == name:
+                return
+            del self._backpressure_spans[key]
+            self._add_span(
+                self._op_pids[op], tid, ongoing_name, "backpressure", start, now
+            )
+        if name is not None:
+            self._backpressure_spans[key] = (now, name)
+
+    def _add_task_span(
+        self,
+        op: PhysicalOperator,
+        task: OpTask,
+        slot: int,
+        start: float,
+        end: float,
+        finished: bool,
+    ) -> None:
+        self._add_span(
+            self._op_pids[op],
+            FIRST_TASK_SLOT_TID + slot,
+            f"Task {task.task_index()}",
+            "task",
+            start,
+            end,
+            args={"task_index": task.task_index(), "finished": finished},
+        )
+
+    def _add_span(
+        self,
+        pid: int,
+        tid: int,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "pid": pid,
+            "tid": tid,
+            "ts": start,
+            "dur": end - start,
+        }
+        if args:
+            event["args"] = args
+        self._add_event(event)
+
+    def _add_counter(
+        self, pid: int, name: str, ts: float, values: Dict[str, float]
+    ) -> None:
+        self._add_event({"name": name, "ph": "C", "pid": pid, "ts": ts, "args": values})
+
+    def _add_metadata(self, pid: int, tid: Optional[int], name: str, value) -> None:
+        key = "sort_index" if name.endswith("sort_index") else "name"
+        event = {"name": name, "ph": "M", "pid": pid, "args": {key: value}}
+        if tid is not None:
+            event["tid"] = tid
+        self._add_event(event)
+
+    def _add_event(self, event: Dict[str, Any]) -> None:
+        if len(self._events) >= self.MAX_NUM_EVENTS:
+            self._num_dropped_events += 1
+            return
+        self._events.append(event)
+
+    def _now_us(self) -> float:
+        """The time since the start of the execution, in microseconds."""
+        return (time.perf_counter() - self._start_time) * 1e6
@@ -0,0 +1,309 @@
+"""On-disk cache of file listings and Parquet footer metadata.
+
+Listing the files of a large dataset and reading the footers of its Parquet files
+can take minutes on cloud storage. If ``DataContext.file_metadata_cache_dir`` is set,
+the results are cached in a SQLite database in that directory, so that later reads
+of the same files skip these requests:
+
+* A directory listing is keyed by the directory path. It's validated against the
+  modification times of the directory, of all its subdirectories and of the listed
+  files, which are requested in a single batch, and expires after
+  ``DataContext.file_metadata_cache_ttl_s``. Listings are only cached if the
+  filesystem reports all these modification times, which object stores don't.
+* The footer metadata of a Parquet file is keyed by the file path, modification time
+  and size. So it's invalidated if the file is rewritten, and also expires after the
+  TTL.
+
+Errors of the cache are logged and treated as cache misses, so they never fail a
+read.
+"""
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from ray.data.context import DataContext
+
+if TYPE_CHECKING:
+    import pyarrow
+
+logger = logging.getLogger(__name__)
+
+# The name of the SQLite database in the cache directory.
+CACHE_DB_FILE_NAME = "file_metadata_cache.db"
+# How long to wait for a lock on the database held by another process.
+SQLITE_TIMEOUT_S = 30
+# Max number of parameters in a single SQLite query.
+SQLITE_MAX_PARAMS = 500
+
+# The size and modification time in nanoseconds of a file.
+FileStat = Tuple[Optional[int], Optional[int]]
+# The path, size and modification time in nanoseconds of a listed file.
+ListingEntry = Tuple[str, int, Optional[int]]
+# The path and modification time in nanoseconds of a listed directory.
+DirectoryStat = Tuple[str, Optional[int]]
+
+
+class FileMetadataCache:
+    """A persistent cache of file listings and Parquet footer metadata.
+
+    Use :meth:`get_current` to get the cache configured by the current
+    ``DataContext``.
+    """
+
+    _instances: Dict[Tuple[str, float], "FileMetadataCache"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, cache_dir: str, ttl_s: float):
+        self._cache_dir = cache_dir
+        self._ttl_s = ttl_s
+        self._db_path = os.path.join(cache_dir, CACHE_DB_FILE_NAME)
+        self._initialized = False
+        self._lock = threading.Lock()
+        # The stats of the files seen in fresh listings, so that the Parquet footers
+        # of the same read can be validated without requesting the stats again.
+        self._file_stats: Dict[str, FileStat] = {}
+        self._warned = False
+
+    @classmethod
+    def get_current(cls) -> Optional["FileMetadataCache"]:
+        """Return the cache configured by the current ``DataContext``, or None if
+        caching is disabled."""
+        ctx = DataContext.get_current()
+        if ctx.file_metadata_cache_dir is None:
+            return None
+        key = (ctx.file_metadata_cache_dir, ctx.file_metadata_cache_ttl_s)
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(*key)
+            return cls._instances[key]
+
+    def get_listing(
+        self,
+        filesystem: "pyarrow.fs.FileSystem",
+        path: str,
+    ) -> Optional[List[Tuple[str, int]]]:
+        """Return the `(file_path, file_size)` pairs of the files under the directory
+        `path`, or None if they aren't cached, expired, or any of the listed
+        directories or files was modified since they were cached."""
+        row = self._execute_one(
+            "SELECT created_s, directories, entries FROM listings WHERE key = ?",
+            (_key(filesystem, path),),
+        )
+        if row is None or self._is_expired(row[0]):
+            return None
+        directories = self._loads(row[1])
+        entries = self._loads(row[2])
+        if directories is None or entries is None:
+            return None
+
+        paths = [dir_path for dir_path, _ in directories]
+        paths.extend(file_path for file_path, _, _ in entries)
+        try:
+            infos = filesystem.get_file_info(paths)
+        except OSError:
+            return None
+        cached_mtimes = [mtime_ns for _, mtime_ns in directories]
+        cached_mtimes.extend(mtime_ns for _, _, mtime_ns in entries)
+        for info, cached_mtime_ns in zip(infos, cached_mtimes):
+            # A missing path has no modification time.
+            if info.mtime_ns is None or info.mtime_ns != cached_mtime_ns:
+                return None
+
+        # The sizes are taken from the fresh stats of the files.
+        entries = [
+            (info.path, info.size, info.mtime_ns) for info in infos[len(directories) :]
+        ]
+        self._remember_stats(entries)
+        return [(file_path, size) for file_path, size, _ in entries]
+
+    def put_listing(
+        self,
+        filesystem: "pyarrow.fs.FileSystem",
+        path: str,
+        directories: List[DirectoryStat],
+        entries: List[ListingEntry],
+    ) -> None:
+        """Cache the `(file_path, file_size, file_mtime_ns)` entries of the files
+        under the directory `path`.
+
+        `directories` are the `(dir_path, dir_mtime_ns)` of `path` and all its
+        subdirectories. The listing isn't cached if any modification time is
+        unknown, since its changes couldn't be detected.
+        """
+        self._remember_stats(entries)
+        if any(mtime_ns is None for _, mtime_ns in directories) or any(
+            mtime_ns is None for _, _, mtime_ns in entries
+        ):
+            return
+        self._execute_many(
+            "INSERT OR REPLACE INTO listings VALUES (?, ?, ?, ?)",
+            [
+                (
+                    _key(filesystem, path),
+                    time.time(),
+                    pickle.dumps(directories),
+                    pickle.dumps(entries),
+                )
+            ],
+        )
+
+    def get_file_stats(
+        self, filesystem: "pyarrow.fs.FileSystem", paths: List[str]
+    ) -> List[FileStat]:
+        """Return the size and modification time of each file.
+
+        The stats of files seen in fresh listings are used once, since they may be
+        stale for later reads. The others are requested from the filesystem in a
+        single batch.
+        """
+        stats = {}
+        with self._lock:
+            for path in paths:
+                if path in self._file_stats:
+                    stats[path] = self._file_stats.pop(path)
+        missing = [path for path in paths if path not in stats]
+        if missing:
+            try:
+                infos = filesystem.get_file_info(missing)
+            except OSError:
+                # The metadata of the files without stats isn't cached.
+                infos = []
+            for info in infos:
+                stats[info.path] = (info.size, info.mtime_ns)
+        return [stats.get(path, (None, None)) for path in paths]
+
+    def get_parquet_metadata(
+        self,
+        filesystem: "pyarrow.fs.FileSystem",
+        paths: List[str],
+        stats: List[FileStat],
+    ) -> List[Optional[Any]]:
+        """Return the cached footer metadata of each Parquet file, or None for the
+        files whose metadata isn't cached, expired, or was cached for a different
+        version of the file."""
+        keys = [_key(filesystem, path) for path in paths]
+        rows = {}
+        for start in range(0, len(keys), SQLITE_MAX_PARAMS):
+            chunk = keys[start : start + SQLITE_MAX_PARAMS]
+            placeholders = ", ".join("?" * len(chunk))
+            for row in self._execute_all(
+                "SELECT key, size, mtime_ns, created_s, metadata FROM parquet_footers "
+                f"WHERE key IN ({placeholders})",
+                chunk,
+            ):
+                rows[row[0]] = row[1:]
+
+        results = []
+        for key, (size, mtime_ns) in zip(keys, stats):
+            row = rows.get(key)
+            if (
+                row is None
+                or mtime_ns is None
+                or (row[0], row[1]) != (size, mtime_ns)
+                or self._is_expired(row[2])
+            ):
+                results.append(None)
+            else:
+                results.append(self._loads(row[3]))
+        return results
+
+    def put_parquet_metadata(
+        self,
+        filesystem: "pyarrow.fs.FileSystem",
+        paths: List[str],
+        stats: List[FileStat],
+        metadata: List[Any],
+    ) -> None:
+        """Cache the footer metadata of each Parquet file."""
+        now = time.time()
+        self._execute_many(
+            "INSERT OR REPLACE INTO parquet_footers VALUES (?, ?, ?, ?, ?)",
+            [
+                (_key(filesystem, path), size, mtime_ns, now, pickle.dumps(m))
+                for path, (size, mtime_ns), m in zip(paths, stats, metadata)
+                # Without a modification time, a rewritten file can't be detected.
+                if mtime_ns is not None
+            ],
+        )
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._file_stats.clear()
+        self._execute_many("DELETE FROM listings", [()])
+        self._execute_many("DELETE FROM parquet_footers", [()])
+
+    def _is_expired(self, created_s: float) -> bool:
+        return time.time() - created_s > self._ttl_s
+
+    def _remember_stats(self, entries: List[ListingEntry]) -> None:
+        with self._lock:
+            for file_path, size, mtime_ns in entries:
+                self._file_stats[file_path] = (size, mtime_ns)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._db_path, timeout=SQLITE_TIMEOUT_S)
+        with self._lock:
+            if not self._initialized:
+                with conn:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS listings (key TEXT PRIMARY KEY, "
+                        "created_s REAL, directories BLOB, entries BLOB)"
+                    )
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS parquet_footers (key TEXT PRIMARY "
+                        "KEY, size INTEGER, mtime_ns INTEGER, created_s REAL, "
+                        "metadata BLOB)"
+                    )
+                self._initialized = True
+        return conn
+
+    def _execute_one(self, query: str, params: tuple) -> Optional[tuple]:
+        rows = self._execute_all(query, params)
+        return rows[0] if rows else None
+
+    def _execute_all(self, query: str, params) -> List[tuple]:
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            with closing(self._connect()) as conn:
+                return conn.execute(query, params).fetchall()
+        except (sqlite3.Error, OSError):
+            self._warn_once()
+            return []
+
+    def _execute_many(self, query: str, params: List[tuple]) -> None:
+        if not params:
+            return
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            with closing(self._connect()) as conn, conn:
+                conn.executemany(query, params)
+        except (sqlite3.Error, OSError):
+            self._warn_once()
+
+    def _loads(self, blob: bytes) -> Optional[Any]:
+        try:
+            return pickle.loads(blob)
+        except Exception:
+            # E.g., the entry was written by an incompatible version.
+            self._warn_once()
+            return None
+
+    def _warn_once(self) -> None:
+        if not self._warned:
+            self._warned = True
+            logger.warning(
+                f"Failed to access the file metadata cache at {self._db_path}. "
+                "Reads will fetch the file metadata without the cache.",
+                exc_info=True,
+            )
+
+
+def _key(filesystem: "pyarrow.fs.FileSystem", path: str) -> str:
+    return f"{filesystem.type_name}://{path}"
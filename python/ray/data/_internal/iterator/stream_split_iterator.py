@@ -38,6 +38,7 @@ class StreamSplitDataIterator(DataIterator):
         n: int,
         equal: bool,
         locality_hints: Optional[List[NodeIdStr]],
+        work_stealing: bool = False,
     ) -> List["StreamSplitDataIterator"]:
         """Create a split iterator from the given base Dataset and options.
 
@@ -49,7 +50,7 @@ class StreamSplitDataIterator(DataIterator):
             scheduling_strategy=NodeAffinitySchedulingStrategy(
                 ray.get_runtime_context().get_node_id(), soft=False
             ),
-        ).remote(base_dataset, n, equal, locality_hints)
+        ).remote(base_dataset, n, equal, locality_hints, work_stealing)
 
         return [
             StreamSplitDataIterator(base_dataset, coord_actor, i, n) for i in range(n)
@@ -134,6 +135,7 @@ class SplitCoordinator:
         n: int,
         equal: bool,
         locality_hints: Optional[List[NodeIdStr]],
+        work_stealing: bool = False,
     ):
         # Automatically set locality with output to the specified location hints.
         if locality_hints:
@@ -166,7 +168,9 @@ class SplitCoordinator:
                 self._executor = executor
 
                 def add_split_op(dag):
-                    return OutputSplitter(dag, n, equal, locality_hints)
+                    return OutputSplitter(
+                        dag, n, equal, locality_hints, work_stealing=work_stealing
+                    )
 
                 output_iterator = execute_to_legacy_bundle_iterator(
                     executor,
@@ -2,6 +2,7 @@ from .logical_operator import LogicalOperator
 from .logical_plan import LogicalPlan
 from .operator import Operator
 from .optimizer import Optimizer, Rule
+from .partitioning import RangePartitioning
 from .physical_plan import PhysicalPlan
 from .plan import Plan
 
@@ -12,5 +13,6 @@ __all__ = [
     "Optimizer",
     "PhysicalPlan",
     "Plan",
+    "RangePartitioning",
     "Rule",
 ]
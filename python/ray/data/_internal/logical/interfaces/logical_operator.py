@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Iterator, List, Optional
 
 from .operator import Operator
+from .partitioning import RangePartitioning
 from ray.data.block import BlockMetadata
 
 if TYPE_CHECKING:
@@ -68,6 +69,15 @@ class LogicalOperator(Operator):
         """
         return BlockMetadata(None, None, None, None, None)
 
+    def output_partitioning(self) -> Optional[RangePartitioning]:
+        """How the outputs of this operator are range-partitioned, or ``None`` if
+        they aren't, or it isn't known.
+
+        Downstream operators use this to skip shuffling the outputs again, e.g., a
+        groupby on the sort key of a sorted dataset.
+        """
+        return None
+
     def is_lineage_serializable(self) -> bool:
         """Returns whether the lineage of this operator can be serialized.
 
@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass(frozen=True)
+class RangePartitioning:
+    """Describes outputs that are range-partitioned on key columns.
+
+    Each output block holds a contiguous range of keys and is sorted by the key
+    columns, and the blocks are ordered by their ranges. So all rows with equal keys
+    are in the same block. This is the case for the outputs of a sort, where each
+    output block is a merged range partition.
+    """
+
+    # The columns that the outputs are partitioned and sorted by.
+    key_columns: List[str]
+    # Whether the keys are in descending order.
+    descending: bool
+    # The boundaries of the ranges, if they're known when planning (i.e., they're
+    # user-provided instead of sampled). Block `i` holds the `i`-th range.
+    boundaries: Optional[List[tuple]] = None
+
+    def is_sorted_by(self, key_columns: List[str]) -> bool:
+        """Whether the outputs are partitioned and sorted in ascending order of
+        `key_columns`."""
+        return not self.descending and self.key_columns == key_columns
+
+    def colocates(self, key_columns: List[str]) -> bool:
+        """Whether all rows with equal values of `key_columns` are in the same block,
+        and the blocks are in ascending order of `key_columns`.
+
+        This is the case if the partitioning key columns are a prefix of
+        `key_columns`.
+        """
+        return (
+            not self.descending
+            and len(self.key_columns) > 0
+            and self.key_columns == key_columns[: len(self.key_columns)]
+        )
+
+    def is_co_partitioned_with(self, other: "RangePartitioning") -> bool:
+        """Whether block `i` of these outputs holds the same range of keys as block
+        `i` of the `other` outputs, so they can be joined without a shuffle."""
+        return (
+            self.boundaries is not None
+            and self.boundaries == other.boundaries
+            and self.descending == other.descending
+            and len(self.key_columns) == len(other.key_columns)
+        )
@@ -1,6 +1,6 @@
 from typing import Any, Dict, List, Optional
 
-from ray.data._internal.logical.interfaces import LogicalOperator
+from ray.data._internal.logical.interfaces import LogicalOperator, RangePartitioning
 from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
 from ray.data._internal.planner.exchange.shuffle_task_spec import ShuffleTaskSpec
 from ray.data._internal.planner.exchange.sort_task_spec import SortKey, SortTaskSpec
@@ -136,6 +136,14 @@ class Sort(AbstractAllToAll):
         assert len(self._input_dependencies) == 1, len(self._input_dependencies)
         return self._input_dependencies[0].aggregate_output_metadata()
 
+    def output_partitioning(self) -> Optional[RangePartitioning]:
+        boundaries = self._sort_key.boundaries
+        return RangePartitioning(
+            key_columns=self._sort_key.get_columns(),
+            descending=self._sort_key.get_descending(),
+            boundaries=[(b,) for b in boundaries] if boundaries else None,
+        )
+
 
 class Aggregate(AbstractAllToAll):
     """Logical operator for aggregate."""
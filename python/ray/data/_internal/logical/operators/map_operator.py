@@ -1,6 +1,6 @@
 import inspect
 import logging
-from typing import Any, Callable, Dict, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Union
 
 from ray.data._internal.compute import ComputeStrategy, TaskPoolStrategy
 from ray.data._internal.logical.interfaces import LogicalOperator
@@ -9,6 +9,9 @@ from ray.data.block import UserDefinedFunction
 from ray.data.context import DEFAULT_BATCH_SIZE
 from ray.data.preprocessor import Preprocessor
 
+if TYPE_CHECKING:
+    from ray.data.expressions import Expr
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +27,7 @@ class AbstractMap(AbstractOneToOne):
         num_outputs: Optional[int] = None,
         *,
         min_rows_per_bundled_input: Optional[int] = None,
+        min_bytes_per_bundled_input: Optional[int] = None,
         ray_remote_args: Optional[Dict[str, Any]] = None,
         ray_remote_args_fn: Optional[Callable[[], Dict[str, Any]]] = None,
     ):
@@ -35,6 +39,8 @@ class AbstractMap(AbstractOneToOne):
                 of `input_op` will be the inputs to this operator.
             min_rows_per_bundled_input: The target number of rows to pass to
                 ``MapOperator._add_bundled_input()``.
+            min_bytes_per_bundled_input: The target number of bytes to pass to
+                ``MapOperator._add_bundled_input()``.
             ray_remote_args: Args to provide to ray.remote.
             ray_remote_args_fn: A function that returns a dictionary of remote args
                 passed to each map worker. The purpose of this argument is to generate
@@ -45,6 +51,7 @@ class AbstractMap(AbstractOneToOne):
         """
         super().__init__(name, input_op, num_outputs)
         self._min_rows_per_bundled_input = min_rows_per_bundled_input
+        self._min_bytes_per_bundled_input = min_bytes_per_bundled_input
         self._ray_remote_args = ray_remote_args or {}
         self._ray_remote_args_fn = ray_remote_args_fn
 
@@ -135,6 +142,60 @@ class AbstractUDFMap(AbstractMap):
             return "<unknown>"
 
 
+class Project(AbstractMap):
+    """Logical operator for select_columns and drop_columns.
+
+    Exactly one of ``cols`` (the columns to keep, in order) and ``drop_cols`` (the
+    columns to remove) is set. Unlike a UDF map, the projection is visible to the
+    optimizer, so ``ProjectionPushdownRule`` can push it down into the read.
+    """
+
+    def __init__(
+        self,
+        input_op: LogicalOperator,
+        cols: Optional[List[str]] = None,
+        drop_cols: Optional[List[str]] = None,
+        compute: Optional[Union[str, ComputeStrategy]] = None,
+        ray_remote_args: Optional[Dict[str, Any]] = None,
+    ):
+        assert (cols is None) != (drop_cols is None), (cols, drop_cols)
+        super().__init__("Project", input_op, ray_remote_args=ray_remote_args)
+        self._cols = cols
+        self._drop_cols = drop_cols
+        self._compute = compute or TaskPoolStrategy()
+
+    @property
+    def can_modify_num_rows(self) -> bool:
+        return False
+
+
+class WithColumn(AbstractMap):
+    """Logical operator for add_column with a column expression.
+
+    The expression is evaluated on Arrow batches, so chains of expression filters and
+    columns that are fused into one operator stay in Arrow.
+    """
+
+    def __init__(
+        self,
+        input_op: LogicalOperator,
+        col: str,
+        expr: "Expr",
+        compute: Optional[Union[str, ComputeStrategy]] = None,
+        ray_remote_args: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(
+            f"WithColumn({col}={expr!r})", input_op, ray_remote_args=ray_remote_args
+        )
+        self._col = col
+        self._expr = expr
+        self._compute = compute or TaskPoolStrategy()
+
+    @property
+    def can_modify_num_rows(self) -> bool:
+        return False
+
+
 class MapBatches(AbstractUDFMap):
     """Logical operator for map_batches."""
 
@@ -210,16 +271,23 @@ class MapRows(AbstractUDFMap):
 
 
 class Filter(AbstractUDFMap):
-    """Logical operator for filter."""
+    """Logical operator for filter.
+
+    The predicate is either a row-based UDF (``fn``) or a column expression
+    (``filter_expr``). Expression filters are evaluated on Arrow batches, and can be
+    pushed down into the read by ``PredicatePushdownRule``.
+    """
 
     def __init__(
         self,
         input_op: LogicalOperator,
-        fn: UserDefinedFunction,
+        fn: Optional[UserDefinedFunction] = None,
+        filter_expr: Optional["Expr"] = None,
         compute: Optional[Union[str, ComputeStrategy]] = None,
         ray_remote_args_fn: Optional[Callable[[], Dict[str, Any]]] = None,
         ray_remote_args: Optional[Dict[str, Any]] = None,
     ):
+        assert (fn is None) != (filter_expr is None), (fn, filter_expr)
         super().__init__(
             "Filter",
             input_op,
@@ -228,6 +296,9 @@ class Filter(AbstractUDFMap):
             ray_remote_args_fn=ray_remote_args_fn,
             ray_remote_args=ray_remote_args,
         )
+        self._filter_expr = filter_expr
+        if filter_expr is not None:
+            self._name = f"Filter({filter_expr!r})"
 
     @property
     def can_modify_num_rows(self) -> bool:
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from ray.data._internal.logical.interfaces import LogicalOperator
 
@@ -41,6 +41,46 @@ class Zip(NAry):
         return max(left_num_outputs, right_num_outputs)
 
 
+class Join(NAry):
+    """Logical operator for join."""
+
+    def __init__(
+        self,
+        left_input_op: LogicalOperator,
+        right_input_op: LogicalOperator,
+        join_type: str,
+        left_key_columns: List[str],
+        right_key_columns: List[str],
+        left_columns_suffix: Optional[str] = None,
+        right_columns_suffix: Optional[str] = None,
+        num_partitions: Optional[int] = None,
+        broadcast: Optional[bool] = None,
+    ):
+        """
+        Args:
+            left_input_op: The input operator at left hand side.
+            right_input_op: The input operator at right hand side.
+            join_type: One of "inner", "left_outer", "right_outer" or "full_outer".
+            left_key_columns: The key columns of the left input.
+            right_key_columns: The key columns of the right input.
+            left_columns_suffix: The suffix to append to non-key columns of the left
+                input that also exist in the right input.
+            right_columns_suffix: The suffix to append to non-key columns of the
+                right input that also exist in the left input.
+            num_partitions: The number of partitions for a hash join.
+            broadcast: Whether to broadcast the right input. If None, it's decided at
+                runtime based on the size of the right input.
+        """
+        super().__init__(left_input_op, right_input_op, num_outputs=num_partitions)
+        self._join_type = join_type
+        self._left_key_columns = left_key_columns
+        self._right_key_columns = right_key_columns
+        self._left_columns_suffix = left_columns_suffix
+        self._right_columns_suffix = right_columns_suffix
+        self._num_partitions = num_partitions
+        self._broadcast = broadcast
+
+
 class Union(NAry):
     """Logical operator for union."""
 
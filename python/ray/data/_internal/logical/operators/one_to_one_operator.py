@@ -1,7 +1,8 @@
 import abc
 from typing import Optional
 
-from ray.data._internal.logical.interfaces import LogicalOperator
+from ray.data._internal.block_cache import BlockCache
+from ray.data._internal.logical.interfaces import LogicalOperator, RangePartitioning
 from ray.data.block import BlockMetadata
 
 
@@ -78,3 +79,36 @@ class Limit(AbstractOneToOne):
     def _input_files(self):
         assert len(self._input_dependencies) == 1, len(self._input_dependencies)
         return self._input_dependencies[0].aggregate_output_metadata().input_files
+
+
+class Cache(AbstractOneToOne):
+    """Logical operator for cache.
+
+    The operator holds the `BlockCache`, so that it's shared by all executions of
+    the dataset.
+    """
+
+    def __init__(
+        self,
+        input_op: LogicalOperator,
+        storage: str,
+        max_bytes: Optional[int],
+    ):
+        super().__init__("Cache", input_op)
+        self._cache = BlockCache(storage, max_bytes)
+
+    @property
+    def can_modify_num_rows(self) -> bool:
+        return False
+
+    def aggregate_output_metadata(self) -> BlockMetadata:
+        assert len(self._input_dependencies) == 1, len(self._input_dependencies)
+        return self._input_dependencies[0].aggregate_output_metadata()
+
+    def output_partitioning(self) -> Optional[RangePartitioning]:
+        # The cached blocks are output in the same order as the input blocks.
+        return self.input_dependency.output_partitioning()
+
+    def is_lineage_serializable(self) -> bool:
+        # This operator isn't serializable because the cache contains ObjectRefs.
+        return False
@@ -21,13 +21,18 @@ class Write(AbstractMap):
             min_rows_per_bundled_input = (
                 datasink_or_legacy_datasource.num_rows_per_write
             )
+            min_bytes_per_bundled_input = (
+                datasink_or_legacy_datasource.min_bytes_per_write
+            )
         else:
             min_rows_per_bundled_input = None
+            min_bytes_per_bundled_input = None
 
         super().__init__(
             "Write",
             input_op,
             min_rows_per_bundled_input=min_rows_per_bundled_input,
+            min_bytes_per_bundled_input=min_bytes_per_bundled_input,
             ray_remote_args=ray_remote_args,
         )
         self._datasink_or_legacy_datasource = datasink_or_legacy_datasource
@@ -10,6 +10,8 @@ from ray.data._internal.logical.rules.inherit_target_max_block_size import (
     InheritTargetMaxBlockSizeRule,
 )
 from ray.data._internal.logical.rules.operator_fusion import OperatorFusionRule
+from ray.data._internal.logical.rules.predicate_pushdown import PredicatePushdownRule
+from ray.data._internal.logical.rules.projection_pushdown import ProjectionPushdownRule
 from ray.data._internal.logical.rules.randomize_blocks import ReorderRandomizeBlocksRule
 from ray.data._internal.logical.rules.set_read_parallelism import SetReadParallelismRule
 from ray.data._internal.logical.rules.zero_copy_map_fusion import (
@@ -20,6 +22,8 @@ from ray.util.annotations import DeveloperAPI
 
 _LOGICAL_RULES = [
     ReorderRandomizeBlocksRule,
+    PredicatePushdownRule,
+    ProjectionPushdownRule,
 ]
 
 _PHYSICAL_RULES = [
@@ -23,13 +23,20 @@ from ray.data._internal.logical.operators.all_to_all_operator import (
     RandomShuffle,
     Repartition,
 )
-from ray.data._internal.logical.operators.map_operator import AbstractUDFMap
+from ray.data._internal.logical.operators.map_operator import (
+    AbstractUDFMap,
+    Project,
+    WithColumn,
+)
 from ray.data._internal.stats import StatsDict
 from ray.data.context import DataContext
 
 # Scheduling strategy can be inherited from upstream operator if not specified.
 INHERITABLE_REMOTE_ARGS = ["scheduling_strategy"]
 
+# Logical map operators that have a compute strategy.
+_MAP_OPS_WITH_COMPUTE = (AbstractUDFMap, Project, WithColumn)
+
 
 class OperatorFusionRule(Rule):
     """Fuses linear chains of compatible physical operators."""
@@ -130,10 +137,7 @@ class OperatorFusionRule(Rule):
               the same class AND constructor args are the same for both.
             * They have compatible remote arguments.
         """
-        from ray.data._internal.logical.operators.map_operator import (
-            AbstractMap,
-            AbstractUDFMap,
-        )
+        from ray.data._internal.logical.operators.map_operator import AbstractMap
 
         if not up_op.supports_fusion() or not down_op.supports_fusion():
             return False
@@ -190,8 +194,8 @@ class OperatorFusionRule(Rule):
         if isinstance(down_logical_op, Repartition) and not down_logical_op._shuffle:
             return False
 
-        if isinstance(down_logical_op, AbstractUDFMap) and isinstance(
-            up_logical_op, AbstractUDFMap
+        if isinstance(down_logical_op, _MAP_OPS_WITH_COMPUTE) and isinstance(
+            up_logical_op, _MAP_OPS_WITH_COMPUTE
         ):
             # Allow fusing tasks->actors if the resources are compatible (read->map),
             # but not the other way around. The latter (downstream op) will be used as
@@ -296,6 +300,15 @@ class OperatorFusionRule(Rule):
             min_rows_per_bundled_input = up_min_rows_per_bundled_input
         else:
             min_rows_per_bundled_input = down_min_rows_per_bundled_input
+        min_bytes_per_bundled_input = max(
+            (
+                logical_op._min_bytes_per_bundled_input
+                for logical_op in [up_logical_op, down_logical_op]
+                if isinstance(logical_op, AbstractMap)
+                and logical_op._min_bytes_per_bundled_input is not None
+            ),
+            default=None,
+        )
 
         target_max_block_size = self._get_merged_target_max_block_size(
             up_op.target_max_block_size, down_op.target_max_block_size
@@ -304,7 +317,7 @@ class OperatorFusionRule(Rule):
         # We take the downstream op's compute in case we're fusing upstream tasks with a
         # downstream actor pool (e.g. read->map).
         compute = None
-        if isinstance(down_logical_op, AbstractUDFMap):
+        if isinstance(down_logical_op, _MAP_OPS_WITH_COMPUTE):
             compute = get_compute(down_logical_op._compute)
         ray_remote_args = up_logical_op._ray_remote_args
         ray_remote_args_fn = (
@@ -323,6 +336,7 @@ class OperatorFusionRule(Rule):
             name=name,
             compute_strategy=compute,
             min_rows_per_bundle=min_rows_per_bundled_input,
+            min_bytes_per_bundle=min_bytes_per_bundled_input,
             ray_remote_args=ray_remote_args,
             ray_remote_args_fn=ray_remote_args_fn,
         )
@@ -358,6 +372,7 @@ class OperatorFusionRule(Rule):
                 name,
                 input_op,
                 min_rows_per_bundled_input=min_rows_per_bundled_input,
+                min_bytes_per_bundled_input=min_bytes_per_bundled_input,
                 ray_remote_args_fn=ray_remote_args_fn,
                 ray_remote_args=ray_remote_args,
             )
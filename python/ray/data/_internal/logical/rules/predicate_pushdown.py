@@ -0,0 +1,107 @@
+import copy
+from typing import List, Optional, Set
+
+from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan, Rule
+from ray.data._internal.logical.operators.map_operator import (
+    Filter,
+    Project,
+    WithColumn,
+)
+from ray.data._internal.logical.operators.read_operator import Read
+
+
+class PredicatePushdownRule(Rule):
+    """Rule for pushing expression filters down into the read.
+
+    When a Filter operator with a column expression (i.e. created with
+    ``Dataset.filter(expr=...)``) is applied on top of a Read operator whose
+    datasource supports predicate pushdown, we remove the Filter operator and
+    replace the datasource with a copy that evaluates the predicate while reading.
+    For example, Parquet reads skip row groups whose statistics can't match.
+
+    Expression filters commute, so a Filter operator is also pushed past other
+    expression filters that can't be pushed down themselves, i.e.
+    `Read -> Filter[a] -> Filter[b]` becomes `Read[b] -> Filter[a]` if only `b` is
+    supported by the datasource. Likewise, a Filter operator is pushed past Project
+    operators that keep all the columns referenced by the predicate, and past
+    WithColumn operators that add columns it doesn't reference.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        optimized_dag = self._apply(plan.dag)
+        return LogicalPlan(dag=optimized_dag, context=plan.context)
+
+    def _apply(self, op: LogicalOperator) -> LogicalOperator:
+        # Post-order traversal, so that filters closest to the read are pushed first.
+        new_inputs = [self._apply(input_op) for input_op in op.input_dependencies]
+        if any(new is not old for new, old in zip(new_inputs, op.input_dependencies)):
+            # We need to make a copy of the operator, because the operator instance
+            # may be shared by multiple Datasets. We shouldn't modify it in place.
+            op = copy.copy(op)
+            op._input_dependencies = new_inputs
+            for new_input in new_inputs:
+                new_input._output_dependencies = [op]
+
+        if isinstance(op, Filter) and op._filter_expr is not None:
+            pushed_op = self._try_push_down(op)
+            if pushed_op is not None:
+                return pushed_op
+        return op
+
+    def _try_push_down(self, filter_op: Filter) -> Optional[LogicalOperator]:
+        """Try to push the predicate of `filter_op` into the upstream read.
+
+        Returns the operator that replaces `filter_op` in the DAG, or None if the
+        predicate can't be pushed down.
+        """
+        # Skip over other expression filters that couldn't be pushed down, and over
+        # projections and added columns that the predicate doesn't depend on.
+        predicate_columns = filter_op._filter_expr.columns()
+        skipped_ops: List[LogicalOperator] = []
+        upstream_op = filter_op.input_dependency
+        while (
+            (isinstance(upstream_op, Filter) and upstream_op._filter_expr is not None)
+            or (
+                isinstance(upstream_op, Project)
+                and _keeps_columns(upstream_op, predicate_columns)
+            )
+            or (
+                isinstance(upstream_op, WithColumn)
+                and upstream_op._col not in predicate_columns
+            )
+        ):
+            skipped_ops.append(upstream_op)
+            upstream_op = upstream_op.input_dependency
+
+        if not isinstance(upstream_op, Read):
+            return None
+
+        datasource = upstream_op._datasource
+        # Legacy readers are created from the read args up front, so they can't be
+        # rebuilt with a predicate.
+        if upstream_op._datasource_or_legacy_reader is not datasource:
+            return None
+        if not datasource.supports_predicate_pushdown(filter_op._filter_expr):
+            return None
+
+        new_datasource = datasource.apply_predicate(filter_op._filter_expr)
+        new_read_op = copy.copy(upstream_op)
+        new_read_op._datasource = new_datasource
+        new_read_op._datasource_or_legacy_reader = new_datasource
+
+        # Re-link the skipped operators on top of the new read operator.
+        new_op: LogicalOperator = new_read_op
+        for skipped_op in reversed(skipped_ops):
+            skipped_op_copy = copy.copy(skipped_op)
+            skipped_op_copy._input_dependencies = [new_op]
+            new_op._output_dependencies = [skipped_op_copy]
+            new_op = skipped_op_copy
+        new_op._output_dependencies = list(filter_op.output_dependencies)
+        return new_op
+
+
+def _keeps_columns(project_op: Project, columns: Set[str]) -> bool:
+    """Whether all of `columns` pass through `project_op` unchanged."""
+    if project_op._cols is not None:
+        return columns.issubset(project_op._cols)
+    return columns.isdisjoint(project_op._drop_cols)
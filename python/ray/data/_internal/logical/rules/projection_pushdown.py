@@ -0,0 +1,84 @@
+import copy
+from typing import List, Optional
+
+from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan, Rule
+from ray.data._internal.logical.operators.map_operator import Project
+from ray.data._internal.logical.operators.read_operator import Read
+
+
+class ProjectionPushdownRule(Rule):
+    """Rule for pushing column projections down into the read.
+
+    When a Project operator (i.e. ``Dataset.select_columns`` or
+    ``Dataset.drop_columns``) is applied directly on top of a Read operator whose
+    datasource supports projection pushdown, we remove the Project operator and
+    replace the datasource with a copy that only reads the projected columns. For
+    example, Parquet reads skip the column chunks of the other columns entirely.
+
+    ``drop_columns`` is only pushed down if the datasource reports its schema
+    without reading any data, because the remaining columns must be known up front.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        optimized_dag = self._apply(plan.dag)
+        return LogicalPlan(dag=optimized_dag, context=plan.context)
+
+    def _apply(self, op: LogicalOperator) -> LogicalOperator:
+        # Post-order traversal, so that consecutive projections are all pushed.
+        new_inputs = [self._apply(input_op) for input_op in op.input_dependencies]
+        if any(new is not old for new, old in zip(new_inputs, op.input_dependencies)):
+            # We need to make a copy of the operator, because the operator instance
+            # may be shared by multiple Datasets. We shouldn't modify it in place.
+            op = copy.copy(op)
+            op._input_dependencies = new_inputs
+            for new_input in new_inputs:
+                new_input._output_dependencies = [op]
+
+        if isinstance(op, Project) and isinstance(op.input_dependency, Read):
+            pushed_op = self._try_push_down(op, op.input_dependency)
+            if pushed_op is not None:
+                return pushed_op
+        return op
+
+    def _try_push_down(self, project_op: Project, read_op: Read) -> Optional[Read]:
+        """Try to push the projection of `project_op` into `read_op`.
+
+        Returns the read operator that replaces `project_op` in the DAG, or None if
+        the projection can't be pushed down.
+        """
+        datasource = read_op._datasource
+        # Legacy readers are created from the read args up front, so they can't be
+        # rebuilt with a projection.
+        if read_op._datasource_or_legacy_reader is not datasource:
+            return None
+        # Custom remote args need to be applied to the projection tasks.
+        if project_op._ray_remote_args:
+            return None
+
+        columns = project_op._cols
+        if columns is None:
+            columns = self._get_remaining_columns(read_op, project_op._drop_cols)
+            if columns is None:
+                return None
+
+        if not datasource.supports_projection_pushdown(columns):
+            return None
+
+        new_datasource = datasource.apply_projection(columns)
+        new_read_op = copy.copy(read_op)
+        new_read_op._datasource = new_datasource
+        new_read_op._datasource_or_legacy_reader = new_datasource
+        new_read_op._output_dependencies = list(project_op.output_dependencies)
+        return new_read_op
+
+    def _get_remaining_columns(
+        self, read_op: Read, drop_cols: List[str]
+    ) -> Optional[List[str]]:
+        schema = read_op.aggregate_output_metadata().schema
+        column_names = getattr(schema, "names", None)
+        if column_names is None:
+            return None
+        # Let the Project operator raise the error for missing columns.
+        if not set(drop_cols).issubset(column_names):
+            return None
+        return [column for column in column_names if column not in drop_cols]
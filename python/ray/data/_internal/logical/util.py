@@ -5,7 +5,7 @@ from typing import Dict
 
 from ray._private.usage.usage_lib import TagKey, record_extra_usage_tag
 from ray.data._internal.logical.interfaces import LogicalOperator
-from ray.data._internal.logical.operators.map_operator import AbstractUDFMap
+from ray.data._internal.logical.operators.map_operator import AbstractUDFMap, WithColumn
 from ray.data._internal.logical.operators.read_operator import Read
 from ray.data._internal.logical.operators.write_operator import Write
 
@@ -57,15 +57,20 @@ _op_name_white_list = [
     "MapBatches",
     "Filter",
     "FlatMap",
+    "Project",
+    "WithColumn",
     # All-to-all
     "RandomizeBlockOrder",
     "RandomShuffle",
     "Repartition",
     "Sort",
     "Aggregate",
+    # One-to-one
+    "Cache",
     # N-ary
     "Zip",
     "Union",
+    "Join",
 ]
 
 
@@ -99,8 +104,8 @@ def _collect_operators_to_dict(op: LogicalOperator, ops_dict: Dict[str, int]):
         op_name = f"Write{op._datasink_or_legacy_datasource.get_name()}"
         if op_name not in _op_name_white_list:
             op_name = "WriteCustom"
-    elif isinstance(op, AbstractUDFMap):
-        # Remove the function name from the map operator name.
+    elif isinstance(op, (AbstractUDFMap, WithColumn)):
+        # Remove the function name or expression from the map operator name.
         # E.g., Map(<lambda>) -> Map
         op_name = re.sub("\\(.*\\)$", "", op_name)
 
@@ -1,10 +1,11 @@
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple, Union
 
 from ray.data._internal.execution.interfaces import (
     AllToAllTransformFn,
     RefBundle,
     TaskContext,
 )
+from ray.data._internal.execution.operators.map_transformer import BlockMapTransformFn
 from ray.data._internal.planner.exchange.aggregate_task_spec import (
     SortAggregateTaskSpec,
 )
@@ -18,6 +19,7 @@ from ray.data._internal.planner.exchange.sort_task_spec import SortKey, SortTask
 from ray.data._internal.stats import StatsDict
 from ray.data._internal.util import unify_block_metadata_schema
 from ray.data.aggregate import AggregateFn
+from ray.data.block import Block, BlockAccessor
 from ray.data.context import DataContext
 
 
@@ -83,3 +85,39 @@ def generate_aggregate_fn(
         )
 
     return fn
+
+
+def generate_local_aggregate_fn(
+    key: Union[str, List[str]],
+    aggs: List[AggregateFn],
+    sort_blocks: bool,
+) -> BlockMapTransformFn:
+    """Generate a block transform that aggregates each block separately.
+
+    This is only correct if all rows with equal keys are in the same block, e.g.,
+    if the input is range-partitioned on the key, in which case the aggregation
+    doesn't need a shuffle.
+
+    Args:
+        key: The groupby key column or columns.
+        aggs: The aggregations to do.
+        sort_blocks: Whether to sort each block by the key before aggregating it.
+            The blocks must be sorted by the key, unless they're already.
+    """
+    if len(aggs) == 0:
+        raise ValueError("Aggregate requires at least one aggregation")
+
+    def fn(blocks: Iterable[Block], _: TaskContext) -> Iterable[Block]:
+        for block in blocks:
+            block = SortAggregateTaskSpec._prune_unused_columns(block, key, aggs)
+            if sort_blocks:
+                (block,) = BlockAccessor.for_block(block).sort_and_partition(
+                    [], SortKey(key)
+                )
+            combined = BlockAccessor.for_block(block).combine(key, aggs)
+            result, _ = BlockAccessor.for_block(combined).aggregate_combined_blocks(
+                [combined], key, aggs, finalize=True
+            )
+            yield result
+
+    return BlockMapTransformFn(fn)
@@ -1,6 +1,7 @@
 from typing import List, Optional, Tuple, Union
 
 from ray.data._internal.aggregate import Count, _AggregateOnKeyBase
+from ray.data._internal.planner.exchange.hash_partition import hash_partition
 from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
 from ray.data._internal.planner.exchange.sort_task_spec import SortKey
 from ray.data._internal.table_block import TableBlockAccessor
@@ -102,3 +103,65 @@ class SortAggregateTaskSpec(ExchangeTaskSpec):
             return block_accessor.select(list(columns))
         else:
             return block
+
+
+class HashAggregateTaskSpec(ExchangeTaskSpec):
+    """
+    The implementation for hash-based aggregate tasks.
+
+    Unlike `SortAggregateTaskSpec`, partitions don't depend on sampled boundaries,
+    so map tasks can run as soon as their input blocks are produced.
+
+    Partial aggregate (`map`): each block is partitioned by the hash of the key
+    columns. Each partition is sorted locally and aggregated separately.
+
+    Final aggregate (`reduce`): each task receives the partially aggregated blocks of
+    one partition, merges them and aggregates on-the-fly. With `partial_reduce`, the
+    accumulators aren't finalized, so the output can be reduced again.
+
+    Outputs are sorted by key within each partition, but not across partitions.
+    """
+
+    def __init__(
+        self,
+        key: Optional[Union[str, List[str]]],
+        aggs: List[AggregateFn],
+    ):
+        super().__init__(
+            map_args=[key, aggs],
+            reduce_args=[key, aggs],
+        )
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        key: Optional[Union[str, List[str]]],
+        aggs: List[AggregateFn],
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+
+        block = SortAggregateTaskSpec._prune_unused_columns(block, key, aggs)
+        if key is None:
+            partitions = [block]
+        else:
+            key_columns = [key] if isinstance(key, str) else key
+            partitions = [
+                BlockAccessor.for_block(p).sort_and_partition([], SortKey(key))[0]
+                for p in hash_partition(block, key_columns, output_num_blocks)
+            ]
+        parts = [BlockAccessor.for_block(p).combine(key, aggs) for p in partitions]
+        meta = BlockAccessor.for_block(block).get_metadata(exec_stats=stats.build())
+        return parts + [meta]
+
+    @staticmethod
+    def reduce(
+        key: Optional[Union[str, List[str]]],
+        aggs: List[AggregateFn],
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> Tuple[Block, BlockMetadata]:
+        return SortAggregateTaskSpec.reduce(
+            key, aggs, *mapper_outputs, partial_reduce=partial_reduce
+        )
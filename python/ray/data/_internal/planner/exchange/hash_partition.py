@@ -0,0 +1,60 @@
+from typing import List
+
+import numpy as np
+
+from ray.data.block import Block, BlockAccessor
+
+
+def hash_partition(
+    block: Block,
+    key_columns: List[str],
+    num_partitions: int,
+) -> List[Block]:
+    """Split `block` into `num_partitions` blocks by the hash of `key_columns`.
+
+    Equal keys are assigned to the same partition index in every process and for
+    every block format, because the hash function is deterministic and only depends
+    on the key values. The partitions keep the format of the input block.
+    """
+    if num_partitions == 1:
+        return [block]
+
+    accessor = BlockAccessor.for_block(block)
+    partition_ids = _get_partition_ids(
+        accessor.select(key_columns), key_columns, num_partitions
+    )
+    # Group the rows by partition with a single `take`, so that each partition is a
+    # zero-copy slice of the grouped block.
+    order = np.argsort(partition_ids, kind="stable")
+    counts = np.bincount(partition_ids.astype(np.int64), minlength=num_partitions)
+    grouped = BlockAccessor.for_block(accessor.take(order))
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    return [
+        grouped.slice(int(offsets[i]), int(offsets[i + 1]), copy=False)
+        for i in range(num_partitions)
+    ]
+
+
+def _get_partition_ids(
+    key_block: Block, key_columns: List[str], num_partitions: int
+) -> np.ndarray:
+    import pandas as pd
+    import pyarrow.compute as pc
+
+    # The keys are hashed in Arrow format, so that pandas and Arrow blocks with the
+    # same keys are partitioned the same way.
+    table = BlockAccessor.for_block(key_block).to_arrow()
+    hashes = np.zeros(table.num_rows, dtype=np.uint64)
+    for key_column in key_columns:
+        column = table.column(key_column)
+        if column.null_count > 0:
+            # Null keys never match, so they can go to any partition. Replace them
+            # with a valid value, so that PyArrow doesn't convert integer columns
+            # with nulls to floats, which would change the hashes of the other rows.
+            non_null = pc.drop_null(column)
+            if len(non_null) == 0:
+                continue
+            column = pc.fill_null(column, non_null[0])
+        values = column.to_numpy()
+        hashes = hashes * np.uint64(31) + pd.util.hash_array(values)
+    return hashes % np.uint64(num_partitions)
@@ -0,0 +1,168 @@
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+
+from ray.data._internal.planner.exchange.hash_partition import hash_partition
+from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+
+if TYPE_CHECKING:
+    import pyarrow
+
+# Maps the join types accepted by `Dataset.join` to PyArrow's join types.
+_JOIN_TYPES = {
+    "inner": "inner",
+    "left_outer": "left outer",
+    "right_outer": "right outer",
+    "full_outer": "full outer",
+}
+
+# Join types that can be executed by broadcasting the right input to every block of
+# the left input. Unmatched rows of the right input can't be emitted this way.
+BROADCAST_JOIN_TYPES = ("inner", "left_outer")
+
+
+class JoinTaskSpec(ExchangeTaskSpec):
+    """
+    The implementation for hash join tasks.
+
+    Join is done in 2 steps: hash partitioning both inputs, and joining the
+    co-partitioned blocks.
+
+    Hash partitioning (`map`): each block of either input is split into
+    `output_num_blocks` partitions by the hash of its key columns, so rows with
+    equal keys end up in partitions with the same index, no matter which input
+    they come from.
+
+    Join (`reduce`): each task receives partition `i` of every block of both
+    inputs, and joins them with Arrow's hash join. The first `num_left_blocks`
+    mapper outputs come from the left input.
+    """
+
+    MAP_SUB_PROGRESS_BAR_NAME = "Join Map"
+    REDUCE_SUB_PROGRESS_BAR_NAME = "Join Reduce"
+
+    def __init__(
+        self,
+        join_type: str,
+        left_key_columns: List[str],
+        right_key_columns: List[str],
+        left_columns_suffix: Optional[str] = None,
+        right_columns_suffix: Optional[str] = None,
+    ):
+        if join_type not in _JOIN_TYPES:
+            raise ValueError(
+                f"Unsupported join type {join_type!r}. Supported join types are: "
+                f"{list(_JOIN_TYPES)}."
+            )
+        if len(left_key_columns) != len(right_key_columns):
+            raise ValueError(
+                "Both sides of a join must have the same number of key columns, got "
+                f"{left_key_columns} and {right_key_columns}."
+            )
+        # The map tasks of the left and right inputs use different key columns, so
+        # the key columns are passed explicitly rather than through `map_args`.
+        super().__init__(
+            map_args=[],
+            reduce_args=[
+                join_type,
+                left_key_columns,
+                right_key_columns,
+                left_columns_suffix,
+                right_columns_suffix,
+            ],
+        )
+        self.left_key_columns = left_key_columns
+        self.right_key_columns = right_key_columns
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        key_columns: List[str],
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+        accessor = BlockAccessor.for_block(block)
+        if accessor.num_rows() == 0:
+            # Blocks that were filtered to empty may not have any columns, so they
+            # can't be partitioned by the key columns. All their partitions are
+            # empty, and are dropped by the reduce tasks.
+            partitions = [block] * output_num_blocks
+        else:
+            partitions = hash_partition(block, key_columns, output_num_blocks)
+        meta = accessor.get_metadata(exec_stats=stats.build())
+        return partitions + [meta]
+
+    @staticmethod
+    def reduce(
+        join_type: str,
+        left_key_columns: List[str],
+        right_key_columns: List[str],
+        left_columns_suffix: Optional[str],
+        right_columns_suffix: Optional[str],
+        num_left_blocks: int,
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> Tuple[Block, BlockMetadata]:
+        stats = BlockExecStats.builder()
+        result = join_blocks(
+            mapper_outputs[:num_left_blocks],
+            mapper_outputs[num_left_blocks:],
+            join_type,
+            left_key_columns,
+            right_key_columns,
+            left_columns_suffix,
+            right_columns_suffix,
+        )
+        meta = BlockAccessor.for_block(result).get_metadata(exec_stats=stats.build())
+        return result, meta
+
+
+def join_blocks(
+    left_blocks: List[Block],
+    right_blocks: List[Block],
+    join_type: str,
+    left_key_columns: List[str],
+    right_key_columns: List[str],
+    left_columns_suffix: Optional[str],
+    right_columns_suffix: Optional[str],
+) -> "pyarrow.Table":
+    """Join the rows of `left_blocks` with the rows of `right_blocks`."""
+    import pyarrow as pa
+
+    left = _concat_tables(left_blocks)
+    right = _concat_tables(right_blocks)
+    # If a side only has empty blocks without columns, its schema is unknown. Only
+    # the rows of the other side can be part of the result in that case.
+    if left is None or right is None:
+        if left is not None and join_type in ("left_outer", "full_outer"):
+            return left
+        if right is not None and join_type in ("right_outer", "full_outer"):
+            return right
+        return pa.table({})
+
+    return left.join(
+        right,
+        keys=left_key_columns,
+        right_keys=right_key_columns,
+        join_type=_JOIN_TYPES[join_type],
+        left_suffix=left_columns_suffix,
+        right_suffix=right_columns_suffix,
+    )
+
+
+def _concat_tables(blocks: List[Block]) -> Optional["pyarrow.Table"]:
+    from ray.data._internal.arrow_ops import transform_pyarrow
+
+    # Empty blocks are dropped, because blocks that were filtered to empty may not
+    # have any columns, and can't be concatenated or joined with the others.
+    all_tables = [BlockAccessor.for_block(block).to_arrow() for block in blocks]
+    tables = [table for table in all_tables if table.num_rows > 0]
+    if not tables:
+        # Keep the schema of an empty side if it's known, e.g., for empty range
+        # partitions, so that the result has the columns of both sides.
+        tables = [table for table in all_tables if table.num_columns > 0][:1]
+    if not tables:
+        return None
+    if len(tables) == 1:
+        return tables[0]
+    return transform_pyarrow.concat(tables)
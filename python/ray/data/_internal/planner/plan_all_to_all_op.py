@@ -1,9 +1,14 @@
-from typing import List
+from typing import List, Union
 
 from ray.data._internal.execution.interfaces import PhysicalOperator
 from ray.data._internal.execution.operators.base_physical_operator import (
     AllToAllOperator,
 )
+from ray.data._internal.execution.operators.hash_shuffle_operator import (
+    HashShuffleOperator,
+)
+from ray.data._internal.execution.operators.map_operator import MapOperator
+from ray.data._internal.execution.operators.map_transformer import MapTransformer
 from ray.data._internal.logical.operators.all_to_all_operator import (
     AbstractAllToAll,
     Aggregate,
@@ -12,7 +17,15 @@ from ray.data._internal.logical.operators.all_to_all_operator import (
     Repartition,
     Sort,
 )
-from ray.data._internal.planner.aggregate import generate_aggregate_fn
+from ray.data._internal.planner.aggregate import (
+    generate_aggregate_fn,
+    generate_local_aggregate_fn,
+)
+from ray.data._internal.planner.exchange.aggregate_task_spec import (
+    HashAggregateTaskSpec,
+)
+from ray.data._internal.planner.exchange.shuffle_task_spec import ShuffleTaskSpec
+from ray.data._internal.planner.exchange.sort_task_spec import SortKey
 from ray.data._internal.planner.random_shuffle import generate_random_shuffle_fn
 from ray.data._internal.planner.randomize_blocks import generate_randomize_blocks_fn
 from ray.data._internal.planner.repartition import generate_repartition_fn
@@ -31,6 +44,21 @@ def plan_all_to_all_op(
     assert len(physical_children) == 1
     input_physical_dag = physical_children[0]
 
+    if isinstance(op, Aggregate) and op._key is not None:
+        partitioning = op.input_dependencies[0].output_partitioning()
+        key_columns = SortKey(op._key).get_columns()
+        if partitioning is not None and partitioning.colocates(key_columns):
+            return _plan_local_aggregate_op(
+                op,
+                input_physical_dag,
+                sort_blocks=not partitioning.is_sorted_by(key_columns),
+            )
+
+    if DataContext.get_current().use_streaming_hash_shuffle and isinstance(
+        op, (RandomShuffle, Aggregate)
+    ):
+        return _plan_hash_shuffle_op(op, input_physical_dag)
+
     target_max_block_size = None
     if isinstance(op, RandomizeBlocks):
         fn = generate_randomize_blocks_fn(op)
@@ -94,3 +122,64 @@ def plan_all_to_all_op(
         sub_progress_bar_names=op._sub_progress_bar_names,
         name=op.name,
     )
+
+
+def _plan_local_aggregate_op(
+    op: Aggregate, input_physical_dag: PhysicalOperator, sort_blocks: bool
+) -> MapOperator:
+    """Plan an aggregation of an input that's range-partitioned on the key.
+
+    All rows of a group are in the same input block, so each block is aggregated
+    separately, without a shuffle.
+    """
+    map_transformer = MapTransformer(
+        [generate_local_aggregate_fn(op._key, op._aggs, sort_blocks)]
+    )
+    return MapOperator.create(
+        map_transformer,
+        input_physical_dag,
+        name=op.name,
+        target_max_block_size=None,
+        ray_remote_args=op._ray_remote_args,
+    )
+
+
+def _plan_hash_shuffle_op(
+    op: Union[RandomShuffle, Aggregate], input_physical_dag: PhysicalOperator
+) -> HashShuffleOperator:
+    """Plan a streaming HashShuffleOperator for ops whose map tasks don't depend on
+    other blocks.
+
+    Sort and repartition need sampled boundaries or the total number of rows, so
+    they always use AllToAllOperator.
+    """
+    ctx = DataContext.get_current()
+    # The number of outputs of most physical operators is unknown until they run,
+    # so use the estimate of the logical plan, which is the number of read tasks
+    # unless the blocks are repartitioned.
+    num_partitions = (
+        op.estimated_num_outputs()
+        or input_physical_dag.num_outputs_total()
+        or ctx.read_op_min_num_blocks
+    )
+    if isinstance(op, RandomShuffle):
+        exchange_spec = ShuffleTaskSpec(
+            ctx.target_shuffle_max_block_size,
+            random_shuffle=True,
+            random_seed=op._seed,
+        )
+    else:
+        if len(op._aggs) == 0:
+            raise ValueError("Aggregate requires at least one aggregation")
+        exchange_spec = HashAggregateTaskSpec(key=op._key, aggs=op._aggs)
+        if op._key is None:
+            num_partitions = 1
+
+    return HashShuffleOperator(
+        input_physical_dag,
+        exchange_spec,
+        num_partitions=num_partitions,
+        name=op.name,
+        target_max_block_size=ctx.target_shuffle_max_block_size,
+        ray_remote_args=op._ray_remote_args,
+    )
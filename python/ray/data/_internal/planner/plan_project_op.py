@@ -0,0 +1,65 @@
+from typing import Iterable, List, Optional
+
+from ray.data._internal.compute import get_compute
+from ray.data._internal.execution.interfaces import PhysicalOperator
+from ray.data._internal.execution.interfaces.task_context import TaskContext
+from ray.data._internal.execution.operators.map_operator import MapOperator
+from ray.data._internal.execution.operators.map_transformer import (
+    BlockMapTransformFn,
+    MapTransformer,
+)
+from ray.data._internal.logical.operators.map_operator import Project
+from ray.data.block import Block, BlockAccessor
+
+
+def generate_project_fn(
+    cols: Optional[List[str]], drop_cols: Optional[List[str]]
+) -> BlockMapTransformFn:
+    """Generate a block transform that selects `cols` or removes `drop_cols`.
+
+    The projection is applied to each block in its native format, so Arrow blocks
+    aren't converted to pandas just to select columns.
+    """
+    if cols is not None:
+        # Selecting a column twice selects it once, at its first position.
+        cols = list(dict.fromkeys(cols))
+
+    def fn(blocks: Iterable[Block], _: TaskContext) -> Iterable[Block]:
+        for block in blocks:
+            block_accessor = BlockAccessor.for_block(block)
+            if cols is not None:
+                yield block_accessor.select(columns=cols)
+                continue
+
+            column_names = block_accessor.column_names()
+            missing = [c for c in drop_cols if c not in column_names]
+            if missing:
+                raise KeyError(
+                    f"Columns {missing} can't be dropped, because they don't exist "
+                    f"in the dataset. Existing columns: {column_names}."
+                )
+            drop = set(drop_cols)
+            yield block_accessor.select(
+                columns=[c for c in column_names if c not in drop]
+            )
+
+    return BlockMapTransformFn(fn)
+
+
+def plan_project_op(
+    op: Project, physical_children: List[PhysicalOperator]
+) -> MapOperator:
+    """Get the corresponding physical operators DAG for a Project operator."""
+    assert len(physical_children) == 1
+    input_physical_dag = physical_children[0]
+
+    map_transformer = MapTransformer([generate_project_fn(op._cols, op._drop_cols)])
+    return MapOperator.create(
+        map_transformer,
+        input_physical_dag,
+        name=op.name,
+        target_max_block_size=None,
+        compute_strategy=get_compute(op._compute),
+        min_rows_per_bundle=op._min_rows_per_bundled_input,
+        ray_remote_args=op._ray_remote_args,
+    )
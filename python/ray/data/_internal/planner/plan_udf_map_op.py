@@ -4,7 +4,7 @@ import inspect
 import queue
 from threading import Thread
 from types import GeneratorType
-from typing import Any, Callable, Iterable, Iterator, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -17,6 +17,7 @@ from ray.data._internal.execution.interfaces import PhysicalOperator
 from ray.data._internal.execution.interfaces.task_context import TaskContext
 from ray.data._internal.execution.operators.map_operator import MapOperator
 from ray.data._internal.execution.operators.map_transformer import (
+    ArrowBatchMapTransformFn,
     BatchMapTransformFn,
     BlocksToBatchesMapTransformFn,
     BlocksToRowsMapTransformFn,
@@ -47,6 +48,9 @@ from ray.data.context import DataContext
 from ray.data.exceptions import UserCodeException
 from ray.util.rpdb import _is_ray_debugger_enabled
 
+if TYPE_CHECKING:
+    from ray.data.expressions import Expr
+
 
 class _MapActorContext:
     def __init__(
@@ -90,6 +94,20 @@ def plan_udf_map_op(
     input_physical_dag = physical_children[0]
 
     compute = get_compute(op._compute)
+
+    if isinstance(op, Filter) and op._filter_expr is not None:
+        map_transformer = _create_map_transformer_for_filter_expr_op(op._filter_expr)
+        return MapOperator.create(
+            map_transformer,
+            input_physical_dag,
+            name=op.name,
+            target_max_block_size=None,
+            compute_strategy=compute,
+            min_rows_per_bundle=op._min_rows_per_bundled_input,
+            ray_remote_args_fn=op._ray_remote_args_fn,
+            ray_remote_args=op._ray_remote_args,
+        )
+
     fn, init_fn = _parse_op_fn(op)
 
     if isinstance(op, MapBatches):
@@ -436,6 +454,33 @@ def _create_map_transformer_for_map_batches_op(
     return MapTransformer(transform_fns, init_fn)
 
 
+def _create_map_transformer_for_filter_expr_op(filter_expr: "Expr") -> MapTransformer:
+    """Create a MapTransformer for a filter operator with a column expression.
+
+    The expression is evaluated with Arrow compute, so no per-row Python callbacks
+    are involved.
+    """
+
+    def filter_batches(
+        batches: Iterable["pa.Table"], _: TaskContext
+    ) -> Iterable["pa.Table"]:
+        # Convert the expression once per task, rather than once per batch.
+        predicate = filter_expr.to_pyarrow()
+        for batch in batches:
+            yield batch.filter(predicate)
+
+    transform_fns = [
+        BlocksToBatchesMapTransformFn(
+            batch_size=None,
+            batch_format="pyarrow",
+            zero_copy_batch=True,
+        ),
+        ArrowBatchMapTransformFn(filter_batches),
+        BuildOutputBlocksMapTransformFn.for_batches(),
+    ]
+    return MapTransformer(transform_fns)
+
+
 def _create_map_transformer_for_row_based_map_op(
     row_fn: MapTransformCallable[Row, Row],
     init_fn: Optional[Callable[[], None]] = None,
@@ -0,0 +1,69 @@
+from typing import TYPE_CHECKING, Iterable, List
+
+from ray.data._internal.compute import get_compute
+from ray.data._internal.execution.interfaces import PhysicalOperator
+from ray.data._internal.execution.interfaces.task_context import TaskContext
+from ray.data._internal.execution.operators.map_operator import MapOperator
+from ray.data._internal.execution.operators.map_transformer import (
+    ArrowBatchMapTransformFn,
+    BlocksToBatchesMapTransformFn,
+    BuildOutputBlocksMapTransformFn,
+    MapTransformer,
+)
+from ray.data._internal.logical.operators.map_operator import WithColumn
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from ray.data.expressions import Expr
+
+
+def generate_with_column_fn(col: str, expr: "Expr") -> ArrowBatchMapTransformFn:
+    """Generate a batch transform that sets the column `col` to `expr`.
+
+    The expression is evaluated with Arrow compute, so no Python code runs per row,
+    and an existing column with the same name is replaced in place.
+    """
+
+    def fn(batches: Iterable["pa.Table"], _: TaskContext) -> Iterable["pa.Table"]:
+        import pyarrow.dataset as pds
+
+        # Convert the expression once per task, rather than once per batch.
+        projection = {col: expr.to_pyarrow()}
+        for batch in batches:
+            values = pds.dataset(batch).to_table(columns=projection).column(col)
+            if col in batch.column_names:
+                yield batch.set_column(batch.column_names.index(col), col, values)
+            else:
+                yield batch.append_column(col, values)
+
+    return ArrowBatchMapTransformFn(fn)
+
+
+def plan_with_column_op(
+    op: WithColumn, physical_children: List[PhysicalOperator]
+) -> MapOperator:
+    """Get the corresponding physical operators DAG for a WithColumn operator."""
+    assert len(physical_children) == 1
+    input_physical_dag = physical_children[0]
+
+    map_transformer = MapTransformer(
+        [
+            BlocksToBatchesMapTransformFn(
+                batch_size=None,
+                batch_format="pyarrow",
+                zero_copy_batch=True,
+            ),
+            generate_with_column_fn(op._col, op._expr),
+            BuildOutputBlocksMapTransformFn.for_batches(),
+        ]
+    )
+    return MapOperator.create(
+        map_transformer,
+        input_physical_dag,
+        name=op.name,
+        target_max_block_size=None,
+        compute_strategy=get_compute(op._compute),
+        min_rows_per_bundle=op._min_rows_per_bundled_input,
+        ray_remote_args=op._ray_remote_args,
+    )
@@ -78,5 +78,6 @@ def plan_write_op(
         target_max_block_size=None,
         ray_remote_args=op._ray_remote_args,
         min_rows_per_bundle=op._min_rows_per_bundled_input,
+        min_bytes_per_bundle=op._min_bytes_per_bundled_input,
         compute_strategy=TaskPoolStrategy(op._concurrency),
     )
@@ -6,6 +6,7 @@ from ray.data._internal.logical.interfaces import (
     LogicalPlan,
     PhysicalPlan,
 )
+from ray.data._internal.logical.operators.one_to_one_operator import Cache
 from ray.util.annotations import DeveloperAPI
 
 LogicalOperatorType = TypeVar("LogicalOperatorType", bound=LogicalOperator)
@@ -31,7 +32,9 @@ def _register_default_plan_logical_op_fns():
     from ray.data._internal.execution.operators.aggregate_num_rows import (
         AggregateNumRows,
     )
+    from ray.data._internal.execution.operators.cache_operator import CacheOperator
     from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
+    from ray.data._internal.execution.operators.join_operator import JoinOperator
     from ray.data._internal.execution.operators.limit_operator import LimitOperator
     from ray.data._internal.execution.operators.union_operator import UnionOperator
     from ray.data._internal.execution.operators.zip_operator import ZipOperator
@@ -41,14 +44,21 @@ def _register_default_plan_logical_op_fns():
     from ray.data._internal.logical.operators.count_operator import Count
     from ray.data._internal.logical.operators.from_operators import AbstractFrom
     from ray.data._internal.logical.operators.input_data_operator import InputData
-    from ray.data._internal.logical.operators.map_operator import AbstractUDFMap
-    from ray.data._internal.logical.operators.n_ary_operator import Union, Zip
+    from ray.data._internal.logical.operators.map_operator import (
+        AbstractUDFMap,
+        Project,
+        WithColumn,
+    )
+    from ray.data._internal.logical.operators.n_ary_operator import Join, Union, Zip
     from ray.data._internal.logical.operators.one_to_one_operator import Limit
     from ray.data._internal.logical.operators.read_operator import Read
     from ray.data._internal.logical.operators.write_operator import Write
+    from ray.data._internal.planner.exchange.join_task_spec import JoinTaskSpec
     from ray.data._internal.planner.plan_all_to_all_op import plan_all_to_all_op
+    from ray.data._internal.planner.plan_project_op import plan_project_op
     from ray.data._internal.planner.plan_read_op import plan_read_op
     from ray.data._internal.planner.plan_udf_map_op import plan_udf_map_op
+    from ray.data._internal.planner.plan_with_column_op import plan_with_column_op
     from ray.data._internal.planner.plan_write_op import plan_write_op
 
     register_plan_logical_op_fn(Read, plan_read_op)
@@ -75,6 +85,8 @@ def _register_default_plan_logical_op_fns():
 
     register_plan_logical_op_fn(AbstractFrom, plan_from_op)
     register_plan_logical_op_fn(AbstractUDFMap, plan_udf_map_op)
+    register_plan_logical_op_fn(Project, plan_project_op)
+    register_plan_logical_op_fn(WithColumn, plan_with_column_op)
     register_plan_logical_op_fn(AbstractAllToAll, plan_all_to_all_op)
 
     def plan_zip_op(_, physical_children):
@@ -83,6 +95,36 @@ def _register_default_plan_logical_op_fns():
 
     register_plan_logical_op_fn(Zip, plan_zip_op)
 
+    def plan_join_op(logical_op: Join, physical_children):
+        assert len(physical_children) == 2
+        join_spec = JoinTaskSpec(
+            join_type=logical_op._join_type,
+            left_key_columns=logical_op._left_key_columns,
+            right_key_columns=logical_op._right_key_columns,
+            left_columns_suffix=logical_op._left_columns_suffix,
+            right_columns_suffix=logical_op._right_columns_suffix,
+        )
+        left_op, right_op = logical_op.input_dependencies
+        left_partitioning = left_op.output_partitioning()
+        right_partitioning = right_op.output_partitioning()
+        co_partitioned = (
+            left_partitioning is not None
+            and right_partitioning is not None
+            and left_partitioning.key_columns == logical_op._left_key_columns
+            and right_partitioning.key_columns == logical_op._right_key_columns
+            and left_partitioning.is_co_partitioned_with(right_partitioning)
+        )
+        return JoinOperator(
+            physical_children[0],
+            physical_children[1],
+            join_spec,
+            num_partitions=logical_op._num_partitions,
+            broadcast=logical_op._broadcast,
+            co_partitioned=co_partitioned,
+        )
+
+    register_plan_logical_op_fn(Join, plan_join_op)
+
     def plan_union_op(_, physical_children):
         assert len(physical_children) >= 2
         return UnionOperator(*physical_children)
@@ -101,6 +143,18 @@ def _register_default_plan_logical_op_fns():
 
     register_plan_logical_op_fn(Count, plan_count_op)
 
+    def plan_cache_op(logical_op: Cache, physical_children):
+        if not physical_children:
+            # The cache is complete, so the input operators were skipped.
+            input_op = InputDataBuffer(input_data=logical_op._cache.get_bundles())
+            return CacheOperator(input_op, logical_op._cache, read_from_cache=True)
+        assert len(physical_children) == 1
+        return CacheOperator(
+            physical_children[0], logical_op._cache, read_from_cache=False
+        )
+
+    register_plan_logical_op_fn(Cache, plan_cache_op)
+
 
 _register_default_plan_logical_op_fns()
 
@@ -126,10 +180,12 @@ class Planner:
         return physical_plan
 
     def _plan(self, logical_op: LogicalOperator) -> PhysicalOperator:
-        # Plan the input dependencies first.
+        # Plan the input dependencies first. If the outputs of the operator are
+        # cached, the input operators don't need to be executed.
         physical_children = []
-        for child in logical_op.input_dependencies:
-            physical_children.append(self._plan(child))
+        if not (isinstance(logical_op, Cache) and logical_op._cache.is_complete()):
+            for child in logical_op.input_dependencies:
+                physical_children.append(self._plan(child))
 
         physical_op = None
         for op_type, plan_fn in PLAN_LOGICAL_OP_FNS:
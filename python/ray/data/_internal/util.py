@@ -557,12 +557,7 @@ def get_compute_strategy(
 
     if compute is not None:
         # Legacy code path to support `compute` argument.
-        logger.warning(
-            "The argument ``compute`` is deprecated in Ray 2.9. Please specify "
-            "argument ``concurrency`` instead. For more information, see "
-            "https://docs.ray.io/en/master/data/transforming-data.html#"
-            "stateful-transforms."
-        )
+        _warn_compute_deprecated()
         if is_callable_class and (
             compute == "tasks" or isinstance(compute, TaskPoolStrategy)
         ):
@@ -622,6 +617,52 @@ def get_compute_strategy(
             return TaskPoolStrategy()
 
 
+def get_task_compute_strategy(
+    compute: Optional[Union[str, "ComputeStrategy"]] = None,
+    concurrency: Optional[int] = None,
+) -> "ComputeStrategy":
+    """Get `ComputeStrategy` for a built-in transform, which runs in Ray tasks.
+
+    Args:
+        compute: Either "tasks" (default) or a
+            :class:`~ray.data._internal.compute.TaskPoolStrategy`.
+        concurrency: The number of Ray tasks to run concurrently.
+
+    Returns:
+       The `ComputeStrategy` for execution.
+    """
+    # Lazily import these objects to avoid circular imports.
+    from ray.data._internal.compute import ActorPoolStrategy, TaskPoolStrategy
+
+    if compute is not None:
+        # Legacy code path to support `compute` argument.
+        _warn_compute_deprecated()
+        if compute == "actors" or isinstance(compute, ActorPoolStrategy):
+            raise ValueError(
+                "``compute`` must specify a task compute strategy for a built-in "
+                f"transform, but got: {compute}."
+            )
+        return compute
+    elif concurrency is not None:
+        if isinstance(concurrency, int) and not isinstance(concurrency, bool):
+            return TaskPoolStrategy(size=concurrency)
+        raise ValueError(
+            "``concurrency`` is expected to be set as an integer for a built-in "
+            f"transform, but got: {concurrency}."
+        )
+    else:
+        return TaskPoolStrategy()
+
+
+def _warn_compute_deprecated():
+    logger.warning(
+        "The argument ``compute`` is deprecated in Ray 2.9. Please specify "
+        "argument ``concurrency`` instead. For more information, see "
+        "https://docs.ray.io/en/master/data/transforming-data.html#"
+        "stateful-transforms."
+    )
+
+
 def capfirst(s: str):
     """Capitalize the first letter of a string
 
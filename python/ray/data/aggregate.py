@@ -1,4 +1,7 @@
-from typing import TYPE_CHECKING, Callable, Optional, Union
+import math
+from typing import TYPE_CHECKING, Callable, List, Optional, Union
+
+import numpy as np
 
 from ray.data.block import AggType, Block, BlockAccessor, KeyType, T, U
 from ray.util.annotations import PublicAPI
@@ -74,3 +77,281 @@ class AggregateFn:
     def _validate(self, schema: Optional[Union[type, "pa.lib.Schema"]]) -> None:
         """Raise an error if this cannot be applied to the given schema."""
         pass
+
+
+class _SketchAggregateBase(AggregateFn):
+    """Base class of the aggregations that accumulate a sketch of a column.
+
+    Sketches are serialized to bytes, so that they can be stored in the columns of
+    partially aggregated blocks. An empty sketch is `b""`. Nulls are ignored.
+    """
+
+    def __init__(
+        self,
+        on: str,
+        accumulate_values: Callable[[bytes, np.ndarray], bytes],
+        merge: Callable[[bytes, bytes], bytes],
+        finalize: Callable[[bytes], U],
+        name: str,
+    ):
+        if not isinstance(on, str):
+            raise ValueError(f"`on` must be a column name, but got: {on!r}.")
+        self._key_fn = on
+
+        def accumulate_block(a: bytes, block: Block) -> bytes:
+            values = _get_non_null_values(block, on)
+            if len(values) == 0:
+                return a
+            return accumulate_values(a, values)
+
+        super().__init__(
+            init=lambda k: b"",
+            merge=lambda a1, a2: merge(a1, a2) if a1 and a2 else a1 or a2,
+            accumulate_block=accumulate_block,
+            finalize=finalize,
+            name=name,
+        )
+
+    def _validate(self, schema: Optional[Union[type, "pa.lib.Schema"]]) -> None:
+        from ray.data._internal.planner.exchange.sort_task_spec import SortKey
+
+        SortKey(self._key_fn).validate_schema(schema)
+
+
+@PublicAPI(stability="alpha")
+class ApproxCountDistinct(_SketchAggregateBase):
+    """Approximately count the distinct values of a column.
+
+    The count is estimated with a HyperLogLog sketch of ``2 ** precision`` bytes,
+    so the memory usage doesn't depend on the number of distinct values. The
+    relative standard error of the estimate is about ``1.04 / sqrt(2 ** precision)``,
+    e.g., 1.6% with the default precision. Nulls aren't counted.
+
+    Examples:
+        >>> import ray
+        >>> from ray.data.aggregate import ApproxCountDistinct
+        >>> ds = ray.data.range(1000)
+        >>> ds.aggregate(ApproxCountDistinct("id"))  # doctest: +SKIP
+        {'approx_count_distinct(id)': 1000}
+
+    Args:
+        on: The name of the column.
+        precision: The number of bits of the hashes that select a register of the
+            sketch. Must be between 4 and 16.
+        alias_name: The name of the output column. Defaults to
+            ``approx_count_distinct(<on>)``.
+    """
+
+    def __init__(
+        self,
+        on: str,
+        precision: int = 12,
+        alias_name: Optional[str] = None,
+    ):
+        if not 4 <= precision <= 16:
+            raise ValueError(
+                f"`precision` must be between 4 and 16, but got: {precision}."
+            )
+        num_registers = 1 << precision
+
+        def accumulate_values(a: bytes, values: np.ndarray) -> bytes:
+            import pandas as pd
+
+            hashes = pd.util.hash_array(values).astype(np.uint64)
+            # The first `precision` bits select the register, and the register keeps
+            # the max position of the leftmost 1 bit in the remaining bits.
+            index = (hashes >> np.uint64(64 - precision)).astype(np.int64)
+            remaining_bits = hashes & np.uint64((1 << (64 - precision)) - 1)
+            ranks = (64 - precision + 1 - _bit_length(remaining_bits)).astype(np.uint8)
+            registers = _hll_registers(a, num_registers)
+            np.maximum.at(registers, index, ranks)
+            return registers.tobytes()
+
+        def merge(a1: bytes, a2: bytes) -> bytes:
+            return np.maximum(
+                _hll_registers(a1, num_registers), _hll_registers(a2, num_registers)
+            ).tobytes()
+
+        def finalize(a: bytes) -> int:
+            if not a:
+                return 0
+            registers = _hll_registers(a, num_registers)
+            m = num_registers
+            alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+            estimate = alpha * m * m / np.sum(np.ldexp(1.0, -registers.astype(int)))
+            num_zeros = int(np.count_nonzero(registers == 0))
+            if estimate <= 2.5 * m and num_zeros > 0:
+                # Use linear counting for small cardinalities.
+                estimate = m * math.log(m / num_zeros)
+            return int(round(estimate))
+
+        super().__init__(
+            on,
+            accumulate_values=accumulate_values,
+            merge=merge,
+            finalize=finalize,
+            name=alias_name or f"approx_count_distinct({on})",
+        )
+
+
+@PublicAPI(stability="alpha")
+class ApproxQuantile(_SketchAggregateBase):
+    """Approximately compute a quantile, or a list of quantiles, of a numeric column.
+
+    The quantiles are estimated with a t-digest sketch of at most about
+    ``compression / 2`` centroids, so it doesn't require sorting the column. The
+    sketch is more accurate for the extreme quantiles than for the median. Nulls are
+    ignored.
+
+    Examples:
+        >>> import ray
+        >>> from ray.data.aggregate import ApproxQuantile
+        >>> ds = ray.data.range(1000)
+        >>> ds.aggregate(ApproxQuantile("id", q=0.99))  # doctest: +SKIP
+        {'approx_quantile(id)': 989.5}
+
+    Args:
+        on: The name of the column.
+        q: The quantile to compute, between 0 and 1. If a list of quantiles, they're
+            estimated from the same sketch, and the result is a list.
+        compression: The compression of the t-digest. Larger values are more
+            accurate, and use more memory.
+        alias_name: The name of the output column. Defaults to
+            ``approx_quantile(<on>)``.
+    """
+
+    def __init__(
+        self,
+        on: str,
+        q: Union[float, List[float]] = 0.5,
+        compression: int = 200,
+        alias_name: Optional[str] = None,
+    ):
+        qs = q if isinstance(q, list) else [q]
+        for q_ in qs:
+            if not 0 <= q_ <= 1:
+                raise ValueError(f"`q` must be between 0 and 1, but got: {q_}.")
+        if compression <= 0:
+            raise ValueError(f"`compression` must be positive, but got: {compression}.")
+
+        def accumulate_values(a: bytes, values: np.ndarray) -> bytes:
+            values = values.astype(np.float64)
+            digest = _TDigest(
+                np.sort(values),
+                np.ones(len(values)),
+                values.min(),
+                values.max(),
+            ).compress(compression)
+            return merge(a, digest.to_bytes()) if a else digest.to_bytes()
+
+        def merge(a1: bytes, a2: bytes) -> bytes:
+            d1, d2 = _TDigest.from_bytes(a1), _TDigest.from_bytes(a2)
+            means = np.concatenate([d1.means, d2.means])
+            weights = np.concatenate([d1.weights, d2.weights])
+            order = np.argsort(means, kind="stable")
+            return (
+                _TDigest(
+                    means[order],
+                    weights[order],
+                    min(d1.min, d2.min),
+                    max(d1.max, d2.max),
+                )
+                .compress(compression)
+                .to_bytes()
+            )
+
+        def finalize(a: bytes) -> Union[Optional[float], List[Optional[float]]]:
+            if not a:
+                quantiles = [None] * len(qs)
+            else:
+                digest = _TDigest.from_bytes(a)
+                quantiles = [digest.quantile(q_) for q_ in qs]
+            return quantiles if isinstance(q, list) else quantiles[0]
+
+        super().__init__(
+            on,
+            accumulate_values=accumulate_values,
+            merge=merge,
+            finalize=finalize,
+            name=alias_name or f"approx_quantile({on})",
+        )
+
+
+class _TDigest:
+    """A t-digest: sorted centroids of the values, and the min and max values.
+
+    Centroids are built with the k1 scale function, so that each centroid spans at
+    most one unit of `k(q) = compression / (2 * pi) * asin(2 * q - 1)`. The centroids
+    at the tails of the distribution are smaller than the ones in the middle.
+    """
+
+    def __init__(
+        self, means: np.ndarray, weights: np.ndarray, min_: float, max_: float
+    ):
+        self.means = means
+        self.weights = weights
+        self.min = min_
+        self.max = max_
+
+    def compress(self, compression: int) -> "_TDigest":
+        """Merge adjacent centroids that fall in the same unit of the scale."""
+        total = self.weights.sum()
+        # The quantile at the center of each centroid.
+        q = (np.cumsum(self.weights) - self.weights / 2) / total
+        k = compression / (2 * np.pi) * np.arcsin(2 * q - 1)
+        _, clusters = np.unique(np.floor(k), return_inverse=True)
+        weights = np.bincount(clusters, weights=self.weights)
+        means = np.bincount(clusters, weights=self.means * self.weights) / weights
+        return _TDigest(means, weights, self.min, self.max)
+
+    def quantile(self, q: float) -> float:
+        # Interpolate between the centers of the centroids, and the min and max.
+        total = self.weights.sum()
+        centers = np.cumsum(self.weights) - self.weights / 2
+        ranks = np.concatenate([[0], centers, [total]])
+        values = np.concatenate([[self.min], self.means, [self.max]])
+        return float(np.interp(q * total, ranks, values))
+
+    def to_bytes(self) -> bytes:
+        return np.concatenate(
+            [[self.min, self.max], self.means, self.weights]
+        ).tobytes()
+
+    @staticmethod
+    def from_bytes(data: bytes) -> "_TDigest":
+        array = np.frombuffer(data, dtype=np.float64)
+        num_centroids = (len(array) - 2) // 2
+        return _TDigest(
+            array[2 : 2 + num_centroids],
+            array[2 + num_centroids :],
+            array[0],
+            array[1],
+        )
+
+
+def _get_non_null_values(block: Block, on: str) -> np.ndarray:
+    import pyarrow.compute as pc
+
+    block_accessor = BlockAccessor.for_block(block)
+    if block_accessor.num_rows() == 0:
+        return np.array([])
+    column = BlockAccessor.for_block(block_accessor.select([on])).to_arrow()[on]
+    return pc.drop_null(column).to_numpy()
+
+
+def _hll_registers(a: bytes, num_registers: int) -> np.ndarray:
+    if not a:
+        return np.zeros(num_registers, dtype=np.uint8)
+    # Copy the registers, because arrays backed by bytes are read-only.
+    return np.frombuffer(a, dtype=np.uint8).copy()
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Return the number of bits needed to represent each of the uint64 values."""
+    values = values.copy()
+    lengths = np.zeros(len(values), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = values >= np.uint64(1 << shift)
+        lengths[mask] += shift
+        values[mask] >>= np.uint64(shift)
+    return lengths + (values > 0)
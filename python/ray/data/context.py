@@ -56,6 +56,10 @@ DEFAULT_USE_PUSH_BASED_SHUFFLE = bool(
     os.environ.get("RAY_DATA_PUSH_BASED_SHUFFLE", None)
 )
 
+DEFAULT_USE_STREAMING_HASH_SHUFFLE = env_bool(
+    "RAY_DATA_USE_STREAMING_HASH_SHUFFLE", False
+)
+
 DEFAULT_SCHEDULING_STRATEGY = "SPREAD"
 
 # This default enables locality-based scheduling in Ray for tasks where arg data
@@ -66,6 +70,8 @@ DEFAULT_LARGE_ARGS_THRESHOLD = 50 * 1024 * 1024
 
 DEFAULT_USE_POLARS = False
 
+DEFAULT_USE_ARROW_HASH_AGGREGATE = env_bool("RAY_DATA_USE_ARROW_HASH_AGGREGATE", True)
+
 DEFAULT_EAGER_FREE = bool(int(os.environ.get("RAY_DATA_EAGER_FREE", "1")))
 
 DEFAULT_DECODING_SIZE_ESTIMATION_ENABLED = True
@@ -86,6 +92,8 @@ DEFAULT_VERBOSE_STATS_LOG = False
 
 DEFAULT_TRACE_ALLOCATIONS = bool(int(os.environ.get("RAY_DATA_TRACE_ALLOCATIONS", "0")))
 
+DEFAULT_EXECUTION_TIMELINE_DIR = os.environ.get("RAY_DATA_EXECUTION_TIMELINE_DIR")
+
 DEFAULT_LOG_INTERNAL_STACK_TRACE_TO_STDOUT = env_bool(
     "RAY_DATA_LOG_INTERNAL_STACK_TRACE_TO_STDOUT", False
 )
@@ -127,6 +135,24 @@ DEFAULT_RETRIED_IO_ERRORS = (
 
 DEFAULT_WARN_ON_DRIVER_MEMORY_USAGE_BYTES = 2 * 1024 * 1024 * 1024
 
+# Inputs smaller than this are broadcast to every block of the other input when
+# joining, instead of hash partitioning both inputs.
+DEFAULT_BROADCAST_JOIN_THRESHOLD_BYTES = env_integer(
+    "RAY_DATA_BROADCAST_JOIN_THRESHOLD_BYTES", 10 * 1024 * 1024
+)
+
+# If set, file listings and Parquet footer metadata are cached in this directory.
+DEFAULT_FILE_METADATA_CACHE_DIR = os.environ.get("RAY_DATA_FILE_METADATA_CACHE_DIR")
+
+DEFAULT_FILE_METADATA_CACHE_TTL_S = float(
+    os.environ.get("RAY_DATA_FILE_METADATA_CACHE_TTL_S", "3600")
+)
+
+# Whether to adjust the target max block size of each operator during execution.
+DEFAULT_ENABLE_BLOCK_SIZE_AUTOTUNING = env_bool(
+    "RAY_DATA_ENABLE_BLOCK_SIZE_AUTOTUNING", False
+)
+
 DEFAULT_ACTOR_TASK_RETRY_ON_ERRORS = False
 
 DEFAULT_ENABLE_OP_RESOURCE_RESERVATION = env_bool(
@@ -205,6 +231,10 @@ class DataContext:
         enable_pandas_block: Whether pandas block format is enabled.
         actor_prefetcher_enabled: Whether to use actor based block prefetcher.
         use_push_based_shuffle: Whether to use push-based shuffle.
+        use_streaming_hash_shuffle: Whether to run ``random_shuffle`` and
+            aggregations with a streaming hash shuffle, which shuffles blocks as
+            they're produced instead of waiting for all upstream operators to
+            finish. Aggregation outputs aren't sorted by key with this shuffle.
         pipeline_push_based_shuffle_reduce_tasks:
         scheduling_strategy: The global scheduling strategy. For tasks with large args,
             ``scheduling_strategy_large_args`` takes precedence.
@@ -214,6 +244,9 @@ class DataContext:
             significant in comparison to task scheduling (i.e., low tens of ms).
         use_polars: Whether to use Polars for tabular dataset sorts, groupbys, and
             aggregations.
+        use_arrow_hash_aggregate: Whether to compute built-in groupby aggregations
+            on Arrow blocks with ``pyarrow.Table.group_by``, instead of per-group
+            Python callbacks.
         eager_free: Whether to eagerly free memory.
         decoding_size_estimation: Whether to estimate in-memory decoding data size for
             data source.
@@ -228,6 +261,11 @@ class DataContext:
             such as `extra_metrics` in the stats output, which are excluded by default.
         trace_allocations: Whether to trace allocations / eager free. This adds
             significant performance overheads and should only be used for debugging.
+        execution_timeline_dir: If set, each execution writes a timeline of its
+            operator tasks, queued blocks, resource usage and backpressure to a
+            Chrome trace JSON file in this directory. You can load the file in
+            ``chrome://tracing`` or https://ui.perfetto.dev to diagnose pipeline
+            stalls.
         execution_options: The
             :class:`~ray.data._internal.execution.interfaces.execution_options.ExecutionOptions`
             to use.
@@ -271,6 +309,24 @@ class DataContext:
         retried_io_errors: A list of substrings of error messages that should
             trigger a retry when reading or writing files. This is useful for handling
             transient errors when reading from remote storage systems.
+        broadcast_join_threshold_bytes: If the right input of a join is smaller than
+            this size in bytes, it's broadcast to every block of the left input
+            instead of hash partitioning both inputs. Only applies to inner and
+            left outer joins.
+        file_metadata_cache_dir: If set, the file listings and Parquet footer
+            metadata fetched when reading files are cached in a database in this
+            directory, so that later reads of the same files skip fetching them.
+            Listings are invalidated if any listed directory or file is modified,
+            and footer metadata if a file's size or modification time changes. The
+            directory should be on a local disk of the driver.
+        file_metadata_cache_ttl_s: The time in seconds after which the entries of
+            the file metadata cache expire.
+        enable_block_size_autotuning: If ``True``, the target max block size of
+            each map operator, including reads, is adjusted during execution. It's
+            decreased when the object store is under pressure or spills, and
+            increased when the operator produces blocks so quickly that per-block
+            overheads dominate. It stays between ``target_min_block_size`` and 4x
+            the initial target.
     """
 
     target_max_block_size: int = DEFAULT_TARGET_MAX_BLOCK_SIZE
@@ -280,6 +336,7 @@ class DataContext:
     enable_pandas_block: bool = DEFAULT_ENABLE_PANDAS_BLOCK
     actor_prefetcher_enabled: bool = DEFAULT_ACTOR_PREFETCHER_ENABLED
     use_push_based_shuffle: bool = DEFAULT_USE_PUSH_BASED_SHUFFLE
+    use_streaming_hash_shuffle: bool = DEFAULT_USE_STREAMING_HASH_SHUFFLE
     pipeline_push_based_shuffle_reduce_tasks: bool = True
     scheduling_strategy: SchedulingStrategyT = DEFAULT_SCHEDULING_STRATEGY
     scheduling_strategy_large_args: SchedulingStrategyT = (
@@ -287,6 +344,7 @@ class DataContext:
     )
     large_args_threshold: int = DEFAULT_LARGE_ARGS_THRESHOLD
     use_polars: bool = DEFAULT_USE_POLARS
+    use_arrow_hash_aggregate: bool = DEFAULT_USE_ARROW_HASH_AGGREGATE
     eager_free: bool = DEFAULT_EAGER_FREE
     decoding_size_estimation: bool = DEFAULT_DECODING_SIZE_ESTIMATION_ENABLED
     min_parallelism: int = DEFAULT_MIN_PARALLELISM
@@ -296,6 +354,7 @@ class DataContext:
     enable_auto_log_stats: bool = DEFAULT_AUTO_LOG_STATS
     verbose_stats_logs: bool = DEFAULT_VERBOSE_STATS_LOG
     trace_allocations: bool = DEFAULT_TRACE_ALLOCATIONS
+    execution_timeline_dir: Optional[str] = DEFAULT_EXECUTION_TIMELINE_DIR
     execution_options: "ExecutionOptions" = field(
         default_factory=_execution_options_factory
     )
@@ -329,6 +388,10 @@ class DataContext:
     retried_io_errors: List[str] = field(
         default_factory=lambda: list(DEFAULT_RETRIED_IO_ERRORS)
     )
+    broadcast_join_threshold_bytes: int = DEFAULT_BROADCAST_JOIN_THRESHOLD_BYTES
+    file_metadata_cache_dir: Optional[str] = DEFAULT_FILE_METADATA_CACHE_DIR
+    file_metadata_cache_ttl_s: float = DEFAULT_FILE_METADATA_CACHE_TTL_S
+    enable_block_size_autotuning: bool = DEFAULT_ENABLE_BLOCK_SIZE_AUTOTUNING
 
     def __post_init__(self):
         # The additonal ray remote args that should be added to
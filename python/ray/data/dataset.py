@@ -32,6 +32,8 @@ from ray.air.util.tensor_extensions.arrow import ArrowTensorTypeV2
 from ray.air.util.tensor_extensions.utils import _create_possibly_ragged_ndarray
 from ray.data._internal.aggregate import Max, Mean, Min, Std, Sum
 from ray.data._internal.compute import ComputeStrategy
+from ray.data._internal.dataset_summary import compute_summary
+from ray.data._internal.datasource.arrow_ipc_datasink import ArrowIPCDatasink
 from ray.data._internal.datasource.bigquery_datasink import BigQueryDatasink
 from ray.data._internal.datasource.csv_datasink import CSVDatasink
 from ray.data._internal.datasource.image_datasink import ImageDatasink
@@ -63,12 +65,15 @@ from ray.data._internal.logical.operators.map_operator import (
     FlatMap,
     MapBatches,
     MapRows,
+    Project,
+    WithColumn,
 )
+from ray.data._internal.logical.operators.n_ary_operator import Join
 from ray.data._internal.logical.operators.n_ary_operator import (
     Union as UnionLogicalOperator,
 )
 from ray.data._internal.logical.operators.n_ary_operator import Zip
-from ray.data._internal.logical.operators.one_to_one_operator import Limit
+from ray.data._internal.logical.operators.one_to_one_operator import Cache, Limit
 from ray.data._internal.logical.operators.write_operator import Write
 from ray.data._internal.logical.optimizers import LogicalPlan
 from ray.data._internal.pandas_block import PandasBlockSchema
@@ -77,7 +82,12 @@ from ray.data._internal.planner.exchange.sort_task_spec import SortKey
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.split import _get_num_rows, _split_at_indices
 from ray.data._internal.stats import DatasetStats, DatasetStatsSummary, StatsManager
-from ray.data._internal.util import AllToAllAPI, ConsumptionAPI, get_compute_strategy
+from ray.data._internal.util import (
+    AllToAllAPI,
+    ConsumptionAPI,
+    get_compute_strategy,
+    get_task_compute_strategy,
+)
 from ray.data.aggregate import AggregateFn
 from ray.data.block import (
     VALID_BATCH_FORMATS,
@@ -91,7 +101,8 @@ from ray.data.block import (
     _apply_batch_size,
 )
 from ray.data.context import DataContext
-from ray.data.datasource import Connection, Datasink, FilenameProvider
+from ray.data.datasource import Connection, Datasink, FilenameProvider, Partitioning
+from ray.data.expressions import Expr
 from ray.data.iterator import DataIterator
 from ray.data.random_access_dataset import RandomAccessDataset
 from ray.types import ObjectRef
@@ -697,16 +708,24 @@ class Dataset:
     def add_column(
         self,
         col: str,
-        fn: Callable[["pandas.DataFrame"], "pandas.Series"],
+        fn: Optional[Callable[["pandas.DataFrame"], "pandas.Series"]] = None,
         *,
+        expr: Optional[Expr] = None,
         compute: Optional[str] = None,
         concurrency: Optional[Union[int, Tuple[int, int]]] = None,
         **ray_remote_args,
     ) -> "Dataset":
         """Add the given column to the dataset.
 
-        A function generating the new column values given the batch in pandas
-        format must be specified.
+        Either a function generating the new column values given the batch in pandas
+        format, or an :class:`~ray.data.expressions.Expr` must be specified.
+
+        .. tip::
+            If you can express the column with :mod:`ray.data.expressions`, pass it
+            with ``expr`` instead of ``fn``. Expressions are evaluated with Arrow
+            compute, without converting the batches to pandas, and chains of
+            expression columns and filters are fused into a single pass over
+            Arrow data.
 
         Examples:
 
@@ -731,6 +750,12 @@ class Dataset:
             >>> ds.add_column("id", lambda df: 0).take(3)
             [{'id': 0}, {'id': 0}, {'id': 0}]
 
+            Add a new column with an expression.
+
+            >>> from ray.data.expressions import col
+            >>> ds.add_column("id_plus_one", expr=col("id") + 1).take(2)
+            [{'id': 0, 'id_plus_one': 1}, {'id': 1, 'id_plus_one': 2}]
+
         Time complexity: O(dataset size / parallelism)
 
         Args:
@@ -738,6 +763,8 @@ class Dataset:
                 column is overwritten.
             fn: Map function generating the column values given a batch of
                 records in pandas format.
+            expr: An :class:`~ray.data.expressions.Expr` to evaluate on each batch.
+                Exactly one of ``fn`` and ``expr`` must be provided.
             compute: This argument is deprecated. Use ``concurrency`` argument.
             concurrency: The number of Ray workers to use concurrently. For a
                 fixed-sized worker pool of size ``n``, specify ``concurrency=n``. For
@@ -746,6 +773,27 @@ class Dataset:
             ray_remote_args: Additional resource requirements to request from
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """
+        if (fn is None) == (expr is None):
+            raise ValueError("Exactly one of `fn` and `expr` must be provided.")
+        if expr is not None:
+            if not isinstance(expr, Expr):
+                raise TypeError(
+                    "`expr` must be a `ray.data.expressions.Expr`, got "
+                    f"{type(expr).__name__}."
+                )
+            compute = get_task_compute_strategy(
+                compute=compute, concurrency=concurrency
+            )
+            plan = self._plan.copy()
+            op = WithColumn(
+                self._logical_plan.dag,
+                col,
+                expr,
+                compute=compute,
+                ray_remote_args=ray_remote_args,
+            )
+            logical_plan = LogicalPlan(op, self.context)
+            return Dataset(plan, logical_plan)
 
         def add_column(batch: "pandas.DataFrame") -> "pandas.DataFrame":
             batch.loc[:, col] = fn(batch)
@@ -807,16 +855,11 @@ class Dataset:
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """  # noqa: E501
 
-        def drop_columns(batch):
-            return batch.drop(columns=cols)
-
-        return self.map_batches(
-            drop_columns,
-            batch_format="pandas",
-            zero_copy_batch=True,
+        return self._project(
+            drop_cols=cols,
             compute=compute,
             concurrency=concurrency,
-            **ray_remote_args,
+            ray_remote_args=ray_remote_args,
         )
 
     @PublicAPI(api_group=BT_API_GROUP)
@@ -833,9 +876,11 @@ class Dataset:
         Specified columns must be in the dataset schema.
 
         .. tip::
-            If you're reading parquet files with :meth:`ray.data.read_parquet`,
-            you might be able to speed it up by using projection pushdown; see
-            :ref:`Parquet column pruning <parquet_column_pruning>` for details.
+            If you call this method directly after :meth:`ray.data.read_parquet`,
+            :meth:`ray.data.read_csv`, or :meth:`ray.data.read_json`, Ray Data
+            pushes the projection down into the read, so unselected columns aren't
+            loaded; see :ref:`Parquet column pruning <parquet_column_pruning>` for
+            details.
 
         Examples:
 
@@ -868,17 +913,35 @@ class Dataset:
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """  # noqa: E501
 
-        def select_columns(batch):
-            return BlockAccessor.for_block(batch).select(columns=cols)
-
-        return self.map_batches(
-            select_columns,
-            batch_format="pandas",
-            zero_copy_batch=True,
+        return self._project(
+            cols=cols,
             compute=compute,
             concurrency=concurrency,
-            **ray_remote_args,
+            ray_remote_args=ray_remote_args,
+        )
+
+    def _project(
+        self,
+        *,
+        cols: Optional[List[str]] = None,
+        drop_cols: Optional[List[str]] = None,
+        compute: Optional[Union[str, ComputeStrategy]],
+        concurrency: Optional[Union[int, Tuple[int, int]]],
+        ray_remote_args: Dict[str, Any],
+    ) -> "Dataset":
+        """Create a Project operator, which the optimizer can push into the read."""
+        compute = get_task_compute_strategy(compute=compute, concurrency=concurrency)
+
+        plan = self._plan.copy()
+        op = Project(
+            self._logical_plan.dag,
+            cols=cols,
+            drop_cols=drop_cols,
+            compute=compute,
+            ray_remote_args=ray_remote_args,
         )
+        logical_plan = LogicalPlan(op, self.context)
+        return Dataset(plan, logical_plan)
 
     @PublicAPI(api_group=BT_API_GROUP)
     def rename_columns(
@@ -1089,8 +1152,9 @@ class Dataset:
     @PublicAPI(api_group=BT_API_GROUP)
     def filter(
         self,
-        fn: UserDefinedFunction[Dict[str, Any], bool],
+        fn: Optional[UserDefinedFunction[Dict[str, Any], bool]] = None,
         *,
+        expr: Optional[Expr] = None,
         compute: Union[str, ComputeStrategy] = None,
         concurrency: Optional[Union[int, Tuple[int, int]]] = None,
         ray_remote_args_fn: Optional[Callable[[], Dict[str, Any]]] = None,
@@ -1108,6 +1172,14 @@ class Dataset:
             :meth:`Dataset.map_batches` might be faster. You can implement filter by
             dropping rows.
 
+        .. tip::
+            If you can express your predicate with
+            :mod:`ray.data.expressions`, pass it with ``expr`` instead of ``fn``.
+            Expression filters are evaluated with Arrow compute, and if the
+            filter directly follows a read from Parquet, Lance, or Iceberg, Ray Data
+            pushes the predicate into the read, so that row groups and files that
+            can't match are skipped.
+
         .. tip::
             If you're reading parquet files with :meth:`ray.data.read_parquet`,
             and the filter is a simple predicate, you might
@@ -1121,11 +1193,17 @@ class Dataset:
             >>> ds.filter(lambda row: row["id"] % 2 == 0).take_all()
             [{'id': 0}, {'id': 2}, {'id': 4}, ...]
 
+            >>> from ray.data.expressions import col
+            >>> ds.filter(expr=col("id") >= 97).take_all()
+            [{'id': 97}, {'id': 98}, {'id': 99}]
+
         Time complexity: O(dataset size / parallelism)
 
         Args:
             fn: The predicate to apply to each row, or a class type
                 that can be instantiated to create such a callable.
+            expr: A boolean :class:`~ray.data.expressions.Expr` to evaluate on
+                each batch. Exactly one of ``fn`` and ``expr`` must be provided.
             compute: This argument is deprecated. Use ``concurrency`` argument.
             concurrency: The number of Ray workers to use concurrently. For a
                 fixed-sized worker pool of size ``n``, specify ``concurrency=n``.
@@ -1140,6 +1218,14 @@ class Dataset:
             ray_remote_args: Additional resource requirements to request from
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """
+        if (fn is None) == (expr is None):
+            raise ValueError("Exactly one of `fn` and `expr` must be provided.")
+        if expr is not None and not isinstance(expr, Expr):
+            raise TypeError(
+                "`expr` must be a `ray.data.expressions.Expr`, got "
+                f"{type(expr).__name__}."
+            )
+
         compute = get_compute_strategy(
             fn,
             compute=compute,
@@ -1150,6 +1236,7 @@ class Dataset:
         op = Filter(
             input_op=self._logical_plan.dag,
             fn=fn,
+            filter_expr=expr,
             compute=compute,
             ray_remote_args_fn=ray_remote_args_fn,
             ray_remote_args=ray_remote_args,
@@ -1366,6 +1453,7 @@ class Dataset:
         *,
         equal: bool = False,
         locality_hints: Optional[List["NodeIdStr"]] = None,
+        work_stealing: bool = False,
     ) -> List[DataIterator]:
         """Returns ``n`` :class:`DataIterators <ray.data.DataIterator>` that can
         be used to read disjoint subsets of the dataset in parallel.
@@ -1387,6 +1475,8 @@ class Dataset:
 
             Because iterators are pulling blocks from the same :class:`Dataset`
             execution, if one iterator falls behind, other iterators may be stalled.
+            Set ``work_stealing=True`` to let the other iterators take the blocks of
+            the slow one instead.
 
         Examples:
 
@@ -1439,6 +1529,10 @@ class Dataset:
                 iterator output locations. This list must have length ``n``. You can
                 get the current node id of a task or actor by calling
                 ``ray.get_runtime_context().get_node_id()``.
+            work_stealing: If ``True``, an iterator that has no blocks queued for it
+                takes blocks queued for the other iterators, so that a slow consumer
+                doesn't stall the others. The iterators may then see very different
+                numbers of rows. Can't be combined with ``equal=True``.
 
         Returns:
             The output iterator splits. These iterators are Ray-serializable and can
@@ -1450,7 +1544,11 @@ class Dataset:
                 Unlike :meth:`~Dataset.streaming_split`, :meth:`~Dataset.split`
                 materializes the dataset in memory.
         """
-        return StreamSplitDataIterator.create(self, n, equal, locality_hints)
+        if equal and work_stealing:
+            raise ValueError("`work_stealing=True` can't be used with `equal=True`.")
+        return StreamSplitDataIterator.create(
+            self, n, equal, locality_hints, work_stealing
+        )
 
     @ConsumptionAPI
     @PublicAPI(api_group=SMD_API_GROUP)
@@ -2312,6 +2410,77 @@ class Dataset:
         ret = self._aggregate_on(Std, on, ignore_nulls, ddof=ddof)
         return self._aggregate_result(ret)
 
+    @AllToAllAPI
+    @ConsumptionAPI
+    @PublicAPI(stability="alpha", api_group=GGA_API_GROUP)
+    def summary(
+        self,
+        columns: Optional[List[str]] = None,
+        *,
+        stats: Optional[List[str]] = None,
+        quantiles: Optional[List[float]] = None,
+        ddof: int = 1,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Compute summary statistics of the columns in a single pass.
+
+        Unlike calling :meth:`~Dataset.min`, :meth:`~Dataset.max`,
+        :meth:`~Dataset.mean` and :meth:`~Dataset.std` separately, this method
+        executes the dataset once, and computes all statistics with mergeable
+        partial aggregations.
+
+        The supported statistics are:
+
+        - ``"count"``: the number of non-null values.
+        - ``"null_count"``: the number of null values.
+        - ``"min"`` and ``"max"``.
+        - ``"mean"`` and ``"std"``.
+        - ``"approx_distinct"``: the approximate number of distinct values. See
+          :class:`~ray.data.aggregate.ApproxCountDistinct`.
+        - ``"approx_quantiles"``: the approximate ``quantiles``, named like
+          ``"25%"``. See :class:`~ray.data.aggregate.ApproxQuantile`.
+
+        By default, all statistics are computed for numeric columns, all but the
+        mean, std and quantiles for string, boolean and temporal columns, and only
+        the counts for other columns.
+
+        .. note::
+            Unless both ``columns`` and ``stats`` are specified, the schema of the
+            dataset is needed to pick the columns and statistics. If the schema
+            isn't known yet (e.g., after a ``map_batches``), fetching it executes
+            the dataset once more before the summary is computed.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.range(100)
+            >>> summary = ds.summary(stats=["count", "min", "max", "mean"])
+            >>> summary["id"]
+            {'count': 100, 'min': 0, 'max': 99, 'mean': 49.5}
+
+            To display the summary as a table, convert it to a pandas DataFrame.
+
+            >>> import pandas as pd
+            >>> pd.DataFrame(ds.summary())  # doctest: +SKIP
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            columns: The columns to summarize. If ``None``, summarize all columns.
+            stats: The statistics to compute for each column. If ``None``, compute
+                the statistics that apply to the type of each column.
+            quantiles: The quantiles to estimate, between 0 and 1. Defaults to
+                ``[0.25, 0.5, 0.75]``.
+            ddof: Delta Degrees of Freedom of the std. The divisor used in
+                calculations is ``N - ddof``, where ``N`` represents the number of
+                non-null values.
+
+        Returns:
+            A dict that maps each column to a dict of its statistics. Nulls are
+            ignored, and the statistics of empty or all-null columns are ``None``.
+        """
+        if quantiles is None:
+            quantiles = [0.25, 0.5, 0.75]
+        return compute_summary(self, columns, stats, quantiles, ddof)
+
     @AllToAllAPI
     @PublicAPI(api_group=SSR_API_GROUP)
     def sort(
@@ -2327,6 +2496,14 @@ class Dataset:
             If it is a list, all items in the list must share the same direction.
             Multi-directional sort is not supported yet.
 
+        .. tip::
+            The sorted dataset is range-partitioned on ``key``. A following
+            :meth:`~ray.data.grouped_data.GroupedData.aggregate` or
+            :meth:`~ray.data.grouped_data.GroupedData.map_groups` grouped by
+            ``key`` (ascending order only) reuses the partitioning instead of
+            shuffling the data again. So does a :meth:`Dataset.join` on ``key`` of
+            two datasets sorted with the same ``boundaries``.
+
         Examples:
             >>> import ray
             >>> ds = ray.data.range(15)
@@ -2415,6 +2592,111 @@ class Dataset:
         logical_plan = LogicalPlan(op, self.context)
         return Dataset(plan, logical_plan)
 
+    @PublicAPI(stability="alpha", api_group=SMD_API_GROUP)
+    def join(
+        self,
+        ds: "Dataset",
+        on: Union[str, List[str]],
+        join_type: str = "inner",
+        *,
+        right_on: Optional[Union[str, List[str]]] = None,
+        left_suffix: Optional[str] = None,
+        right_suffix: Optional[str] = None,
+        num_partitions: Optional[int] = None,
+        broadcast: Optional[bool] = None,
+    ) -> "Dataset":
+        """Join this dataset with another dataset on key columns.
+
+        By default, if ``ds`` is smaller than
+        :attr:`DataContext.broadcast_join_threshold_bytes
+        <ray.data.DataContext.broadcast_join_threshold_bytes>` and the join type is
+        ``"inner"`` or ``"left_outer"``, ``ds`` is broadcast to every block of this
+        dataset, and blocks of this dataset are joined as they're produced.
+        Otherwise, both datasets are hash partitioned on their key columns and each
+        pair of partitions is joined in a separate task.
+
+        .. note::
+            The order of the output rows isn't deterministic.
+
+        Examples:
+            >>> import ray
+            >>> users = ray.data.from_items(
+            ...     [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
+            ... )
+            >>> orders = ray.data.from_items(
+            ...     [{"user_id": 1, "item": "apple"}, {"user_id": 1, "item": "pear"}]
+            ... )
+            >>> joined = orders.join(users, on="user_id", right_on="id")
+            >>> sorted(joined.take_all(), key=lambda row: row["item"])
+            [{'user_id': 1, 'item': 'apple', 'name': 'Alice'}, {'user_id': 1, 'item': 'pear', 'name': 'Alice'}]
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            ds: The dataset to join with on the right hand side.
+            on: The key column or columns of this dataset.
+            join_type: One of ``"inner"``, ``"left_outer"``, ``"right_outer"`` or
+                ``"full_outer"``.
+            right_on: The key column or columns of ``ds``. Defaults to ``on``.
+            left_suffix: The suffix to append to non-key columns of this dataset
+                that also exist in ``ds``.
+            right_suffix: The suffix to append to non-key columns of ``ds`` that
+                also exist in this dataset.
+            num_partitions: The number of partitions to hash partition both datasets
+                into. Defaults to the number of blocks of the larger dataset.
+            broadcast: Whether to broadcast ``ds`` to every block of this dataset.
+                If ``None``, this is decided based on the size of ``ds``. Broadcast
+                joins only support the ``"inner"`` and ``"left_outer"`` join types.
+
+        Returns:
+            A :class:`Dataset` with the joined rows.
+        """  # noqa: E501
+        from ray.data._internal.planner.exchange.join_task_spec import (
+            _JOIN_TYPES,
+            BROADCAST_JOIN_TYPES,
+        )
+
+        if join_type not in _JOIN_TYPES:
+            raise ValueError(
+                f"Unsupported join type {join_type!r}. Supported join types are: "
+                f"{list(_JOIN_TYPES)}."
+            )
+        if broadcast and join_type not in BROADCAST_JOIN_TYPES:
+            raise ValueError(
+                f"Broadcast joins don't support the join type {join_type!r}. Use one "
+                f"of {list(BROADCAST_JOIN_TYPES)}, or set `broadcast=False`."
+            )
+        if num_partitions is not None and num_partitions <= 0:
+            raise ValueError(
+                f"`num_partitions` must be positive, got {num_partitions}."
+            )
+
+        left_keys = [on] if isinstance(on, str) else list(on)
+        if right_on is None:
+            right_keys = left_keys
+        else:
+            right_keys = [right_on] if isinstance(right_on, str) else list(right_on)
+        if len(left_keys) != len(right_keys):
+            raise ValueError(
+                "`on` and `right_on` must have the same number of columns, got "
+                f"{left_keys} and {right_keys}."
+            )
+
+        plan = self._plan.copy()
+        op = Join(
+            self._logical_plan.dag,
+            ds._logical_plan.dag,
+            join_type=join_type,
+            left_key_columns=left_keys,
+            right_key_columns=right_keys,
+            left_columns_suffix=left_suffix,
+            right_columns_suffix=right_suffix,
+            num_partitions=num_partitions,
+            broadcast=broadcast,
+        )
+        logical_plan = LogicalPlan(op, self.context)
+        return Dataset(plan, logical_plan)
+
     @PublicAPI(api_group=BT_API_GROUP)
     def limit(self, limit: int) -> "Dataset":
         """Truncate the dataset to the first ``limit`` rows.
@@ -2824,6 +3106,8 @@ class Dataset:
         filename_provider: Optional[FilenameProvider] = None,
         arrow_parquet_args_fn: Optional[Callable[[], Dict[str, Any]]] = None,
         num_rows_per_file: Optional[int] = None,
+        target_file_bytes: Optional[int] = None,
+        partitioning: Optional[Partitioning] = None,
         ray_remote_args: Dict[str, Any] = None,
         concurrency: Optional[int] = None,
         **arrow_parquet_args,
@@ -2832,7 +3116,8 @@ class Dataset:
 
         The number of files is determined by the number of blocks in the dataset.
         To control the number of number of blocks, call
-        :meth:`~ray.data.Dataset.repartition`.
+        :meth:`~ray.data.Dataset.repartition`, or set ``num_rows_per_file`` or
+        ``target_file_bytes`` to coalesce small blocks into larger files.
 
         If pyarrow can't represent your data, this method errors.
 
@@ -2885,6 +3170,20 @@ class Dataset:
                 might write more or fewer rows to each file. In specific, if the number
                 of rows per block is larger than the specified value, Ray Data writes
                 the number of rows per block to each file.
+            target_file_bytes: [Experimental] The target size of each file in bytes,
+                measured in memory before compression. Small blocks are coalesced
+                into the same write task, and the data of each write task is split
+                into files of about this size. If ``None``, the size of the files
+                isn't considered.
+            partitioning: [Experimental] A
+                :class:`~ray.data.datasource.Partitioning` with the ``field_names``
+                of the columns to partition the files by. The rows of each partition
+                are written to a separate directory, for example,
+                ``path/year=2024/`` for ``Partitioning("hive", field_names=["year"])``.
+                The partition columns aren't written to the files. Read the files
+                back with the same ``partitioning``. The ``%``, ``/`` and ``=``
+                characters of the partition values are percent-encoded in the
+                directory names.
             ray_remote_args: Kwargs passed to :meth:`~ray.remote` in the write tasks.
             concurrency: The maximum number of Ray tasks to run concurrently. Set this
                 to control number of tasks to run concurrently. This doesn't change the
@@ -2909,6 +3208,8 @@ class Dataset:
             open_stream_args=arrow_open_stream_args,
             filename_provider=filename_provider,
             dataset_uuid=self._uuid,
+            target_file_bytes=target_file_bytes,
+            partitioning=partitioning,
         )
         self.write_datasink(
             datasink,
@@ -3489,6 +3790,97 @@ class Dataset:
             concurrency=concurrency,
         )
 
+    @ConsumptionAPI
+    @PublicAPI(stability="alpha", api_group=IOC_API_GROUP)
+    def write_arrow_ipc(
+        self,
+        path: str,
+        *,
+        compression: Optional[str] = None,
+        filesystem: Optional["pyarrow.fs.FileSystem"] = None,
+        try_create_dir: bool = True,
+        arrow_open_stream_args: Optional[Dict[str, Any]] = None,
+        filename_provider: Optional[FilenameProvider] = None,
+        num_rows_per_file: Optional[int] = None,
+        ray_remote_args: Dict[str, Any] = None,
+        concurrency: Optional[int] = None,
+    ) -> None:
+        """Writes the :class:`~ray.data.Dataset` to Arrow IPC (Feather V2) files.
+
+        Read the files with :func:`~ray.data.read_arrow_ipc`, which memory-maps local
+        files instead of decoding them.
+
+        The number of files is determined by the number of blocks in the dataset.
+        To control the number of number of blocks, call
+        :meth:`~ray.data.Dataset.repartition`.
+
+        By default, the format of the output files is ``{uuid}_{block_idx}.arrow``,
+        where ``uuid`` is a unique id for the dataset. To modify this behavior,
+        implement a custom :class:`~ray.data.datasource.FilenameProvider`
+        and pass it in as the ``filename_provider`` argument.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.range(100)
+            >>> ds.write_arrow_ipc("local:///tmp/data/")
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            path: The path to the destination root directory, where
+                the Arrow IPC files are written to.
+            compression: The compression codec of the buffers, either ``"lz4"`` or
+                ``"zstd"``, or ``None`` to not compress them. Reads of compressed
+                files decompress the buffers, so they can't reference the
+                memory-mapped file.
+            filesystem: The pyarrow filesystem implementation to write to.
+                These filesystems are specified in the
+                `pyarrow docs <https://arrow.apache.org/docs\
+                /python/api/filesystems.html#filesystem-implementations>`_.
+                Specify this if you need to provide specific configurations to the
+                filesystem. By default, the filesystem is automatically selected based
+                on the scheme of the paths. For example, if the path begins with
+                ``s3://``, the ``S3FileSystem`` is used.
+            try_create_dir: If ``True``, attempts to create all directories in
+                destination path. Does nothing if all directories already
+                exist. Defaults to ``True``.
+            arrow_open_stream_args: kwargs passed to
+                `pyarrow.fs.FileSystem.open_output_stream <https://arrow.apache.org\
+                /docs/python/generated/pyarrow.fs.FileSystem.html\
+                #pyarrow.fs.FileSystem.open_output_stream>`_, which is used when
+                opening the file to write to.
+            filename_provider: A :class:`~ray.data.datasource.FilenameProvider`
+                implementation. Use this parameter to customize what your filenames
+                look like.
+            num_rows_per_file: [Experimental] The target number of rows to write to each
+                file. If ``None``, Ray Data writes a system-chosen number of rows to
+                each file. The specified value is a hint, not a strict limit. Ray Data
+                might write more or fewer rows to each file. In specific, if the number
+                of rows per block is larger than the specified value, Ray Data writes
+                the number of rows per block to each file.
+            ray_remote_args: kwargs passed to :meth:`~ray.remote` in the write tasks.
+            concurrency: The maximum number of Ray tasks to run concurrently. Set this
+                to control number of tasks to run concurrently. This doesn't change the
+                total number of tasks run. By default, concurrency is dynamically
+                decided based on the available resources.
+        """
+
+        datasink = ArrowIPCDatasink(
+            path,
+            compression=compression,
+            num_rows_per_file=num_rows_per_file,
+            filesystem=filesystem,
+            try_create_dir=try_create_dir,
+            open_stream_args=arrow_open_stream_args,
+            filename_provider=filename_provider,
+            dataset_uuid=self._uuid,
+        )
+        self.write_datasink(
+            datasink,
+            ray_remote_args=ray_remote_args,
+            concurrency=concurrency,
+        )
+
     @ConsumptionAPI
     def write_sql(
         self,
@@ -3899,6 +4291,8 @@ class Dataset:
         drop_last: bool = False,
         local_shuffle_buffer_size: Optional[int] = None,
         local_shuffle_seed: Optional[int] = None,
+        reuse_buffers: bool = False,
+        pin_memory: bool = False,
     ) -> Iterable[TorchBatchType]:
         """Return an iterable over batches of data represented as Torch tensors.
 
@@ -3974,6 +4368,13 @@ class Dataset:
                 the buffer, the remaining rows in the buffer are drained.
                 ``batch_size`` must also be specified when using local shuffling.
             local_shuffle_seed: The seed to use for the local random shuffle.
+            reuse_buffers: If ``True``, fixed-shape tensor columns are copied into a
+                ring of preallocated tensor buffers instead of allocating new
+                tensors for each batch. If the tensors stay on the CPU, they're only
+                valid until the next batch is requested, so clone them if you need
+                to keep them. You can't use this parameter with ``collate_fn``.
+            pin_memory: Whether to allocate the reused tensor buffers in pinned
+                memory, which speeds up copies to GPUs. Requires ``reuse_buffers``.
 
         Returns:
             An iterable over Torch Tensor batches.
@@ -3991,6 +4392,8 @@ class Dataset:
             drop_last=drop_last,
             local_shuffle_buffer_size=local_shuffle_buffer_size,
             local_shuffle_seed=local_shuffle_seed,
+            reuse_buffers=reuse_buffers,
+            pin_memory=pin_memory,
         )
 
     @ConsumptionAPI
@@ -4738,6 +5141,10 @@ class Dataset:
         self,
         key: str,
         num_workers: Optional[int] = None,
+        *,
+        replication_factor: int = 1,
+        cache_size: int = 0,
+        batch_wait_timeout_s: float = 0,
     ) -> RandomAccessDataset:
         """Convert this dataset into a distributed RandomAccessDataset (EXPERIMENTAL).
 
@@ -4758,10 +5165,28 @@ class Dataset:
                 in the cluster by four. As a rule of thumb, you can expect each worker
                 to provide ~3000 records / second via ``get_async()``, and
                 ~10000 records / second via ``multiget()``.
+            replication_factor: The number of workers that serve each block. Lookups
+                are spread randomly across the replicas of a block, so increasing
+                this increases the throughput of hot keys, at the cost of more
+                memory.
+            cache_size: The max number of records that each worker keeps in a LRU
+                cache, to avoid repeatedly looking up and decoding hot keys.
+            batch_wait_timeout_s: If greater than zero, concurrent ``get_async()``
+                calls are coalesced into a single call per worker. If other
+                threads called recently, the first call of a batch waits up to
+                this long for more calls. This is useful when many threads call
+                ``get_async()`` concurrently.
         """
         if num_workers is None:
             num_workers = 4 * len(ray.nodes())
-        return RandomAccessDataset(self, key, num_workers=num_workers)
+        return RandomAccessDataset(
+            self,
+            key,
+            num_workers=num_workers,
+            replication_factor=replication_factor,
+            cache_size=cache_size,
+            batch_wait_timeout_s=batch_wait_timeout_s,
+        )
 
     @ConsumptionAPI(pattern="store memory.", insert_after=True)
     @PublicAPI(api_group=E_API_GROUP)
@@ -4813,6 +5238,52 @@ class Dataset:
         output._plan.execute()  # No-op that marks the plan as fully executed.
         return output
 
+    @PublicAPI(stability="alpha", api_group=E_API_GROUP)
+    def cache(
+        self,
+        storage: str = "memory_and_disk",
+        max_bytes: Optional[int] = None,
+    ) -> "Dataset":
+        """Cache the blocks of this dataset, so that later executions of the
+        returned dataset don't recompute them.
+
+        Unlike :meth:`~Dataset.materialize`, this method is lazy, and doesn't pin
+        all of the blocks in the object store. The first execution of the returned
+        dataset that produces all of the blocks writes them to the cache. Later
+        executions, e.g., the next epochs of a training loop, read the blocks from
+        the cache. If blocks were evicted, the next execution recomputes the
+        dataset. If spilled blocks were lost with their nodes, the execution that
+        reads them fails, and the next execution recomputes the dataset.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.range(100).map_batches(lambda batch: batch)
+            >>> ds = ds.cache(storage="memory_and_disk", max_bytes=100 * 1024**2)
+            >>> for epoch in range(2):
+            ...     for batch in ds.iter_batches():
+            ...         pass
+
+        Time complexity: O(1)
+
+        Args:
+            storage: Where to cache the blocks. With ``"memory"``, blocks are kept
+                in the object store, and the least recently used blocks are evicted
+                when the cached blocks exceed ``max_bytes``. With
+                ``"memory_and_disk"``, the least recently used blocks are spilled to
+                the local disk of their nodes in the Arrow IPC format instead. With
+                ``"disk"``, all blocks are spilled, and ``max_bytes`` limits the
+                size of the spilled blocks.
+            max_bytes: The max size in bytes of the blocks cached in the object
+                store, or on disk with ``storage="disk"``. Defaults to no limit.
+
+        Returns:
+            A :class:`Dataset` that caches the blocks of this dataset.
+        """
+        plan = self._plan.copy()
+        op = Cache(self._logical_plan.dag, storage=storage, max_bytes=max_bytes)
+        logical_plan = LogicalPlan(op, self.context)
+        return Dataset(plan, logical_plan)
+
     @PublicAPI(api_group=IM_API_GROUP)
     def stats(self) -> str:
         """Returns a string containing execution timing information.
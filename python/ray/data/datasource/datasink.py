@@ -142,6 +142,15 @@ class Datasink:
         """
         return None
 
+    @property
+    def min_bytes_per_write(self) -> Optional[int]:
+        """The target number of bytes to pass to each
+        :meth:`~ray.data.Datasink.write` call.
+
+        If ``None``, the number of bytes isn't considered.
+        """
+        return None
+
 
 @DeveloperAPI
 class DummyOutputDatasink(Datasink):
@@ -1,4 +1,4 @@
-from typing import Callable, Iterable, List, Optional
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional
 
 import numpy as np
 
@@ -6,6 +6,9 @@ from ray.data._internal.util import _check_pyarrow_version
 from ray.data.block import Block, BlockMetadata
 from ray.util.annotations import Deprecated, DeveloperAPI, PublicAPI
 
+if TYPE_CHECKING:
+    from ray.data.expressions import Expr
+
 
 @PublicAPI
 class Datasource:
@@ -79,6 +82,47 @@ class Datasource:
         """If ``False``, only launch read tasks on the driver's node."""
         return True
 
+    def supports_predicate_pushdown(self, predicate: "Expr") -> bool:
+        """Whether this datasource can evaluate ``predicate`` while reading.
+
+        If this returns ``True``, the optimizer removes a
+        ``Dataset.filter(expr=predicate)`` that directly follows the read and calls
+        :meth:`~ray.data.Datasource.apply_predicate` instead.
+        """
+        return False
+
+    def apply_predicate(self, predicate: "Expr") -> "Datasource":
+        """Return a copy of this datasource that only reads rows that satisfy
+        ``predicate``.
+
+        This is only called if
+        :meth:`~ray.data.Datasource.supports_predicate_pushdown` returns ``True``.
+        The datasource must not be modified in place, because it may be shared by
+        several datasets.
+        """
+        raise NotImplementedError
+
+    def supports_projection_pushdown(self, columns: List[str]) -> bool:
+        """Whether this datasource can read only ``columns``.
+
+        If this returns ``True``, the optimizer removes a
+        ``Dataset.select_columns(columns)`` (or the equivalent
+        ``Dataset.drop_columns``) that directly follows the read and calls
+        :meth:`~ray.data.Datasource.apply_projection` instead.
+        """
+        return False
+
+    def apply_projection(self, columns: List[str]) -> "Datasource":
+        """Return a copy of this datasource that only reads ``columns``, in the
+        given order.
+
+        This is only called if
+        :meth:`~ray.data.Datasource.supports_projection_pushdown` returns ``True``.
+        The datasource must not be modified in place, because it may be shared by
+        several datasets.
+        """
+        raise NotImplementedError
+
 
 @Deprecated
 class Reader:
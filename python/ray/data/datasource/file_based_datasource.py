@@ -1,3 +1,4 @@
+import copy
 import io
 import logging
 from typing import (
@@ -76,6 +77,10 @@ class FileBasedDatasource(Datasource):
     # Number of threads for concurrent reading within each read task.
     # If zero or negative, reading will be performed in the main thread.
     _NUM_THREADS_PER_TASK = 0
+    # If `_SUPPORTS_PROJECTION_PUSHDOWN` is `True`, the optimizer can push
+    # `select_columns` and `drop_columns` into the read. Subclasses can read
+    # `self._columns` in `_read_stream` to avoid decoding unneeded columns.
+    _SUPPORTS_PROJECTION_PUSHDOWN = False
 
     def __init__(
         self,
@@ -109,6 +114,8 @@ class FileBasedDatasource(Datasource):
         self._partitioning = partitioning
         self._ignore_missing_paths = ignore_missing_paths
         self._include_paths = include_paths
+        # The columns to output, in order, if a projection was pushed down.
+        self._columns: Optional[List[str]] = None
         paths, self._filesystem = _resolve_paths_and_filesystem(paths, filesystem)
         paths, file_sizes = map(
             list,
@@ -199,6 +206,7 @@ class FileBasedDatasource(Datasource):
             open_stream_args = {}
 
         open_input_source = self._open_input_source
+        columns = self._columns
 
         def read_files(
             read_paths: Iterable[str],
@@ -227,6 +235,8 @@ class FileBasedDatasource(Datasource):
                             block = block_accessor.append_column(
                                 "path", [read_path] * block_accessor.num_rows()
                             )
+                        if columns is not None:
+                            block = BlockAccessor.for_block(block).select(columns)
                         yield block
 
         def create_read_task_fn(read_paths, num_threads):
@@ -371,6 +381,27 @@ class FileBasedDatasource(Datasource):
     def supports_distributed_reads(self) -> bool:
         return self._supports_distributed_reads
 
+    def supports_projection_pushdown(self, columns: List[str]) -> bool:
+        if not self._SUPPORTS_PROJECTION_PUSHDOWN or len(set(columns)) != len(columns):
+            return False
+        # The inferred schema doesn't contain the `path` column, so a projection
+        # without it might come from `drop_columns` and can't be trusted.
+        return not self._include_paths or "path" in columns
+
+    def apply_projection(self, columns: List[str]) -> "FileBasedDatasource":
+        import pyarrow as pa
+
+        datasource = copy.copy(self)
+        datasource._columns = list(columns)
+        if isinstance(self._schema, pa.Schema) and set(columns).issubset(
+            self._schema.names
+        ):
+            datasource._schema = pa.schema(
+                [self._schema.field(column) for column in columns],
+                self._schema.metadata,
+            )
+        return datasource
+
 
 def _add_partitions(
     data: Union["pyarrow.Table", "pd.DataFrame"], partitions: Dict[str, Any]
@@ -1,6 +1,8 @@
 import logging
+import math
 import posixpath
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from ray._private.utils import _add_creatable_buckets_param_if_s3_uri
@@ -14,6 +16,7 @@ from ray.data.datasource.filename_provider import (
     FilenameProvider,
     _DefaultFilenameProvider,
 )
+from ray.data.datasource.partitioning import Partitioning, PartitionStyle
 from ray.data.datasource.path_util import _resolve_paths_and_filesystem
 from ray.util.annotations import DeveloperAPI
 
@@ -38,6 +41,9 @@ class _FileDatasink(Datasink):
         filename_provider: Optional[FilenameProvider] = None,
         dataset_uuid: Optional[str] = None,
         file_format: Optional[str] = None,
+        min_rows_per_file: Optional[int] = None,
+        target_file_bytes: Optional[int] = None,
+        partitioning: Optional[Partitioning] = None,
     ):
         """Initialize this datasink.
 
@@ -53,10 +59,33 @@ class _FileDatasink(Datasink):
                 included in the filename.
             file_format: The file extension. If specified, files are written with this
                 extension.
+            min_rows_per_file: The min number of rows to write to each file. Blocks
+                are coalesced into write tasks of at least this many rows, so that
+                small blocks don't produce small files. This is a hint; the last
+                file may have fewer rows.
+            target_file_bytes: The target size of each file in bytes, measured in
+                memory. Blocks are coalesced into write tasks of at least this size,
+                and the data of each write task is split into files of about this
+                size.
+            partitioning: If specified, write the rows of each partition to a
+                separate directory under ``path``, e.g., ``path/year=2024/`` with
+                ``Partitioning("hive", field_names=["year"])``. The partition columns
+                aren't written to the files.
         """
         if open_stream_args is None:
             open_stream_args = {}
 
+        if min_rows_per_file is not None and min_rows_per_file <= 0:
+            raise ValueError(
+                f"`min_rows_per_file` must be positive, got {min_rows_per_file}."
+            )
+        if target_file_bytes is not None and target_file_bytes <= 0:
+            raise ValueError(
+                f"`target_file_bytes` must be positive, got {target_file_bytes}."
+            )
+        if partitioning is not None and not partitioning.field_names:
+            raise ValueError("`partitioning` must specify `field_names` for writes.")
+
         if filename_provider is None:
             filename_provider = _DefaultFilenameProvider(
                 dataset_uuid=dataset_uuid, file_format=file_format
@@ -72,6 +101,9 @@ class _FileDatasink(Datasink):
         self.filename_provider = filename_provider
         self.dataset_uuid = dataset_uuid
         self.file_format = file_format
+        self.min_rows_per_file = min_rows_per_file
+        self.target_file_bytes = target_file_bytes
+        self.partitioning = partitioning
 
         self.has_created_dir = False
 
@@ -96,13 +128,7 @@ class _FileDatasink(Datasink):
         # a policy only allows users to write blobs prefixed with s3://bucket/foo
         # a call to create_dir for s3://bucket/foo/bar will fail even though it
         # should not.
-        parsed_uri = urlparse(self.path)
-        is_s3_uri = parsed_uri.scheme == "s3"
-        skip_create_dir_for_s3 = (
-            is_s3_uri and not DataContext.get_current().s3_try_create_dir
-        )
-
-        if self.try_create_dir and not skip_create_dir_for_s3:
+        if self._should_create_dir():
             if self.filesystem.get_file_info(self.path).type is FileType.NotFound:
                 # Arrow's S3FileSystem doesn't allow creating buckets by default, so we
                 # add a query arg enabling bucket creation if an S3 URI is provided.
@@ -110,25 +136,152 @@ class _FileDatasink(Datasink):
                 self.filesystem.create_dir(tmp, recursive=True)
                 self.has_created_dir = True
 
+    def _should_create_dir(self) -> bool:
+        parsed_uri = urlparse(self.path)
+        is_s3_uri = parsed_uri.scheme == "s3"
+        skip_create_dir_for_s3 = (
+            is_s3_uri and not DataContext.get_current().s3_try_create_dir
+        )
+        return self.try_create_dir and not skip_create_dir_for_s3
+
     def write(
         self,
         blocks: Iterable[Block],
         ctx: TaskContext,
     ) -> None:
-        builder = DelegatingBlockBuilder()
-        for block in blocks:
-            builder.add_block(block)
-        block = builder.build()
-        block_accessor = BlockAccessor.for_block(block)
-
-        if block_accessor.num_rows() == 0:
+        block_index = 0
+        for partition_dir, file_blocks in self._group_blocks_into_files(blocks):
+            builder = DelegatingBlockBuilder()
+            for block in file_blocks:
+                builder.add_block(block)
+            block_accessor = BlockAccessor.for_block(builder.build())
+            if block_accessor.num_rows() == 0:
+                continue
+            self.write_block(block_accessor, block_index, ctx, partition_dir)
+            block_index += 1
+
+        if block_index == 0:
             logger.warning(f"Skipped writing empty block to {self.path}")
+
+    def write_block(
+        self,
+        block: BlockAccessor,
+        block_index: int,
+        ctx: TaskContext,
+        partition_dir: str = "",
+    ):
+        raise NotImplementedError
+
+    def _get_write_path(self, partition_dir: str, filename: str) -> str:
+        """Return the path to write `filename` to, creating the partition directory
+        if needed."""
+        if partition_dir:
+            dir_path = posixpath.join(self.path, partition_dir)
+            if self._should_create_dir():
+                self.filesystem.create_dir(dir_path, recursive=True)
+            return posixpath.join(dir_path, filename)
+        return posixpath.join(self.path, filename)
+
+    def _group_blocks_into_files(
+        self, blocks: Iterable[Block]
+    ) -> Iterator[Tuple[str, List[Block]]]:
+        """Group the blocks of a write task into files.
+
+        Blocks are split by partition, and the blocks of each partition are buffered
+        until they reach ``target_file_bytes``.
+
+        Returns:
+            An iterator of the partition directory (relative to ``path``) and the
+            blocks of each file. The blocks of a file may be empty.
+        """
+        buffers: Dict[str, List[Block]] = defaultdict(list)
+        buffer_bytes: Dict[str, int] = defaultdict(int)
+        for block in blocks:
+            for partition_dir, partition_block in self._split_by_partition(block):
+                for piece in self._split_by_size(partition_block):
+                    buffers[partition_dir].append(piece)
+                    size_bytes = BlockAccessor.for_block(piece).size_bytes()
+                    buffer_bytes[partition_dir] += size_bytes
+                    if (
+                        self.target_file_bytes is not None
+                        and buffer_bytes[partition_dir] >= self.target_file_bytes
+                    ):
+                        yield partition_dir, buffers.pop(partition_dir)
+                        del buffer_bytes[partition_dir]
+        yield from buffers.items()
+
+    def _split_by_partition(self, block: Block) -> Iterator[Tuple[str, Block]]:
+        if self.partitioning is None:
+            yield "", block
             return
 
-        self.write_block(block_accessor, 0, ctx)
+        import numpy as np
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        table = BlockAccessor.for_block(block).to_arrow()
+        field_names = self.partitioning.field_names
+        missing = [name for name in field_names if name not in table.column_names]
+        if missing:
+            raise ValueError(
+                f"Partition columns {missing} don't exist in the dataset. Existing "
+                f"columns: {table.column_names}."
+            )
+        for name in field_names:
+            if table[name].null_count > 0:
+                raise ValueError(f"Partition column {name!r} can't have null values.")
+        if table.num_rows == 0:
+            return
 
-    def write_block(self, block: BlockAccessor, block_index: int, ctx: TaskContext):
-        raise NotImplementedError
+        # Sort the rows by their partition values once, so that each partition is a
+        # slice of the table.
+        table = table.take(
+            pc.sort_indices(
+                table, sort_keys=[(name, "ascending") for name in field_names]
+            )
+        )
+        is_first_row = np.zeros(table.num_rows, dtype=bool)
+        is_first_row[0] = True
+        for name in field_names:
+            column = table[name]
+            previous, current = column.slice(0, len(column) - 1), column.slice(1)
+            is_changed = pc.not_equal(current, previous)
+            if pa.types.is_floating(column.type):
+                # NaNs aren't equal to each other, but their rows form one partition.
+                is_nan = pc.and_(pc.is_nan(current), pc.is_nan(previous))
+                is_changed = pc.and_not(is_changed, is_nan)
+            is_first_row[1:] |= is_changed.to_numpy()
+
+        data_columns = [name for name in table.column_names if name not in field_names]
+        starts = np.flatnonzero(is_first_row)
+        ends = np.append(starts[1:], table.num_rows)
+        for start, end in zip(starts, ends):
+            partition = table.slice(start, end - start)
+            values = partition.select(field_names).slice(0, 1).to_pylist()[0]
+            yield self._get_partition_dir(values), partition.select(data_columns)
+
+    def _get_partition_dir(self, values: Dict[str, Any]) -> str:
+        field_names = self.partitioning.field_names
+        if self.partitioning.style == PartitionStyle.HIVE:
+            dirs = [
+                f"{name}={_escape_partition_value(values[name])}"
+                for name in field_names
+            ]
+        else:
+            dirs = [_escape_partition_value(values[name]) for name in field_names]
+        return posixpath.join(*dirs)
+
+    def _split_by_size(self, block: Block) -> Iterator[Block]:
+        """Split a block that is larger than ``target_file_bytes``."""
+        block_accessor = BlockAccessor.for_block(block)
+        num_rows = block_accessor.num_rows()
+        if self.target_file_bytes is None or num_rows <= 1:
+            yield block
+            return
+        num_pieces = math.ceil(block_accessor.size_bytes() / self.target_file_bytes)
+        rows_per_piece = math.ceil(num_rows / num_pieces)
+        for start in range(0, num_rows, rows_per_piece):
+            yield block_accessor.slice(start, start + rows_per_piece, copy=False)
 
     def on_write_complete(self, write_result_blocks: List[Block]) -> WriteResult:
         aggregated_results = super().on_write_complete(write_result_blocks)
@@ -142,6 +295,14 @@ class _FileDatasink(Datasink):
     def supports_distributed_writes(self) -> bool:
         return not _is_local_scheme(self.unresolved_path)
 
+    @property
+    def num_rows_per_write(self) -> Optional[int]:
+        return self.min_rows_per_file
+
+    @property
+    def min_bytes_per_write(self) -> Optional[int]:
+        return self.target_file_bytes
+
 
 @DeveloperAPI
 class RowBasedFileDatasink(_FileDatasink):
@@ -182,12 +343,18 @@ class RowBasedFileDatasink(_FileDatasink):
         """
         raise NotImplementedError
 
-    def write_block(self, block: BlockAccessor, block_index: int, ctx: TaskContext):
+    def write_block(
+        self,
+        block: BlockAccessor,
+        block_index: int,
+        ctx: TaskContext,
+        partition_dir: str = "",
+    ):
         for row_index, row in enumerate(block.iter_rows(public_row_format=False)):
             filename = self.filename_provider.get_filename_for_row(
                 row, ctx.task_idx, block_index, row_index
             )
-            write_path = posixpath.join(self.path, filename)
+            write_path = self._get_write_path(partition_dir, filename)
 
             def write_row_to_path():
                 with self.open_output_stream(write_path) as file:
@@ -225,10 +392,10 @@ class BlockBasedFileDatasink(_FileDatasink):
     def __init__(
         self, path, *, num_rows_per_file: Optional[int] = None, **file_datasink_kwargs
     ):
+        if num_rows_per_file is not None:
+            file_datasink_kwargs["min_rows_per_file"] = num_rows_per_file
         super().__init__(path, **file_datasink_kwargs)
 
-        self._num_rows_per_file = num_rows_per_file
-
     def write_block_to_file(self, block: BlockAccessor, file: "pyarrow.NativeFile"):
         """Write a block of data to a file.
 
@@ -238,11 +405,17 @@ class BlockBasedFileDatasink(_FileDatasink):
         """
         raise NotImplementedError
 
-    def write_block(self, block: BlockAccessor, block_index: int, ctx: TaskContext):
+    def write_block(
+        self,
+        block: BlockAccessor,
+        block_index: int,
+        ctx: TaskContext,
+        partition_dir: str = "",
+    ):
         filename = self.filename_provider.get_filename_for_block(
             block, ctx.task_idx, block_index
         )
-        write_path = posixpath.join(self.path, filename)
+        write_path = self._get_write_path(partition_dir, filename)
 
         def write_block_to_path():
             with self.open_output_stream(write_path) as file:
@@ -257,6 +430,14 @@ class BlockBasedFileDatasink(_FileDatasink):
             max_backoff_s=WRITE_FILE_RETRY_MAX_BACKOFF_SECONDS,
         )
 
-    @property
-    def num_rows_per_write(self) -> Optional[int]:
-        return self._num_rows_per_file
+
+def _escape_partition_value(value: Any) -> str:
+    """Percent-encode the characters of a partition value that would change the
+    meaning of its directory name.
+
+    PyArrow decodes the values when reading Hive partitions.
+    """
+    value = str(value).replace("%", "%25").replace("/", "%2F").replace("=", "%3D")
+    if value in (".", ".."):
+        value = value.replace(".", "%2E")
+    return value
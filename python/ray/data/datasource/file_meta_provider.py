@@ -429,8 +429,7 @@ def _get_file_infos(
     except OSError as e:
         _handle_read_os_error(e, path)
     if file_info.type == FileType.Directory:
-        for file_path, file_size in _expand_directory(path, filesystem):
-            file_infos.append((file_path, file_size))
+        file_infos.extend(_expand_directory_cached(path, file_info, filesystem))
     elif file_info.type == FileType.File:
         file_infos.append((path, file_info.size))
     elif file_info.type == FileType.NotFound and ignore_missing_path:
@@ -441,12 +440,38 @@ def _get_file_infos(
     return file_infos
 
 
+def _expand_directory_cached(
+    path: str,
+    file_info: "pyarrow.fs.FileInfo",
+    filesystem: "pyarrow.fs.FileSystem",
+) -> List[Tuple[str, int]]:
+    """Expand the provided directory path, using the file metadata cache if it's
+    enabled."""
+    from ray.data._internal.file_metadata_cache import FileMetadataCache
+
+    cache = FileMetadataCache.get_current()
+    if cache is None:
+        return _expand_directory(path, filesystem)
+
+    file_infos = cache.get_listing(filesystem, path)
+    if file_infos is None:
+        entries, directories = _expand_directory(path, filesystem, include_mtime=True)
+        directories.insert(0, (path, file_info.mtime_ns))
+        cache.put_listing(filesystem, path, directories, entries)
+        file_infos = [(file_path, file_size) for file_path, file_size, _ in entries]
+    return file_infos
+
+
 def _expand_directory(
     path: str,
     filesystem: "pyarrow.fs.FileSystem",
     exclude_prefixes: Optional[List[str]] = None,
     ignore_missing_path: bool = False,
-) -> List[Tuple[str, int]]:
+    include_mtime: bool = False,
+) -> Union[
+    List[Tuple[str, int]],
+    Tuple[List[Tuple[str, int, Optional[int]]], List[Tuple[str, Optional[int]]]],
+]:
     """
     Expand the provided directory path to a list of file paths.
 
@@ -457,20 +482,30 @@ def _expand_directory(
         exclude_prefixes: The file relative path prefixes that should be
             excluded from the returned file set. Default excluded prefixes are
             "." and "_".
+        include_mtime: Whether to also return the modification times of the files
+            and of the subdirectories.
 
     Returns:
-        An iterator of (file_path, file_size) tuples.
+        An iterator of (file_path, file_size) tuples. If ``include_mtime`` is True,
+        a list of (file_path, file_size, file_mtime_ns) tuples and a list of
+        (dir_path, dir_mtime_ns) tuples of all subdirectories instead.
     """
     if exclude_prefixes is None:
         exclude_prefixes = [".", "_"]
 
-    from pyarrow.fs import FileSelector
+    from pyarrow.fs import FileSelector, FileType
 
     selector = FileSelector(path, recursive=True, allow_not_found=ignore_missing_path)
     files = filesystem.get_file_info(selector)
     base_path = selector.base_dir
     out = []
+    directories = []
     for file_ in files:
+        if include_mtime and file_.type == FileType.Directory:
+            # Adding or removing a file only changes the modification time of its
+            # parent directory, so cached listings are validated against all of
+            # them.
+            directories.append((file_.path, file_.mtime_ns))
         if not file_.is_file:
             continue
         file_path = file_.path
@@ -479,6 +514,11 @@ def _expand_directory(
         relative = file_path[len(base_path) :]
         if any(relative.startswith(prefix) for prefix in exclude_prefixes):
             continue
-        out.append((file_path, file_.size))
+        if include_mtime:
+            out.append((file_path, file_.size, file_.mtime_ns))
+        else:
+            out.append((file_path, file_.size))
     # We sort the paths to guarantee a stable order.
+    if include_mtime:
+        return sorted(out), directories
     return sorted(out)
@@ -13,6 +13,7 @@ if TYPE_CHECKING:
     import pyarrow
 
     from ray.data._internal.datasource.parquet_datasource import SerializedFragment
+    from ray.data._internal.file_metadata_cache import FileMetadataCache
 
 
 FRAGMENTS_PER_META_FETCH = 6
@@ -131,6 +132,63 @@ class ParquetMetadataProvider(FileMetadataProvider):
             must be returned in the same order as all input file fragments, such
             that `metadata[i]` always contains the metadata for `fragments[i]`.
         """
+        from ray.data._internal.file_metadata_cache import FileMetadataCache
+
+        cache = FileMetadataCache.get_current()
+        if cache is None or not fragments:
+            return self._fetch_file_metadata(fragments, **ray_remote_args)
+        return self._prefetch_file_metadata_with_cache(
+            cache, fragments, **ray_remote_args
+        )
+
+    def _prefetch_file_metadata_with_cache(
+        self,
+        cache: "FileMetadataCache",
+        fragments: List["pyarrow.dataset.ParquetFileFragment"],
+        **ray_remote_args,
+    ) -> List[_ParquetFileFragmentMetaData]:
+        """Pre-fetches the file metadata of the fragments that aren't in the file
+        metadata cache, and caches it."""
+        filesystem = fragments[0].filesystem
+        paths = [fragment.path for fragment in fragments]
+        stats = cache.get_file_stats(filesystem, paths)
+        metadata = cache.get_parquet_metadata(filesystem, paths, stats)
+
+        missing = [i for i, m in enumerate(metadata) if m is None]
+        if missing:
+            fetched = self._fetch_file_metadata(
+                [fragments[i] for i in missing], **ray_remote_args
+            )
+            # The fetched metadata stops at the first fragment without metadata.
+            missing = missing[: len(fetched)]
+            for i, m in zip(missing, fetched):
+                metadata[i] = m
+            cache.put_parquet_metadata(
+                filesystem,
+                [paths[i] for i in missing],
+                [stats[i] for i in missing],
+                fetched,
+            )
+
+        result = []
+        for m in metadata:
+            if m is None:
+                break
+            result.append(m)
+        # Share the identical schemas of cached and fetched metadata, like
+        # `_dedupe_metadata` does.
+        unique_schemas = {}
+        for m in result:
+            m.set_schema_pickled(
+                unique_schemas.setdefault(m.schema_pickled, m.schema_pickled)
+            )
+        return result
+
+    def _fetch_file_metadata(
+        self,
+        fragments: List["pyarrow.dataset.ParquetFileFragment"],
+        **ray_remote_args,
+    ) -> List[_ParquetFileFragmentMetaData]:
         from ray.data._internal.datasource.parquet_datasource import SerializedFragment
 
         if len(fragments) > PARALLELIZE_META_FETCH_THRESHOLD:
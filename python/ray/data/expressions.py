@@ -0,0 +1,348 @@
+import math
+import re
+from typing import TYPE_CHECKING, Any, Iterable, List, Set
+
+from ray.util.annotations import DeveloperAPI, PublicAPI
+
+if TYPE_CHECKING:
+    import pyarrow.compute as pc
+
+
+# Column names that can be written into a SQL filter string without quoting.
+_SQL_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+@DeveloperAPI
+class Expr:
+    """A column expression that Ray Data can evaluate and push down into sources.
+
+    Don't construct this class directly. Use :func:`~ray.data.expressions.col` and
+    :func:`~ray.data.expressions.lit`, and combine the results with Python
+    operators.
+
+    Examples:
+        >>> from ray.data.expressions import col
+        >>> (col("age") >= 18) & col("country").is_in(["US", "CA"])
+        ((col('age') >= lit(18)) & col('country').is_in(['US', 'CA']))
+        >>> col("price") * (1 - col("discount"))
+        (col('price') * (lit(1) - col('discount')))
+
+    Arithmetic follows Arrow semantics. In particular, dividing two integer
+    columns truncates the result, and overflows raise an error.
+    """
+
+    def to_pyarrow(self) -> "pc.Expression":
+        """Convert this expression into a ``pyarrow.compute.Expression``."""
+        raise NotImplementedError
+
+    def to_sql(self) -> str:
+        """Convert this expression into a SQL-style predicate string.
+
+        Raises:
+            ValueError: If the expression references a column name or a literal
+                that can't be represented without quoting.
+        """
+        raise NotImplementedError
+
+    def columns(self) -> Set[str]:
+        """Return the names of all columns referenced by this expression."""
+        raise NotImplementedError
+
+    def __eq__(self, other: Any) -> "Expr":  # type: ignore[override]
+        return _BinaryExpr("==", self, _to_expr(other))
+
+    def __ne__(self, other: Any) -> "Expr":  # type: ignore[override]
+        return _BinaryExpr("!=", self, _to_expr(other))
+
+    def __lt__(self, other: Any) -> "Expr":
+        return _BinaryExpr("<", self, _to_expr(other))
+
+    def __le__(self, other: Any) -> "Expr":
+        return _BinaryExpr("<=", self, _to_expr(other))
+
+    def __gt__(self, other: Any) -> "Expr":
+        return _BinaryExpr(">", self, _to_expr(other))
+
+    def __ge__(self, other: Any) -> "Expr":
+        return _BinaryExpr(">=", self, _to_expr(other))
+
+    def __add__(self, other: Any) -> "Expr":
+        return _BinaryExpr("+", self, _to_expr(other))
+
+    def __radd__(self, other: Any) -> "Expr":
+        return _BinaryExpr("+", _to_expr(other), self)
+
+    def __sub__(self, other: Any) -> "Expr":
+        return _BinaryExpr("-", self, _to_expr(other))
+
+    def __rsub__(self, other: Any) -> "Expr":
+        return _BinaryExpr("-", _to_expr(other), self)
+
+    def __mul__(self, other: Any) -> "Expr":
+        return _BinaryExpr("*", self, _to_expr(other))
+
+    def __rmul__(self, other: Any) -> "Expr":
+        return _BinaryExpr("*", _to_expr(other), self)
+
+    def __truediv__(self, other: Any) -> "Expr":
+        return _BinaryExpr("/", self, _to_expr(other))
+
+    def __rtruediv__(self, other: Any) -> "Expr":
+        return _BinaryExpr("/", _to_expr(other), self)
+
+    def __and__(self, other: Any) -> "Expr":
+        return _BinaryExpr("&", self, _to_expr(other))
+
+    def __rand__(self, other: Any) -> "Expr":
+        return _BinaryExpr("&", _to_expr(other), self)
+
+    def __or__(self, other: Any) -> "Expr":
+        return _BinaryExpr("|", self, _to_expr(other))
+
+    def __ror__(self, other: Any) -> "Expr":
+        return _BinaryExpr("|", _to_expr(other), self)
+
+    def __invert__(self) -> "Expr":
+        return _NotExpr(self)
+
+    def __bool__(self) -> bool:
+        raise TypeError(
+            "Ray Data expressions can't be used as Python booleans. Use `&`, `|`, "
+            "and `~` instead of `and`, `or`, and `not`, and avoid chained "
+            "comparisons like `a < col('x') < b`."
+        )
+
+    # Expressions override `__eq__`, so they can't be hashed by value.
+    __hash__ = None
+
+    def is_null(self) -> "Expr":
+        """Return an expression that's true where this expression is null."""
+        return _IsNullExpr(self)
+
+    def is_in(self, values: Iterable[Any]) -> "Expr":
+        """Return an expression that's true where this expression is in ``values``."""
+        return _IsInExpr(self, list(values))
+
+
+class _ColumnExpr(Expr):
+    def __init__(self, name: str):
+        self.name = name
+
+    def to_pyarrow(self) -> "pc.Expression":
+        import pyarrow.compute as pc
+
+        return pc.field(self.name)
+
+    def to_sql(self) -> str:
+        if not _SQL_IDENTIFIER_PATTERN.match(self.name):
+            raise ValueError(
+                f"Column name {self.name!r} can't be used in a SQL predicate."
+            )
+        return self.name
+
+    def columns(self) -> Set[str]:
+        return {self.name}
+
+    def __repr__(self) -> str:
+        return f"col({self.name!r})"
+
+
+class _LiteralExpr(Expr):
+    def __init__(self, value: Any):
+        self.value = value
+
+    def to_pyarrow(self) -> "pc.Expression":
+        import pyarrow.compute as pc
+
+        return pc.scalar(self.value)
+
+    def to_sql(self) -> str:
+        return _literal_to_sql(self.value)
+
+    def columns(self) -> Set[str]:
+        return set()
+
+    def __repr__(self) -> str:
+        return f"lit({self.value!r})"
+
+
+class _BinaryExpr(Expr):
+    # Maps each operator to the SQL operator used by `to_sql()`.
+    _SQL_OPERATORS = {
+        "==": "=",
+        "!=": "!=",
+        "<": "<",
+        "<=": "<=",
+        ">": ">",
+        ">=": ">=",
+        "+": "+",
+        "-": "-",
+        "*": "*",
+        "/": "/",
+        "&": "AND",
+        "|": "OR",
+    }
+
+    def __init__(self, op: str, left: Expr, right: Expr):
+        self.op = op
+        self.left = left
+        self.right = right
+
+    def to_pyarrow(self) -> "pc.Expression":
+        left, right = self.left.to_pyarrow(), self.right.to_pyarrow()
+        if self.op == "==":
+            return left == right
+        elif self.op == "!=":
+            return left != right
+        elif self.op == "<":
+            return left < right
+        elif self.op == "<=":
+            return left <= right
+        elif self.op == ">":
+            return left > right
+        elif self.op == ">=":
+            return left >= right
+        elif self.op == "+":
+            return left + right
+        elif self.op == "-":
+            return left - right
+        elif self.op == "*":
+            return left * right
+        elif self.op == "/":
+            return left / right
+        elif self.op == "&":
+            return left & right
+        elif self.op == "|":
+            return left | right
+        raise ValueError(f"Unsupported operator: {self.op}")
+
+    def to_sql(self) -> str:
+        sql_op = self._SQL_OPERATORS[self.op]
+        return f"({self.left.to_sql()} {sql_op} {self.right.to_sql()})"
+
+    def columns(self) -> Set[str]:
+        return self.left.columns() | self.right.columns()
+
+    def __repr__(self) -> str:
+        return f"({self.left!r} {self.op} {self.right!r})"
+
+
+class _NotExpr(Expr):
+    def __init__(self, operand: Expr):
+        self.operand = operand
+
+    def to_pyarrow(self) -> "pc.Expression":
+        return ~self.operand.to_pyarrow()
+
+    def to_sql(self) -> str:
+        return f"(NOT {self.operand.to_sql()})"
+
+    def columns(self) -> Set[str]:
+        return self.operand.columns()
+
+    def __repr__(self) -> str:
+        return f"~{self.operand!r}"
+
+
+class _IsNullExpr(Expr):
+    def __init__(self, operand: Expr):
+        self.operand = operand
+
+    def to_pyarrow(self) -> "pc.Expression":
+        return self.operand.to_pyarrow().is_null()
+
+    def to_sql(self) -> str:
+        return f"({self.operand.to_sql()} IS NULL)"
+
+    def columns(self) -> Set[str]:
+        return self.operand.columns()
+
+    def __repr__(self) -> str:
+        return f"{self.operand!r}.is_null()"
+
+
+class _IsInExpr(Expr):
+    def __init__(self, operand: Expr, values: List[Any]):
+        self.operand = operand
+        self.values = values
+
+    def to_pyarrow(self) -> "pc.Expression":
+        import pyarrow as pa
+
+        return self.operand.to_pyarrow().isin(pa.array(self.values))
+
+    def to_sql(self) -> str:
+        if not self.values:
+            raise ValueError("An empty `is_in` can't be used in a SQL predicate.")
+        values = ", ".join(_literal_to_sql(v) for v in self.values)
+        return f"({self.operand.to_sql()} IN ({values}))"
+
+    def columns(self) -> Set[str]:
+        return self.operand.columns()
+
+    def __repr__(self) -> str:
+        return f"{self.operand!r}.is_in({self.values!r})"
+
+
+def _to_expr(value: Any) -> Expr:
+    if isinstance(value, Expr):
+        return value
+    return _LiteralExpr(value)
+
+
+def _literal_to_sql(value: Any) -> str:
+    # NOTE: `bool` must be checked before `int`, since `bool` subclasses `int`.
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    elif isinstance(value, int):
+        return repr(value)
+    elif isinstance(value, float):
+        # SQL has no literals for infinity and NaN.
+        if not math.isfinite(value):
+            raise ValueError(f"Literal {value!r} can't be used in a SQL predicate.")
+        return repr(value)
+    elif isinstance(value, str):
+        escaped = value.replace("'", "''")
+        return f"'{escaped}'"
+    raise ValueError(
+        f"Literal {value!r} of type {type(value).__name__} can't be used in a SQL "
+        "predicate."
+    )
+
+
+@PublicAPI(stability="alpha")
+def col(name: str) -> Expr:
+    """Reference a column by name.
+
+    Examples:
+        >>> import ray
+        >>> from ray.data.expressions import col
+        >>> ds = ray.data.range(10)
+        >>> ds.filter(expr=col("id") >= 8).take_all()
+        [{'id': 8}, {'id': 9}]
+        >>> ds.add_column("id_squared", expr=col("id") * col("id")).take(2)
+        [{'id': 0, 'id_squared': 0}, {'id': 1, 'id_squared': 1}]
+
+    Args:
+        name: The name of the column.
+
+    Returns:
+        An expression that evaluates to the column's values.
+    """
+    return _ColumnExpr(name)
+
+
+@PublicAPI(stability="alpha")
+def lit(value: Any) -> Expr:
+    """Create a literal (constant) value.
+
+    Comparisons between a column and a plain Python value wrap the value with
+    ``lit`` automatically, so you usually don't need to call this directly.
+
+    Args:
+        value: A scalar value like an ``int``, ``float``, ``str``, or ``bool``.
+
+    Returns:
+        An expression that evaluates to ``value``.
+    """
+    return _LiteralExpr(value)
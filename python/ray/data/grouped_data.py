@@ -4,6 +4,7 @@ from ray.data._internal.aggregate import Count, Max, Mean, Min, Std, Sum
 from ray.data._internal.compute import ComputeStrategy
 from ray.data._internal.logical.interfaces import LogicalPlan
 from ray.data._internal.logical.operators.all_to_all_operator import Aggregate
+from ray.data._internal.planner.exchange.sort_task_spec import SortKey
 from ray.data.aggregate import AggregateFn
 from ray.data.block import BlockAccessor, CallableClass, UserDefinedFunction
 from ray.data.dataset import DataBatch, Dataset
@@ -199,7 +200,14 @@ class GroupedData:
         # Note that sort() will ensure that records of the same key partitioned
         # into the same block.
         if self._key is not None:
-            sorted_ds = self._dataset.sort(self._key)
+            partitioning = self._dataset._logical_plan.dag.output_partitioning()
+            if partitioning is not None and partitioning.is_sorted_by(
+                SortKey(self._key).get_columns()
+            ):
+                # The dataset is already sorted by the key.
+                sorted_ds = self._dataset
+            else:
+                sorted_ds = self._dataset.sort(self._key)
         else:
             sorted_ds = self._dataset.repartition(1)
 
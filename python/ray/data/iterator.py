@@ -17,7 +17,10 @@ from typing import (
 
 import numpy as np
 
-from ray.data._internal.block_batching.iter_batches import iter_batches
+from ray.data._internal.block_batching.iter_batches import (
+    TensorBufferOptions,
+    iter_batches,
+)
 from ray.data._internal.execution.interfaces import RefBundle
 from ray.data._internal.logical.operators.input_data_operator import InputData
 from ray.data._internal.logical.optimizers import LogicalPlan
@@ -103,6 +106,7 @@ class DataIterator(abc.ABC):
         local_shuffle_seed: Optional[int] = None,
         _collate_fn: Optional[Callable[[DataBatch], "CollatedData"]] = None,
         _finalize_fn: Optional[Callable[[Any], Any]] = None,
+        _tensor_buffers: Optional[TensorBufferOptions] = None,
     ) -> Iterable[DataBatch]:
         """Return a batched iterable over the dataset.
 
@@ -167,6 +171,7 @@ class DataIterator(abc.ABC):
                     shuffle_buffer_min_size=local_shuffle_buffer_size,
                     shuffle_seed=local_shuffle_seed,
                     prefetch_batches=prefetch_batches,
+                    tensor_buffers=_tensor_buffers,
                 )
             )
 
@@ -265,6 +270,8 @@ class DataIterator(abc.ABC):
         drop_last: bool = False,
         local_shuffle_buffer_size: Optional[int] = None,
         local_shuffle_seed: Optional[int] = None,
+        reuse_buffers: bool = False,
+        pin_memory: bool = False,
     ) -> Iterable["TorchBatchType"]:
         """Return a batched iterable of Torch Tensors over the dataset.
 
@@ -341,6 +348,13 @@ class DataIterator(abc.ABC):
                 therefore ``batch_size`` must also be specified when using local
                 shuffling.
             local_shuffle_seed: The seed to use for the local random shuffle.
+            reuse_buffers: If ``True``, fixed-shape tensor columns are copied into a
+                ring of preallocated tensor buffers instead of allocating new
+                tensors for each batch. If the tensors stay on the CPU, they're only
+                valid until the next batch is requested, so clone them if you need
+                to keep them. You can't use this parameter with ``collate_fn``.
+            pin_memory: Whether to allocate the reused tensor buffers in pinned
+                memory, which speeds up copies to GPUs. Requires ``reuse_buffers``.
 
         Returns:
             An iterable over Torch Tensor batches.
@@ -357,6 +371,10 @@ class DataIterator(abc.ABC):
                 "You should manually move the output Torch tensors to the"
                 "desired dtype and device outside of collate_fn."
             )
+        if collate_fn is not None and reuse_buffers:
+            raise ValueError("collate_fn cannot be used with reuse_buffers.")
+        if pin_memory and not reuse_buffers:
+            raise ValueError("pin_memory can only be used with reuse_buffers.")
 
         if device == "auto":
             # Use the appropriate device for Ray Train, or falls back to CPU if
@@ -389,6 +407,13 @@ class DataIterator(abc.ABC):
         else:
             finalize_fn = None
 
+        if reuse_buffers:
+            # The tensor buffers replace the default collate_fn.
+            collate_fn = None
+            tensor_buffers = TensorBufferOptions(dtypes=dtypes, pin_memory=pin_memory)
+        else:
+            tensor_buffers = None
+
         return self.iter_batches(
             prefetch_batches=prefetch_batches,
             batch_size=batch_size,
@@ -397,6 +422,7 @@ class DataIterator(abc.ABC):
             local_shuffle_seed=local_shuffle_seed,
             _collate_fn=collate_fn,
             _finalize_fn=finalize_fn,
+            _tensor_buffers=tensor_buffers,
         )
 
     def iter_tf_batches(
@@ -4,7 +4,7 @@ import collections
 import pickle
 import warnings
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from ray.air.util.data_batch_conversion import BatchFormat
 from ray.util.annotations import DeveloperAPI, PublicAPI
@@ -15,6 +15,7 @@ if TYPE_CHECKING:
 
     from ray.air.data_batch_type import DataBatchType
     from ray.data import Dataset
+    from ray.data.aggregate import AggregateFn
 
 
 @PublicAPI(stability="beta")
@@ -41,7 +42,10 @@ class Preprocessor(abc.ABC):
     following:
 
     * ``_fit`` if your preprocessor is stateful. Otherwise, set
-      ``_is_fittable=False``.
+      ``_is_fittable=False``. If the fitted state can be computed with
+      aggregations, override ``_get_fit_aggregates`` and ``_fit_from_aggregates``
+      instead, so that :class:`~ray.data.preprocessors.Chain` can fit it in the same
+      pass as other preprocessors.
     * ``_transform_pandas`` and/or ``_transform_numpy`` for best performance,
       implement both. Otherwise, the data will be converted to the match the
       implemented method.
@@ -185,9 +189,39 @@ class Preprocessor(abc.ABC):
 
     @DeveloperAPI
     def _fit(self, ds: "Dataset") -> "Preprocessor":
-        """Sub-classes should override this instead of fit()."""
+        """Sub-classes should override this instead of fit().
+
+        By default, computes the aggregations of ``_get_fit_aggregates`` and passes
+        the result to ``_fit_from_aggregates``.
+        """
+        aggregates = self._get_fit_aggregates()
+        if aggregates is None:
+            raise NotImplementedError()
+        self._fit_from_aggregates(ds.aggregate(*aggregates))
+        return self
+
+    @DeveloperAPI
+    def _get_fit_aggregates(self) -> Optional[List["AggregateFn"]]:
+        """Return the aggregations that compute the fitted state, or ``None`` if this
+        preprocessor isn't fit with aggregations."""
+        return None
+
+    @DeveloperAPI
+    def _fit_from_aggregates(self, result: Optional[Dict[str, Any]]) -> None:
+        """Set the fitted state from the results of the aggregations returned by
+        ``_get_fit_aggregates``, keyed by their names."""
         raise NotImplementedError()
 
+    @DeveloperAPI
+    def _get_transformed_columns(self) -> Optional[List[str]]:
+        """Return the columns that ``transform`` adds, modifies or removes, or
+        ``None`` if they aren't known before fitting.
+
+        :class:`~ray.data.preprocessors.Chain` uses them to find the preprocessors
+        that can be fit in the same pass.
+        """
+        return None
+
     def _determine_transform_to_use(self) -> BatchFormat:
         """Determine which batch format to use based on Preprocessor implementation.
 
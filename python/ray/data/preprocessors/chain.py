@@ -1,18 +1,23 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple
 
 from ray.air.util.data_batch_conversion import BatchFormat
 from ray.data import Dataset
+from ray.data._internal.arrow_block import ArrowBlockAccessor
 from ray.data.preprocessor import Preprocessor
 
 if TYPE_CHECKING:
     from ray.air.data_batch_type import DataBatchType
+    from ray.data.aggregate import AggregateFn
 
 
 class Chain(Preprocessor):
     """Combine multiple preprocessors into a single :py:class:`Preprocessor`.
 
     When you call ``fit``, each preprocessor is fit on the dataset produced by the
-    preceeding preprocessor's ``fit_transform``.
+    preceeding preprocessor's ``fit_transform``. Consecutive preprocessors that are
+    fit with aggregations, like scalers, encoders and imputers, are fit in a single
+    pass over the dataset, as long as they don't read the columns transformed by the
+    preceding preprocessors of the pass.
 
     Example:
         >>> import pandas as pd
@@ -69,14 +74,63 @@ class Chain(Preprocessor):
         self.preprocessors = preprocessors
 
     def _fit(self, ds: Dataset) -> Preprocessor:
-        for preprocessor in self.preprocessors[:-1]:
-            ds = preprocessor.fit_transform(ds)
-        self.preprocessors[-1].fit(ds)
+        # The preprocessors of a stage are fit with a single aggregation over the
+        # input of the stage.
+        stage: List[Tuple[Preprocessor, List["AggregateFn"]]] = []
+        transformed_columns: Set[str] = set()
+        for preprocessor in self.preprocessors:
+            if preprocessor.fit_status() == Preprocessor.FitStatus.NOT_FITTABLE:
+                aggregates = []
+            else:
+                aggregates = preprocessor._get_fit_aggregates()
+
+            if aggregates is None:
+                ds = self._fit_stage(stage, ds)
+                stage, transformed_columns = [], set()
+                ds = preprocessor.fit_transform(ds)
+                continue
+
+            columns = _get_aggregated_columns(aggregates)
+            if columns is None or columns & transformed_columns:
+                # The preprocessor must be fit on the output of the current stage.
+                ds = self._fit_stage(stage, ds)
+                stage, transformed_columns = [], set()
+            stage.append((preprocessor, aggregates))
+
+            columns = preprocessor._get_transformed_columns()
+            if columns is None:
+                ds = self._fit_stage(stage, ds)
+                stage, transformed_columns = [], set()
+            else:
+                transformed_columns.update(columns)
+
+        self._fit_stage(stage, ds)
         return self
 
-    def fit_transform(self, ds: Dataset) -> Dataset:
-        for preprocessor in self.preprocessors:
-            ds = preprocessor.fit_transform(ds)
+    def _fit_stage(
+        self,
+        stage: List[Tuple[Preprocessor, List["AggregateFn"]]],
+        ds: Dataset,
+    ) -> Dataset:
+        """Fit the preprocessors of a stage, and return the transformed dataset."""
+        all_aggregates = [agg for _, aggregates in stage for agg in aggregates]
+        result = ds.aggregate(*all_aggregates) if all_aggregates else None
+        # Resolve the output names of the aggregations, which are deduplicated if
+        # several preprocessors use the same names.
+        names = iter(ArrowBlockAccessor._resolve_agg_names(all_aggregates))
+        for preprocessor, aggregates in stage:
+            preprocessor_result = {agg.name: next(names) for agg in aggregates}
+            if preprocessor.fit_status() != Preprocessor.FitStatus.NOT_FITTABLE:
+                if result is not None:
+                    preprocessor_result = {
+                        agg_name: result[name]
+                        for agg_name, name in preprocessor_result.items()
+                    }
+                else:
+                    preprocessor_result = None
+                preprocessor._fit_from_aggregates(preprocessor_result)
+                preprocessor._fitted = True
+            ds = preprocessor.transform(ds)
         return ds
 
     def _transform(self, ds: Dataset) -> Dataset:
@@ -99,3 +153,14 @@ class Chain(Preprocessor):
         # TODO (jiaodong): We should revisit if our Chain preprocessor is
         # still optimal with context of lazy execution.
         return self.preprocessors[0]._determine_transform_to_use()
+
+
+def _get_aggregated_columns(aggregates: List["AggregateFn"]) -> Optional[Set[str]]:
+    """Return the columns read by the aggregations, or None if they're unknown."""
+    columns = set()
+    for agg in aggregates:
+        if not hasattr(agg, "_key_fn"):
+            return None
+        if agg._key_fn is not None:
+            columns.add(agg._key_fn)
+    return columns
@@ -108,6 +108,9 @@ class Concatenator(Preprocessor):
         df.loc[:, self.output_column_name] = pd.Series(list(concatenated))
         return df
 
+    def _get_transformed_columns(self) -> Optional[List[str]]:
+        return self.columns + [self.output_column_name]
+
     def __repr__(self):
         default_values = {
             "output_column_name": "concat_out",
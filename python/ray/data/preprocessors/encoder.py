@@ -8,7 +8,9 @@ import pandas.api.types
 
 from ray.air.util.data_batch_conversion import BatchFormat
 from ray.data import Dataset
+from ray.data.aggregate import AggregateFn
 from ray.data.preprocessor import Preprocessor, PreprocessorNotFittedException
+from ray.data.preprocessors.utils import _load_value_counts, _ValueCounts
 from ray.util.annotations import PublicAPI
 
 
@@ -88,11 +90,14 @@ class OrdinalEncoder(Preprocessor):
         self.columns = columns
         self.encode_lists = encode_lists
 
-    def _fit(self, dataset: Dataset) -> Preprocessor:
-        self.stats_ = _get_unique_value_indices(
-            dataset, self.columns, encode_lists=self.encode_lists
-        )
-        return self
+    def _get_fit_aggregates(self) -> List[AggregateFn]:
+        return _get_value_counts_aggregates(self.columns, self.encode_lists)
+
+    def _fit_from_aggregates(self, result: Optional[Dict[str, bytes]]) -> None:
+        self.stats_ = _get_unique_value_indices_from_counts(result, self.columns)
+
+    def _get_transformed_columns(self) -> List[str]:
+        return self.columns
 
     def _transform_pandas(self, df: pd.DataFrame):
         _validate_df(df, *self.columns)
@@ -207,14 +212,14 @@ class OneHotEncoder(Preprocessor):
         self.columns = columns
         self.max_categories = max_categories
 
-    def _fit(self, dataset: Dataset) -> Preprocessor:
-        self.stats_ = _get_unique_value_indices(
-            dataset,
-            self.columns,
-            max_categories=self.max_categories,
-            encode_lists=False,
+    def _get_fit_aggregates(self) -> List[AggregateFn]:
+        _validate_max_categories(self.columns, self.max_categories)
+        return _get_value_counts_aggregates(self.columns, encode_lists=False)
+
+    def _fit_from_aggregates(self, result: Optional[Dict[str, bytes]]) -> None:
+        self.stats_ = _get_unique_value_indices_from_counts(
+            result, self.columns, max_categories=self.max_categories
         )
-        return self
 
     def _transform_pandas(self, df: pd.DataFrame):
         _validate_df(df, *self.columns)
@@ -321,14 +326,17 @@ class MultiHotEncoder(Preprocessor):
         self.columns = columns
         self.max_categories = max_categories
 
-    def _fit(self, dataset: Dataset) -> Preprocessor:
-        self.stats_ = _get_unique_value_indices(
-            dataset,
-            self.columns,
-            max_categories=self.max_categories,
-            encode_lists=True,
+    def _get_fit_aggregates(self) -> List[AggregateFn]:
+        _validate_max_categories(self.columns, self.max_categories)
+        return _get_value_counts_aggregates(self.columns, encode_lists=True)
+
+    def _fit_from_aggregates(self, result: Optional[Dict[str, bytes]]) -> None:
+        self.stats_ = _get_unique_value_indices_from_counts(
+            result, self.columns, max_categories=self.max_categories
         )
-        return self
+
+    def _get_transformed_columns(self) -> List[str]:
+        return self.columns
 
     def _transform_pandas(self, df: pd.DataFrame):
         _validate_df(df, *self.columns)
@@ -409,9 +417,14 @@ class LabelEncoder(Preprocessor):
     def __init__(self, label_column: str):
         self.label_column = label_column
 
-    def _fit(self, dataset: Dataset) -> Preprocessor:
-        self.stats_ = _get_unique_value_indices(dataset, [self.label_column])
-        return self
+    def _get_fit_aggregates(self) -> List[AggregateFn]:
+        return _get_value_counts_aggregates([self.label_column], encode_lists=True)
+
+    def _fit_from_aggregates(self, result: Optional[Dict[str, bytes]]) -> None:
+        self.stats_ = _get_unique_value_indices_from_counts(result, [self.label_column])
+
+    def _get_transformed_columns(self) -> List[str]:
+        return [self.label_column]
 
     def _transform_pandas(self, df: pd.DataFrame):
         _validate_df(df, self.label_column)
@@ -563,52 +576,68 @@ def _get_unique_value_indices(
     encode_lists: bool = True,
 ) -> Dict[str, Dict[str, int]]:
     """If drop_na_values is True, will silently drop NA values."""
+    _validate_max_categories(columns, max_categories)
+    result = dataset.aggregate(*_get_value_counts_aggregates(columns, encode_lists))
+    return _get_unique_value_indices_from_counts(
+        result, columns, drop_na_values, key_format, max_categories
+    )
 
-    if max_categories is None:
-        max_categories = {}
+
+def _validate_max_categories(
+    columns: List[str], max_categories: Optional[Dict[str, int]]
+) -> None:
     columns_set = set(columns)
-    for column in max_categories:
+    for column in max_categories or {}:
         if column not in columns_set:
             raise ValueError(
                 f"You set `max_categories` for {column}, which is not present in "
                 f"{columns}."
             )
 
-    def get_pd_value_counts_per_column(col: pd.Series):
-        # special handling for lists
-        if _is_series_composed_of_lists(col):
-            if encode_lists:
-                counter = Counter()
-
-                def update_counter(element):
-                    counter.update(element)
-                    return element
-
-                col.map(update_counter)
-                return counter
-            else:
-                # convert to tuples to make lists hashable
-                col = col.map(lambda x: tuple(x))
-        return Counter(col.value_counts(dropna=False).to_dict())
-
-    def get_pd_value_counts(df: pd.DataFrame) -> List[Dict[str, Counter]]:
-        df_columns = df.columns.tolist()
+
+def _get_value_counts_aggregates(
+    columns: List[str], encode_lists: bool
+) -> List[AggregateFn]:
+    """Return the aggregations that count the values of each column."""
+    count_values = partial(_get_pd_value_counts_per_column, encode_lists=encode_lists)
+    return [_ValueCounts(column, count_values) for column in columns]
+
+
+def _get_pd_value_counts_per_column(col: pd.Series, encode_lists: bool) -> Counter:
+    # special handling for lists
+    if _is_series_composed_of_lists(col):
+        if encode_lists:
+            counter = Counter()
+
+            def update_counter(element):
+                counter.update(element)
+                return element
+
+            col.map(update_counter)
+            return counter
+        else:
+            # convert to tuples to make lists hashable
+            col = col.map(lambda x: tuple(x))
+    return Counter(col.value_counts(dropna=False).to_dict())
+
+
+def _get_unique_value_indices_from_counts(
+    result: Optional[Dict[str, bytes]],
+    columns: List[str],
+    drop_na_values: bool = False,
+    key_format: str = "unique_values({0})",
+    max_categories: Optional[Dict[str, int]] = None,
+) -> Dict[str, Dict[str, int]]:
+    """Compute the unique value indices from the results of the aggregations of
+    `_get_value_counts_aggregates`."""
+    if max_categories is None:
+        max_categories = {}
+    if result is None:
+        # The dataset is empty.
         result = {}
-        for col in columns:
-            if col in df_columns:
-                result[col] = [get_pd_value_counts_per_column(df[col])]
-            else:
-                raise ValueError(
-                    f"Column '{col}' does not exist in DataFrame, which has columns: {df_columns}"  # noqa: E501
-                )
-        return result
-
-    value_counts = dataset.map_batches(get_pd_value_counts, batch_format="pandas")
-    final_counters = {col: Counter() for col in columns}
-    for batch in value_counts.iter_batches(batch_size=None):
-        for col, counters in batch.items():
-            for counter in counters:
-                final_counters[col] += counter
+    final_counters = {
+        col: _load_value_counts(result.get(f"value_counts({col})")) for col in columns
+    }
 
     # Inspect if there is any NA values.
     for col in columns:
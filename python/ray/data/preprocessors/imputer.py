@@ -1,13 +1,14 @@
 from collections import Counter
 from numbers import Number
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
 from pandas.api.types import is_categorical_dtype
 
-from ray.data import Dataset
 from ray.data._internal.aggregate import Mean
+from ray.data.aggregate import AggregateFn
 from ray.data.preprocessor import Preprocessor
+from ray.data.preprocessors.utils import _load_value_counts, _ValueCounts
 from ray.util.annotations import PublicAPI
 
 
@@ -107,14 +108,27 @@ class SimpleImputer(Preprocessor):
                     '`fill_value` must be set when using "constant" strategy.'
                 )
 
-    def _fit(self, dataset: Dataset) -> Preprocessor:
+    def _get_fit_aggregates(self) -> List[AggregateFn]:
         if self.strategy == "mean":
-            aggregates = [Mean(col) for col in self.columns]
-            self.stats_ = dataset.aggregate(*aggregates)
+            return [Mean(col) for col in self.columns]
         elif self.strategy == "most_frequent":
-            self.stats_ = _get_most_frequent_values(dataset, *self.columns)
+            return [_ValueCounts(col, _count_values) for col in self.columns]
 
-        return self
+    def _fit_from_aggregates(self, result: Optional[Dict[str, Any]]) -> None:
+        if self.strategy == "mean":
+            self.stats_ = result
+        elif self.strategy == "most_frequent":
+            result = result or {}
+            self.stats_ = {}
+            for column in self.columns:
+                counter = _load_value_counts(result.get(f"value_counts({column})"))
+                most_common = counter.most_common(1)
+                self.stats_[f"most_frequent({column})"] = (
+                    most_common[0][0] if most_common else None
+                )
+
+    def _get_transformed_columns(self) -> List[str]:
+        return self.columns
 
     def _transform_pandas(self, df: pd.DataFrame):
         if self.strategy == "mean":
@@ -149,22 +163,5 @@ class SimpleImputer(Preprocessor):
         )
 
 
-def _get_most_frequent_values(
-    dataset: Dataset, *columns: str
-) -> Dict[str, Union[str, Number]]:
-    columns = list(columns)
-
-    def get_pd_value_counts(df: pd.DataFrame) -> List[Dict[str, Counter]]:
-        return {col: [Counter(df[col].value_counts().to_dict())] for col in columns}
-
-    value_counts = dataset.map_batches(get_pd_value_counts, batch_format="pandas")
-    final_counters = {col: Counter() for col in columns}
-    for batch in value_counts.iter_batches(batch_size=None):
-        for col, counters in batch.items():
-            for counter in counters:
-                final_counters[col] += counter
-
-    return {
-        f"most_frequent({column})": final_counters[column].most_common(1)[0][0]
-        for column in columns
-    }
+def _count_values(col: pd.Series) -> Counter:
+    return Counter(col.value_counts().to_dict())
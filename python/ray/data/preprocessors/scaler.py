@@ -1,10 +1,12 @@
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
 from ray.data import Dataset
-from ray.data._internal.aggregate import AbsMax, Max, Mean, Min, Std
+from ray.data._internal.aggregate import AbsMax
+from ray.data._internal.dataset_summary import get_summary_aggregates, parse_summary
+from ray.data.aggregate import AggregateFn
 from ray.data.preprocessor import Preprocessor
 from ray.util.annotations import PublicAPI
 
@@ -67,11 +69,21 @@ class StandardScaler(Preprocessor):
     def __init__(self, columns: List[str]):
         self.columns = columns
 
-    def _fit(self, dataset: Dataset) -> Preprocessor:
-        mean_aggregates = [Mean(col) for col in self.columns]
-        std_aggregates = [Std(col, ddof=0) for col in self.columns]
-        self.stats_ = dataset.aggregate(*mean_aggregates, *std_aggregates)
-        return self
+    def _get_fit_aggregates(self) -> List[AggregateFn]:
+        column_stats = {col: ["mean", "std"] for col in self.columns}
+        return get_summary_aggregates(column_stats, ddof=0)
+
+    def _fit_from_aggregates(self, result: Optional[Dict[str, Any]]) -> None:
+        column_stats = {col: ["mean", "std"] for col in self.columns}
+        summary = parse_summary(column_stats, result)
+        self.stats_ = {
+            f"{stat}({col})": summary[col][stat]
+            for stat in ["mean", "std"]
+            for col in self.columns
+        }
+
+    def _get_transformed_columns(self) -> List[str]:
+        return self.columns
 
     def _transform_pandas(self, df: pd.DataFrame):
         def column_standard_scaler(s: pd.Series):
@@ -151,10 +163,21 @@ class MinMaxScaler(Preprocessor):
     def __init__(self, columns: List[str]):
         self.columns = columns
 
-    def _fit(self, dataset: Dataset) -> Preprocessor:
-        aggregates = [Agg(col) for Agg in [Min, Max] for col in self.columns]
-        self.stats_ = dataset.aggregate(*aggregates)
-        return self
+    def _get_fit_aggregates(self) -> List[AggregateFn]:
+        column_stats = {col: ["min", "max"] for col in self.columns}
+        return get_summary_aggregates(column_stats)
+
+    def _fit_from_aggregates(self, result: Optional[Dict[str, Any]]) -> None:
+        column_stats = {col: ["min", "max"] for col in self.columns}
+        summary = parse_summary(column_stats, result)
+        self.stats_ = {
+            f"{stat}({col})": summary[col][stat]
+            for stat in ["min", "max"]
+            for col in self.columns
+        }
+
+    def _get_transformed_columns(self) -> List[str]:
+        return self.columns
 
     def _transform_pandas(self, df: pd.DataFrame):
         def column_min_max_scaler(s: pd.Series):
@@ -231,10 +254,14 @@ class MaxAbsScaler(Preprocessor):
     def __init__(self, columns: List[str]):
         self.columns = columns
 
-    def _fit(self, dataset: Dataset) -> Preprocessor:
-        aggregates = [AbsMax(col) for col in self.columns]
-        self.stats_ = dataset.aggregate(*aggregates)
-        return self
+    def _get_fit_aggregates(self) -> List[AggregateFn]:
+        return [AbsMax(col) for col in self.columns]
+
+    def _fit_from_aggregates(self, result: Optional[Dict[str, Any]]) -> None:
+        self.stats_ = result
+
+    def _get_transformed_columns(self) -> List[str]:
+        return self.columns
 
     def _transform_pandas(self, df: pd.DataFrame):
         def column_abs_max_scaler(s: pd.Series):
@@ -1,8 +1,16 @@
 import hashlib
-from typing import List
+import pickle
+from collections import Counter
+from typing import TYPE_CHECKING, Callable, List, Optional, Union
 
+from ray.data.aggregate import AggregateFn
+from ray.data.block import Block, BlockAccessor
 from ray.util.annotations import DeveloperAPI
 
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
 
 @DeveloperAPI
 def simple_split_tokenizer(value: str) -> List[str]:
@@ -17,3 +25,47 @@ def simple_hash(value: object, num_features: int) -> int:
     hashed_value = hashlib.sha1(encoded_value)
     hashed_value_int = int(hashed_value.hexdigest(), 16)
     return hashed_value_int % num_features
+
+
+class _ValueCounts(AggregateFn):
+    """Count the occurrences of the values of a column.
+
+    The counters are pickled, so that they can be stored in the columns of partially
+    aggregated blocks. Use :func:`_load_value_counts` to load the result.
+    """
+
+    def __init__(
+        self,
+        on: str,
+        count_values: Callable[["pd.Series"], Counter],
+        alias_name: Optional[str] = None,
+    ):
+        self._key_fn = on
+
+        def accumulate_block(a: bytes, block: Block) -> bytes:
+            block_accessor = BlockAccessor.for_block(block)
+            if block_accessor.num_rows() == 0:
+                return a
+            df = BlockAccessor.for_block(block_accessor.select([on])).to_pandas()
+            return merge(a, pickle.dumps(count_values(df[on])))
+
+        def merge(a1: bytes, a2: bytes) -> bytes:
+            if not a1 or not a2:
+                return a1 or a2
+            return pickle.dumps(pickle.loads(a1) + pickle.loads(a2))
+
+        super().__init__(
+            init=lambda k: b"",
+            merge=merge,
+            accumulate_block=accumulate_block,
+            name=alias_name or f"value_counts({on})",
+        )
+
+    def _validate(self, schema: Optional[Union[type, "pa.lib.Schema"]]) -> None:
+        from ray.data._internal.planner.exchange.sort_task_spec import SortKey
+
+        SortKey(self._key_fn).validate_schema(schema)
+
+
+def _load_value_counts(a: Optional[bytes]) -> Counter:
+    return pickle.loads(a) if a else Counter()
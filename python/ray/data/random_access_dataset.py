@@ -1,9 +1,10 @@
 import bisect
 import logging
 import random
+import threading
 import time
-from collections import defaultdict
-from typing import TYPE_CHECKING, Any, List, Optional
+from collections import OrderedDict, defaultdict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import numpy as np
 
@@ -27,6 +28,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# The max number of keys of a batch of `get_async()` calls.
+MAX_GET_BATCH_SIZE = 1000
+
 
 @PublicAPI(stability="alpha")
 class RandomAccessDataset:
@@ -40,6 +44,9 @@ class RandomAccessDataset:
         ds: "Dataset",
         key: str,
         num_workers: int,
+        replication_factor: int = 1,
+        cache_size: int = 0,
+        batch_wait_timeout_s: float = 0,
     ):
         """Construct a RandomAccessDataset (internal API).
 
@@ -49,6 +56,20 @@ class RandomAccessDataset:
         schema = ds.schema(fetch_if_missing=True)
         if schema is None or isinstance(schema, type):
             raise ValueError("RandomAccessDataset only supports Arrow-format blocks.")
+        if replication_factor < 1:
+            raise ValueError(
+                f"`replication_factor` must be at least 1, got {replication_factor}."
+            )
+        if cache_size < 0:
+            raise ValueError(f"`cache_size` must be non-negative, got {cache_size}.")
+        if batch_wait_timeout_s < 0:
+            raise ValueError(
+                "`batch_wait_timeout_s` must be non-negative, got "
+                f"{batch_wait_timeout_s}."
+            )
+        self._replication_factor = replication_factor
+        self._batch_wait_timeout_s = batch_wait_timeout_s
+        self._get_batcher = self._create_get_batcher()
 
         start = time.perf_counter()
         logger.info("[setup] Indexing dataset by sort key.")
@@ -74,7 +95,7 @@ class RandomAccessDataset:
         scheduling_strategy = ctx.scheduling_strategy
         self._workers = [
             _RandomAccessWorker.options(scheduling_strategy=scheduling_strategy).remote(
-                key
+                key, cache_size
             )
             for _ in range(num_workers)
         ]
@@ -122,19 +143,45 @@ class RandomAccessDataset:
                     block_to_workers[block_idx].append(worker)
                     worker_to_blocks[worker].append(block_idx)
 
-        # Randomly assign any leftover blocks to at least one worker.
-        # TODO: the load balancing here could be improved.
-        for block_idx, block in enumerate(self._non_empty_blocks):
-            if len(block_to_workers[block_idx]) == 0:
-                worker = random.choice(self._workers)
-                block_to_workers[block_idx].append(worker)
+        # Then assign each block to the least loaded other workers until it has
+        # `replication_factor` replicas, so that lookups of hot keys are spread
+        # across the replicas.
+        num_replicas = min(self._replication_factor, len(self._workers))
+        for block_idx in range(len(self._non_empty_blocks)):
+            assigned = block_to_workers[block_idx]
+            while len(assigned) < num_replicas:
+                candidates = [w for w in self._workers if w not in assigned]
+                # Break ties randomly.
+                random.shuffle(candidates)
+                worker = min(candidates, key=lambda w: len(worker_to_blocks[w]))
+                assigned.append(worker)
                 worker_to_blocks[worker].append(block_idx)
 
         return block_to_workers, worker_to_blocks
 
+    def _create_get_batcher(self) -> Optional["_GetBatcher"]:
+        if self._batch_wait_timeout_s == 0:
+            return None
+        return _GetBatcher(self, self._batch_wait_timeout_s, MAX_GET_BATCH_SIZE)
+
+    def __getstate__(self):
+        # The batcher holds a lock and pending calls, so it isn't serialized.
+        state = self.__dict__.copy()
+        del state["_get_batcher"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._get_batcher = self._create_get_batcher()
+
     def get_async(self, key: Any) -> ObjectRef[Any]:
         """Asynchronously finds the record for a single key.
 
+        If ``batch_wait_timeout_s`` is set, concurrent calls (e.g., from multiple
+        threads) are coalesced into a single call per worker. If other threads
+        called recently, the first call of a batch waits up to
+        ``batch_wait_timeout_s`` for more calls before submitting the batch.
+
         Args:
             key: The key of the record to find.
 
@@ -144,6 +191,8 @@ class RandomAccessDataset:
         block_index = self._find_le(key)
         if block_index is None:
             return ray.put(None)
+        if self._get_batcher is not None:
+            return self._get_batcher.submit(block_index, key)
         return self._worker_for(block_index).get.remote(block_index, key)
 
     def multiget(self, keys: List[Any]) -> List[Optional[Any]]:
@@ -155,24 +204,36 @@ class RandomAccessDataset:
         Returns:
             List of found records (in pydict form), or None for missing records.
         """
-        batches = defaultdict(list)
-        for k in keys:
-            batches[self._find_le(k)].append(k)
-        futures = {}
-        for index, keybatch in batches.items():
-            if index is None:
+        if not self._upper_bounds:
+            return [None] * len(keys)
+        block_indices = np.searchsorted(np.asarray(self._upper_bounds), keys)
+
+        # Send a single batch of keys to each worker, picking a replica for each
+        # block.
+        block_workers = {}
+        batches = defaultdict(lambda: ([], [], []))
+        for position, (key, block_index) in enumerate(zip(keys, block_indices)):
+            if block_index >= len(self._upper_bounds) or key < self._lower_bound:
                 continue
-            fut = self._worker_for(index).multiget.remote(
-                [index] * len(keybatch), keybatch
-            )
-            futures[index] = fut
-        results = {}
-        for i, fut in futures.items():
-            keybatch = batches[i]
-            values = ray.get(fut)
-            for k, v in zip(keybatch, values):
-                results[k] = v
-        return [results.get(k) for k in keys]
+            block_index = int(block_index)
+            if block_index not in block_workers:
+                block_workers[block_index] = self._worker_for(block_index)
+            positions, batch_block_indices, batch_keys = batches[
+                block_workers[block_index]
+            ]
+            positions.append(position)
+            batch_block_indices.append(block_index)
+            batch_keys.append(key)
+
+        futures = [
+            worker.multiget.remote(batch_block_indices, batch_keys)
+            for worker, (_, batch_block_indices, batch_keys) in batches.items()
+        ]
+        results = [None] * len(keys)
+        for (positions, _, _), values in zip(batches.values(), ray.get(futures)):
+            for position, value in zip(positions, values):
+                results[position] = value
+        return results
 
     def stats(self) -> str:
         """Returns a string containing access timing information."""
@@ -180,9 +241,12 @@ class RandomAccessDataset:
         total_time = sum(s["total_time"] for s in stats)
         accesses = [s["num_accesses"] for s in stats]
         blocks = [s["num_blocks"] for s in stats]
+        num_keys = sum(s["num_keys"] for s in stats)
+        num_cache_hits = sum(s["num_cache_hits"] for s in stats)
         msg = "RandomAccessDataset:\n"
         msg += "- Build time: {}s\n".format(round(self._build_time, 2))
         msg += "- Num workers: {}\n".format(len(stats))
+        msg += "- Replication factor: {}\n".format(self._replication_factor)
         msg += "- Blocks per worker: {} min, {} max, {} mean\n".format(
             min(blocks), max(blocks), int(sum(blocks) / len(blocks))
         )
@@ -192,6 +256,9 @@ class RandomAccessDataset:
         msg += "- Mean access time: {}us\n".format(
             int(total_time / (1 + sum(accesses)) * 1e6)
         )
+        msg += "- Cache hit rate: {}%\n".format(
+            round(100 * num_cache_hits / max(num_keys, 1), 2)
+        )
         return msg
 
     def _worker_for(self, block_index: int):
@@ -204,40 +271,135 @@ class RandomAccessDataset:
         return i
 
 
+class _GetBatcher:
+    """Coalesces concurrent ``get_async()`` calls into ``multiget`` calls.
+
+    The first call of a batch waits up to ``batch_wait_timeout_s`` for more calls,
+    or until the batch has ``max_batch_size`` keys, and then submits the batch with
+    a single call per worker. Each call gets its own ObjectRef of the results.
+
+    A thread can't add calls to a batch while it waits, so the first call is
+    submitted right away if no other thread called in the last
+    ``batch_wait_timeout_s``.
+    """
+
+    def __init__(
+        self,
+        rad: RandomAccessDataset,
+        batch_wait_timeout_s: float,
+        max_batch_size: int,
+    ):
+        self._rad = rad
+        self._batch_wait_timeout_s = batch_wait_timeout_s
+        self._max_batch_size = max_batch_size
+        self._cv = threading.Condition()
+        self._batch: Optional[_GetBatch] = None
+        # The time of the last call of each thread that called recently.
+        self._last_call_times: Dict[int, float] = {}
+
+    def submit(self, block_index: int, key: Any) -> ObjectRef[Any]:
+        with self._cv:
+            now = time.monotonic()
+            thread_id = threading.get_ident()
+            self._last_call_times = {
+                caller: call_time
+                for caller, call_time in self._last_call_times.items()
+                if now - call_time < self._batch_wait_timeout_s
+            }
+            has_concurrent_callers = any(
+                caller != thread_id for caller in self._last_call_times
+            )
+            self._last_call_times[thread_id] = now
+
+            is_first_call = self._batch is None
+            if is_first_call:
+                self._batch = _GetBatch()
+            batch = self._batch
+            position = len(batch.keys)
+            batch.block_indices.append(block_index)
+            batch.keys.append(key)
+
+            if len(batch.keys) >= self._max_batch_size or (
+                is_first_call and not has_concurrent_callers
+            ):
+                self._flush(batch)
+            elif is_first_call:
+                deadline = now + self._batch_wait_timeout_s
+                while batch.refs is None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._flush(batch)
+                        break
+                    self._cv.wait(remaining)
+            else:
+                while batch.refs is None:
+                    self._cv.wait()
+            return batch.refs[position]
+
+    def _flush(self, batch: "_GetBatch") -> None:
+        """Submit the batch. Must be called with the lock held."""
+        self._batch = None
+        worker_positions = defaultdict(list)
+        for position, block_index in enumerate(batch.block_indices):
+            worker_positions[self._rad._worker_for(block_index)].append(position)
+
+        refs = [None] * len(batch.keys)
+        for worker, positions in worker_positions.items():
+            # Return each result as a separate object, so that each call gets its
+            # own ObjectRef.
+            worker_refs = worker.multiget.options(num_returns=len(positions)).remote(
+                [batch.block_indices[p] for p in positions],
+                [batch.keys[p] for p in positions],
+            )
+            if len(positions) == 1:
+                worker_refs = [worker_refs]
+            for position, ref in zip(positions, worker_refs):
+                refs[position] = ref
+        batch.refs = refs
+        self._cv.notify_all()
+
+
+class _GetBatch:
+    def __init__(self):
+        self.block_indices: List[int] = []
+        self.keys: List[Any] = []
+        # The ObjectRefs of the results, set when the batch is submitted.
+        self.refs: Optional[List[ObjectRef[Any]]] = None
+
+
 @ray.remote(num_cpus=0)
 class _RandomAccessWorker:
-    def __init__(self, key_field):
+    def __init__(self, key_field, cache_size=0):
         self.blocks = None
+        self.key_columns = None
         self.key_field = key_field
+        # LRU cache of the rows of recently accessed keys.
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
         self.num_accesses = 0
+        self.num_keys = 0
+        self.num_cache_hits = 0
         self.total_time = 0
 
     def assign_blocks(self, block_ref_dict):
         self.blocks = {k: ray.get(ref) for k, ref in block_ref_dict.items()}
+        # The sorted key column of each block, to search keys with vectorized
+        # `np.searchsorted`.
+        self.key_columns = {
+            k: BlockAccessor.for_block(block).to_numpy(self.key_field)
+            for k, block in self.blocks.items()
+        }
 
     def get(self, block_index, key):
         start = time.perf_counter()
-        result = self._get(block_index, key)
+        result = self._multiget([block_index], [key])[0]
         self.total_time += time.perf_counter() - start
         self.num_accesses += 1
         return result
 
     def multiget(self, block_indices, keys):
         start = time.perf_counter()
-        block = self.blocks[block_indices[0]]
-        if len(set(block_indices)) == 1 and isinstance(
-            self.blocks[block_indices[0]], pa.Table
-        ):
-            # Fast path: use np.searchsorted for vectorized search on a single block.
-            # This is ~3x faster than the naive case.
-            block = self.blocks[block_indices[0]]
-            col = block[self.key_field]
-            indices = np.searchsorted(col, keys)
-            acc = BlockAccessor.for_block(block)
-            result = [acc._get_row(i) for i in indices]
-            # assert result == [self._get(i, k) for i, k in zip(block_indices, keys)]
-        else:
-            result = [self._get(i, k) for i, k in zip(block_indices, keys)]
+        result = self._multiget(block_indices, keys)
         self.total_time += time.perf_counter() - start
         self.num_accesses += 1
         return result
@@ -249,39 +411,43 @@ class _RandomAccessWorker:
         return {
             "num_blocks": len(self.blocks),
             "num_accesses": self.num_accesses,
+            "num_keys": self.num_keys,
+            "num_cache_hits": self.num_cache_hits,
             "total_time": self.total_time,
         }
 
-    def _get(self, block_index, key):
-        if block_index is None:
-            return None
-        block = self.blocks[block_index]
-        column = block[self.key_field]
-        if isinstance(block, pa.Table):
-            column = _ArrowListWrapper(column)
-        i = _binary_search_find(column, key)
-        if i is None:
-            return None
-        acc = BlockAccessor.for_block(block)
-        return acc._get_row(i)
-
-
-def _binary_search_find(column, x):
-    i = bisect.bisect_left(column, x)
-    if i != len(column) and column[i] == x:
-        return i
-    return None
-
-
-class _ArrowListWrapper:
-    def __init__(self, arrow_col):
-        self.arrow_col = arrow_col
-
-    def __getitem__(self, i):
-        return self.arrow_col[i].as_py()
-
-    def __len__(self):
-        return len(self.arrow_col)
+    def _multiget(self, block_indices, keys):
+        self.num_keys += len(keys)
+        results = [None] * len(keys)
+        # The positions of the keys that aren't cached, grouped by block.
+        block_positions = defaultdict(list)
+        for position, (block_index, key) in enumerate(zip(block_indices, keys)):
+            if block_index is None:
+                continue
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                results[position] = self.cache[key]
+                self.num_cache_hits += 1
+            else:
+                block_positions[block_index].append(position)
+
+        for block_index, positions in block_positions.items():
+            column = self.key_columns[block_index]
+            block_keys = [keys[p] for p in positions]
+            indices = np.searchsorted(column, block_keys)
+            acc = BlockAccessor.for_block(self.blocks[block_index])
+            for position, key, i in zip(positions, block_keys, indices):
+                if i < len(column) and column[i] == key:
+                    results[position] = acc._get_row(i)
+                    self._cache_put(key, results[position])
+        return results
+
+    def _cache_put(self, key, row):
+        if self.cache_size == 0:
+            return
+        self.cache[key] = row
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
 
 
 def _get_bounds(block, key):
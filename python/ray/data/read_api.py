@@ -20,6 +20,7 @@ import numpy as np
 import ray
 from ray._private.auto_init_hook import wrap_auto_init
 from ray.air.util.tensor_extensions.utils import _create_possibly_ragged_ndarray
+from ray.data._internal.datasource.arrow_ipc_datasource import ArrowIPCDatasource
 from ray.data._internal.datasource.avro_datasource import AvroDatasource
 from ray.data._internal.datasource.bigquery_datasource import BigQueryDatasource
 from ray.data._internal.datasource.binary_datasource import BinaryDatasource
@@ -1672,6 +1673,109 @@ def read_numpy(
     )
 
 
+@PublicAPI(stability="alpha")
+def read_arrow_ipc(
+    paths: Union[str, List[str]],
+    *,
+    filesystem: Optional["pyarrow.fs.FileSystem"] = None,
+    memory_map: bool = True,
+    ray_remote_args: Optional[Dict[str, Any]] = None,
+    meta_provider: Optional[BaseFileMetadataProvider] = None,
+    partition_filter: Optional[PathPartitionFilter] = None,
+    partitioning: Partitioning = None,
+    include_paths: bool = False,
+    ignore_missing_paths: bool = False,
+    shuffle: Union[Literal["files"], None] = None,
+    file_extensions: Optional[List[str]] = ArrowIPCDatasource._FILE_EXTENSIONS,
+    concurrency: Optional[int] = None,
+    override_num_blocks: Optional[int] = None,
+) -> Dataset:
+    """Create a :class:`~ray.data.Dataset` from Arrow IPC (Feather V2) files.
+
+    Arrow IPC files store data in the Arrow in-memory format, so they can be read
+    without decoding. Files on the local filesystem are memory-mapped, and the
+    blocks reference the mapped file instead of copies of the data. This makes Arrow
+    IPC a good format for node-local scratch data. To avoid copies, write the files
+    without compression.
+
+    Examples:
+        Read a directory of files on the local filesystem.
+
+        >>> import ray
+        >>> ray.data.read_arrow_ipc("/mnt/local_disk/path") # doctest: +SKIP
+
+        Read multiple files without memory-mapping them.
+
+        >>> ray.data.read_arrow_ipc( # doctest: +SKIP
+        ...     ["/path/to/file1.arrow", "/path/to/file2.arrow"], memory_map=False)
+
+    Args:
+        paths: A single file or directory, or a list of file or directory paths.
+            A list of paths can contain both files and directories.
+        filesystem: The PyArrow filesystem
+            implementation to read from. These filesystems are specified in the
+            `PyArrow docs <https://arrow.apache.org/docs/python/api/\
+            filesystems.html#filesystem-implementations>`_. Specify this parameter if
+            you need to provide specific configurations to the filesystem. By default,
+            the filesystem is automatically selected based on the scheme of the paths.
+            For example, if the path begins with ``s3://``, the `S3FileSystem` is used.
+        memory_map: If ``True``, memory-map files on the local filesystem instead of
+            reading them into memory. Files on other filesystems are always read
+            into memory.
+        ray_remote_args: kwargs passed to :meth:`~ray.remote` in the read tasks.
+        meta_provider: A :ref:`file metadata provider <metadata_provider>`. Custom
+            metadata providers may be able to resolve file metadata more quickly and/or
+            accurately. In most cases, you do not need to set this. If ``None``, this
+            function uses a system-chosen implementation.
+        partition_filter: A
+            :class:`~ray.data.datasource.partitioning.PathPartitionFilter`.
+            Use with a custom callback to read only selected partitions of a
+            dataset. By default, this filters out any file paths whose file extension
+            doesn't match ``*.arrow``, ``*.feather`` or ``*.ipc``.
+        partitioning: A :class:`~ray.data.datasource.partitioning.Partitioning` object
+            that describes how paths are organized. Defaults to ``None``.
+        include_paths: If ``True``, include the path to each file. File paths are
+            stored in the ``'path'`` column.
+        ignore_missing_paths: If True, ignores any file paths in ``paths`` that are not
+            found. Defaults to False.
+        shuffle: If setting to "files", randomly shuffle input files order before read.
+            Defaults to not shuffle with ``None``.
+        file_extensions: A list of file extensions to filter files by.
+        concurrency: The maximum number of Ray tasks to run concurrently. Set this
+            to control number of tasks to run concurrently. This doesn't change the
+            total number of tasks run or the total number of output blocks. By default,
+            concurrency is dynamically decided based on the available resources.
+        override_num_blocks: Override the number of output blocks from all read tasks.
+            By default, the number of output blocks is dynamically decided based on
+            input data size and available resources. You shouldn't manually set this
+            value in most cases.
+
+    Returns:
+        :class:`~ray.data.Dataset` holding records from the Arrow IPC files.
+    """
+    if meta_provider is None:
+        meta_provider = DefaultFileMetadataProvider()
+
+    datasource = ArrowIPCDatasource(
+        paths,
+        memory_map=memory_map,
+        filesystem=filesystem,
+        meta_provider=meta_provider,
+        partition_filter=partition_filter,
+        partitioning=partitioning,
+        ignore_missing_paths=ignore_missing_paths,
+        shuffle=shuffle,
+        include_paths=include_paths,
+        file_extensions=file_extensions,
+    )
+    return read_datasource(
+        datasource,
+        ray_remote_args=ray_remote_args,
+        concurrency=concurrency,
+        override_num_blocks=override_num_blocks,
+    )
+
+
 @PublicAPI(stability="alpha")
 def read_tfrecords(
     paths: Union[str, List[str]],
@@ -3,8 +3,16 @@ import pytest
 
 import ray
 from ray.air.util.data_batch_conversion import BatchFormat
+from ray.data import Dataset
 from ray.data.preprocessor import Preprocessor
-from ray.data.preprocessors import Chain, LabelEncoder, SimpleImputer, StandardScaler
+from ray.data.preprocessors import (
+    Chain,
+    Concatenator,
+    LabelEncoder,
+    MinMaxScaler,
+    SimpleImputer,
+    StandardScaler,
+)
 
 
 def test_chain():
@@ -72,6 +80,61 @@ def test_chain():
     assert pred_out_df.equals(pred_expected_df)
 
 
+def test_chain_combined_fit(monkeypatch):
+    """Tests that independent preprocessors are fit in a single aggregation."""
+    in_df = pd.DataFrame.from_dict(
+        {
+            "A": [-1, -1, 1, 1],
+            "B": [1, 2, 3, None],
+            "C": ["sunday", "monday", "tuesday", "tuesday"],
+        }
+    )
+    ds = ray.data.from_pandas(in_df)
+
+    num_aggregations = 0
+    aggregate = Dataset.aggregate
+
+    def counting_aggregate(self, *aggs):
+        nonlocal num_aggregations
+        num_aggregations += 1
+        return aggregate(self, *aggs)
+
+    monkeypatch.setattr(Dataset, "aggregate", counting_aggregate)
+
+    # The preprocessors read different columns, so they're fit in a single pass.
+    scaler = StandardScaler(["A"])
+    imputer = SimpleImputer(["B"])
+    encoder = LabelEncoder("C")
+    Chain(scaler, imputer, encoder).fit(ds)
+    assert num_aggregations == 1
+    assert scaler.stats_ == {"mean(A)": 0.0, "std(A)": 1.0}
+    assert imputer.stats_ == {"mean(B)": 2.0}
+    assert encoder.stats_ == {
+        "unique_values(C)": {"monday": 0, "sunday": 1, "tuesday": 2}
+    }
+
+    # The scaler reads the column transformed by the imputer, so it's fit on the
+    # imputed values in a second pass.
+    num_aggregations = 0
+    imputer = SimpleImputer(["B"])
+    min_max_scaler = MinMaxScaler(["A"])
+    scaler = StandardScaler(["B"])
+    Chain(imputer, min_max_scaler, scaler).fit(ds)
+    assert num_aggregations == 2
+    assert min_max_scaler.stats_ == {"min(A)": -1, "max(A)": 1}
+    assert scaler.stats_ == {"mean(B)": 2.0, "std(B)": pytest.approx(0.5**0.5)}
+
+    # The columns transformed by a concatenator aren't read by later preprocessors.
+    num_aggregations = 0
+    chain = Chain(
+        Concatenator(columns=["A"], output_column_name="X"),
+        StandardScaler(["B"]),
+    )
+    out_df = chain.fit_transform(ds).to_pandas()
+    assert num_aggregations == 1
+    assert "X" in out_df.columns
+
+
 def test_nested_chain_state():
     col_a = [-1, -1, 1, 1]
     col_b = [1, 1, 1, None]
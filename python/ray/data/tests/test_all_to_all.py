@@ -14,7 +14,10 @@ from ray.data._internal.aggregate import Count, Max, Mean, Min, Quantile, Std, S
 from ray.data._internal.execution.interfaces.ref_bundle import (
     _ref_bundles_iterator_to_block_refs_list,
 )
-from ray.data.aggregate import AggregateFn
+from ray.data._internal.execution.operators.map_operator import MapOperator
+from ray.data._internal.logical.operators.all_to_all_operator import Sort
+from ray.data._internal.logical.optimizers import get_execution_plan
+from ray.data.aggregate import AggregateFn, ApproxCountDistinct, ApproxQuantile
 from ray.data.context import DataContext
 from ray.data.tests.conftest import *  # noqa
 from ray.data.tests.util import named_values
@@ -311,6 +314,68 @@ def test_groupby_multiple_keys_tabular_count(
     ]
 
 
+@pytest.mark.parametrize("num_parts", [1, 30])
+@pytest.mark.parametrize("ds_format", ["pyarrow", "pandas"])
+def test_groupby_streaming_hash_shuffle(
+    ray_start_regular_shared, restore_data_context, ds_format, num_parts
+):
+    DataContext.get_current().use_streaming_hash_shuffle = True
+    random.seed(RANDOM_SEED)
+    xs = list(range(100))
+    random.shuffle(xs)
+
+    ds = ray.data.from_items([{"A": (x % 3), "B": x} for x in xs]).repartition(
+        num_parts
+    )
+    ds = ds.map_batches(lambda x: x, batch_size=None, batch_format=ds_format)
+
+    agg_ds = ds.groupby("A").aggregate(Count(), Sum("B"))
+    assert list(agg_ds.sort("A").iter_rows()) == [
+        {"A": 0, "count()": 34, "sum(B)": 1683},
+        {"A": 1, "count()": 33, "sum(B)": 1617},
+        {"A": 2, "count()": 33, "sum(B)": 1650},
+    ]
+    assert ds.sum("B") == 4950
+    assert ds.groupby(["A", "B"]).count().count() == 100
+
+
+@pytest.mark.parametrize("ds_format", ["pyarrow", "pandas"])
+def test_groupby_sorted_dataset(ray_start_regular_shared, ds_format):
+    random.seed(RANDOM_SEED)
+    xs = list(range(100))
+    random.shuffle(xs)
+    ds = ray.data.from_items(
+        [{"A": x % 7, "B": x % 3, "C": x} for x in xs]
+    ).repartition(10)
+    ds = ds.map_batches(lambda x: x, batch_size=None, batch_format=ds_format)
+    sorted_ds = ds.sort("A")
+
+    def is_shuffled(ds):
+        return not isinstance(get_execution_plan(ds._logical_plan).dag, MapOperator)
+
+    # Groupbys on the sort key, or on keys starting with it, reuse the partitioning.
+    for key in ["A", ["A", "B"]]:
+        agg_ds = sorted_ds.groupby(key).aggregate(Count(), Sum("C"))
+        assert not is_shuffled(agg_ds)
+        expected = ds.groupby(key).aggregate(Count(), Sum("C")).take_all()
+        assert agg_ds.take_all() == expected
+
+    assert is_shuffled(sorted_ds.groupby("B").count())
+    assert is_shuffled(ds.sort("A", descending=True).groupby("A").count())
+
+    # `map_groups` doesn't sort the dataset again.
+    mapped = sorted_ds.groupby("A").map_groups(
+        lambda group: {"A": group["A"][:1], "n": [len(group["A"])]},
+        batch_format="numpy",
+    )
+    assert not any(
+        isinstance(op, Sort) and isinstance(op.input_dependencies[0], Sort)
+        for op in mapped._logical_plan.dag.post_order_iter()
+    )
+    counts = sorted((row["A"], row["n"]) for row in mapped.take_all())
+    assert counts == [(a, len([x for x in xs if x % 7 == a])) for a in range(7)]
+
+
 @pytest.mark.parametrize("num_parts", [1, 30])
 @pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
 def test_groupby_tabular_sum(
@@ -903,6 +968,108 @@ def test_groupby_arrow_multi_agg_alias(ray_start_regular_shared, num_parts):
             assert result == expected
 
 
+@pytest.mark.parametrize("num_parts", [1, 30])
+@pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
+def test_approx_aggregations(ray_start_regular_shared, ds_format, num_parts):
+    rng = np.random.default_rng(RANDOM_SEED)
+    df = pd.DataFrame(
+        {
+            "A": rng.integers(0, 3, 10000),
+            "B": rng.normal(size=10000),
+            "C": rng.integers(0, 500, 10000),
+        }
+    )
+    df.loc[::7, "B"] = None
+    ds = ray.data.from_pandas(df).repartition(num_parts)
+    if ds_format == "arrow":
+        ds = ds.map_batches(lambda x: x, batch_size=None, batch_format="pyarrow")
+
+    # Global aggregation.
+    result = ds.aggregate(
+        ApproxCountDistinct("C"),
+        ApproxQuantile("B", q=0.5, alias_name="median"),
+        ApproxQuantile("B", q=0.99, alias_name="p99"),
+    )
+    assert result["approx_count_distinct(C)"] == pytest.approx(
+        df["C"].nunique(), rel=0.05
+    )
+    assert result["median"] == pytest.approx(df["B"].quantile(0.5), abs=0.05)
+    assert result["p99"] == pytest.approx(df["B"].quantile(0.99), abs=0.05)
+
+    # Groupby aggregation.
+    agg_df = (
+        ds.groupby("A")
+        .aggregate(ApproxCountDistinct("C"), ApproxQuantile("B", q=0.9))
+        .to_pandas()
+    )
+    expected = df.groupby("A").agg(
+        distinct=("C", "nunique"), quantile=("B", lambda b: b.quantile(0.9))
+    )
+    np.testing.assert_allclose(
+        agg_df["approx_count_distinct(C)"], expected["distinct"], rtol=0.05
+    )
+    np.testing.assert_allclose(
+        agg_df["approx_quantile(B)"], expected["quantile"], atol=0.05
+    )
+
+    # Nulls are ignored.
+    assert ray.data.from_items([{"B": None}] * 3).aggregate(
+        ApproxCountDistinct("B"), ApproxQuantile("B")
+    ) == {"approx_count_distinct(B)": 0, "approx_quantile(B)": None}
+    with pytest.raises(ValueError):
+        ApproxQuantile("B", q=2)
+    with pytest.raises(ValueError):
+        ApproxCountDistinct("C", precision=20)
+
+
+@pytest.mark.parametrize("num_parts", [1, 30])
+@pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
+def test_summary(ray_start_regular_shared, ds_format, num_parts):
+    rng = np.random.default_rng(RANDOM_SEED)
+    df = pd.DataFrame(
+        {
+            "A": rng.integers(0, 500, 10000),
+            "B": rng.normal(size=10000),
+            "C": [str(i % 3) for i in range(10000)],
+        }
+    )
+    df.loc[::7, "B"] = None
+    ds = ray.data.from_pandas(df).repartition(num_parts)
+    if ds_format == "arrow":
+        ds = ds.map_batches(lambda x: x, batch_size=None, batch_format="pyarrow")
+
+    summary = ds.summary(quantiles=[0.5, 0.99])
+    assert summary["A"]["count"] == 10000
+    assert summary["A"]["null_count"] == 0
+    assert summary["A"]["min"] == df["A"].min()
+    assert summary["A"]["max"] == df["A"].max()
+    assert summary["A"]["approx_distinct"] == pytest.approx(df["A"].nunique(), rel=0.05)
+    assert summary["B"]["count"] == df["B"].count()
+    assert summary["B"]["null_count"] == df["B"].isnull().sum()
+    assert summary["B"]["mean"] == pytest.approx(df["B"].mean())
+    assert summary["B"]["std"] == pytest.approx(df["B"].std())
+    assert summary["B"]["50%"] == pytest.approx(df["B"].quantile(0.5), abs=0.05)
+    assert summary["B"]["99%"] == pytest.approx(df["B"].quantile(0.99), abs=0.05)
+    if ds_format == "arrow":
+        # String columns don't have a mean, std or quantiles.
+        assert summary["C"] == {
+            "count": 10000,
+            "null_count": 0,
+            "min": "0",
+            "max": "2",
+            "approx_distinct": 3,
+        }
+
+    # Only the requested statistics of the requested columns are computed.
+    assert ds.summary(["A"], stats=["min", "max"]) == {
+        "A": {"min": df["A"].min(), "max": df["A"].max()}
+    }
+    with pytest.raises(ValueError):
+        ds.summary(["D"])
+    with pytest.raises(ValueError):
+        ds.summary(stats=["median"])
+
+
 @pytest.mark.parametrize("num_parts", [1, 2, 30])
 def test_groupby_map_groups_for_none_groupkey(ray_start_regular_shared, num_parts):
     ds = ray.data.from_items(list(range(100)))
@@ -1117,6 +1284,19 @@ def test_random_block_order(ray_start_regular_shared, restore_data_context):
 # tests should only be carefully reordered to retain this invariant!
 
 
+def test_random_shuffle_streaming_hash_shuffle(
+    ray_start_regular_shared, restore_data_context
+):
+    DataContext.get_current().use_streaming_hash_shuffle = True
+    r0 = ray.data.range(100, override_num_blocks=10).take_all()
+    r1 = ray.data.range(100, override_num_blocks=10).random_shuffle().take_all()
+    assert r1 != r0
+    assert sorted(r1, key=lambda row: row["id"]) == r0
+    # The streaming shuffle outputs one block per partition.
+    ds = ray.data.range(100, override_num_blocks=10).random_shuffle()
+    assert ds.materialize().num_blocks() <= 10
+
+
 def test_random_shuffle(shutdown_only, use_push_based_shuffle):
     r1 = ray.data.range(100).random_shuffle().take(999)
     r2 = ray.data.range(100).random_shuffle().take(999)
@@ -6,7 +6,10 @@ import pytest
 
 import ray
 from ray._private.test_utils import run_string_as_driver
+from ray.data._internal.aggregate import Count, Max, Mean, Min, Std, Sum
 from ray.data._internal.arrow_block import ArrowBlockAccessor
+from ray.data._internal.planner.exchange.sort_task_spec import SortKey
+from ray.data.context import DataContext
 from ray.data.extensions.object_extension import object_extension_type_allowed
 
 
@@ -22,6 +25,64 @@ def test_append_column(ray_start_regular_shared):
     assert actual_block.equals(expected_block)
 
 
+def _round_floats(value):
+    if isinstance(value, float):
+        return round(value, 10)
+    if isinstance(value, list):
+        return [_round_floats(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _round_floats(v) for k, v in value.items()}
+    return value
+
+
+@pytest.mark.parametrize("finalize", [True, False])
+@pytest.mark.parametrize("with_std", [True, False])
+def test_hash_aggregate(restore_data_context, finalize, with_std):
+    # The vectorized aggregations should match the Python callbacks. Std
+    # accumulators are only combined with Arrow, and merged in Python.
+    aggs = [
+        Count(),
+        Count("v"),
+        Sum("v"),
+        Min("v"),
+        Max("v"),
+        Mean("v"),
+        Mean("v", ignore_nulls=False),
+    ]
+    if with_std:
+        aggs.append(Std("v"))
+    blocks = [
+        pa.table({"k": [2, 1, 1, 3], "v": [1.5, None, 2.0, None]}),
+        pa.table({"k": [1, 2, 2, 4], "v": [4.0, -1.0, 3.0, 5.0]}),
+    ]
+
+    def aggregate(use_arrow_hash_aggregate):
+        DataContext.get_current().use_arrow_hash_aggregate = use_arrow_hash_aggregate
+        combined = []
+        for block in blocks:
+            block = ArrowBlockAccessor(block).sort_and_partition([], SortKey("k"))[0]
+            combined.append(ArrowBlockAccessor(block).combine("k", aggs))
+        return (
+            combined,
+            ArrowBlockAccessor.aggregate_combined_blocks(
+                combined, "k", aggs, finalize=finalize
+            )[0],
+        )
+
+    combined, result = aggregate(True)
+    expected_combined, expected = aggregate(False)
+    for block, expected_block in zip(combined, expected_combined):
+        assert _round_floats(block.to_pylist()) == _round_floats(
+            expected_block.to_pylist()
+        )
+    assert _round_floats(result.to_pylist()) == _round_floats(expected.to_pylist())
+    if finalize:
+        assert result.column("count()").to_pylist() == [3, 3, 1, 1]
+        # Only the non-null values are counted.
+        assert result.column("count(v)").to_pylist() == [2, 3, 0, 1]
+        assert result.column("mean(v)_2").to_pylist()[:2] == [None, 1.1666666666666667]
+
+
 def test_register_arrow_types(tmp_path):
     # Test that our custom arrow extension types are registered on initialization.
     ds = ray.data.from_items(np.zeros((8, 8, 8), dtype=np.int64))
@@ -0,0 +1,90 @@
+import os
+
+import pyarrow as pa
+import pyarrow.feather as feather
+import pytest
+
+import ray
+from ray.data._internal.datasource.arrow_ipc_datasource import ArrowIPCDatasource
+from ray.data.datasource import Partitioning
+from ray.data.tests.conftest import *  # noqa
+from ray.tests.conftest import *  # noqa
+
+
+@pytest.mark.parametrize("compression", [None, "lz4", "zstd"])
+def test_arrow_ipc_roundtrip(ray_start_regular_shared, tmp_path, compression):
+    ds = ray.data.range(100, override_num_blocks=4).map(
+        lambda row: {"id": row["id"], "text": str(row["id"])}
+    )
+    ds.write_arrow_ipc(tmp_path, compression=compression)
+
+    assert len(os.listdir(tmp_path)) == 4
+    assert all(filename.endswith(".arrow") for filename in os.listdir(tmp_path))
+
+    ds = ray.data.read_arrow_ipc(tmp_path)
+    assert ds.schema().names == ["id", "text"]
+    assert sorted(ds.take_all(), key=lambda row: row["id"]) == [
+        {"id": i, "text": str(i)} for i in range(100)
+    ]
+
+
+@pytest.mark.parametrize("memory_map", [True, False])
+def test_read_arrow_ipc_feather(ray_start_regular_shared, tmp_path, memory_map):
+    table = pa.table({"a": list(range(10)), "b": [str(i) for i in range(10)]})
+    feather.write_feather(table, os.path.join(tmp_path, "data.feather"))
+    # Files in the IPC streaming format are also supported.
+    with pa.ipc.new_stream(os.path.join(tmp_path, "data.ipc"), table.schema) as w:
+        w.write_table(table)
+
+    ds = ray.data.read_arrow_ipc(tmp_path, memory_map=memory_map)
+    assert ds.count() == 20
+    assert sorted(ds.to_pandas()["a"]) == sorted(list(range(10)) * 2)
+
+
+def test_read_arrow_ipc_memory_map(tmp_path):
+    path = os.path.join(tmp_path, "data.arrow")
+    table = pa.table({"a": list(range(1000))})
+    feather.write_feather(table, path, compression="uncompressed")
+
+    datasource = ArrowIPCDatasource(path)
+    fs = pa.fs.LocalFileSystem()
+    with datasource._open_input_source(fs, path) as f:
+        assert isinstance(f, pa.MemoryMappedFile)
+        allocated_bytes = pa.total_allocated_bytes()
+        (block,) = datasource._read_stream(f, path)
+        # The block references the memory-mapped file instead of a copy.
+        assert pa.total_allocated_bytes() == allocated_bytes
+        assert block.equals(table)
+
+
+def test_read_arrow_ipc_block_size(
+    ray_start_regular_shared, tmp_path, restore_data_context
+):
+    path = os.path.join(tmp_path, "data.arrow")
+    table = pa.table({"a": list(range(1000))})
+    feather.write_feather(table, path, chunksize=100, compression="uncompressed")
+
+    # Record batches are combined into blocks of up to the target max block size.
+    ctx = ray.data.DataContext.get_current()
+    ctx.target_max_block_size = 250 * 8
+    datasource = ArrowIPCDatasource(path, memory_map=False)
+    with datasource._open_input_source(pa.fs.LocalFileSystem(), path) as f:
+        blocks = list(datasource._read_stream(f, path))
+    assert [len(block) for block in blocks] == [200, 200, 200, 200, 200]
+
+
+def test_read_arrow_ipc_partitioning(ray_start_regular_shared, tmp_path):
+    path = os.path.join(tmp_path, "country=us", "data.arrow")
+    os.mkdir(os.path.dirname(path))
+    feather.write_feather(pa.table({"a": [1, 2]}), path)
+
+    ds = ray.data.read_arrow_ipc(path, partitioning=Partitioning("hive"))
+
+    assert ds.schema().names == ["a", "country"]
+    assert [r["country"] for r in ds.take()] == ["us", "us"]
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
@@ -10,6 +10,7 @@ import pytest
 import ray
 from ray.data._internal.execution.backpressure_policy import (
     ENABLED_BACKPRESSURE_POLICIES_CONFIG_KEY,
+    AdaptiveConcurrencyBackpressurePolicy,
     ConcurrencyCapBackpressurePolicy,
 )
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
@@ -130,6 +131,71 @@ class TestConcurrencyCapBackpressurePolicy(unittest.TestCase):
         assert start1 < start2 < end1 < end2, (start1, start2, end1, end2)
 
 
+def test_adaptive_concurrency_backpressure_policy():
+    input_op = InputDataBuffer(input_data=[MagicMock()])
+    map_op = TaskPoolMapOperator(
+        map_transformer=MagicMock(),
+        input_op=input_op,
+        target_max_block_size=None,
+    )
+    topology = {input_op: MagicMock(), map_op: MagicMock()}
+    policy = AdaptiveConcurrencyBackpressurePolicy(topology)
+
+    outputs_usage = {map_op: 0}
+    resource_manager = MagicMock()
+    resource_manager.get_global_limits.return_value.object_store_memory = 1000
+    resource_manager.get_op_outputs_object_store_usage.side_effect = (
+        lambda op: outputs_usage[op]
+    )
+
+    def update(object_store_usage):
+        resource_manager.get_global_usage.return_value.object_store_memory = (
+            object_store_usage
+        )
+        # Force an update regardless of the update interval.
+        policy._last_update_time = 0
+        policy.on_usages_updated(resource_manager)
+
+    # Operators aren't capped until the object store is under pressure.
+    map_op.metrics.num_tasks_running = 8
+    assert policy.can_add_input(map_op)
+    update(100)
+    assert policy.can_add_input(map_op)
+    assert map_op.metrics.concurrency_cap == 0
+
+    # Under high pressure, the op produced 100 bytes, but only 20 bytes were
+    # consumed, so the cap is decreased by the max factor.
+    map_op.metrics.bytes_task_outputs_generated = 100
+    outputs_usage[map_op] = 80
+    update(900)
+    assert policy._concurrency_caps[map_op] == 4
+    assert not policy.can_add_input(map_op)
+    map_op.metrics.num_tasks_running = 3
+    assert policy.can_add_input(map_op)
+    assert map_op.metrics.concurrency_cap == 4
+    assert map_op.metrics.num_concurrency_cap_decreases == 1
+
+    # 90 bytes out of 100 were consumed, so the cap is decreased by 10%.
+    map_op.metrics.num_tasks_running = 4
+    map_op.metrics.bytes_task_outputs_generated = 200
+    outputs_usage[map_op] = 90
+    update(900)
+    assert policy._concurrency_caps[map_op] == 3
+
+    # Under low pressure, the cap is increased additively.
+    map_op.metrics.num_tasks_running = 3
+    outputs_usage[map_op] = 0
+    update(100)
+    assert policy._concurrency_caps[map_op] == 4
+    assert map_op.metrics.concurrency_cap == 4
+    assert map_op.metrics.num_concurrency_cap_decreases == 2
+
+    # The cap isn't increased if the op doesn't run at its cap.
+    map_op.metrics.num_tasks_running = 1
+    update(100)
+    assert policy._concurrency_caps[map_op] == 4
+
+
 if __name__ == "__main__":
     import sys
 
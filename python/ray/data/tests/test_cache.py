@@ -0,0 +1,83 @@
+import pytest
+
+import ray
+from ray.data.tests.conftest import *  # noqa
+from ray.data.tests.util import Counter
+from ray.tests.conftest import *  # noqa
+
+
+def _counted_dataset(counter, num_rows=100, num_blocks=10):
+    def count(batch):
+        ray.get(counter.increment.remote())
+        return batch
+
+    return ray.data.range(num_rows, override_num_blocks=num_blocks).map_batches(
+        count, batch_size=None
+    )
+
+
+def _ids(ds):
+    return sorted(row["id"] for row in ds.iter_rows())
+
+
+@pytest.mark.parametrize("storage", ["memory", "memory_and_disk", "disk"])
+def test_cache_is_reused(ray_start_regular_shared, storage):
+    counter = Counter.remote()
+    ds = _counted_dataset(counter).cache(storage=storage)
+
+    for _ in range(3):
+        assert _ids(ds) == list(range(100))
+    # The blocks were only computed by the first execution.
+    assert ray.get(counter.get.remote()) == 10
+
+    # Downstream operators are executed for each epoch.
+    assert sorted(ds.map(lambda row: {"id": -row["id"]}).to_pandas()["id"]) == sorted(
+        -i for i in range(100)
+    )
+    assert ray.get(counter.get.remote()) == 10
+
+
+def test_cache_spills_to_disk(ray_start_regular_shared):
+    counter = Counter.remote()
+    # All blocks exceed the budget, so they are spilled.
+    ds = _counted_dataset(counter).cache(storage="memory_and_disk", max_bytes=0)
+
+    for _ in range(2):
+        assert _ids(ds) == list(range(100))
+    assert ray.get(counter.get.remote()) == 10
+
+
+def test_cache_recomputes_evicted_blocks(ray_start_regular_shared):
+    counter = Counter.remote()
+    # Blocks are evicted, so the cache is incomplete.
+    ds = _counted_dataset(counter).cache(storage="memory", max_bytes=100)
+
+    for _ in range(2):
+        assert _ids(ds) == list(range(100))
+    assert ray.get(counter.get.remote()) == 20
+
+
+def test_cache_partial_execution(ray_start_regular_shared):
+    counter = Counter.remote()
+    ds = _counted_dataset(counter).cache()
+
+    # Executions that don't consume all blocks don't complete the cache.
+    assert len(ds.take(1)) == 1
+    count = ray.get(counter.get.remote())
+    assert _ids(ds) == list(range(100))
+    assert ray.get(counter.get.remote()) == count + 10
+    assert _ids(ds) == list(range(100))
+    assert ray.get(counter.get.remote()) == count + 10
+
+
+def test_cache_invalid_args(ray_start_regular_shared):
+    with pytest.raises(ValueError):
+        ray.data.range(10).cache(storage="gpu")
+    with pytest.raises(ValueError):
+        ray.data.range(10).cache(max_bytes=-1)
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
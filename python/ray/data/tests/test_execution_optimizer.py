@@ -1,10 +1,12 @@
 import itertools
+import os
 import sys
 from typing import List, Optional
 
 import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 import ray
@@ -17,6 +19,7 @@ from ray.data._internal.execution.operators.base_physical_operator import (
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
 from ray.data._internal.execution.operators.map_operator import MapOperator
 from ray.data._internal.execution.operators.map_transformer import (
+    ArrowBatchMapTransformFn,
     BatchMapTransformFn,
     BlockMapTransformFn,
     BlocksToBatchesMapTransformFn,
@@ -45,6 +48,7 @@ from ray.data._internal.logical.operators.map_operator import (
     FlatMap,
     MapBatches,
     MapRows,
+    WithColumn,
 )
 from ray.data._internal.logical.operators.n_ary_operator import Union, Zip
 from ray.data._internal.logical.operators.write_operator import Write
@@ -67,6 +71,7 @@ from ray.data.block import BlockMetadata
 from ray.data.context import DataContext
 from ray.data.datasource import Datasource
 from ray.data.datasource.datasource import ReadTask
+from ray.data.expressions import col
 from ray.data.tests.conftest import *  # noqa
 from ray.data.tests.test_util import get_parquet_read_logical_op
 from ray.data.tests.util import column_udf, extract_values, named_values
@@ -371,11 +376,11 @@ def test_column_ops_e2e(ray_start_regular_shared):
 
     select_ds = ds.select_columns(cols=["new_col"])
     assert select_ds.take_all() == [{"new_col": 0}, {"new_col": 1}]
-    _check_usage_record(["ReadRange", "MapBatches"])
+    _check_usage_record(["ReadRange", "MapBatches", "Project"])
 
     ds = ds.drop_columns(cols=["new_col"])
     assert ds.take_all() == [{"id": 0}, {"id": 1}], ds
-    _check_usage_record(["ReadRange", "MapBatches"])
+    _check_usage_record(["ReadRange", "MapBatches", "Project"])
 
 
 def test_random_sample_e2e(ray_start_regular_shared):
@@ -653,6 +658,33 @@ def test_read_map_chain_operator_fusion(ray_start_regular_shared):
     assert physical_op._logical_operators == [read_op, map1, map2, map3, map4]
 
 
+def test_expression_operator_fusion(ray_start_regular_shared):
+    ctx = DataContext.get_current()
+
+    # Test that expression columns and filters are fused, and that the fused
+    # operator passes Arrow batches between them without building blocks.
+    planner = Planner()
+    read_op = get_parquet_read_logical_op(parallelism=1)
+    op1 = WithColumn(read_op, "b", col("a") + 1)
+    op2 = Filter(op1, filter_expr=col("b") > 2)
+    op3 = WithColumn(op2, "c", col("b") * 2)
+    logical_plan = LogicalPlan(op3, ctx)
+    physical_plan = planner.plan(logical_plan)
+    physical_plan = PhysicalOptimizer().optimize(physical_plan)
+    physical_op = physical_plan.dag
+
+    assert isinstance(physical_op, MapOperator)
+    assert physical_op._logical_operators == [read_op, op1, op2, op3]
+    transform_fns = physical_op.get_map_transformer().get_transform_fns()
+    assert [type(fn) for fn in transform_fns[-5:]] == [
+        BlocksToBatchesMapTransformFn,
+        ArrowBatchMapTransformFn,
+        ArrowBatchMapTransformFn,
+        ArrowBatchMapTransformFn,
+        BuildOutputBlocksMapTransformFn,
+    ]
+
+
 def test_read_map_batches_operator_fusion_compatible_remote_args(
     ray_start_regular_shared,
 ):
@@ -1584,6 +1616,143 @@ def test_limit_pushdown(ray_start_regular_shared):
     )
 
 
+def test_predicate_pushdown(ray_start_regular_shared, tmp_path):
+    table = pa.table({"a": list(range(100)), "b": [str(i) for i in range(100)]})
+    pq.write_table(table, os.path.join(tmp_path, "data.parquet"), row_group_size=10)
+
+    # Test basic Filter pushdown into the Parquet read.
+    ds = ray.data.read_parquet(str(tmp_path)).filter(expr=col("a") >= 97)
+    _check_valid_plan_and_result(
+        ds,
+        "Read[ReadParquet]",
+        [{"a": i, "b": str(i)} for i in range(97, 100)],
+    )
+
+    # Test consecutive Filter pushdown.
+    ds = (
+        ray.data.read_parquet(str(tmp_path))
+        .filter(expr=col("a") >= 90)
+        .filter(expr=col("b").is_in(["91", "95"]))
+    )
+    _check_valid_plan_and_result(
+        ds, "Read[ReadParquet]", [{"a": 91, "b": "91"}, {"a": 95, "b": "95"}]
+    )
+
+    # Test that Filter isn't pushed past a UDF.
+    ds = (
+        ray.data.read_parquet(str(tmp_path))
+        .map_batches(lambda x: x)
+        .filter(expr=col("a") < 2)
+    )
+    _check_valid_plan_and_result(
+        ds,
+        "Read[ReadParquet] -> MapBatches[MapBatches(<lambda>)] -> "
+        "Filter[Filter((col('a') < lit(2)))]",
+        [{"a": 0, "b": "0"}, {"a": 1, "b": "1"}],
+    )
+
+    # Test that Filter isn't pushed into datasources that don't support it.
+    ds = ray.data.range(10).filter(expr=col("id") < 2)
+    _check_valid_plan_and_result(
+        ds,
+        "Read[ReadRange] -> Filter[Filter((col('id') < lit(2)))]",
+        [{"id": 0}, {"id": 1}],
+    )
+
+
+def test_predicate_pushdown_partition_column(ray_start_regular_shared, tmp_path):
+    for part in range(2):
+        part_dir = os.path.join(tmp_path, f"part={part}")
+        os.makedirs(part_dir)
+        pq.write_table(
+            pa.table({"a": [part * 10 + i for i in range(3)]}),
+            os.path.join(part_dir, "data.parquet"),
+        )
+
+    # Partition columns are added after the file scan, so filters on them can't be
+    # pushed down. A filter on a file column is still pushed past them.
+    ds = (
+        ray.data.read_parquet(str(tmp_path))
+        .filter(expr=col("part") == "1")
+        .filter(expr=col("a") > 10)
+    )
+    _check_valid_plan_and_result(
+        ds,
+        "Read[ReadParquet] -> Filter[Filter((col('part') == lit('1')))]",
+        [{"a": 11, "part": "1"}, {"a": 12, "part": "1"}],
+    )
+
+
+def test_projection_pushdown(ray_start_regular_shared, tmp_path):
+    table = pa.table({"a": [1, 2, 3], "b": ["x", "y", "z"], "c": [1.0, 2.0, 3.0]})
+    pq.write_table(table, os.path.join(tmp_path, "data.parquet"))
+
+    # Test select_columns pushdown into the Parquet read.
+    ds = ray.data.read_parquet(str(tmp_path)).select_columns(["c", "a"])
+    _check_valid_plan_and_result(
+        ds,
+        "Read[ReadParquet]",
+        [{"c": 1.0, "a": 1}, {"c": 2.0, "a": 2}, {"c": 3.0, "a": 3}],
+    )
+    assert ds.schema().names == ["c", "a"]
+
+    # Test drop_columns pushdown into the Parquet read.
+    ds = ray.data.read_parquet(str(tmp_path)).drop_columns(["b"])
+    _check_valid_plan_and_result(
+        ds,
+        "Read[ReadParquet]",
+        [{"a": 1, "c": 1.0}, {"a": 2, "c": 2.0}, {"a": 3, "c": 3.0}],
+    )
+
+    # Test that a pushed down filter can reference columns that aren't selected.
+    ds = (
+        ray.data.read_parquet(str(tmp_path))
+        .filter(expr=col("a") > 1)
+        .select_columns(["b"])
+    )
+    _check_valid_plan_and_result(ds, "Read[ReadParquet]", [{"b": "y"}, {"b": "z"}])
+
+    # Test that a Filter is pushed past a projection that keeps its columns.
+    ds = (
+        ray.data.read_parquet(str(tmp_path))
+        .select_columns(["a", "b"])
+        .filter(expr=col("a") < 2)
+    )
+    _check_valid_plan_and_result(ds, "Read[ReadParquet]", [{"a": 1, "b": "x"}])
+
+    # Test that projections aren't pushed down if they select duplicate or
+    # non-existent columns.
+    ds = ray.data.read_parquet(str(tmp_path)).select_columns(["a", "a"])
+    _check_valid_plan_and_result(
+        ds, "Read[ReadParquet] -> Project[Project]", [{"a": 1}, {"a": 2}, {"a": 3}]
+    )
+    ds = ray.data.read_parquet(str(tmp_path)).select_columns(["a", "d"])
+    with pytest.raises(KeyError):
+        ds.materialize()
+
+    # Test that projections aren't pushed into datasources that don't support it.
+    ds = ray.data.range(2).select_columns(["id"])
+    _check_valid_plan_and_result(
+        ds, "Read[ReadRange] -> Project[Project]", [{"id": 0}, {"id": 1}]
+    )
+
+
+def test_projection_pushdown_csv(ray_start_regular_shared, tmp_path):
+    path = os.path.join(tmp_path, "data.csv")
+    with open(path, "w") as f:
+        f.write("a,b,c\n1,x,1.5\n2,y,2.5\n")
+
+    ds = ray.data.read_csv(path).select_columns(["c", "a"])
+    _check_valid_plan_and_result(
+        ds, "Read[ReadCSV]", [{"c": 1.5, "a": 1}, {"c": 2.5, "a": 2}]
+    )
+
+    ds = ray.data.read_csv(path, include_paths=True).select_columns(["b", "path"])
+    _check_valid_plan_and_result(
+        ds, "Read[ReadCSV]", [{"b": "x", "path": path}, {"b": "y", "path": path}]
+    )
+
+
 def test_execute_to_legacy_block_list(
     ray_start_regular_shared,
 ):
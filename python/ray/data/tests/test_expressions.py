@@ -0,0 +1,115 @@
+import pyarrow as pa
+import pytest
+
+import ray
+from ray.data.expressions import col, lit
+from ray.data.tests.conftest import *  # noqa
+from ray.tests.conftest import *  # noqa
+
+
+def test_expression_to_pyarrow():
+    table = pa.table({"a": [1, 2, 3, None], "b": ["x", "y", "z", "x"]})
+
+    def evaluate(expr):
+        return table.filter(expr.to_pyarrow()).column("a").to_pylist()
+
+    assert evaluate(col("a") > 1) == [2, 3]
+    assert evaluate((col("a") >= 2) & (col("b") != "z")) == [2]
+    assert evaluate((col("a") == 1) | (col("b") == "z")) == [1, 3]
+    assert evaluate(~(col("a") < 3)) == [3]
+    assert evaluate(col("a").is_null()) == [None]
+    assert evaluate(col("b").is_in(["x"])) == [1, None]
+    assert evaluate(lit(2) < col("a")) == [3]
+    assert evaluate(col("a") * 2 - 1 > 3) == [3]
+    assert evaluate(10 / col("a") == 5) == [2]
+    assert evaluate(1 + col("a") == 2) == [1]
+
+
+def test_expression_to_sql():
+    expr = (col("a") >= 1) & ~col("b").is_in(["it's", "y"]) | col("c").is_null()
+    assert expr.to_sql() == (
+        "(((a >= 1) AND (NOT (b IN ('it''s', 'y')))) OR (c IS NULL))"
+    )
+    assert (col("flag") == True).to_sql() == "(flag = TRUE)"  # noqa: E712
+    assert ((col("a") + 1) * 2 > col("b") / 3).to_sql() == "(((a + 1) * 2) > (b / 3))"
+
+    with pytest.raises(ValueError):
+        (col("sepal.length") > 5).to_sql()
+    with pytest.raises(ValueError):
+        (col("a") == None).to_sql()  # noqa: E711
+    with pytest.raises(ValueError):
+        col("a").is_in([]).to_sql()
+    with pytest.raises(ValueError):
+        (col("a") < float("inf")).to_sql()
+    with pytest.raises(ValueError):
+        col("a").is_in([1.0, float("nan")]).to_sql()
+
+
+def test_expression_columns():
+    expr = (col("a") > 1) & (col("b").is_in([1]) | col("a").is_null())
+    assert expr.columns() == {"a", "b"}
+    assert lit(1).columns() == set()
+
+
+def test_expression_bool_raises():
+    with pytest.raises(TypeError):
+        bool(col("a") > 1)
+
+    with pytest.raises(TypeError):
+        1 < col("a") < 3
+
+
+def test_filter_expr(ray_start_regular_shared):
+    ds = ray.data.range(10, override_num_blocks=3)
+    assert ds.filter(expr=col("id") > 6).take_all() == [{"id": 7}, {"id": 8}, {"id": 9}]
+
+    # Pandas blocks are converted to Arrow before the predicate is evaluated.
+    ds = ray.data.from_pandas(pa.table({"id": [1, 2, 3]}).to_pandas())
+    assert ds.filter(expr=col("id") != 2).take_all() == [{"id": 1}, {"id": 3}]
+
+    with pytest.raises(ValueError):
+        ds.filter(lambda row: True, expr=col("id") > 1)
+    with pytest.raises(ValueError):
+        ds.filter()
+    with pytest.raises(TypeError):
+        ds.filter(expr="id > 1")
+
+
+def test_add_column_expr(ray_start_regular_shared):
+    ds = ray.data.range(5, override_num_blocks=2)
+    ds = ds.add_column("double", expr=col("id") * 2)
+    assert ds.take_all() == [{"id": i, "double": 2 * i} for i in range(5)]
+
+    # An existing column is replaced in place.
+    ds = ray.data.from_pandas(pa.table({"a": [1, 2], "b": [3, 4]}).to_pandas())
+    assert ds.add_column("a", expr=col("a") + col("b")).take_all() == [
+        {"a": 4, "b": 3},
+        {"a": 6, "b": 4},
+    ]
+    assert ds.add_column("c", expr=lit(0)).take_all() == [
+        {"a": 1, "b": 3, "c": 0},
+        {"a": 2, "b": 4, "c": 0},
+    ]
+
+    with pytest.raises(ValueError):
+        ds.add_column("c", lambda df: 0, expr=lit(0))
+    with pytest.raises(ValueError):
+        ds.add_column("c")
+    with pytest.raises(TypeError):
+        ds.add_column("c", expr="a + b")
+
+
+def test_chained_exprs(ray_start_regular_shared):
+    ds = (
+        ray.data.range(100, override_num_blocks=4)
+        .add_column("x", expr=col("id") * 3)
+        .filter(expr=col("x") > 150)
+        .add_column("y", expr=col("x") - col("id"))
+    )
+    assert ds.take_all() == [{"id": i, "x": 3 * i, "y": 2 * i} for i in range(51, 100)]
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
@@ -16,6 +16,7 @@ import ray
 from ray._private.utils import _get_pyarrow_version
 from ray.data import read_iceberg
 from ray.data._internal.datasource.iceberg_datasource import IcebergDatasource
+from ray.data.expressions import col
 
 _CATALOG_NAME = "ray_catalog"
 _DB_NAME = "ray_db"
@@ -257,6 +258,55 @@ def test_read_basic():
     assert orig_table_p.equals(table_p)
 
 
+@pytest.mark.skipif(
+    Version(pa.__version__) < Version("9.0.0"),
+    reason="PyIceberg depends on pyarrow>=9.0.0",
+)
+def test_predicate_pushdown():
+    # NOTE: Iceberg only works with PyArrow 9 or above.
+    pyarrow_version = _get_pyarrow_version()
+    if pyarrow_version is not None:
+        pyarrow_version = parse_version(pyarrow_version)
+    if pyarrow_version is not None and pyarrow_version < parse_version("9.0.0"):
+        return
+
+    iceberg_ds = IcebergDatasource(
+        table_identifier=f"{_DB_NAME}.{_TABLE_NAME}",
+        row_filter=pyi_expr.In("col_c", {1, 2, 3, 4}),
+        catalog_kwargs=_CATALOG_KWARGS.copy(),
+    )
+    predicate = (col("col_c") >= 3) & (col("col_a") < 50)
+    assert iceberg_ds.supports_predicate_pushdown(predicate)
+    # PyIceberg prunes the files that can't match the combined row filter.
+    pushed_ds = iceberg_ds.apply_predicate(predicate)
+    assert len(pushed_ds.plan_files) < len(iceberg_ds.plan_files)
+    assert not iceberg_ds.supports_predicate_pushdown(col("col_a") + 1 > 2)
+    assert not iceberg_ds.supports_predicate_pushdown(col("col_a") < float("inf"))
+
+    ray_ds = read_iceberg(
+        table_identifier=f"{_DB_NAME}.{_TABLE_NAME}",
+        row_filter=pyi_expr.In("col_c", {1, 2, 3, 4}),
+        catalog_kwargs=_CATALOG_KWARGS.copy(),
+    ).filter(expr=predicate)
+    table_p = ray_ds.to_pandas().sort_values(["col_a"]).reset_index(drop=True)
+    assert str(ray_ds._plan._logical_plan.dag) == "Read[ReadIceberg]"
+
+    # Read the raw table from PyIceberg
+    sql_catalog = pyi_catalog.load_catalog(**_CATALOG_KWARGS)
+    orig_table_p = (
+        sql_catalog.load_table(f"{_DB_NAME}.{_TABLE_NAME}")
+        .scan(
+            row_filter=pyi_expr.And(
+                pyi_expr.In("col_c", {3, 4}), pyi_expr.LessThan("col_a", 50)
+            )
+        )
+        .to_pandas()
+        .sort_values(["col_a"])
+        .reset_index(drop=True)
+    )
+    assert orig_table_p.equals(table_p)
+
+
 if __name__ == "__main__":
     import sys
 
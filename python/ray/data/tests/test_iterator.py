@@ -195,6 +195,36 @@ def test_torch_conversion_collate_fn(ray_start_regular_shared):
         ), iter_batches_calls_kwargs
 
 
+def test_torch_conversion_reuse_buffers(ray_start_regular_shared):
+    ds = ray.data.range(100, override_num_blocks=4).map_batches(
+        lambda batch: {
+            "id": batch["id"],
+            "vector": np.stack([batch["id"]] * 3, axis=1),
+        }
+    )
+    it = ds.iterator()
+
+    ids = []
+    data_ptrs = set()
+    for batch in it.iter_torch_batches(
+        batch_size=10, dtypes={"id": torch.float32}, reuse_buffers=True
+    ):
+        batch_ids = batch["id"].tolist()
+        assert batch["id"].dtype == torch.float32
+        assert batch["vector"].dtype == torch.int64
+        assert batch["vector"].tolist() == [[i] * 3 for i in batch_ids]
+        ids.extend(batch_ids)
+        data_ptrs.add(batch["id"].data_ptr())
+    assert sorted(ids) == list(range(100))
+    # The 10 batches reuse the buffers of the ring's slots.
+    assert len(data_ptrs) < 10
+
+    with pytest.raises(ValueError):
+        it.iter_torch_batches(collate_fn=lambda batch: batch, reuse_buffers=True)
+    with pytest.raises(ValueError):
+        it.iter_torch_batches(pin_memory=True)
+
+
 def test_iterator_to_materialized_dataset(ray_start_regular_shared):
     """Tests that `DataIterator.materialize` fully consumes the
     iterator and returns a `MaterializedDataset` view of the data
@@ -0,0 +1,194 @@
+import pyarrow as pa
+import pytest
+
+import ray
+from ray.data._internal.logical.optimizers import get_execution_plan
+from ray.data._internal.planner.exchange.hash_partition import hash_partition
+from ray.data._internal.planner.exchange.join_task_spec import JoinTaskSpec
+from ray.data.context import DataContext
+from ray.data.tests.conftest import *  # noqa
+from ray.tests.conftest import *  # noqa
+
+
+def _sorted_rows(ds, key="id"):
+    return sorted(ds.take_all(), key=lambda row: (row[key] is None, row[key]))
+
+
+@pytest.fixture
+def left_and_right(ray_start_regular_shared):
+    left = ray.data.from_items(
+        [{"id": i, "left_value": i * 10} for i in range(8)]
+    ).repartition(4)
+    right = ray.data.from_items(
+        [{"id": i, "right_value": i * 100} for i in range(4, 12)]
+    ).repartition(3)
+    return left, right
+
+
+@pytest.mark.parametrize("broadcast", [False, True])
+def test_inner_join(left_and_right, broadcast):
+    left, right = left_and_right
+    ds = left.join(right, on="id", broadcast=broadcast)
+    assert _sorted_rows(ds) == [
+        {"id": i, "left_value": i * 10, "right_value": i * 100} for i in range(4, 8)
+    ]
+
+
+@pytest.mark.parametrize("broadcast", [False, True])
+def test_left_outer_join(left_and_right, broadcast):
+    left, right = left_and_right
+    ds = left.join(right, on="id", join_type="left_outer", broadcast=broadcast)
+    assert _sorted_rows(ds) == [
+        {"id": i, "left_value": i * 10, "right_value": i * 100 if i >= 4 else None}
+        for i in range(8)
+    ]
+
+
+def test_right_and_full_outer_join(left_and_right):
+    left, right = left_and_right
+    ds = left.join(right, on="id", join_type="right_outer")
+    assert _sorted_rows(ds) == [
+        {"id": i, "left_value": i * 10 if i < 8 else None, "right_value": i * 100}
+        for i in range(4, 12)
+    ]
+
+    ds = left.join(right, on="id", join_type="full_outer", num_partitions=5)
+    assert _sorted_rows(ds) == [
+        {
+            "id": i,
+            "left_value": i * 10 if i < 8 else None,
+            "right_value": i * 100 if i >= 4 else None,
+        }
+        for i in range(12)
+    ]
+
+
+def test_join_different_keys_and_suffixes(ray_start_regular_shared):
+    users = ray.data.from_items(
+        [{"user_id": i, "name": f"user_{i}", "score": i} for i in range(5)]
+    )
+    orders = ray.data.from_items(
+        [{"uid": i % 3, "order": i, "score": -i} for i in range(6)]
+    ).repartition(3)
+    ds = orders.join(
+        users,
+        on="uid",
+        right_on="user_id",
+        left_suffix="_order",
+        right_suffix="_user",
+        broadcast=False,
+    )
+    rows = sorted(ds.take_all(), key=lambda row: row["order"])
+    assert rows == [
+        {
+            "uid": i % 3,
+            "order": i,
+            "score_order": -i,
+            "name": f"user_{i % 3}",
+            "score_user": i % 3,
+        }
+        for i in range(6)
+    ]
+
+
+def test_join_multiple_keys(ray_start_regular_shared):
+    left = ray.data.from_items(
+        [{"a": i % 2, "b": i % 3, "x": i} for i in range(6)]
+    ).repartition(2)
+    right = ray.data.from_items([{"a": 1, "b": 2, "y": "match"}])
+    ds = left.join(right, on=["a", "b"], broadcast=False, num_partitions=4)
+    assert ds.take_all() == [{"a": 1, "b": 2, "x": 5, "y": "match"}]
+
+
+def test_join_broadcast_threshold(left_and_right, restore_data_context):
+    left, right = left_and_right
+    expected = [
+        {"id": i, "left_value": i * 10, "right_value": i * 100} for i in range(4, 8)
+    ]
+
+    DataContext.get_current().broadcast_join_threshold_bytes = 0
+    ds = left.join(right, on="id")
+    assert _sorted_rows(ds) == expected
+
+    DataContext.get_current().broadcast_join_threshold_bytes = 1024**3
+    ds = left.join(right, on="id")
+    assert _sorted_rows(ds) == expected
+
+
+def test_join_empty_side(ray_start_regular_shared):
+    left = ray.data.from_items([{"id": i} for i in range(3)])
+    right = ray.data.from_items([{"id": 0, "v": 1}]).filter(lambda row: False)
+    assert left.join(right, on="id").take_all() == []
+    ds = left.join(right, on="id", join_type="left_outer")
+    assert [row["id"] for row in _sorted_rows(ds)] == [0, 1, 2]
+
+
+@pytest.mark.parametrize("join_type", ["inner", "full_outer"])
+def test_join_co_partitioned(left_and_right, join_type):
+    left, right = left_and_right
+    expected = _sorted_rows(left.join(right, on="id", join_type=join_type))
+
+    # Both inputs are sorted with the same boundaries, so the join reuses the
+    # partitioning instead of shuffling.
+    sorted_left = left.sort("id", boundaries=[3, 6, 9])
+    sorted_right = right.sort("id", boundaries=[3, 6, 9])
+    ds = sorted_left.join(sorted_right, on="id", join_type=join_type)
+    assert get_execution_plan(ds._logical_plan).dag._co_partitioned
+    assert _sorted_rows(ds) == expected
+
+    # Different boundaries.
+    ds = sorted_left.join(right.sort("id", boundaries=[5]), on="id")
+    assert not get_execution_plan(ds._logical_plan).dag._co_partitioned
+
+    # An empty input has no blocks, so the inputs are shuffled.
+    empty = right.filter(lambda row: False).sort("id", boundaries=[3, 6, 9])
+    ds = sorted_left.join(empty, on="id", join_type="left_outer")
+    assert [row["id"] for row in _sorted_rows(ds)] == list(range(8))
+
+
+def test_join_invalid_args(left_and_right):
+    left, right = left_and_right
+    with pytest.raises(ValueError):
+        left.join(right, on="id", join_type="cross")
+    with pytest.raises(ValueError):
+        left.join(right, on="id", join_type="full_outer", broadcast=True)
+    with pytest.raises(ValueError):
+        left.join(right, on=["id"], right_on=["id", "right_value"])
+    with pytest.raises(ValueError):
+        left.join(right, on="id", num_partitions=0)
+
+
+def test_hash_partition():
+    table = pa.table({"k": [1, 2, None, 4, 1, 2, 3, 4], "v": list(range(8))})
+    partitions = hash_partition(table, ["k"], 3)
+    assert len(partitions) == 3
+    assert sum(p.num_rows for p in partitions) == table.num_rows
+    # Equal keys always end up in the same partition.
+    for key in [1, 2, 3, 4]:
+        assert sum(1 for p in partitions if key in p.column("k").to_pylist()) == 1, key
+
+    # The same keys are partitioned the same way in a different table.
+    other = pa.table({"k": [4, 3, 2, 1]})
+    other_partitions = hash_partition(other, ["k"], 3)
+    for p, other_p in zip(partitions, other_partitions):
+        assert set(other_p.column("k").to_pylist()) <= set(p.column("k").to_pylist())
+
+
+def test_join_task_spec_reduce():
+    spec = JoinTaskSpec("inner", ["k"], ["k"])
+    left_blocks = [pa.table({"k": [1, 2]}), pa.table({"k": [3]})]
+    right_blocks = [pa.table({"k": [2, 3], "v": ["b", "c"]})]
+    block, meta = JoinTaskSpec.reduce(
+        *spec._reduce_args, len(left_blocks), *left_blocks, *right_blocks
+    )
+    assert sorted(block.to_pylist(), key=lambda row: row["k"]) == [
+        {"k": 2, "v": "b"},
+        {"k": 3, "v": "c"},
+    ]
+    assert meta.num_rows == 2
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
@@ -10,7 +10,9 @@ import ray
 from ray._private.test_utils import wait_for_condition
 from ray._private.utils import _get_pyarrow_version
 from ray.data import Schema
+from ray.data._internal.datasource.lance_datasource import LanceDatasource
 from ray.data.datasource.path_util import _unwrap_protocol
+from ray.data.expressions import col
 
 
 @pytest.mark.parametrize(
@@ -114,6 +116,36 @@ def test_lance_read_many_files(data_path):
     wait_for_condition(test_lance, timeout=10)
 
 
+@pytest.mark.parametrize("data_path", [lazy_fixture("local_path")])
+def test_lance_predicate_pushdown(data_path):
+    # NOTE: Lance only works with PyArrow 12 or above.
+    pyarrow_version = _get_pyarrow_version()
+    if pyarrow_version is not None:
+        pyarrow_version = parse_version(pyarrow_version)
+    if pyarrow_version is not None and pyarrow_version < parse_version("12.0.0"):
+        return
+
+    setup_data_path = _unwrap_protocol(data_path)
+    path = os.path.join(setup_data_path, "test.lance")
+    data = pa.table({"one": [1, 2, 3, 4, 5, 6], "two": ["a", "b", "c", "d", "e", "f"]})
+    lance.write_dataset(data, path, max_rows_per_file=2)
+
+    # The pushed predicate is combined with the user-specified filter.
+    datasource = LanceDatasource(path, filter="one > 1")
+    pushed = datasource.apply_predicate(col("two") != "c")
+    assert pushed.scanner_options["filter"] == "(one > 1) AND (two != 'c')"
+    assert datasource.scanner_options["filter"] == "one > 1"
+
+    ds = ray.data.read_lance(path, filter="one > 1").filter(expr=col("two") != "c")
+    assert sorted(row["one"] for row in ds.take_all()) == [2, 4, 5, 6]
+    assert str(ds._plan._logical_plan.dag) == "Read[ReadLance]"
+
+    # Predicates that can't be written as SQL are evaluated after the read.
+    ds = ray.data.read_lance(path).filter(expr=col("one") < float("inf"))
+    assert ds.count() == 6
+    assert not datasource.supports_predicate_pushdown(col("one") < float("inf"))
+
+
 if __name__ == "__main__":
     import sys
 
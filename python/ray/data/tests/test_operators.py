@@ -11,6 +11,7 @@ import pytest
 
 import ray
 from ray._private.test_utils import wait_for_condition
+from ray.data._internal.aggregate import Count
 from ray.data._internal.compute import ActorPoolStrategy, TaskPoolStrategy
 from ray.data._internal.execution.interfaces import (
     ExecutionOptions,
@@ -23,6 +24,9 @@ from ray.data._internal.execution.operators.actor_pool_map_operator import (
 from ray.data._internal.execution.operators.base_physical_operator import (
     AllToAllOperator,
 )
+from ray.data._internal.execution.operators.hash_shuffle_operator import (
+    HashShuffleOperator,
+)
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
 from ray.data._internal.execution.operators.limit_operator import LimitOperator
 from ray.data._internal.execution.operators.map_operator import (
@@ -38,6 +42,9 @@ from ray.data._internal.execution.operators.task_pool_map_operator import (
 )
 from ray.data._internal.execution.operators.union_operator import UnionOperator
 from ray.data._internal.execution.util import make_ref_bundles
+from ray.data._internal.planner.exchange.aggregate_task_spec import (
+    HashAggregateTaskSpec,
+)
 from ray.data.block import Block, BlockAccessor
 from ray.data.context import DataContext
 from ray.data.tests.util import run_one_op_task, run_op_tasks_sync
@@ -668,6 +675,41 @@ def test_limit_operator(ray_start_regular_shared):
         assert limit_op.completed(), limit
 
 
+def test_hash_shuffle_operator(ray_start_regular_shared):
+    """Test that HashShuffleOperator shuffles inputs before all inputs are done."""
+    input_op = InputDataBuffer(make_ref_bundles([list(range(5)) for _ in range(20)]))
+    op = HashShuffleOperator(
+        input_op,
+        HashAggregateTaskSpec(key="id", aggs=[Count()]),
+        num_partitions=3,
+    )
+    op.MERGE_FACTOR = 4
+    op.start(ExecutionOptions())
+    while input_op.has_next():
+        op.add_input(input_op.get_next(), 0)
+
+    # Map and merge tasks run before all inputs are done.
+    run_op_tasks_sync(op)
+    # 20 map tasks, and 5 merge tasks per partition.
+    assert op.metrics.num_tasks_finished == 20 + 3 * 5
+    assert op.metrics.obj_store_mem_shuffle_buffer > 0
+    assert not op.has_next()
+    assert not op.completed()
+
+    op.input_done(0)
+    op.all_inputs_done()
+    run_op_tasks_sync(op)
+    rows = []
+    while op.has_next():
+        for block_ref in op.get_next().block_refs:
+            rows.extend(BlockAccessor.for_block(ray.get(block_ref)).iter_rows(True))
+    assert sorted((row["id"], row["count()"]) for row in rows) == [
+        (i, 20) for i in range(5)
+    ]
+    assert op.metrics.obj_store_mem_shuffle_buffer == 0
+    assert op.completed()
+
+
 def _get_bundles(bundle: RefBundle):
     output = []
     for block_ref in bundle.block_refs:
@@ -836,6 +878,30 @@ def test_block_ref_bundler_uniform(
     assert flat_out == list(range(n))
 
 
+def test_block_ref_bundler_min_bytes():
+    # Test that the bundler bundles up to the bytes target, and to both targets if
+    # both are set.
+    bundles = make_ref_bundles([[i] for i in range(10)])
+    bundle_size_bytes = bundles[0].size_bytes()
+    assert all(bundle.size_bytes() == bundle_size_bytes for bundle in bundles)
+
+    for min_rows, expected_bundles in [
+        (None, [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]),
+        (2, [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]),
+        (4, [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]),
+    ]:
+        bundler = _BlockRefBundler(min_rows, 3 * bundle_size_bytes)
+        out_bundles = []
+        for bundle in make_ref_bundles([[i] for i in range(10)]):
+            bundler.add_bundle(bundle)
+            while bundler.has_bundle():
+                out_bundles.append(_get_bundles(bundler.get_next_bundle()))
+        bundler.done_adding_bundles()
+        if bundler.has_bundle():
+            out_bundles.append(_get_bundles(bundler.get_next_bundle()))
+        assert out_bundles == expected_bundles
+
+
 def test_operator_metrics():
     NUM_INPUTS = 100
     NUM_BLOCKS_PER_TASK = 5
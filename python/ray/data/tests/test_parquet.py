@@ -28,7 +28,11 @@ from ray.data.block import BlockAccessor
 from ray.data.context import DataContext
 from ray.data.datasource import DefaultFileMetadataProvider, ParquetMetadataProvider
 from ray.data.datasource.parquet_meta_provider import PARALLELIZE_META_FETCH_THRESHOLD
-from ray.data.datasource.partitioning import Partitioning, PathPartitionFilter
+from ray.data.datasource.partitioning import (
+    Partitioning,
+    PartitionStyle,
+    PathPartitionFilter,
+)
 from ray.data.datasource.path_util import _unwrap_protocol
 from ray.data.tests.conftest import *  # noqa
 from ray.data.tests.mock_http_server import *  # noqa
@@ -746,6 +750,83 @@ def test_parquet_read_parallel_meta_fetch(ray_start_regular_shared, fs, data_pat
     assert sorted(values) == list(range(3 * num_dfs))
 
 
+def test_parquet_read_file_metadata_cache(
+    ray_start_regular_shared, tmp_path, restore_data_context, monkeypatch
+):
+    import ray.data.datasource.file_meta_provider as file_meta_provider
+    import ray.data.datasource.parquet_meta_provider as parquet_meta_provider
+
+    ctx = DataContext.get_current()
+    ctx.file_metadata_cache_dir = str(tmp_path / "cache")
+    data_path = tmp_path / "data"
+    os.mkdir(data_path)
+    for i in range(3):
+        pq.write_table(pa.table({"one": [i] * (i + 1)}), data_path / f"{i}.parquet")
+
+    # Record the directory listings and Parquet footer fetches.
+    num_listings = 0
+    fetched_files = []
+    original_expand_directory = file_meta_provider._expand_directory
+    original_fetch_metadata = parquet_meta_provider._fetch_metadata
+
+    def expand_directory(*args, **kwargs):
+        nonlocal num_listings
+        num_listings += 1
+        return original_expand_directory(*args, **kwargs)
+
+    def fetch_metadata(fragments):
+        fetched_files.extend(os.path.basename(f.path) for f in fragments)
+        return original_fetch_metadata(fragments)
+
+    monkeypatch.setattr(file_meta_provider, "_expand_directory", expand_directory)
+    monkeypatch.setattr(parquet_meta_provider, "_fetch_metadata", fetch_metadata)
+
+    def read_and_check(expected_values):
+        ds = ray.data.read_parquet(str(data_path))
+        assert ds.count() == len(expected_values)
+        assert sorted(row["one"] for row in ds.take_all()) == expected_values
+
+    read_and_check([0, 1, 1, 2, 2, 2])
+    assert num_listings == 1
+    assert sorted(fetched_files) == ["0.parquet", "1.parquet", "2.parquet"]
+
+    # The second read uses the cached listing and footers.
+    fetched_files.clear()
+    read_and_check([0, 1, 1, 2, 2, 2])
+    assert num_listings == 1
+    assert fetched_files == []
+
+    # Rewriting a file invalidates the cached listing and its cached footer.
+    pq.write_table(pa.table({"one": [1] * 4}), data_path / "1.parquet")
+    read_and_check([0, 1, 1, 1, 1, 2, 2, 2])
+    assert num_listings == 2
+    assert fetched_files == ["1.parquet"]
+
+    # Adding a file to a nested directory invalidates the cached listing.
+    os.mkdir(data_path / "nested")
+    pq.write_table(pa.table({"one": [3]}), data_path / "nested" / "3.parquet")
+    read_and_check([0, 1, 1, 1, 1, 2, 2, 2, 3])
+    assert num_listings == 3
+    read_and_check([0, 1, 1, 1, 1, 2, 2, 2, 3])
+    assert num_listings == 3
+    pq.write_table(pa.table({"one": [4]}), data_path / "nested" / "4.parquet")
+    read_and_check([0, 1, 1, 1, 1, 2, 2, 2, 3, 4])
+    assert num_listings == 4
+
+    # Expired entries are fetched again.
+    fetched_files.clear()
+    ctx.file_metadata_cache_ttl_s = 0
+    read_and_check([0, 1, 1, 1, 1, 2, 2, 2, 3, 4])
+    assert num_listings == 5
+    assert sorted(fetched_files) == [
+        "0.parquet",
+        "1.parquet",
+        "2.parquet",
+        "3.parquet",
+        "4.parquet",
+    ]
+
+
 def test_parquet_reader_estimate_data_size(shutdown_only, tmp_path):
     ctx = ray.data.context.DataContext.get_current()
     old_decoding_size_estimation = ctx.decoding_size_estimation
@@ -1176,6 +1257,88 @@ def test_write_num_rows_per_file(tmp_path, ray_start_regular_shared, num_rows_pe
         assert len(table) == num_rows_per_file
 
 
+def test_write_target_file_bytes(tmp_path, ray_start_regular_shared):
+    import pyarrow.parquet as pq
+
+    ds = ray.data.range(1000, override_num_blocks=100).materialize()
+    block_size_bytes = ds.size_bytes() // 100
+    ds.write_parquet(tmp_path, target_file_bytes=10 * block_size_bytes)
+
+    # Small blocks are coalesced into about 10 files of about 100 rows each.
+    filenames = os.listdir(tmp_path)
+    assert len(filenames) <= 11
+    num_rows = [
+        len(pq.read_table(os.path.join(tmp_path, filename))) for filename in filenames
+    ]
+    assert sum(num_rows) == 1000
+    assert sorted(ray.data.read_parquet(tmp_path).to_pandas()["id"]) == list(
+        range(1000)
+    )
+
+    # Large blocks are split into files of about the target size.
+    ray.data.range(1000, override_num_blocks=1).write_parquet(
+        tmp_path / "split", target_file_bytes=10 * block_size_bytes
+    )
+    assert len(os.listdir(tmp_path / "split")) == 10
+
+
+@pytest.mark.parametrize("style", [PartitionStyle.HIVE, PartitionStyle.DIRECTORY])
+def test_write_partitioning(tmp_path, ray_start_regular_shared, style):
+    ds = ray.data.range(100, override_num_blocks=10).map(
+        lambda row: {"id": row["id"], "group": row["id"] % 3}
+    )
+    partitioning = Partitioning(style, base_dir=str(tmp_path), field_names=["group"])
+    ds.write_parquet(tmp_path, partitioning=partitioning, num_rows_per_file=50)
+
+    if style == PartitionStyle.HIVE:
+        expected_dirs = ["group=0", "group=1", "group=2"]
+    else:
+        expected_dirs = ["0", "1", "2"]
+    assert sorted(os.listdir(tmp_path)) == expected_dirs
+
+    df = ray.data.read_parquet(tmp_path, partitioning=partitioning).to_pandas()
+    assert sorted(df["id"]) == list(range(100))
+    assert all(int(group) == i % 3 for i, group in zip(df["id"], df["group"]))
+
+
+def test_write_partitioning_special_values(tmp_path, ray_start_regular_shared):
+    import pyarrow.parquet as pq
+
+    # The partition values are escaped in the directory names.
+    groups = ["a/b", "x=y", "50%", "a/b"]
+    ds = ray.data.from_items([{"id": i, "group": g} for i, g in enumerate(groups)])
+    ds.write_parquet(
+        tmp_path / "escaped", partitioning=Partitioning("hive", field_names=["group"])
+    )
+    assert sorted(os.listdir(tmp_path / "escaped")) == [
+        "group=50%25",
+        "group=a%2Fb",
+        "group=x%3Dy",
+    ]
+    table = pq.read_table(tmp_path / "escaped")
+    assert sorted(zip(table["id"].to_pylist(), table["group"].to_pylist())) == list(
+        enumerate(groups)
+    )
+
+    # The rows with NaN partition values are written to a single partition.
+    ds = ray.data.from_items(
+        [{"id": i, "group": float("nan") if i % 2 else 1.0} for i in range(10)]
+    )
+    ds.write_parquet(
+        tmp_path / "nan", partitioning=Partitioning("hive", field_names=["group"])
+    )
+    assert sorted(os.listdir(tmp_path / "nan")) == ["group=1.0", "group=nan"]
+    table = pq.read_table(tmp_path / "nan" / "group=nan")
+    assert sorted(table["id"].to_pylist()) == [1, 3, 5, 7, 9]
+
+
+def test_write_partitioning_missing_column(tmp_path, ray_start_regular_shared):
+    with pytest.raises(ValueError):
+        ray.data.range(10).write_parquet(
+            tmp_path, partitioning=Partitioning("hive", field_names=["group"])
+        )
+
+
 @pytest.mark.parametrize("shuffle", [True, False, "file"])
 def test_invalid_shuffle_arg_raises_error(ray_start_regular_shared, shuffle):
 
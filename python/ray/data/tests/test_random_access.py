@@ -1,3 +1,6 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pyarrow
 import pytest
 
@@ -57,6 +60,61 @@ def test_stats(ray_start_regular_shared):
     assert "Accesses per worker: 2 min, 2 max, 2 mean" in stats, stats
 
 
+def test_missing_keys(ray_start_regular_shared):
+    ds = ray.data.range(100, override_num_blocks=10).filter(lambda r: r["id"] % 2 == 0)
+    rad = ds.to_random_access_dataset("id", num_workers=2)
+
+    assert rad.multiget(list(range(100))) == [
+        {"id": i} if i % 2 == 0 else None for i in range(100)
+    ]
+    assert ray.get(rad.get_async(51)) is None
+
+
+def test_replication(ray_start_regular_shared):
+    ds = ray.data.range(100, override_num_blocks=10)
+    rad = ds.to_random_access_dataset("id", num_workers=4, replication_factor=2)
+
+    for workers in rad._block_to_workers_map.values():
+        assert len(set(workers)) >= 2
+    assert rad.multiget(list(range(100))) == [{"id": i} for i in range(100)]
+    assert "Replication factor: 2" in rad.stats()
+
+    with pytest.raises(ValueError):
+        ds.to_random_access_dataset("id", num_workers=1, replication_factor=0)
+
+
+def test_cache(ray_start_regular_shared):
+    ds = ray.data.range(100, override_num_blocks=10)
+    rad = ds.to_random_access_dataset("id", num_workers=1, cache_size=10)
+
+    assert rad.multiget([1, 2]) == [{"id": 1}, {"id": 2}]
+    assert rad.multiget([1, 2]) == [{"id": 1}, {"id": 2}]
+    assert ray.get(rad.get_async(1)) == {"id": 1}
+    stats = rad.stats()
+    assert "Cache hit rate: 60.0%" in stats, stats
+
+
+def test_batched_get_async(ray_start_regular_shared):
+    ds = ray.data.range(100, override_num_blocks=10)
+    rad = ds.to_random_access_dataset("id", num_workers=2, batch_wait_timeout_s=1)
+
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        refs = list(executor.map(rad.get_async, range(20)))
+    assert ray.get(refs) == [{"id": i} for i in range(20)]
+
+    # The calls were coalesced into fewer worker calls.
+    stats = ray.get([w.stats.remote() for w in rad._workers])
+    assert sum(s["num_keys"] for s in stats) == 20
+    assert sum(s["num_accesses"] for s in stats) < 20
+
+    # A call without concurrent callers doesn't wait for the timeout.
+    rad = ds.to_random_access_dataset("id", num_workers=2, batch_wait_timeout_s=10)
+    start = time.monotonic()
+    ref = rad.get_async(3)
+    assert time.monotonic() - start < 5
+    assert ray.get(ref) == {"id": 3}
+
+
 if __name__ == "__main__":
     import sys
 
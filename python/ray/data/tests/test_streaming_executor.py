@@ -1,3 +1,4 @@
+import json
 import time
 import unittest
 from concurrent.futures import ThreadPoolExecutor
@@ -7,6 +8,7 @@ import pytest
 
 import ray
 from ray._private.test_utils import run_string_as_driver_nonblocking
+from ray.data._internal.execution.block_size_autotuner import BlockSizeAutotuner
 from ray.data._internal.execution.interfaces import (
     ExecutionOptions,
     ExecutionResources,
@@ -18,6 +20,9 @@ from ray.data._internal.execution.operators.map_operator import MapOperator
 from ray.data._internal.execution.operators.map_transformer import (
     create_map_transformer_from_block_fn,
 )
+from ray.data._internal.execution.operators.task_pool_map_operator import (
+    TaskPoolMapOperator,
+)
 from ray.data._internal.execution.resource_manager import ResourceManager
 from ray.data._internal.execution.streaming_executor import (
     _debug_dump_topology,
@@ -33,6 +38,7 @@ from ray.data._internal.execution.streaming_executor_state import (
     update_operator_states,
 )
 from ray.data._internal.execution.util import make_ref_bundles
+from ray.data.context import DataContext
 from ray.data.tests.conftest import *  # noqa
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 
@@ -573,6 +579,24 @@ class OpBufferQueueTest(unittest.TestCase):
         for f in futures:
             assert f.result() is True, f.result()
 
+    def test_steal(self):
+        ref_bundles = make_ref_bundles([[[i]] for i in range(6)])
+        queue = OpBufferQueue()
+        for ref_bundle, output_split_idx in zip(ref_bundles, [0, 1, 1, 1, 2, 2]):
+            ref_bundle.output_split_idx = output_split_idx
+            queue.append(ref_bundle)
+
+        # Steals from the back of the longest queue of another split.
+        ref_bundle = queue.steal(0, min_queued=2)
+        assert ref_bundle is ref_bundles[3]
+        assert queue.num_blocks == 5
+        ref_bundle = queue.steal(1, min_queued=2)
+        assert ref_bundle is ref_bundles[5]
+        assert queue.steal(0, min_queued=3) is None
+        assert queue.steal(2, min_queued=1) is ref_bundles[2]
+        assert queue.pop(1) is ref_bundles[1]
+        assert queue.pop(2) is ref_bundles[4]
+
 
 def test_exception_concise_stacktrace():
     driver_script = """
@@ -602,6 +626,96 @@ def test_time_scheduling():
     assert 0 < ds_stats.streaming_exec_schedule_s.get() < 1
 
 
+def test_execution_timeline(ray_start_10_cpus_shared, restore_data_context, tmp_path):
+    DataContext.get_current().execution_timeline_dir = str(tmp_path)
+
+    ds = ray.data.range(100, override_num_blocks=10).map_batches(lambda x: x)
+    assert ds.count() == 100
+
+    (path,) = tmp_path.iterdir()
+    with open(path) as f:
+        events = json.load(f)
+
+    op_pids = {
+        event["args"]["name"]: event["pid"]
+        for event in events
+        if event["ph"] == "M" and event["name"] == "process_name"
+    }
+    map_pid = next(pid for name, pid in op_pids.items() if "MapBatches" in name)
+    task_spans = [
+        event
+        for event in events
+        if event["ph"] == "X" and event["cat"] == "task" and event["pid"] == map_pid
+    ]
+    assert sorted(span["args"]["task_index"] for span in task_spans) == list(range(10))
+    assert all(span["args"]["finished"] for span in task_spans)
+    assert all(span["dur"] >= 0 for span in task_spans)
+    counters = {event["name"] for event in events if event["ph"] == "C"}
+    assert {"Queued blocks", "Active tasks", "Object store memory"} <= counters
+
+
+def test_block_size_autotuner(restore_data_context):
+    ctx = DataContext.get_current()
+    ctx.target_max_block_size = 1000
+    ctx.target_min_block_size = 100
+    bytes_spilled = 0
+
+    input_op = InputDataBuffer(input_data=[MagicMock()])
+    map_op = TaskPoolMapOperator(
+        map_transformer=MagicMock(),
+        input_op=input_op,
+        target_max_block_size=None,
+    )
+    topology = {input_op: MagicMock(), map_op: MagicMock()}
+    autotuner = BlockSizeAutotuner(topology, get_bytes_spilled=lambda: bytes_spilled)
+
+    resource_manager = MagicMock()
+    resource_manager.get_global_limits.return_value.object_store_memory = 1000
+
+    def update(object_store_usage, num_blocks, block_size, block_generation_time_s):
+        metrics = map_op.metrics
+        metrics.num_task_outputs_generated += num_blocks
+        metrics.bytes_task_outputs_generated += num_blocks * block_size
+        metrics.block_generation_time += num_blocks * block_generation_time_s
+        resource_manager.get_global_usage.return_value.object_store_memory = (
+            object_store_usage
+        )
+        # Force an update regardless of the update interval.
+        autotuner._last_update_time = 0
+        autotuner.on_usages_updated(resource_manager)
+
+    # The target isn't adjusted until enough blocks are generated.
+    update(900, 2, 1000, 1)
+    assert map_op.actual_target_max_block_size == 1000
+
+    # Under high pressure, the target is decreased.
+    update(900, 2, 1000, 1)
+    assert map_op.actual_target_max_block_size == 500
+    assert map_op.metrics.autotuned_target_max_block_size == 500
+    assert map_op.metrics.num_target_max_block_size_decreases == 1
+
+    # Spilled objects decrease the target, even under low pressure.
+    bytes_spilled = 100
+    update(100, 4, 500, 1)
+    assert map_op.actual_target_max_block_size == 250
+
+    # Blocks that don't reach the target don't adjust it.
+    update(900, 4, 100, 1)
+    assert map_op.actual_target_max_block_size == 250
+
+    # Blocks that are generated too quickly increase the target, up to 4x the
+    # initial target.
+    for expected_target in [500, 1000, 2000, 4000, 4000]:
+        update(100, 4, map_op.actual_target_max_block_size, 0.01)
+        assert map_op.actual_target_max_block_size == expected_target
+    assert map_op.metrics.num_target_max_block_size_decreases == 2
+
+    # The target isn't decreased below the min block size.
+    for _ in range(10):
+        update(900, 4, map_op.actual_target_max_block_size, 1)
+    assert map_op.actual_target_max_block_size == 100
+
+
 if __name__ == "__main__":
     import sys
 
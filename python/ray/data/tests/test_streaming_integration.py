@@ -155,6 +155,51 @@ def test_output_split_e2e(ray_start_10_cpus_shared):
     assert len(c1.out) == 10, c0.out
 
 
+def test_output_split_work_stealing(ray_start_10_cpus_shared):
+    with pytest.raises(ValueError):
+        OutputSplitter(InputDataBuffer([]), 2, equal=True, work_stealing=True)
+
+    executor = StreamingExecutor(ExecutionOptions())
+    inputs = make_ref_bundles([[x] for x in range(20)])
+    o1 = InputDataBuffer(inputs)
+    o2 = OutputSplitter(o1, 2, equal=False, work_stealing=True)
+    it = executor.execute(o2)
+
+    class Consume(threading.Thread):
+        def __init__(self, idx, delay_s):
+            self.idx = idx
+            self.delay_s = delay_s
+            self.out = []
+            super().__init__()
+
+        def run(self):
+            while True:
+                try:
+                    bundle = it.get_next(output_split_idx=self.idx)
+                except StopIteration:
+                    break
+                assert bundle.output_split_idx == self.idx
+                self.out.extend(ray.get(bundle.block_refs[0])["id"])
+                time.sleep(self.delay_s)
+
+    # The fast consumer takes the bundles queued for the slow one.
+    fast = Consume(0, 0)
+    slow = Consume(1, 0.5)
+    fast.start()
+    slow.start()
+    fast.join()
+    slow.join()
+
+    assert sorted(fast.out + slow.out) == list(range(20))
+    assert len(fast.out) > len(slow.out), (fast.out, slow.out)
+    metrics = o2.metrics.as_dict()
+    assert metrics["num_consumed_0"] == len(fast.out)
+    assert metrics["num_consumed_1"] == len(slow.out)
+    assert metrics["num_stolen_0"] > 0
+    assert metrics["num_stolen_1"] == 0
+    assert metrics["consumer_throughput_rows_per_s_0"] > 0
+
+
 def test_streaming_split_e2e(ray_start_10_cpus_shared):
     def get_lengths(*iterators, use_iter_batches=True):
         lengths = []
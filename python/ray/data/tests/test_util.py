@@ -5,6 +5,7 @@ import pytest
 from typing_extensions import Hashable
 
 import ray
+from ray.data._internal.compute import ActorPoolStrategy, TaskPoolStrategy
 from ray.data._internal.datasource.parquet_datasource import ParquetDatasource
 from ray.data._internal.logical.operators.read_operator import Read
 from ray.data._internal.memory_tracing import (
@@ -16,6 +17,7 @@ from ray.data._internal.remote_fn import _make_hashable, cached_remote_fn
 from ray.data._internal.util import (
     _check_pyarrow_version,
     _split_list,
+    get_task_compute_strategy,
     iterate_with_retry,
 )
 from ray.data.tests.conftest import *  # noqa: F401, F403
@@ -150,6 +152,17 @@ def test_list_splits():
     assert _split_list(["foo", 1, [0], None], 3) == [["foo", 1], [[0]], [None]]
 
 
+def test_get_task_compute_strategy():
+    assert get_task_compute_strategy() == TaskPoolStrategy()
+    assert get_task_compute_strategy(concurrency=2) == TaskPoolStrategy(size=2)
+    assert get_task_compute_strategy(compute="tasks") == "tasks"
+
+    with pytest.raises(ValueError):
+        get_task_compute_strategy(compute=ActorPoolStrategy(size=2))
+    with pytest.raises(ValueError):
+        get_task_compute_strategy(concurrency=(1, 2))
+
+
 def get_parquet_read_logical_op(
     ray_remote_args: Optional[Dict[str, Any]] = None,
     **read_kwargs,
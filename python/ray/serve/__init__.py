@@ -20,6 +20,7 @@ try:
         status,
     )
     from ray.serve.batching import batch
+    from ray.serve.caching import cache
     from ray.serve.config import HTTPOptions
 
 except ModuleNotFoundError as e:
@@ -39,6 +40,7 @@ ray._private.worker.blocking_get_inside_async_warned = True
 __all__ = [
     "_run",
     "batch",
+    "cache",
     "start",
     "HTTPOptions",
     "get_replica_context",
@@ -0,0 +1,239 @@
+"""Offline simulator that replays request traces against autoscaling policies.
+
+A trace is a list of the `(arrival_time_s, duration_s)` of the requests sent to a
+deployment. The simulator steps through the trace every `CONTROL_LOOP_INTERVAL_S`,
+like the controller does, and calls the policy with the number of ongoing requests
+averaged over the `look_back_period_s` of the autoscaling config. Replicas that
+are added by the policy start serving requests after `replica_startup_s`.
+
+The requests are replayed as recorded, so their durations don't depend on the
+simulated capacity. Instead, the simulation reports how long the ongoing requests
+exceeded the capacity of the running replicas, which is when requests would be
+queued and the latency SLOs would be breached.
+
+Example:
+
+.. code-block:: bash
+
+    python -m ray.serve._private.autoscaling_simulator trace.csv \\
+        --max-replicas 20 --replica-startup-s 300
+"""
+
+import csv
+import heapq
+import inspect
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+import click
+
+from ray.serve._private.constants import (
+    CONTROL_LOOP_INTERVAL_S,
+    DEFAULT_MAX_ONGOING_REQUESTS,
+)
+from ray.serve.autoscaling_policy import (
+    predictive_autoscaling_policy,
+    replica_queue_length_autoscaling_policy,
+)
+from ray.serve.config import AutoscalingConfig
+
+
+@dataclass
+class SimulationResult:
+    """The state of the simulated deployment at each step of a simulation."""
+
+    step_s: float
+    max_ongoing_requests: int
+    timestamps: List[float] = field(default_factory=list)
+    num_ongoing_requests: List[int] = field(default_factory=list)
+    num_running_replicas: List[int] = field(default_factory=list)
+    target_num_replicas: List[int] = field(default_factory=list)
+
+    @property
+    def replica_seconds(self) -> float:
+        """The total time the replicas were running, summed over the replicas."""
+        return sum(self.num_running_replicas) * self.step_s
+
+    @property
+    def overloaded_s(self) -> float:
+        """The time during which the ongoing requests exceeded the capacity of the
+        running replicas."""
+        return self.step_s * sum(
+            num_requests > num_replicas * self.max_ongoing_requests
+            for num_requests, num_replicas in zip(
+                self.num_ongoing_requests, self.num_running_replicas
+            )
+        )
+
+    @property
+    def max_num_replicas(self) -> int:
+        return max(self.num_running_replicas, default=0)
+
+    def summary(self) -> str:
+        return (
+            f"replica-hours: {self.replica_seconds / 3600:.2f}, "
+            f"overloaded: {self.overloaded_s:.1f}s, "
+            f"max replicas: {self.max_num_replicas}"
+        )
+
+
+def simulate_autoscaling(
+    trace: List[Tuple[float, float]],
+    config: AutoscalingConfig,
+    policy: Optional[Callable[..., int]] = None,
+    replica_startup_s: float = 0.0,
+    max_ongoing_requests: int = DEFAULT_MAX_ONGOING_REQUESTS,
+) -> SimulationResult:
+    """Replay a request trace against an autoscaling policy.
+
+    Args:
+        trace: The `(arrival_time_s, duration_s)` of each request.
+        config: The autoscaling config of the deployment.
+        policy: The autoscaling policy to simulate. Defaults to the policy of
+            `config`.
+        replica_startup_s: The time it takes for a new replica to start.
+        max_ongoing_requests: The max number of ongoing requests of a replica,
+            used to measure how long the deployment is overloaded.
+
+    Returns:
+        The state of the deployment at each step of the simulation.
+    """
+    if policy is None:
+        policy = config.get_policy()
+    # Policies that accept the current time are passed the simulated time.
+    pass_now = "now" in inspect.signature(policy).parameters
+
+    step_s = CONTROL_LOOP_INTERVAL_S
+    result = SimulationResult(step_s, max_ongoing_requests)
+    if not trace:
+        return result
+
+    arrivals = sorted(trace)
+    end_time = max(arrival + duration for arrival, duration in arrivals)
+    num_running = config.initial_replicas
+    if num_running is None:
+        num_running = config.min_replicas
+    target_num_replicas = num_running
+    # The times at which the starting replicas become running.
+    starting: List[float] = []
+    # The end times of the ongoing requests.
+    ongoing: List[float] = []
+    # The number of ongoing requests at each step of the look back period.
+    window: deque = deque()
+    window_sum = 0
+    window_size = max(1, round(config.look_back_period_s / step_s))
+    policy_state = {}
+
+    next_arrival = 0
+    now = arrivals[0][0]
+    while now <= end_time:
+        while next_arrival < len(arrivals) and arrivals[next_arrival][0] <= now:
+            arrival, duration = arrivals[next_arrival]
+            heapq.heappush(ongoing, arrival + duration)
+            next_arrival += 1
+        while ongoing and ongoing[0] <= now:
+            heapq.heappop(ongoing)
+        while starting and starting[0] <= now:
+            heapq.heappop(starting)
+            num_running += 1
+
+        window.append(len(ongoing))
+        window_sum += len(ongoing)
+        if len(window) > window_size:
+            window_sum -= window.popleft()
+
+        kwargs = dict(
+            curr_target_num_replicas=target_num_replicas,
+            total_num_requests=window_sum / len(window),
+            num_running_replicas=num_running,
+            config=config,
+            capacity_adjusted_min_replicas=config.min_replicas,
+            capacity_adjusted_max_replicas=config.max_replicas,
+            policy_state=policy_state,
+        )
+        if pass_now:
+            kwargs["now"] = now
+        target_num_replicas = max(
+            config.min_replicas, min(config.max_replicas, policy(**kwargs))
+        )
+
+        # Start or stop replicas to reach the target. The starting replicas are
+        # stopped first, and replicas stop immediately.
+        num_to_start = target_num_replicas - num_running - len(starting)
+        for _ in range(num_to_start):
+            heapq.heappush(starting, now + replica_startup_s)
+        for _ in range(-num_to_start):
+            if starting:
+                starting.remove(max(starting))
+                heapq.heapify(starting)
+            else:
+                num_running -= 1
+
+        result.timestamps.append(now)
+        result.num_ongoing_requests.append(len(ongoing))
+        result.num_running_replicas.append(num_running)
+        result.target_num_replicas.append(target_num_replicas)
+        now += step_s
+
+    return result
+
+
+def load_trace(path: str) -> List[Tuple[float, float]]:
+    """Load a trace from a CSV file with `arrival_time_s` and `duration_s`
+    columns."""
+    with open(path) as f:
+        return [
+            (float(row["arrival_time_s"]), float(row["duration_s"]))
+            for row in csv.DictReader(f)
+        ]
+
+
+@click.command(help="Replay a request trace against the Serve autoscaling policies.")
+@click.argument("trace_path")
+@click.option("--min-replicas", type=int, default=1)
+@click.option("--max-replicas", type=int, default=10)
+@click.option("--target-ongoing-requests", type=float, default=2.0)
+@click.option("--upscale-delay-s", type=float, default=30.0)
+@click.option("--downscale-delay-s", type=float, default=600.0)
+@click.option(
+    "--replica-startup-s",
+    type=float,
+    default=0.0,
+    help="Time it takes for a new replica to start (seconds).",
+)
+@click.option("--max-ongoing-requests", type=int, default=DEFAULT_MAX_ONGOING_REQUESTS)
+def main(
+    trace_path: str,
+    min_replicas: int,
+    max_replicas: int,
+    target_ongoing_requests: float,
+    upscale_delay_s: float,
+    downscale_delay_s: float,
+    replica_startup_s: float,
+    max_ongoing_requests: int,
+):
+    trace = load_trace(trace_path)
+    config = AutoscalingConfig(
+        min_replicas=min_replicas,
+        max_replicas=max_replicas,
+        target_ongoing_requests=target_ongoing_requests,
+        upscale_delay_s=upscale_delay_s,
+        downscale_delay_s=downscale_delay_s,
+    )
+    for policy in [
+        replica_queue_length_autoscaling_policy,
+        predictive_autoscaling_policy,
+    ]:
+        result = simulate_autoscaling(
+            trace,
+            config,
+            policy=policy,
+            replica_startup_s=replica_startup_s,
+            max_ongoing_requests=max_ongoing_requests,
+        )
+        print(f"{policy.__name__}: {result.summary()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Benchmark the latency of requests to replicas that run at different speeds.
+
+Some replicas of the downstream deployment are slowed down to simulate replicas on
+slower or contended nodes. The benchmark is run with and without latency-aware
+replica scheduling (`RAY_SERVE_ENABLE_LATENCY_AWARE_SCHEDULING`), which is set in
+the environment of the `Benchmarker` replica that sends the requests.
+
+Example:
+
+.. code-block:: bash
+
+    python -m ray.serve._private.benchmarks.heterogeneous_replicas_latency \\
+        --num-replicas 4 --num-slow-replicas 1 --slowdown-factor 5
+"""
+
+import asyncio
+import logging
+
+import click
+
+import ray
+from ray import serve
+from ray.serve._private.benchmarks.common import Benchmarker
+from ray.serve.handle import DeploymentHandle
+
+
+@ray.remote(num_cpus=0)
+class ReplicaIndexAssigner:
+    def __init__(self):
+        self._next_index = 0
+
+    def get_index(self) -> int:
+        index = self._next_index
+        self._next_index += 1
+        return index
+
+
+@serve.deployment(ray_actor_options={"num_cpus": 0})
+class Sleeper:
+    def __init__(
+        self,
+        index_assigner: ray.actor.ActorHandle,
+        num_slow_replicas: int,
+        latency_ms: float,
+        slowdown_factor: float,
+    ):
+        logging.getLogger("ray.serve").setLevel(logging.WARNING)
+        # The first replicas to start are the slow ones.
+        index = ray.get(index_assigner.get_index.remote())
+        self._latency_s = latency_ms / 1000
+        if index < num_slow_replicas:
+            self._latency_s *= slowdown_factor
+
+    async def __call__(self):
+        await asyncio.sleep(self._latency_s)
+        return b""
+
+
+@click.command(help="Benchmark latency-aware scheduling on heterogeneous replicas.")
+@click.option("--num-replicas", type=int, default=4)
+@click.option(
+    "--num-slow-replicas",
+    type=int,
+    default=1,
+    help="Number of replicas that are slowed down.",
+)
+@click.option(
+    "--latency-ms",
+    type=float,
+    default=10,
+    help="Latency of the requests to the replicas that aren't slowed down.",
+)
+@click.option(
+    "--slowdown-factor",
+    type=float,
+    default=5,
+    help="Factor by which the latency of the slow replicas is increased.",
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=16,
+    help="Number of concurrent requests sent in each batch.",
+)
+@click.option("--num-trials", type=int, default=5)
+@click.option(
+    "--trial-runtime",
+    type=int,
+    default=5,
+    help="Duration to run each trial of the benchmark for (seconds).",
+)
+def main(
+    num_replicas: int,
+    num_slow_replicas: int,
+    latency_ms: float,
+    slowdown_factor: float,
+    batch_size: int,
+    num_trials: int,
+    trial_runtime: int,
+):
+    for latency_aware in [False, True]:
+        index_assigner = ReplicaIndexAssigner.remote()
+        app = Benchmarker.options(
+            ray_actor_options={
+                "runtime_env": {
+                    "env_vars": {
+                        "RAY_SERVE_ENABLE_LATENCY_AWARE_SCHEDULING": (
+                            "1" if latency_aware else "0"
+                        )
+                    }
+                }
+            }
+        ).bind(
+            Sleeper.options(num_replicas=num_replicas).bind(
+                index_assigner, num_slow_replicas, latency_ms, slowdown_factor
+            )
+        )
+        h: DeploymentHandle = serve.run(app)
+
+        mean, stddev, latencies = h.run_throughput_benchmark.remote(
+            batch_size=batch_size,
+            num_trials=num_trials,
+            trial_runtime=trial_runtime,
+        ).result()
+
+        print(
+            "Throughput and latency (ms) "
+            f"(latency_aware={latency_aware}, num_replicas={num_replicas}, "
+            f"num_slow_replicas={num_slow_replicas}, "
+            f"slowdown_factor={slowdown_factor}): {mean} +- {stddev} requests/s"
+        )
+        print(latencies.describe(percentiles=[0.5, 0.9, 0.95, 0.99]))
+
+        serve.delete("default")
+        ray.kill(index_assigner)
+
+
+if __name__ == "__main__":
+    main()
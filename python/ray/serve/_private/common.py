@@ -583,6 +583,13 @@ class RequestMetadata:
     # Multiplexed model ID.
     multiplexed_model_id: str = ""
 
+    # Priority of the request, higher is more important.
+    priority: int = 0
+
+    # Tenant that sent the request. Requests of the same priority share the
+    # deployment fairly between tenants.
+    tenant: str = ""
+
     # If this request expects a streaming response.
     is_streaming: bool = False
 
@@ -641,3 +648,6 @@ class TargetCapacityDirection(str, Enum):
 class ReplicaQueueLengthInfo:
     accepted: bool
     num_ongoing_requests: int
+    # Whether the request was rejected to hold the capacity of the replica for
+    # requests of other priorities and tenants, while the replica isn't full.
+    rejected_for_fair_share: bool = False
@@ -214,6 +214,10 @@ SERVE_LOG_EXTRA_FIELDS = "ray_serve_extra_fields"
 # Serve HTTP request header key for routing requests.
 SERVE_MULTIPLEXED_MODEL_ID = "serve_multiplexed_model_id"
 
+# Serve HTTP request header keys for the priority and tenant of requests.
+SERVE_REQUEST_PRIORITY = "serve_request_priority"
+SERVE_REQUEST_TENANT = "serve_request_tenant"
+
 # Feature flag to turn on node locality routing for proxies. On by default.
 RAY_SERVE_PROXY_PREFER_LOCAL_NODE_ROUTING = (
     os.environ.get("RAY_SERVE_PROXY_PREFER_LOCAL_NODE_ROUTING", "1") == "1"
@@ -302,9 +306,63 @@ RAY_SERVE_QUEUE_LENGTH_CACHE_TIMEOUT_S = float(
     os.environ.get("RAY_SERVE_QUEUE_LENGTH_CACHE_TIMEOUT_S", 10.0)
 )
 
+# Feature flag for choosing replicas based on the expected completion time of requests,
+# estimated from their queue length and the average latency of their responses,
+# instead of their queue length alone.
+RAY_SERVE_ENABLE_LATENCY_AWARE_SCHEDULING = (
+    os.environ.get("RAY_SERVE_ENABLE_LATENCY_AWARE_SCHEDULING", "0") == "1"
+)
+
+# Weight of the latest response in the moving average of the response latency of
+# each replica used by latency-aware scheduling.
+RAY_SERVE_REPLICA_LATENCY_EWMA_ALPHA = float(
+    os.environ.get("RAY_SERVE_REPLICA_LATENCY_EWMA_ALPHA", 0.2)
+)
+
+# Requests of priority `p` are weighted by `RAY_SERVE_REQUEST_PRIORITY_WEIGHT_BASE ** p`
+# when fairly sharing the queues of routers and the capacity of replicas.
+RAY_SERVE_REQUEST_PRIORITY_WEIGHT_BASE = float(
+    os.environ.get("RAY_SERVE_REQUEST_PRIORITY_WEIGHT_BASE", 4.0)
+)
+
+# Range that the priorities set by the `serve_request_priority` header of HTTP
+# requests are clamped to. Any HTTP client can set the header, so by default clients
+# can only lower the priority of their requests. Only raise the max if the proxies are
+# behind a trusted gateway that sets or strips the header.
+RAY_SERVE_HTTP_MIN_REQUEST_PRIORITY = int(
+    os.environ.get("RAY_SERVE_HTTP_MIN_REQUEST_PRIORITY", -64)
+)
+RAY_SERVE_HTTP_MAX_REQUEST_PRIORITY = int(
+    os.environ.get("RAY_SERVE_HTTP_MAX_REQUEST_PRIORITY", 0)
+)
+
+# Time after its last request that a flow of requests (a priority and tenant) stops
+# being considered active by the fair admission of requests at replicas.
+RAY_SERVE_FAIR_ADMISSION_ACTIVE_FLOW_TIMEOUT_S = float(
+    os.environ.get("RAY_SERVE_FAIR_ADMISSION_ACTIVE_FLOW_TIMEOUT_S", 1.0)
+)
+
 # The default autoscaling policy to use if none is specified.
 DEFAULT_AUTOSCALING_POLICY = "ray.serve.autoscaling_policy:default_autoscaling_policy"
 
+# The interval at which `predictive_autoscaling_policy` samples the load of a
+# deployment to forecast it.
+RAY_SERVE_PREDICTIVE_AUTOSCALING_SAMPLE_INTERVAL_S = float(
+    os.environ.get("RAY_SERVE_PREDICTIVE_AUTOSCALING_SAMPLE_INTERVAL_S", 60.0)
+)
+
+# The period of the seasonality of the load forecast by
+# `predictive_autoscaling_policy`. Daily by default.
+RAY_SERVE_PREDICTIVE_AUTOSCALING_SEASON_PERIOD_S = float(
+    os.environ.get("RAY_SERVE_PREDICTIVE_AUTOSCALING_SEASON_PERIOD_S", 24 * 60 * 60)
+)
+
+# How far ahead `predictive_autoscaling_policy` scales for the forecast load. This
+# should cover the time it takes to start a replica.
+RAY_SERVE_PREDICTIVE_AUTOSCALING_LEAD_TIME_S = float(
+    os.environ.get("RAY_SERVE_PREDICTIVE_AUTOSCALING_LEAD_TIME_S", 300.0)
+)
+
 # Feature flag to enable collecting all queued and ongoing request
 # metrics at handles instead of replicas. ON by default.
 RAY_SERVE_COLLECT_AUTOSCALING_METRICS_ON_HANDLE = (
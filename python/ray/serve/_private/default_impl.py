@@ -10,6 +10,7 @@ from ray.serve._private.cluster_node_info_cache import (
 )
 from ray.serve._private.common import DeploymentID
 from ray.serve._private.constants import (
+    RAY_SERVE_ENABLE_LATENCY_AWARE_SCHEDULING,
     RAY_SERVE_ENABLE_QUEUE_LENGTH_CACHE,
     RAY_SERVE_ENABLE_STRICT_MAX_ONGOING_REQUESTS,
     RAY_SERVE_PROXY_PREFER_LOCAL_AZ_ROUTING,
@@ -95,6 +96,7 @@ def create_router(
         use_replica_queue_len_cache=(
             not is_inside_ray_client_context and RAY_SERVE_ENABLE_QUEUE_LENGTH_CACHE
         ),
+        use_latency_aware_scheduling=RAY_SERVE_ENABLE_LATENCY_AWARE_SCHEDULING,
         create_replica_wrapper_func=lambda r: ActorReplicaWrapper(r),
     )
 
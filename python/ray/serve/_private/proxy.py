@@ -40,6 +40,8 @@ from ray.serve._private.constants import (
     SERVE_LOGGER_NAME,
     SERVE_MULTIPLEXED_MODEL_ID,
     SERVE_NAMESPACE,
+    SERVE_REQUEST_PRIORITY,
+    SERVE_REQUEST_TENANT,
 )
 from ray.serve._private.default_impl import add_grpc_address
 from ray.serve._private.grpc_util import DummyServicer, create_serve_grpc_server
@@ -73,6 +75,7 @@ from ray.serve._private.proxy_router import (
     LongestPrefixRouter,
     ProxyRouter,
 )
+from ray.serve._private.request_priority import clamp_http_request_priority
 from ray.serve._private.usage import ServeUsageTag
 from ray.serve._private.utils import (
     call_function_from_import_path,
@@ -933,6 +936,17 @@ class HTTPProxy(GenericProxy):
                 multiplexed_model_id = value.decode()
                 handle = handle.options(multiplexed_model_id=multiplexed_model_id)
                 request_context_info["multiplexed_model_id"] = multiplexed_model_id
+            if key.decode() == SERVE_REQUEST_PRIORITY:
+                try:
+                    priority = clamp_http_request_priority(int(value.decode()))
+                    handle = handle.options(priority=priority)
+                except ValueError:
+                    logger.warning(
+                        f"Ignoring invalid {SERVE_REQUEST_PRIORITY} header "
+                        f"'{value.decode()}', the priority must be an integer."
+                    )
+            if key.decode() == SERVE_REQUEST_TENANT:
+                handle = handle.options(tenant=value.decode())
             if key.decode() == "x-request-id":
                 request_context_info["request_id"] = value.decode()
         ray.serve.context._serve_request_context.set(
@@ -56,6 +56,7 @@ from ray.serve._private.logging_utils import (
     get_component_logger_file_path,
 )
 from ray.serve._private.metrics_utils import InMemoryMetricsStore, MetricsPusher
+from ray.serve._private.request_priority import FairShareAdmissionController
 from ray.serve._private.thirdparty.get_asgi_route_name import get_asgi_route_name
 from ray.serve._private.utils import get_component_file_name  # noqa: F401
 from ray.serve._private.utils import parse_import_path, wrap_to_ray_error
@@ -295,6 +296,10 @@ class ReplicaActor:
             self._deployment_config.autoscaling_config,
         )
 
+        # Shares `max_ongoing_requests` between the priorities and tenants of the
+        # requests that are handled with strict enforcement.
+        self._admission_controller = FairShareAdmissionController()
+
         self._port: Optional[int] = None
 
     def _set_internal_replica_context(self, *, servable_object: Callable = None):
@@ -551,7 +556,8 @@ class ReplicaActor:
 
         The first response from this generator is always a system message indicating
         if the request was accepted (the replica has capacity for the request) or
-        rejected (the replica is already at max_ongoing_requests).
+        rejected (the replica is already at max_ongoing_requests, or the priority and
+        tenant of the request are using more than their fair share of it).
 
         For non-streaming requests, there will only be one more message, the unary
         result of the user request handler.
@@ -562,41 +568,63 @@ class ReplicaActor:
         request_metadata = pickle.loads(pickled_request_metadata)
         limit = self._deployment_config.max_ongoing_requests
         num_ongoing_requests = self.get_num_ongoing_requests()
-        if num_ongoing_requests >= limit:
-            logger.warning(
-                f"Replica at capacity of max_ongoing_requests={limit}, "
-                f"rejecting request {request_metadata.request_id}.",
-                extra={"log_to_stderr": False},
-            )
-            yield pickle.dumps(
-                ReplicaQueueLengthInfo(
-                    accepted=False, num_ongoing_requests=num_ongoing_requests
+        if not self._admission_controller.try_admit(
+            request_metadata, num_ongoing_requests, limit
+        ):
+            if num_ongoing_requests >= limit:
+                logger.warning(
+                    f"Replica at capacity of max_ongoing_requests={limit}, "
+                    f"rejecting request {request_metadata.request_id}.",
+                    extra={"log_to_stderr": False},
+                )
+            else:
+                logger.warning(
+                    "Requests of priority "
+                    f"{request_metadata.priority} and tenant "
+                    f"'{request_metadata.tenant}' at their fair share of "
+                    f"max_ongoing_requests={limit}, rejecting request "
+                    f"{request_metadata.request_id}.",
+                    extra={"log_to_stderr": False},
                 )
-            )
-            return
 
-        with self._wrap_user_method_call(request_metadata, request_args):
             yield pickle.dumps(
                 ReplicaQueueLengthInfo(
-                    accepted=True,
-                    # NOTE(edoakes): `_wrap_user_method_call` will increment the number
-                    # of ongoing requests to include this one, so re-fetch the value.
-                    num_ongoing_requests=self.get_num_ongoing_requests(),
+                    accepted=False,
+                    num_ongoing_requests=num_ongoing_requests,
+                    # The replica still has capacity for other priorities and
+                    # tenants, so the router backs off from sending requests of
+                    # this priority and tenant to it instead of probing it again.
+                    rejected_for_fair_share=num_ongoing_requests < limit,
                 )
             )
+            return
 
-            if request_metadata.is_streaming:
-                async for result in self._call_user_generator(
-                    request_metadata,
-                    request_args,
-                    request_kwargs,
-                ):
-                    yield result
-            else:
-                yield await self._user_callable_wrapper.call_user_method(
-                    request_metadata, request_args, request_kwargs
+        try:
+            with self._wrap_user_method_call(request_metadata, request_args):
+                yield pickle.dumps(
+                    ReplicaQueueLengthInfo(
+                        accepted=True,
+                        # NOTE(edoakes): `_wrap_user_method_call` will increment the
+                        # number of ongoing requests to include this one, so re-fetch
+                        # the value.
+                        num_ongoing_requests=self.get_num_ongoing_requests(),
+                    )
                 )
 
+                if request_metadata.is_streaming:
+                    async for result in self._call_user_generator(
+                        request_metadata,
+                        request_args,
+                        request_kwargs,
+                    ):
+                        yield result
+                else:
+                    yield await self._user_callable_wrapper.call_user_method(
+                        request_metadata, request_args, request_kwargs
+                    )
+        finally:
+            self._admission_controller.on_request_finished(request_metadata)
+
     async def handle_request_from_java(
         self,
         proto_request_metadata: bytes,
@@ -1,14 +1,21 @@
 import asyncio
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set
 
 from ray.serve._private.common import ReplicaID, RequestMetadata
 from ray.serve._private.constants import (
     RAY_SERVE_QUEUE_LENGTH_CACHE_TIMEOUT_S,
+    RAY_SERVE_REPLICA_LATENCY_EWMA_ALPHA,
     SERVE_LOGGER_NAME,
 )
+from ray.serve._private.request_priority import (
+    RequestFlow,
+    get_priority_weight,
+    get_request_flow,
+)
 
 logger = logging.getLogger(SERVE_LOGGER_NAME)
 
@@ -26,6 +33,115 @@ class PendingRequest:
         self.future = asyncio.Future()
 
 
+class PendingRequestQueue:
+    """Queue of pending requests that is fair between the flows of requests.
+
+    Requests of the same flow (priority and tenant) are popped in FIFO order. Between
+    flows, requests are popped by weighted fair queuing: while several flows have
+    pending requests, each gets a share of the popped requests proportional to the
+    weight of its priority. With a single flow, this is a FIFO queue.
+
+    Each flow with pending requests has a virtual finish time for its first request,
+    and the request with the lowest one is popped first (ties are broken by the
+    creation time of the requests). The virtual time of the queue is the virtual
+    finish time of the last popped request.
+    """
+
+    def __init__(self):
+        self._flows: Dict[RequestFlow, Deque[PendingRequest]] = {}
+        self._head_finish_times: Dict[RequestFlow, float] = {}
+        self._virtual_time = 0.0
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[PendingRequest]:
+        """Iterate over the flows in the order of their first request, and over the
+        requests of each flow in FIFO order."""
+        for flow in sorted(self._flows, key=self._get_head_order):
+            yield from self._flows[flow]
+
+    def _get_head_order(self, flow: RequestFlow):
+        return self._head_finish_times[flow], self._flows[flow][0].created_at
+
+    def _get_flow_to_insert(self, pending_request: PendingRequest) -> Deque:
+        flow = get_request_flow(pending_request.metadata)
+        if flow not in self._flows:
+            self._flows[flow] = deque()
+            self._head_finish_times[flow] = self._virtual_time + (
+                1 / get_priority_weight(flow[0])
+            )
+
+        self._len += 1
+        return self._flows[flow]
+
+    def append(self, pending_request: PendingRequest):
+        self._get_flow_to_insert(pending_request).append(pending_request)
+
+    def insert_in_creation_order(self, pending_request: PendingRequest):
+        """Insert the request among the requests of its flow by creation time.
+
+        This is used to retry requests without penalizing them for the retry.
+        """
+        requests = self._get_flow_to_insert(pending_request)
+        index = 0
+        for pr in requests:
+            if pending_request.created_at < pr.created_at:
+                break
+
+            index += 1
+
+        requests.insert(index, pending_request)
+
+    def peek(self) -> Optional[PendingRequest]:
+        """Get the request that will be popped next, or `None` if empty."""
+        if len(self._flows) == 0:
+            return None
+
+        return self._flows[min(self._flows, key=self._get_head_order)][0]
+
+    def popleft(self) -> PendingRequest:
+        """Pop the next request, raises `IndexError` if empty."""
+        if len(self._flows) == 0:
+            raise IndexError("pop from an empty queue")
+
+        flow = min(self._flows, key=self._get_head_order)
+        requests = self._flows[flow]
+        self._virtual_time = self._head_finish_times[flow]
+        self._len -= 1
+        pending_request = requests.popleft()
+        if len(requests) > 0:
+            self._head_finish_times[flow] += 1 / get_priority_weight(flow[0])
+        else:
+            self._remove_flow(flow)
+
+        return pending_request
+
+    def remove(self, pending_request: PendingRequest):
+        """Remove the request if it's in the queue.
+
+        Unlike popping it, this doesn't count the request in the share of its flow.
+        """
+        flow = get_request_flow(pending_request.metadata)
+        requests = self._flows.get(flow)
+        if requests is None:
+            return
+
+        try:
+            requests.remove(pending_request)
+        except ValueError:
+            return
+
+        self._len -= 1
+        if len(requests) == 0:
+            self._remove_flow(flow)
+
+    def _remove_flow(self, flow: RequestFlow):
+        self._flows.pop(flow)
+        self._head_finish_times.pop(flow)
+
+
 @dataclass(frozen=True)
 class ReplicaQueueLengthCacheEntry:
     queue_len: int
@@ -74,3 +190,49 @@ class ReplicaQueueLengthCache:
         for replica_id in list(self._cache.keys()):
             if replica_id not in active_replica_ids:
                 self._cache.pop(replica_id)
+
+
+class ReplicaLatencyTracker:
+    def __init__(self, *, alpha: float = RAY_SERVE_REPLICA_LATENCY_EWMA_ALPHA):
+        """Tracks the exponentially weighted moving average of the response latency
+        of each replica.
+
+        Arguments:
+            alpha: weight of the latest latency in the average, between 0 and 1.
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}.")
+
+        self._alpha = alpha
+        self._latencies_s: Dict[ReplicaID, float] = {}
+
+    def get(self, replica_id: ReplicaID) -> Optional[float]:
+        """Get the average latency of a replica, or `None` if it's unknown."""
+        return self._latencies_s.get(replica_id)
+
+    def get_mean(self) -> Optional[float]:
+        """Get the mean of the average latencies of all replicas, or `None` if no
+        latency is known."""
+        # NOTE: latencies may be updated from another thread by the callbacks of
+        # the responses, so iterate over a copy.
+        latencies_s = list(self._latencies_s.values())
+        if not latencies_s:
+            return None
+
+        return sum(latencies_s) / len(latencies_s)
+
+    def update(self, replica_id: ReplicaID, latency_s: float):
+        """Add the latency of a response from a replica to its average."""
+        average_s = self._latencies_s.get(replica_id)
+        if average_s is None:
+            self._latencies_s[replica_id] = latency_s
+        else:
+            self._latencies_s[replica_id] = (
+                self._alpha * latency_s + (1 - self._alpha) * average_s
+            )
+
+    def remove_inactive_replicas(self, *, active_replica_ids: Set[ReplicaID]):
+        """Removes entries for all replica IDs not in the provided active set."""
+        for replica_id in list(self._latencies_s.keys()):
+            if replica_id not in active_replica_ids:
+                self._latencies_s.pop(replica_id)
@@ -4,12 +4,11 @@ import logging
 import math
 import random
 import time
-from collections import defaultdict, deque
+from collections import defaultdict
 from typing import (
     AsyncGenerator,
     Callable,
     DefaultDict,
-    Deque,
     Dict,
     List,
     Optional,
@@ -35,10 +34,13 @@ from ray.serve._private.constants import (
 )
 from ray.serve._private.replica_scheduler.common import (
     PendingRequest,
+    PendingRequestQueue,
+    ReplicaLatencyTracker,
     ReplicaQueueLengthCache,
 )
 from ray.serve._private.replica_scheduler.replica_scheduler import ReplicaScheduler
 from ray.serve._private.replica_scheduler.replica_wrapper import ReplicaWrapper
+from ray.serve._private.request_priority import RequestFlow, get_request_flow
 from ray.util import metrics
 
 logger = logging.getLogger(SERVE_LOGGER_NAME)
@@ -61,6 +63,18 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
     accept the request are considered; between those, the one with the lower queue
     length is chosen.
 
+    If latency-aware scheduling is enabled, the replica with the lowest expected
+    completion time, `(queue_len + 1) * service_time`, is chosen instead. The service
+    time of a replica is the moving average of the latency of its responses, each
+    divided by the number of requests ongoing on the replica when it was sent plus one.
+    This avoids sending the same share of requests to replicas on slower or contended
+    nodes, while still accounting for their current queues.
+
+    If a replica rejects a request to hold its capacity for requests of other
+    priorities and tenants, requests of the same priority and tenant aren't sent to it
+    for an increasing backoff time, since its queue length doesn't tell whether it
+    would admit them.
+
     In the case when neither replica accepts the request (e.g., their queues are full),
     the procedure is repeated with backoff. This backoff repeats indefinitely until a
     replica is chosen, so the caller should use timeouts and cancellation to avoid
@@ -76,6 +90,10 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
     # The last item in the list is the max timeout and will be used repeatedly.
     backoff_sequence_s = [0, 0.05, 0.1, 0.15, 0.2, 0.5, 1.0]
 
+    # The sequence of times for which a replica isn't chosen for the requests of a
+    # priority and tenant after consecutive fair share rejections of them.
+    fair_share_backoff_sequence_s = [0.05, 0.1, 0.2, 0.5, 1.0]
+
     # Deadline for replicas to respond with their queue length. If the response isn't
     # received within this deadline, the replica will not be considered.
     # If this deadline is repeatedly missed, it will be exponentially increased up to
@@ -100,6 +118,7 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         self_actor_handle: Optional[ActorHandle] = None,
         self_availability_zone: Optional[str] = None,
         use_replica_queue_len_cache: bool = False,
+        use_latency_aware_scheduling: bool = False,
         get_curr_time_s: Optional[Callable[[], float]] = None,
         create_replica_wrapper_func: Optional[
             Callable[[RunningReplicaInfo], ReplicaWrapper]
@@ -114,6 +133,7 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         self._self_actor_handle = self_actor_handle
         self._self_availability_zone = self_availability_zone
         self._use_replica_queue_len_cache = use_replica_queue_len_cache
+        self._use_latency_aware_scheduling = use_latency_aware_scheduling
         self._create_replica_wrapper_func = create_replica_wrapper_func
 
         # Current replicas available to be scheduled.
@@ -123,6 +143,16 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         self._replica_queue_len_cache = ReplicaQueueLengthCache(
             get_curr_time_s=get_curr_time_s,
         )
+        self._replica_latency_tracker = ReplicaLatencyTracker()
+        self._get_curr_time_s = (
+            get_curr_time_s if get_curr_time_s is not None else time.time
+        )
+        # The replicas that rejected the requests of a flow for fair share, mapped to
+        # the number of consecutive rejections and the time until which requests of
+        # the flow aren't sent to the replica.
+        self._fair_share_backoffs: Dict[
+            Tuple[ReplicaID, RequestFlow], Tuple[int, float]
+        ] = {}
 
         # NOTE(edoakes): Python 3.10 removed the `loop` parameter to `asyncio.Event`.
         # Now, the `asyncio.Event` will call `get_running_loop` in its constructor to
@@ -152,15 +182,16 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
 
         # We keep two separate queues of pending requests:
         # - self._pending_requests_to_fulfill is a queue that will be used to fulfill
-        # requests in FIFO order by scheduling tasks once they've acquired a replica.
+        # requests in fair queuing order by scheduling tasks once they've acquired a
+        # replica (FIFO order for requests of the same priority and tenant).
         # To avoid long tail latencies due to backoff, the scheduling task started by
         # a given request may not be the one to fulfill it.
         # - self._pending_requests_to_schedule is a queue that is used for tasks to
         # best-effort grab the metadata of requests waiting to be fulfilled. This is
         # currently used for scheduling tasks to know which multiplexed model IDs they
         # should be trying to get replicas for.
-        self._pending_requests_to_fulfill: Deque[PendingRequest] = deque()
-        self._pending_requests_to_schedule: Deque[PendingRequest] = deque()
+        self._pending_requests_to_fulfill = PendingRequestQueue()
+        self._pending_requests_to_schedule = PendingRequestQueue()
 
         # Prepare scheduler metrics.
         self.num_scheduling_tasks_gauge = metrics.Gauge(
@@ -241,6 +272,14 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
     def replica_queue_len_cache(self) -> ReplicaQueueLengthCache:
         return self._replica_queue_len_cache
 
+    @property
+    def use_latency_aware_scheduling(self) -> bool:
+        return self._use_latency_aware_scheduling
+
+    @property
+    def replica_latency_tracker(self) -> ReplicaLatencyTracker:
+        return self._replica_latency_tracker
+
     def create_replica_wrapper(
         self, replica_info: RunningReplicaInfo
     ) -> ReplicaWrapper:
@@ -252,6 +291,9 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         self._replica_id_set.discard(replica_id)
         for id_set in self._colocated_replica_ids.values():
             id_set.discard(replica_id)
+        self._replica_latency_tracker.remove_inactive_replicas(
+            active_replica_ids=self._replica_id_set
+        )
 
     def on_replica_actor_unavailable(self, replica_id: ReplicaID):
         """Invalidate cache entry so active probing is required for the next request."""
@@ -266,6 +308,68 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
                 replica_id, queue_len_info.num_ongoing_requests
             )
 
+    def on_request_completed(
+        self, replica_id: ReplicaID, latency_s: float, num_requests_ahead: int = 0
+    ):
+        """Update the average service time of the replica used to schedule requests.
+
+        The latency includes the time the request waited for the requests ahead of
+        it, so the service time of a request is estimated as its latency divided by
+        the number of requests it shared the replica with.
+        """
+        if self._use_latency_aware_scheduling and replica_id in self._replica_id_set:
+            self._replica_latency_tracker.update(
+                replica_id, latency_s / (num_requests_ahead + 1)
+            )
+
+    def on_request_rejected_for_fair_share(
+        self, replica_id: ReplicaID, request_metadata: RequestMetadata
+    ):
+        """Back off from sending requests of the flow to the replica."""
+        curr_time_s = self._get_curr_time_s()
+        max_backoff_s = self.fair_share_backoff_sequence_s[-1]
+        # Remove the backoffs that are too old to be followed by a consecutive
+        # rejection.
+        self._fair_share_backoffs = {
+            key: backoff
+            for key, backoff in self._fair_share_backoffs.items()
+            if curr_time_s - backoff[1] <= max_backoff_s
+        }
+
+        key = (replica_id, get_request_flow(request_metadata))
+        num_rejections, _ = self._fair_share_backoffs.get(key, (0, 0))
+        backoff_s = self.fair_share_backoff_sequence_s[
+            min(num_rejections, len(self.fair_share_backoff_sequence_s) - 1)
+        ]
+        self._fair_share_backoffs[key] = (num_rejections + 1, curr_time_s + backoff_s)
+
+    def _is_backing_off_for_flow(
+        self, replica_id: ReplicaID, flow: RequestFlow
+    ) -> bool:
+        backoff = self._fair_share_backoffs.get((replica_id, flow))
+        return backoff is not None and self._get_curr_time_s() < backoff[1]
+
+    def shed_lower_priority_request(self, priority: int, error: Exception) -> bool:
+        """Fail the newest pending request of the lowest priority below `priority`.
+
+        Returns whether a request was shed.
+        """
+        candidates = [
+            pr
+            for pr in self._pending_requests_to_fulfill
+            if not pr.future.done() and pr.metadata.priority < priority
+        ]
+        if len(candidates) == 0:
+            return False
+
+        request_to_shed = min(
+            candidates, key=lambda pr: (pr.metadata.priority, -pr.created_at)
+        )
+        request_to_shed.future.set_exception(error)
+        self._pending_requests_to_fulfill.remove(request_to_shed)
+        self._pending_requests_to_schedule.remove(request_to_shed)
+        return True
+
     def update_replicas(self, replicas: List[ReplicaWrapper]):
         """Update the set of available replicas to be considered for scheduling.
 
@@ -322,6 +426,9 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         self._replica_queue_len_cache.remove_inactive_replicas(
             active_replica_ids=new_replica_id_set
         )
+        self._replica_latency_tracker.remove_inactive_replicas(
+            active_replica_ids=new_replica_id_set
+        )
         # Populate cache for new replicas
         self._loop.create_task(self._probe_queue_lens(replicas_to_ping, 0))
         self._replicas_updated_event.set()
@@ -597,22 +704,55 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         assert len(result) == len(replicas)
         return result
 
+    def _get_scheduling_score(self, replica_id: ReplicaID, queue_len: int) -> float:
+        """Get the score of a replica to schedule a request on, lower is better.
+
+        Without latency-aware scheduling, this is the queue length of the replica.
+        Otherwise, it's the expected completion time of the request on the replica,
+        `(queue_len + 1) * service_time`. Replicas whose service time isn't known yet
+        are assumed to have the mean service time of the other replicas. If no
+        service time is known, the queue length is used.
+        """
+        if not self._use_latency_aware_scheduling:
+            return queue_len
+
+        service_time_s = self._replica_latency_tracker.get(replica_id)
+        if service_time_s is None:
+            service_time_s = self._replica_latency_tracker.get_mean()
+        if service_time_s is None:
+            return queue_len
+
+        return (queue_len + 1) * service_time_s
+
     async def select_from_candidate_replicas(
         self,
         candidates: List[ReplicaWrapper],
         backoff_index: int,
+        request_metadata: Optional[RequestMetadata] = None,
     ) -> Optional[ReplicaWrapper]:
         """Chooses the best replica from the list of candidates.
 
         If none of the replicas can be scheduled, returns `None`.
 
+        Replicas that are backing off from the flow of the request after rejecting
+        it for fair share aren't considered.
+
         The queue length for each replica is first looked up in the local cache. If not
         present in the cache, the replica will be actively probed and the cache updated.
 
         Among replicas that respond within the deadline and don't have full queues, the
-        one with the lowest queue length is chosen.
+        one with the lowest queue length (or expected completion time if latency-aware
+        scheduling is enabled) is chosen.
         """
-        lowest_queue_len = math.inf
+        if request_metadata is not None and self._fair_share_backoffs:
+            flow = get_request_flow(request_metadata)
+            candidates = [
+                r
+                for r in candidates
+                if not self._is_backing_off_for_flow(r.replica_id, flow)
+            ]
+
+        lowest_score = math.inf
         chosen_replica_id: Optional[str] = None
         not_in_cache: List[ReplicaWrapper] = []
         if self._use_replica_queue_len_cache:
@@ -624,8 +764,11 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
                 # cache entries expire.
                 if queue_len is None or queue_len >= r.max_ongoing_requests:
                     not_in_cache.append(r)
-                elif queue_len < lowest_queue_len:
-                    lowest_queue_len = queue_len
+                    continue
+
+                score = self._get_scheduling_score(r.replica_id, queue_len)
+                if score < lowest_score:
+                    lowest_score = score
                     chosen_replica_id = r.replica_id
         else:
             not_in_cache = candidates
@@ -641,8 +784,12 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
                     # None is returned if we failed to get the queue len.
                     continue
 
-                if queue_len < r.max_ongoing_requests and queue_len < lowest_queue_len:
-                    lowest_queue_len = queue_len
+                if queue_len >= r.max_ongoing_requests:
+                    continue
+
+                score = self._get_scheduling_score(r.replica_id, queue_len)
+                if score < lowest_score:
+                    lowest_score = score
                     chosen_replica_id = r.replica_id
         elif len(not_in_cache) > 0:
             # If there are replicas without a valid cache entry, probe them in the
@@ -675,7 +822,7 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         replica: ReplicaWrapper,
         request_metadata: Optional[RequestMetadata] = None,
     ):
-        """Assign the replica to the next pending request in FIFO order.
+        """Assign the replica to the next pending request in fair queuing order.
 
         If a pending request has been cancelled, it will be popped from the queue
         and not assigned.
@@ -691,7 +838,7 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
             return
 
         # If no pending request matches the request metadata, fulfill the next in the
-        # queue in FIFO order, passing over futures that have been cancelled.
+        # queue in order, passing over futures that have been cancelled.
         while len(self._pending_requests_to_fulfill) > 0:
             pr = self._pending_requests_to_fulfill.popleft()
             if not pr.future.done():
@@ -730,7 +877,7 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
                     # if we need to continue this scheduling task.
                     while (
                         len(self._pending_requests_to_fulfill) > 0
-                        and self._pending_requests_to_fulfill[0].future.done()
+                        and self._pending_requests_to_fulfill.peek().future.done()
                     ):
                         self._pending_requests_to_fulfill.popleft()
 
@@ -738,7 +885,7 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
                         break
 
                     replica = await self.select_from_candidate_replicas(
-                        candidates, backoff_index
+                        candidates, backoff_index, request_metadata
                     )
                     if replica is not None:
                         self.fulfill_next_pending_request(replica, request_metadata)
@@ -794,11 +941,12 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
     ) -> ReplicaWrapper:
         """Chooses a replica to send the provided request to.
 
-        By default, requests are scheduled in FIFO order, so this places a future on the
-        back of an internal queue that will be popped when a replica is available.
+        Requests of the same priority and tenant are scheduled in FIFO order, and
+        requests of different ones by weighted fair queuing, so this places a future in
+        an internal queue that will be popped when a replica is available.
 
-        If `emplace_front` is passed, the request will be placed at the front of the
-        queue.
+        If `is_retry` is passed, the request will be placed in front of the requests
+        of its priority and tenant that were created after it.
 
         Upon cancellation (by the caller), the future is cancelled and will be passed
         over when a replica becomes available.
@@ -809,23 +957,12 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
                 self._pending_requests_to_schedule.append(pending_request)
             else:
                 pending_request.reset_future()
-                index = 0
-                for pr in self._pending_requests_to_fulfill:
-                    if pending_request.created_at < pr.created_at:
-                        break
-
-                    index += 1
-
-                self._pending_requests_to_fulfill.insert(index, pending_request)
-
-                index = 0
-                for pr in self._pending_requests_to_schedule:
-                    if pending_request.created_at < pr.created_at:
-                        break
-
-                    index += 1
-
-                self._pending_requests_to_schedule.insert(index, pending_request)
+                self._pending_requests_to_fulfill.insert_in_creation_order(
+                    pending_request
+                )
+                self._pending_requests_to_schedule.insert_in_creation_order(
+                    pending_request
+                )
 
             self.maybe_start_scheduling_tasks()
             replica = await pending_request.future
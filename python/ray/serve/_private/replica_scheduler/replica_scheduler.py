@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List
 
-from ray.serve._private.common import ReplicaID, RunningReplicaInfo
+from ray.serve._private.common import ReplicaID, RequestMetadata, RunningReplicaInfo
 from ray.serve._private.replica_scheduler.common import (
     PendingRequest,
     ReplicaQueueLengthCache,
@@ -42,6 +42,44 @@ class ReplicaScheduler(ABC):
     def on_replica_actor_unavailable(self, replica_id: ReplicaID):
         pass
 
+    def on_request_completed(
+        self, replica_id: ReplicaID, latency_s: float, num_requests_ahead: int = 0
+    ):
+        """Called when a request sent to the replica completes successfully.
+
+        `latency_s` is the time from sending the request to receiving its full
+        response, and `num_requests_ahead` is the number of requests that were
+        ongoing on the replica when it was sent. Schedulers that don't use the
+        latencies can ignore them.
+        """
+        pass
+
+    def on_request_rejected_for_fair_share(
+        self, replica_id: ReplicaID, request_metadata: RequestMetadata
+    ):
+        """Called when a replica rejects a request to hold its capacity for requests
+        of other priorities and tenants.
+
+        The queue length of the replica doesn't tell whether it would admit the
+        request, so schedulers should back off from sending requests of the same
+        priority and tenant to the replica.
+        """
+        pass
+
+    def shed_lower_priority_request(self, priority: int, error: Exception) -> bool:
+        """Fail a pending request of a priority lower than `priority` with `error`.
+
+        This is called to make room for a request when the queue of the router is
+        full. Returns whether a request was shed, schedulers that don't support
+        priorities never shed requests.
+        """
+        return False
+
+    @property
+    def use_latency_aware_scheduling(self) -> bool:
+        """Whether `on_request_completed` should be called with the latencies."""
+        return False
+
     @property
     @abstractmethod
     def replica_queue_len_cache(self) -> ReplicaQueueLengthCache:
@@ -0,0 +1,131 @@
+import math
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ray.serve._private.common import RequestMetadata
+from ray.serve._private.constants import (
+    RAY_SERVE_FAIR_ADMISSION_ACTIVE_FLOW_TIMEOUT_S,
+    RAY_SERVE_HTTP_MAX_REQUEST_PRIORITY,
+    RAY_SERVE_HTTP_MIN_REQUEST_PRIORITY,
+    RAY_SERVE_REQUEST_PRIORITY_WEIGHT_BASE,
+)
+
+# The priorities are clipped to this range when computing their weights so that the
+# weights don't overflow.
+_MAX_ABS_PRIORITY = 64
+
+# Requests of the same priority and tenant form a flow, requests of the same flow
+# are handled in FIFO order and the flows share the deployment fairly.
+RequestFlow = Tuple[int, str]
+
+
+def get_request_flow(request_metadata: RequestMetadata) -> RequestFlow:
+    return request_metadata.priority, request_metadata.tenant
+
+
+def get_priority_weight(priority: int) -> float:
+    """The weight of the requests of a priority when sharing the deployment."""
+    priority = max(-_MAX_ABS_PRIORITY, min(_MAX_ABS_PRIORITY, priority))
+    return RAY_SERVE_REQUEST_PRIORITY_WEIGHT_BASE**priority
+
+
+def clamp_http_request_priority(
+    priority: int,
+    *,
+    min_priority: int = RAY_SERVE_HTTP_MIN_REQUEST_PRIORITY,
+    max_priority: int = RAY_SERVE_HTTP_MAX_REQUEST_PRIORITY,
+) -> int:
+    """Clamp a priority set by an HTTP client to the range allowed by the proxy.
+
+    The `serve_request_priority` header isn't authenticated, so clients can't raise
+    the priority of their requests above `max_priority`.
+    """
+    return max(min_priority, min(max_priority, priority))
+
+
+class FairShareAdmissionController:
+    """Admits the requests to a replica fairly between their flows.
+
+    Each active flow is entitled to a share of the `max_ongoing_requests` of the
+    replica proportional to the weight of its priority. A flow that is below its
+    share is admitted whenever the replica has capacity. A flow that is at or beyond
+    its share is only admitted to the capacity that isn't needed by the other active
+    flows to reach their shares, so a single flow can still use the whole replica.
+
+    A flow is active while it has ongoing requests, and for `active_flow_timeout_s`
+    after its last request (including rejected ones).
+    """
+
+    def __init__(
+        self,
+        *,
+        active_flow_timeout_s: float = RAY_SERVE_FAIR_ADMISSION_ACTIVE_FLOW_TIMEOUT_S,
+        get_curr_time_s: Optional[Callable[[], float]] = None,
+    ):
+        self._active_flow_timeout_s = active_flow_timeout_s
+        self._get_curr_time_s = (
+            get_curr_time_s if get_curr_time_s is not None else time.time
+        )
+        self._num_ongoing_requests: Dict[RequestFlow, int] = {}
+        self._last_request_time_s: Dict[RequestFlow, float] = {}
+
+    def _get_active_flows(self) -> List[RequestFlow]:
+        """Get the active flows, removing the flows that are no longer active."""
+        curr_time_s = self._get_curr_time_s()
+        active_flows = []
+        # NOTE: the size of the dictionary changes during this loop.
+        for flow, last_request_time_s in list(self._last_request_time_s.items()):
+            if (
+                self._num_ongoing_requests.get(flow, 0) > 0
+                or curr_time_s - last_request_time_s <= self._active_flow_timeout_s
+            ):
+                active_flows.append(flow)
+            else:
+                self._last_request_time_s.pop(flow)
+                self._num_ongoing_requests.pop(flow, None)
+
+        return active_flows
+
+    def try_admit(
+        self,
+        request_metadata: RequestMetadata,
+        num_ongoing_requests: int,
+        max_ongoing_requests: int,
+    ) -> bool:
+        """Decide whether to admit a request to the replica.
+
+        `num_ongoing_requests` is the number of requests ongoing on the replica,
+        including the requests that weren't admitted through this controller.
+
+        If the request is admitted, `on_request_finished` must be called once it
+        finishes.
+        """
+        flow = get_request_flow(request_metadata)
+        self._last_request_time_s[flow] = self._get_curr_time_s()
+        if num_ongoing_requests >= max_ongoing_requests:
+            return False
+
+        active_flows = self._get_active_flows()
+        if len(active_flows) > 1:
+            total_weight = sum(get_priority_weight(p) for p, _ in active_flows)
+
+            def get_num_reserved(f: RequestFlow) -> int:
+                share = math.ceil(
+                    max_ongoing_requests * get_priority_weight(f[0]) / total_weight
+                )
+                return max(0, share - self._num_ongoing_requests.get(f, 0))
+
+            if get_num_reserved(flow) == 0:
+                num_reserved = sum(get_num_reserved(f) for f in active_flows)
+                if max_ongoing_requests - num_ongoing_requests <= num_reserved:
+                    return False
+
+        self._num_ongoing_requests[flow] = self._num_ongoing_requests.get(flow, 0) + 1
+        return True
+
+    def on_request_finished(self, request_metadata: RequestMetadata):
+        """Release the capacity of a request that was admitted."""
+        flow = get_request_flow(request_metadata)
+        num_ongoing_requests = self._num_ongoing_requests.get(flow, 0)
+        if num_ongoing_requests > 0:
+            self._num_ongoing_requests[flow] = num_ongoing_requests - 1
@@ -6,7 +6,7 @@ import uuid
 from collections import defaultdict
 from contextlib import contextmanager
 from functools import partial
-from typing import Any, Coroutine, DefaultDict, List, Optional, Tuple, Union
+from typing import Any, Callable, Coroutine, DefaultDict, List, Optional, Tuple, Union
 
 import ray
 from ray.actor import ActorHandle
@@ -113,7 +113,17 @@ class RouterMetricsManager:
         self._shutdown: bool = False
 
     @contextmanager
-    def wrap_request_assignment(self, request_meta: RequestMetadata):
+    def wrap_request_assignment(
+        self,
+        request_meta: RequestMetadata,
+        shed_queued_request: Optional[Callable[[int, Exception], bool]] = None,
+    ):
+        """Track the request while it's being assigned to a replica.
+
+        If `max_queued_requests` is reached, `shed_queued_request` is called to make
+        room for the request by failing a queued request of lower priority. If no
+        request is shed, a `BackPressureError` is raised.
+        """
         max_queued_requests = (
             self.deployment_config.max_queued_requests
             if self.deployment_config is not None
@@ -127,8 +137,17 @@ class RouterMetricsManager:
                 num_queued_requests=self.num_queued_requests,
                 max_queued_requests=max_queued_requests,
             )
-            logger.warning(e.message)
-            raise e
+            if shed_queued_request is not None and shed_queued_request(
+                request_meta.priority, e
+            ):
+                logger.warning(
+                    f"{e.message} Shed a queued request of lower priority than "
+                    f"request {request_meta.request_id} "
+                    f"(priority={request_meta.priority})."
+                )
+            else:
+                logger.warning(e.message)
+                raise e
 
         try:
             self.inc_num_total_requests(request_meta.route)
@@ -410,9 +429,12 @@ class Router:
         replica_id: ReplicaID,
         parent_request_id: str,
         response_id: str,
+        sent_at: float,
+        num_requests_ahead: Optional[int],
         result: Union[Any, RayError],
     ):
-        self._metrics_manager.dec_num_running_requests_for_replica(replica_id)
+        if RAY_SERVE_COLLECT_AUTOSCALING_METRICS_ON_HANDLE:
+            self._metrics_manager.dec_num_running_requests_for_replica(replica_id)
         if isinstance(result, ActorDiedError):
             # Replica has died but controller hasn't notified the router yet.
             # Don't consider this replica for requests in the future, and retry
@@ -432,12 +454,21 @@ class Router:
             logger.warning(
                 f"Request failed because {replica_id} is temporarily unavailable."
             )
+        elif not isinstance(result, RayError):
+            # Only successful responses are used to estimate the latency, so that
+            # replicas that fail requests quickly don't look fast.
+            self._replica_scheduler.on_request_completed(
+                replica_id, time.time() - sent_at, num_requests_ahead or 0
+            )
 
     async def schedule_and_send_request(
         self, pr: PendingRequest
-    ) -> Tuple[ReplicaResult, ReplicaID]:
+    ) -> Tuple[ReplicaResult, ReplicaID, Optional[int]]:
         """Choose a replica for the request and send it.
 
+        Also returns the number of requests that were ongoing on the replica when the
+        request was sent, or `None` if it's unknown.
+
         This will block indefinitely if no replicas are available to handle the
         request, so it's up to the caller to time out or cancel the request.
         """
@@ -447,7 +478,11 @@ class Router:
         # then directly send the query and hand the response back. The replica will
         # never reject requests in this code path.
         if not self._enable_strict_max_ongoing_requests or replica.is_cross_language:
-            return replica.send_request(pr), replica.replica_id
+            # The queue length of the replica was fetched to schedule the request.
+            num_requests_ahead = self._replica_scheduler.replica_queue_len_cache.get(
+                replica.replica_id
+            )
+            return replica.send_request(pr), replica.replica_id, num_requests_ahead
 
         while True:
             replica_result = None
@@ -460,7 +495,16 @@ class Router:
                     replica.replica_id, queue_len_info
                 )
                 if queue_len_info.accepted:
-                    return replica_result, replica.replica_id
+                    # The replica's number of ongoing requests includes this one.
+                    return (
+                        replica_result,
+                        replica.replica_id,
+                        queue_len_info.num_ongoing_requests - 1,
+                    )
+                if queue_len_info.rejected_for_fair_share:
+                    self._replica_scheduler.on_request_rejected_for_fair_share(
+                        replica.replica_id, pr.metadata
+                    )
             except asyncio.CancelledError:
                 # NOTE(edoakes): this is not strictly necessary because there are
                 # currently no `await` statements between getting the ref and returning,
@@ -514,7 +558,9 @@ class Router:
             )
         )
 
-        with self._metrics_manager.wrap_request_assignment(request_meta):
+        with self._metrics_manager.wrap_request_assignment(
+            request_meta, self._replica_scheduler.shed_lower_priority_request
+        ):
             # Optimization: if there are currently zero replicas for a deployment,
             # push handle metric to controller to allow for fast cold start time.
             if self._metrics_manager.should_send_scaled_to_zero_optimized_push(
@@ -527,7 +573,11 @@ class Router:
                 request_args, request_kwargs = await self._resolve_request_args(
                     request_args, request_kwargs
                 )
-                replica_result, replica_id = await self.schedule_and_send_request(
+                (
+                    replica_result,
+                    replica_id,
+                    num_requests_ahead,
+                ) = await self.schedule_and_send_request(
                     PendingRequest(
                         args=list(request_args),
                         kwargs=request_kwargs,
@@ -537,16 +587,22 @@ class Router:
 
                 # Keep track of requests that have been sent out to replicas
                 if RAY_SERVE_COLLECT_AUTOSCALING_METRICS_ON_HANDLE:
-                    _request_context = ray.serve.context._serve_request_context.get()
-                    request_id: str = _request_context.request_id
                     self._metrics_manager.inc_num_running_requests_for_replica(
                         replica_id
                     )
+                if (
+                    RAY_SERVE_COLLECT_AUTOSCALING_METRICS_ON_HANDLE
+                    or self._replica_scheduler.use_latency_aware_scheduling
+                ):
+                    _request_context = ray.serve.context._serve_request_context.get()
+                    request_id: str = _request_context.request_id
                     callback = partial(
                         self._process_finished_request,
                         replica_id,
                         request_id,
                         response_id,
+                        time.time(),
+                        num_requests_ahead,
                     )
                     replica_result.add_done_callback(callback)
 
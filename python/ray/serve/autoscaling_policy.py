@@ -1,8 +1,15 @@
 import logging
 import math
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, List, Optional
 
-from ray.serve._private.constants import CONTROL_LOOP_INTERVAL_S, SERVE_LOGGER_NAME
+from ray.serve._private.constants import (
+    CONTROL_LOOP_INTERVAL_S,
+    RAY_SERVE_PREDICTIVE_AUTOSCALING_LEAD_TIME_S,
+    RAY_SERVE_PREDICTIVE_AUTOSCALING_SAMPLE_INTERVAL_S,
+    RAY_SERVE_PREDICTIVE_AUTOSCALING_SEASON_PERIOD_S,
+    SERVE_LOGGER_NAME,
+)
 from ray.serve.config import AutoscalingConfig
 from ray.util.annotations import PublicAPI
 
@@ -156,4 +163,154 @@ def replica_queue_length_autoscaling_policy(
     return decision_num_replicas
 
 
+class _LoadForecaster:
+    """Forecasts the load of a deployment with Holt-Winters exponential smoothing.
+
+    The load is averaged over samples of `sample_interval_s`. Each sample updates
+    the level, the trend and the seasonal component of the load at the sample's
+    position in the season, which has `season_length` samples.
+    """
+
+    # Smoothing factors of the level, the trend and the seasonal components.
+    LEVEL_SMOOTHING = 0.2
+    TREND_SMOOTHING = 0.05
+    SEASONAL_SMOOTHING = 0.5
+
+    def __init__(self, sample_interval_s: float, season_length: int):
+        self.sample_interval_s = sample_interval_s
+        self.season_length = max(1, season_length)
+        self._level: Optional[float] = None
+        self._trend = 0.0
+        self._seasonals: List[float] = [0.0] * self.season_length
+        # The index of the current sample, from the start of the history.
+        self._index = 0
+        self._sample_start_time: Optional[float] = None
+        self._sample_sum = 0.0
+        self._sample_count = 0
+
+    def observe(self, now: float, load: float) -> None:
+        """Record the load at the given time."""
+        if self._sample_start_time is None:
+            self._sample_start_time = now
+        num_elapsed = int((now - self._sample_start_time) // self.sample_interval_s)
+        if num_elapsed > 0:
+            if self._sample_count > 0:
+                self._update(self._sample_sum / self._sample_count)
+                num_elapsed -= 1
+                self._sample_start_time += self.sample_interval_s
+            # Skip the samples without observations, e.g., if the controller
+            # wasn't running.
+            self._index += num_elapsed
+            self._sample_start_time += num_elapsed * self.sample_interval_s
+            self._sample_sum = 0.0
+            self._sample_count = 0
+        self._sample_sum += load
+        self._sample_count += 1
+
+    def forecast(self, horizon_s: float) -> Optional[float]:
+        """Return the max load forecast over the next `horizon_s`, or None if no
+        sample was completed yet."""
+        if self._level is None:
+            return None
+        num_samples = max(1, math.ceil(horizon_s / self.sample_interval_s))
+        return max(
+            0.0,
+            max(
+                self._level
+                + h * self._trend
+                + self._seasonals[(self._index + h - 1) % self.season_length]
+                for h in range(1, num_samples + 1)
+            ),
+        )
+
+    def _update(self, load: float) -> None:
+        i = self._index % self.season_length
+        seasonal = self._seasonals[i]
+        if self._level is None:
+            self._level = load - seasonal
+        else:
+            last_level = self._level
+            self._level = self.LEVEL_SMOOTHING * (load - seasonal) + (
+                1 - self.LEVEL_SMOOTHING
+            ) * (last_level + self._trend)
+            self._trend = (
+                self.TREND_SMOOTHING * (self._level - last_level)
+                + (1 - self.TREND_SMOOTHING) * self._trend
+            )
+        self._seasonals[i] = (
+            self.SEASONAL_SMOOTHING * (load - self._level)
+            + (1 - self.SEASONAL_SMOOTHING) * seasonal
+        )
+        self._index += 1
+
+
+@PublicAPI(stability="alpha")
+def predictive_autoscaling_policy(
+    curr_target_num_replicas: int,
+    total_num_requests: int,
+    num_running_replicas: int,
+    config: Optional[AutoscalingConfig],
+    capacity_adjusted_min_replicas: int,
+    capacity_adjusted_max_replicas: int,
+    policy_state: Dict[str, Any],
+    now: Optional[float] = None,
+) -> int:
+    """An autoscaling policy that scales ahead of the forecast load.
+
+    The policy records the history of the total number of requests, and forecasts
+    it with exponential smoothing and daily seasonality. It scales up to the number
+    of replicas needed to serve the max forecast load over the next
+    `RAY_SERVE_PREDICTIVE_AUTOSCALING_LEAD_TIME_S`, without waiting for
+    `upscale_delay_s`, so that replicas are started before predictable ramps.
+    Otherwise, and when the forecast is lower than the current load, it makes the
+    same decisions as `replica_queue_length_autoscaling_policy`, but doesn't scale
+    down below the forecast.
+
+    The history is kept in the policy state, so it's reset when the deployment is
+    redeployed or the controller restarts. `now` overrides the current time, e.g.,
+    to replay recorded traces.
+    """
+    if now is None:
+        now = time.time()
+    forecaster = policy_state.get("forecaster")
+    if forecaster is None:
+        forecaster = _LoadForecaster(
+            RAY_SERVE_PREDICTIVE_AUTOSCALING_SAMPLE_INTERVAL_S,
+            round(
+                RAY_SERVE_PREDICTIVE_AUTOSCALING_SEASON_PERIOD_S
+                / RAY_SERVE_PREDICTIVE_AUTOSCALING_SAMPLE_INTERVAL_S
+            ),
+        )
+        policy_state["forecaster"] = forecaster
+    forecaster.observe(now, total_num_requests)
+
+    decision_num_replicas = replica_queue_length_autoscaling_policy(
+        curr_target_num_replicas=curr_target_num_replicas,
+        total_num_requests=total_num_requests,
+        num_running_replicas=num_running_replicas,
+        config=config,
+        capacity_adjusted_min_replicas=capacity_adjusted_min_replicas,
+        capacity_adjusted_max_replicas=capacity_adjusted_max_replicas,
+        policy_state=policy_state,
+    )
+
+    forecast = forecaster.forecast(RAY_SERVE_PREDICTIVE_AUTOSCALING_LEAD_TIME_S)
+    if forecast is not None:
+        forecast_num_replicas = math.ceil(
+            forecast / config.get_target_ongoing_requests()
+        )
+        forecast_num_replicas = max(
+            capacity_adjusted_min_replicas,
+            min(capacity_adjusted_max_replicas, forecast_num_replicas),
+        )
+        if forecast_num_replicas > decision_num_replicas:
+            logger.debug(
+                f"Scaling to {forecast_num_replicas} replicas ahead of the forecast "
+                f"load of {forecast:.1f} requests."
+            )
+            decision_num_replicas = forecast_num_replicas
+
+    return decision_num_replicas
+
+
 default_autoscaling_policy = replica_queue_length_autoscaling_policy
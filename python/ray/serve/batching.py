@@ -1,9 +1,10 @@
 import asyncio
 import io
 import logging
+import math
 import time
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import wraps
 from inspect import isasyncgenfunction, iscoroutinefunction
 from typing import (
@@ -26,6 +27,7 @@ from typing import (
 from ray import serve
 from ray._private.signature import extract_signature, flatten_args, recover_args
 from ray._private.utils import get_or_create_event_loop
+from ray.serve import metrics
 from ray.serve._private.constants import SERVE_LOGGER_NAME
 from ray.serve._private.utils import extract_self_if_method_call
 from ray.serve.exceptions import RayServeException
@@ -44,6 +46,7 @@ class _SingleRequest:
     self_arg: Any
     flattened_args: List[Any]
     future: asyncio.Future
+    enqueue_time: float = field(default_factory=time.time)
 
 
 @dataclass
@@ -77,12 +80,190 @@ def _batch_args_kwargs(
     return recover_args(batched_flattened_args)
 
 
+class _AdaptiveBatchController:
+    """Adapts the batch size and wait timeout of a batch queue to a latency target.
+
+    The controller measures the latency of each request, from when it's queued
+    until the batch handler returns, and the execution time of the batch handler
+    for each batch size. Every `ADJUSTMENT_INTERVAL_NUM_REQUESTS` requests, it
+    compares the p95 latency of the requests since the last adjustment with the
+    target:
+
+    * If the p95 latency exceeds the target, the batch size is decreased by
+      `DECREASE_FACTOR`.
+    * If the p95 latency is below `HEADROOM_FRACTION` of the target, the batch size
+      is increased by `INCREASE_FACTOR`, up to the largest batch size whose
+      execution time fits in the target. The execution time of a batch size is
+      predicted by a linear fit of the recent execution times vs. batch sizes.
+
+    The wait timeout is set to `WAIT_FRACTION` of the time left in the target
+    after executing a batch, so that the rest covers the time requests wait for
+    the previous batch. The batch size and wait timeout never exceed the
+    configured `max_batch_size` and `batch_wait_timeout_s`.
+    """
+
+    # The number of requests between 2 adjustments of the settings.
+    ADJUSTMENT_INTERVAL_NUM_REQUESTS = 50
+    # The factors by which the batch size is decreased and increased.
+    DECREASE_FACTOR = 0.75
+    INCREASE_FACTOR = 1.25
+    # The batch size is only increased if the p95 latency is below this fraction
+    # of the target.
+    HEADROOM_FRACTION = 0.8
+    # The fraction of the time left in the target after executing a batch that is
+    # spent waiting for the batch to fill.
+    WAIT_FRACTION = 0.5
+    # The number of recent batches used to fit the execution time.
+    EXECUTION_TIME_WINDOW_NUM_BATCHES = 100
+
+    def __init__(
+        self,
+        name: str,
+        max_batch_size: int,
+        max_batch_wait_timeout_s: float,
+        target_latency_s: float,
+    ):
+        self.max_batch_size = max_batch_size
+        self.max_batch_wait_timeout_s = max_batch_wait_timeout_s
+        self.target_latency_s = target_latency_s
+        # Start with the configured settings, and decrease them if they don't
+        # meet the target.
+        self.batch_size = max_batch_size
+        self.batch_wait_timeout_s = max_batch_wait_timeout_s
+
+        # The `(batch_size, execution_time_s)` of the recent batches.
+        self._execution_times: deque = deque(
+            maxlen=self.EXECUTION_TIME_WINDOW_NUM_BATCHES
+        )
+        # The latencies of the requests since the last adjustment.
+        self._latencies_s: List[float] = []
+
+        # The gauges report the controller's current settings per batched function.
+        self.batch_size_gauge = metrics.Gauge(
+            "serve_batch_adaptive_batch_size",
+            description="The current max batch size of an adaptive @serve.batch.",
+            tag_keys=("function",),
+        )
+        self.batch_size_gauge.set_default_tags({"function": name})
+        self.batch_wait_timeout_gauge = metrics.Gauge(
+            "serve_batch_adaptive_wait_timeout_s",
+            description="The current batch wait timeout of an adaptive @serve.batch.",
+            tag_keys=("function",),
+        )
+        self.batch_wait_timeout_gauge.set_default_tags({"function": name})
+        self.p95_latency_gauge = metrics.Gauge(
+            "serve_batch_p95_latency_s",
+            description=(
+                "The p95 latency of the requests to an adaptive @serve.batch "
+                "measured at its last adjustment."
+            ),
+            tag_keys=("function",),
+        )
+        self.p95_latency_gauge.set_default_tags({"function": name})
+        self._update_gauges()
+
+    def set_max_batch_size(self, max_batch_size: int) -> None:
+        self.max_batch_size = max_batch_size
+        self.batch_size = min(self.batch_size, max_batch_size)
+        self._update_gauges()
+
+    def set_max_batch_wait_timeout_s(self, max_batch_wait_timeout_s: float) -> None:
+        self.max_batch_wait_timeout_s = max_batch_wait_timeout_s
+        self.batch_wait_timeout_s = min(
+            self.batch_wait_timeout_s, max_batch_wait_timeout_s
+        )
+        self._update_gauges()
+
+    def on_batch_finished(
+        self, execution_time_s: float, latencies_s: List[float]
+    ) -> None:
+        """Record the execution time of a batch and the latencies of its requests,
+        and adjust the settings if enough requests were recorded."""
+        self._execution_times.append((len(latencies_s), execution_time_s))
+        self._latencies_s.extend(latencies_s)
+        if len(self._latencies_s) < self.ADJUSTMENT_INTERVAL_NUM_REQUESTS:
+            return
+
+        latencies_s = sorted(self._latencies_s)
+        self._latencies_s = []
+        p95_latency_s = latencies_s[math.ceil(0.95 * len(latencies_s)) - 1]
+        self.p95_latency_gauge.set(p95_latency_s)
+
+        if p95_latency_s > self.target_latency_s:
+            self.batch_size = max(1, math.floor(self.batch_size * self.DECREASE_FACTOR))
+        elif p95_latency_s < self.HEADROOM_FRACTION * self.target_latency_s:
+            self.batch_size = max(
+                self.batch_size,
+                min(
+                    self.max_batch_size,
+                    self._get_max_batch_size_within_target(),
+                    math.ceil(self.batch_size * self.INCREASE_FACTOR),
+                ),
+            )
+
+        remaining_s = self.target_latency_s - self._predict_execution_time_s(
+            self.batch_size
+        )
+        self.batch_wait_timeout_s = min(
+            self.max_batch_wait_timeout_s, max(0.0, self.WAIT_FRACTION * remaining_s)
+        )
+        self._update_gauges()
+
+    def _fit_execution_time(self) -> Tuple[float, float]:
+        """Fit the execution time of a batch as `intercept + slope * batch_size`.
+
+        Returns `(intercept, slope)`. If the batch sizes don't vary or the
+        execution time doesn't increase with them, the slope is 0.
+        """
+        n = len(self._execution_times)
+        if n == 0:
+            return 0.0, 0.0
+
+        mean_size = sum(size for size, _ in self._execution_times) / n
+        mean_time_s = sum(time_s for _, time_s in self._execution_times) / n
+        size_variance = sum(
+            (size - mean_size) ** 2 for size, _ in self._execution_times
+        )
+        if size_variance == 0:
+            return mean_time_s, 0.0
+
+        slope = (
+            sum(
+                (size - mean_size) * (time_s - mean_time_s)
+                for size, time_s in self._execution_times
+            )
+            / size_variance
+        )
+        if slope <= 0:
+            return mean_time_s, 0.0
+
+        return mean_time_s - slope * mean_size, slope
+
+    def _predict_execution_time_s(self, batch_size: int) -> float:
+        intercept, slope = self._fit_execution_time()
+        return intercept + slope * batch_size
+
+    def _get_max_batch_size_within_target(self) -> int:
+        """Get the largest batch size whose predicted execution time fits in the
+        target latency, at least 1."""
+        intercept, slope = self._fit_execution_time()
+        if slope == 0:
+            return self.max_batch_size
+
+        return max(1, math.floor((self.target_latency_s - intercept) / slope))
+
+    def _update_gauges(self) -> None:
+        self.batch_size_gauge.set(self.batch_size)
+        self.batch_wait_timeout_gauge.set(self.batch_wait_timeout_s)
+
+
 class _BatchQueue:
     def __init__(
         self,
         max_batch_size: int,
         batch_wait_timeout_s: float,
         handle_batch_func: Optional[Callable] = None,
+        target_latency_s: Optional[float] = None,
     ) -> None:
         """Async queue that accepts individual items and returns batches.
 
@@ -93,6 +274,9 @@ class _BatchQueue:
         If handle_batch_func is passed in, a background coroutine will run to
         poll from the queue and call handle_batch_func on the results.
 
+        If target_latency_s is passed in, the batch size and timeout are adapted
+        to meet the latency target, bounded by max_batch_size and timeout_s.
+
         Cannot be pickled.
 
         Arguments:
@@ -101,6 +285,8 @@ class _BatchQueue:
                 batch.
             handle_batch_func(Optional[Callable]): callback to run in the
                 background to handle batches if provided.
+            target_latency_s(Optional[float]): target p95 latency of the
+                requests, from when they're queued until their batch is handled.
         """
         self.queue: asyncio.Queue[_SingleRequest] = asyncio.Queue()
         self.max_batch_size = max_batch_size
@@ -110,6 +296,15 @@ class _BatchQueue:
         # Used for observability.
         self.curr_iteration_start_time = time.time()
 
+        self._adaptive_controller: Optional[_AdaptiveBatchController] = None
+        if target_latency_s is not None:
+            self._adaptive_controller = _AdaptiveBatchController(
+                getattr(handle_batch_func, "__qualname__", ""),
+                max_batch_size,
+                batch_wait_timeout_s,
+                target_latency_s,
+            )
+
         self._handle_batch_task = None
         self._loop = get_or_create_event_loop()
         if handle_batch_func is not None:
@@ -137,8 +332,31 @@ class _BatchQueue:
     def set_max_batch_size(self, new_max_batch_size: int) -> None:
         """Updates queue's max_batch_size."""
         self.max_batch_size = new_max_batch_size
+        if self._adaptive_controller is not None:
+            self._adaptive_controller.set_max_batch_size(new_max_batch_size)
         self._warn_if_max_batch_size_exceeds_max_ongoing_requests()
 
+    def set_batch_wait_timeout_s(self, new_batch_wait_timeout_s: float) -> None:
+        """Updates queue's batch_wait_timeout_s."""
+        self.batch_wait_timeout_s = new_batch_wait_timeout_s
+        if self._adaptive_controller is not None:
+            self._adaptive_controller.set_max_batch_wait_timeout_s(
+                new_batch_wait_timeout_s
+            )
+
+    def get_effective_batch_settings(self) -> Tuple[int, float]:
+        """Returns the max batch size and timeout used for the next batch.
+
+        These are the adapted settings if the queue has a latency target.
+        """
+        if self._adaptive_controller is not None:
+            return (
+                self._adaptive_controller.batch_size,
+                self._adaptive_controller.batch_wait_timeout_s,
+            )
+
+        return self.max_batch_size, self.batch_wait_timeout_s
+
     def put(self, request: Tuple[_SingleRequest, asyncio.Future]) -> None:
         self.queue.put_nowait(request)
         self.requests_available_event.set()
@@ -158,8 +376,7 @@ class _BatchQueue:
         batch.append(await self.queue.get())
 
         # Cache current max_batch_size and batch_wait_timeout_s for this batch.
-        max_batch_size = self.max_batch_size
-        batch_wait_timeout_s = self.batch_wait_timeout_s
+        max_batch_size, batch_wait_timeout_s = self.get_effective_batch_settings()
 
         # Wait self.timeout_s seconds for new queue arrivals.
         batch_start_time = time.time()
@@ -292,6 +509,7 @@ class _BatchQueue:
         batch: List[_SingleRequest] = await self.wait_for_batch()
         assert len(batch) > 0
         futures = [item.future for item in batch]
+        handler_start_time = time.time()
 
         # Most of the logic in the function should be wrapped in this try-
         # except block, so the futures' exceptions can be set if an exception
@@ -320,6 +538,13 @@ class _BatchQueue:
             for future in futures:
                 _set_exception_if_not_done(future, e)
 
+        if self._adaptive_controller is not None:
+            handler_end_time = time.time()
+            self._adaptive_controller.on_batch_finished(
+                handler_end_time - handler_start_time,
+                [handler_end_time - item.enqueue_time for item in batch],
+            )
+
     def __del__(self):
         if (
             self._handle_batch_task is None
@@ -346,11 +571,13 @@ class _LazyBatchQueueWrapper:
         max_batch_size: int = 10,
         batch_wait_timeout_s: float = 0.0,
         handle_batch_func: Optional[Callable] = None,
+        target_latency_s: Optional[float] = None,
     ):
         self._queue: Optional[_BatchQueue] = None
         self.max_batch_size = max_batch_size
         self.batch_wait_timeout_s = batch_wait_timeout_s
         self.handle_batch_func = handle_batch_func
+        self.target_latency_s = target_latency_s
 
     @property
     def queue(self) -> _BatchQueue:
@@ -363,6 +590,7 @@ class _LazyBatchQueueWrapper:
                 self.max_batch_size,
                 self.batch_wait_timeout_s,
                 self.handle_batch_func,
+                self.target_latency_s,
             )
         return self._queue
 
@@ -378,7 +606,7 @@ class _LazyBatchQueueWrapper:
         self.batch_wait_timeout_s = new_batch_wait_timeout_s
 
         if self._queue is not None:
-            self._queue.batch_wait_timeout_s = new_batch_wait_timeout_s
+            self._queue.set_batch_wait_timeout_s(new_batch_wait_timeout_s)
 
     def get_max_batch_size(self) -> int:
         return self.max_batch_size
@@ -386,6 +614,10 @@ class _LazyBatchQueueWrapper:
     def get_batch_wait_timeout_s(self) -> float:
         return self.batch_wait_timeout_s
 
+    def _get_effective_batch_settings(self) -> Tuple[int, float]:
+        """Gets the max batch size and timeout used for the next batch."""
+        return self.queue.get_effective_batch_settings()
+
     def _get_curr_iteration_start_time(self) -> Optional[float]:
         """Gets current iteration's start time on default _BatchQueue implementation.
 
@@ -437,6 +669,21 @@ def _validate_max_batch_size(max_batch_size):
         )
 
 
+def _validate_target_latency_s(target_latency_s):
+    if target_latency_s is None:
+        return
+
+    if not isinstance(target_latency_s, (float, int)):
+        raise TypeError(
+            f"target_latency_s must be a float > 0 or None, got {target_latency_s}"
+        )
+
+    if target_latency_s <= 0:
+        raise ValueError(
+            f"target_latency_s must be a float > 0 or None, got {target_latency_s}"
+        )
+
+
 def _validate_batch_wait_timeout_s(batch_wait_timeout_s):
     if not isinstance(batch_wait_timeout_s, (float, int)):
         raise TypeError(
@@ -496,6 +743,7 @@ def batch(
     /,
     max_batch_size: int = 10,
     batch_wait_timeout_s: float = 0.0,
+    target_latency_s: Optional[float] = None,
 ) -> "_BatchDecorator":
     ...
 
@@ -532,6 +780,7 @@ def batch(
     /,
     max_batch_size: int = 10,
     batch_wait_timeout_s: float = 0.0,
+    target_latency_s: Optional[float] = None,
 ) -> Callable:
     """Converts a function to asynchronously handle batches.
 
@@ -547,6 +796,15 @@ def batch(
     methods from the batch_handler (`set_max_batch_size` and
     `set_batch_wait_timeout_s`).
 
+    If `target_latency_s` is set, the batch size and wait timeout are adapted
+    online to keep the p95 latency of the requests, from when they're queued
+    until the function returns, below the target while batching as many requests
+    as possible. The adaptation uses the measured execution time of the function
+    for each batch size, and is bounded by `max_batch_size` and
+    `batch_wait_timeout_s`. The current settings are reported as the
+    `serve_batch_adaptive_batch_size` and `serve_batch_adaptive_wait_timeout_s`
+    gauges, tagged with the name of the function.
+
     Example:
 
     .. code-block:: python
@@ -579,6 +837,8 @@ def batch(
             one call to the underlying function.
         batch_wait_timeout_s: the maximum duration to wait for
             `max_batch_size` elements before running the current batch.
+        target_latency_s: the target p95 latency of the requests. If set, the
+            batch size and wait timeout are adapted to meet it.
     """
     # `_func` will be None in the case when the decorator is parametrized.
     # See the comment at the end of this function for a detailed explanation.
@@ -593,12 +853,14 @@ def batch(
 
     _validate_max_batch_size(max_batch_size)
     _validate_batch_wait_timeout_s(batch_wait_timeout_s)
+    _validate_target_latency_s(target_latency_s)
 
     def _batch_decorator(_func):
         lazy_batch_queue_wrapper = _LazyBatchQueueWrapper(
             max_batch_size,
             batch_wait_timeout_s,
             _func,
+            target_latency_s,
         )
 
         async def batch_handler_generator(
@@ -654,6 +916,9 @@ def batch(
         wrapper.set_batch_wait_timeout_s = (
             lazy_batch_queue_wrapper.set_batch_wait_timeout_s
         )
+        wrapper._get_effective_batch_settings = (
+            lazy_batch_queue_wrapper._get_effective_batch_settings
+        )
 
         # Store debugging methods in the lazy_batch_queue wrapper
         wrapper._get_curr_iteration_start_time = (
@@ -0,0 +1,365 @@
+import asyncio
+import sys
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+from inspect import isasyncgenfunction, iscoroutinefunction
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+    overload,
+)
+
+from ray import cloudpickle
+from ray.serve import metrics
+from ray.serve._private.utils import extract_self_if_method_call
+from ray.util.annotations import PublicAPI
+
+# The default max size of the cached responses of a function on a replica.
+DEFAULT_CACHE_MAX_BYTES = 100 * 1024 * 1024
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    size_bytes: int
+    # The `time.monotonic()` after which the entry is expired.
+    expiration_time: float
+
+
+def _default_key_fn(*args, **kwargs) -> Hashable:
+    return args, tuple(sorted(kwargs.items()))
+
+
+def _default_size_fn(value: Any) -> int:
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    try:
+        return len(cloudpickle.dumps(value))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class _ResponseCache:
+    def __init__(
+        self,
+        name: str,
+        max_bytes: int,
+        ttl_s: Optional[float],
+        size_fn: Callable[[Any], int],
+    ):
+        """LRU cache of the responses of a function on a replica.
+
+        Entries are evicted in the LRU order once their total size exceeds
+        `max_bytes`, and expire `ttl_s` after they're cached. Concurrent misses of
+        the same key are coalesced, so that the function is only called once.
+
+        Arguments:
+            name: name of the cached function, used to tag the metrics.
+            max_bytes: max total size of the cached responses.
+            ttl_s: time after which a cached response expires, or None if the
+                responses don't expire.
+            size_fn: function that returns the size of a response in bytes.
+        """
+        self.max_bytes = max_bytes
+        self.ttl_s = ttl_s
+        self._size_fn = size_fn
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._size_bytes = 0
+        # The computations of the keys that missed the cache and are running.
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+
+        # Each metric gets its own default tags, because the serve tags are added
+        # to them in place.
+        self.hits_counter = metrics.Counter(
+            "serve_cache_hits",
+            description="The number of requests served from the response cache.",
+            tag_keys=("function",),
+        )
+        self.hits_counter.set_default_tags({"function": name})
+        self.misses_counter = metrics.Counter(
+            "serve_cache_misses",
+            description=(
+                "The number of requests that missed the response cache and called "
+                "the cached function."
+            ),
+            tag_keys=("function",),
+        )
+        self.misses_counter.set_default_tags({"function": name})
+        self.coalesced_counter = metrics.Counter(
+            "serve_cache_coalesced_requests",
+            description=(
+                "The number of requests that missed the response cache and waited "
+                "for the same pending call of the cached function."
+            ),
+            tag_keys=("function",),
+        )
+        self.coalesced_counter.set_default_tags({"function": name})
+        self.evictions_counter = metrics.Counter(
+            "serve_cache_evictions",
+            description=(
+                "The number of responses evicted from the response cache because "
+                "it's full."
+            ),
+            tag_keys=("function",),
+        )
+        self.evictions_counter.set_default_tags({"function": name})
+        self.size_bytes_gauge = metrics.Gauge(
+            "serve_cache_size_bytes",
+            description="The total size of the responses in the response cache.",
+            tag_keys=("function",),
+        )
+        self.size_bytes_gauge.set_default_tags({"function": name})
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return whether the key is cached, and its cached value if it is."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        if time.monotonic() >= entry.expiration_time:
+            self._remove(key)
+            return False, None
+        self._entries.move_to_end(key)
+        return True, entry.value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        size_bytes = self._size_fn(value)
+        if key in self._entries:
+            self._remove(key)
+        if size_bytes > self.max_bytes:
+            # The value would evict the whole cache, so don't cache it.
+            return
+
+        expiration_time = float("inf")
+        if self.ttl_s is not None:
+            expiration_time = time.monotonic() + self.ttl_s
+        self._entries[key] = _CacheEntry(value, size_bytes, expiration_time)
+        self._size_bytes += size_bytes
+        while self._size_bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions_counter.inc()
+        self.size_bytes_gauge.set(self._size_bytes)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size_bytes = 0
+        self.size_bytes_gauge.set(0)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._size_bytes -= entry.size_bytes
+        self.size_bytes_gauge.set(self._size_bytes)
+
+    async def get_or_compute(
+        self, key: Hashable, compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value of the key, or compute and cache it.
+
+        The computation runs in its own task, so that it isn't cancelled if the
+        request that started it is cancelled while other requests wait for it.
+        """
+        found, value = self.get(key)
+        if found:
+            self.hits_counter.inc()
+            return value
+
+        pending = self._pending.get(key)
+        if pending is None:
+            self.misses_counter.inc()
+            pending = asyncio.ensure_future(self._compute_and_put(key, compute))
+            # Retrieve the exception even if all the callers were cancelled, so
+            # that asyncio doesn't log it as never retrieved.
+            pending.add_done_callback(_retrieve_exception)
+            self._pending[key] = pending
+        else:
+            self.coalesced_counter.inc()
+        return await asyncio.shield(pending)
+
+    async def _compute_and_put(
+        self, key: Hashable, compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        try:
+            value = await compute()
+            self.put(key, value)
+            return value
+        finally:
+            del self._pending[key]
+
+
+def _retrieve_exception(future: asyncio.Future) -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+@overload  # `cache` called WITHOUT arguments
+def cache(_func: F, /) -> F:
+    ...
+
+
+@overload  # `cache` called WITH arguments
+def cache(
+    _func: None = None,
+    /,
+    *,
+    key_fn: Optional[Callable[..., Hashable]] = None,
+    max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ttl_s: Optional[float] = None,
+    size_fn: Optional[Callable[[Any], int]] = None,
+) -> Callable[[F], F]:
+    ...
+
+
+@PublicAPI(stability="alpha")
+def cache(
+    _func: Optional[Callable] = None,
+    /,
+    *,
+    key_fn: Optional[Callable[..., Hashable]] = None,
+    max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ttl_s: Optional[float] = None,
+    size_fn: Optional[Callable[[Any], int]] = None,
+) -> Callable:
+    """Caches the responses of a function or method on each replica.
+
+    The function can be a standalone function or a class method, and must be
+    `async def`. Calls with the same cache key return the cached response instead
+    of calling the function again. If several calls with the same key miss the
+    cache concurrently, the function is only called once, and all of them receive
+    its response. Exceptions aren't cached.
+
+    Responses are cached separately on each replica, and for methods, on each
+    instance of the class. Once their total size exceeds `max_bytes`, the least
+    recently used responses are evicted.
+
+    The cache reports the `serve_cache_hits`, `serve_cache_misses`,
+    `serve_cache_coalesced_requests` and `serve_cache_evictions` counters and the
+    `serve_cache_size_bytes` gauge, tagged with the name of the function.
+
+    Example:
+
+    .. code-block:: python
+
+            from ray import serve
+            from starlette.requests import Request
+
+            @serve.deployment
+            class CachedDeployment:
+                @serve.cache(key_fn=lambda prompt: prompt, ttl_s=600)
+                async def generate(self, prompt: str) -> str:
+                    return await self.model.generate(prompt)
+
+                async def __call__(self, request: Request) -> str:
+                    return await self.generate((await request.json())["prompt"])
+
+            app = CachedDeployment.bind()
+
+    Arguments:
+        key_fn: function that takes the arguments of the cached function, except
+            `self`, and returns a hashable cache key. By default, the key is made
+            of the arguments themselves, which must then be hashable.
+        max_bytes: the maximum total size of the cached responses on each
+            replica, or on each instance for methods.
+        ttl_s: the time in seconds after which a cached response expires. By
+            default, responses don't expire.
+        size_fn: function that returns the size of a response in bytes. By
+            default, the size of its serialized form.
+    """
+    # `_func` will be None in the case when the decorator is parametrized.
+    if _func is not None:
+        if not callable(_func):
+            raise TypeError(
+                "@serve.cache can only be used to decorate functions or methods."
+            )
+        if isasyncgenfunction(_func) or not iscoroutinefunction(_func):
+            raise TypeError("Functions decorated with @serve.cache must be 'async def'")
+
+    if key_fn is not None and not callable(key_fn):
+        raise TypeError("key_fn must be callable.")
+    if size_fn is not None and not callable(size_fn):
+        raise TypeError("size_fn must be callable.")
+    if not isinstance(max_bytes, int) or isinstance(max_bytes, bool):
+        raise TypeError(f"max_bytes must be an integer, got {type(max_bytes)}.")
+    if max_bytes <= 0:
+        raise ValueError(f"max_bytes must be positive, got {max_bytes}.")
+    if ttl_s is not None:
+        if not isinstance(ttl_s, (float, int)):
+            raise TypeError(f"ttl_s must be a number, got {type(ttl_s)}.")
+        if ttl_s <= 0:
+            raise ValueError(f"ttl_s must be positive, got {ttl_s}.")
+
+    def _cache_decorator(_func):
+        # The caches are created lazily, on the first call in the replica. A
+        # function has a single cache, and a method has one cache per instance,
+        # stored on the instance.
+        cache_attr = f"__serve_cache_{_func.__name__}"
+        response_cache: Optional[_ResponseCache] = None
+        instance_caches: "weakref.WeakSet[_ResponseCache]" = weakref.WeakSet()
+
+        def create_cache() -> _ResponseCache:
+            return _ResponseCache(
+                _func.__qualname__,
+                max_bytes,
+                ttl_s,
+                size_fn or _default_size_fn,
+            )
+
+        def get_cache(self: Optional[object] = None) -> _ResponseCache:
+            nonlocal response_cache
+            if self is not None:
+                instance_cache = getattr(self, cache_attr, None)
+                if instance_cache is None:
+                    instance_cache = create_cache()
+                    setattr(self, cache_attr, instance_cache)
+                    instance_caches.add(instance_cache)
+                return instance_cache
+            if response_cache is None:
+                response_cache = create_cache()
+            return response_cache
+
+        @wraps(_func)
+        async def cache_wrapper(*args, **kwargs):
+            # If the function is a method, remove self from the key arguments.
+            self = extract_self_if_method_call(args, _func)
+            key_args = args[1:] if self is not None else args
+            key = (key_fn or _default_key_fn)(*key_args, **kwargs)
+            try:
+                hash(key)
+            except TypeError as e:
+                raise TypeError(
+                    "The cache key of a call of a function decorated with "
+                    "@serve.cache must be hashable. Pass a `key_fn` that returns "
+                    f"a hashable key for its arguments: {e}"
+                ) from e
+            return await get_cache(self).get_or_compute(
+                key, lambda: _func(*args, **kwargs)
+            )
+
+        def cache_clear():
+            if response_cache is not None:
+                response_cache.clear()
+            for instance_cache in list(instance_caches):
+                instance_cache.clear()
+
+        cache_wrapper.cache_clear = cache_clear
+        # Used for testing.
+        cache_wrapper._get_cache = get_cache
+        return cache_wrapper
+
+    return _cache_decorator(_func) if callable(_func) else _cache_decorator
@@ -107,6 +107,8 @@ class _DynamicHandleOptionsBase(ABC):
     method_name: str = "__call__"
     multiplexed_model_id: str = ""
     stream: bool = False
+    priority: int = 0
+    tenant: str = ""
     _request_protocol: str = RequestProtocol.UNDEFINED
 
     def copy_and_update(self, **kwargs) -> "_DynamicHandleOptionsBase":
@@ -308,6 +310,8 @@ class _DeploymentHandleBase:
             app_name=self.app_name,
             multiplexed_model_id=self.handle_options.multiplexed_model_id,
             is_streaming=self.handle_options.stream,
+            priority=self.handle_options.priority,
+            tenant=self.handle_options.tenant,
             _request_protocol=self.handle_options._request_protocol,
             grpc_context=_request_context.grpc_context,
         )
@@ -785,11 +789,26 @@ class DeploymentHandle(_DeploymentHandleBase):
         method_name: Union[str, DEFAULT] = DEFAULT.VALUE,
         multiplexed_model_id: Union[str, DEFAULT] = DEFAULT.VALUE,
         stream: Union[bool, DEFAULT] = DEFAULT.VALUE,
+        priority: Union[int, DEFAULT] = DEFAULT.VALUE,
+        tenant: Union[str, DEFAULT] = DEFAULT.VALUE,
         use_new_handle_api: Union[bool, DEFAULT] = DEFAULT.VALUE,
         _prefer_local_routing: Union[bool, DEFAULT] = DEFAULT.VALUE,
     ) -> "DeploymentHandle":
         """Set options for this handle and return an updated copy of it.
 
+        Requests with a higher `priority` get a larger share of the deployment when
+        it's overloaded, and requests of the same priority are shared fairly between
+        each `tenant`. When `max_queued_requests` is reached, queued requests of
+        lower priority are dropped to make room for new ones.
+
+        HTTP clients can set the priority and tenant of their requests with the
+        `serve_request_priority` and `serve_request_tenant` headers. Any client can
+        set these headers, so the proxy clamps their priorities to the range set by
+        the `RAY_SERVE_HTTP_MIN_REQUEST_PRIORITY` (default -64) and
+        `RAY_SERVE_HTTP_MAX_REQUEST_PRIORITY` (default 0) environment variables.
+        Only raise the max priority, or rely on the tenant header, if the proxies
+        are behind a trusted gateway that sets or strips these headers.
+
         Example:
 
         .. code-block:: python
@@ -798,7 +817,20 @@ class DeploymentHandle(_DeploymentHandleBase):
                 method_name="other_method",
                 multiplexed_model_id="model:v1",
             ).remote()
+
+            response: DeploymentResponse = handle.options(
+                priority=1,
+                tenant="interactive-users",
+            ).remote()
         """
+        if priority is not DEFAULT.VALUE and (
+            not isinstance(priority, int) or isinstance(priority, bool)
+        ):
+            raise TypeError(f"priority must be an int, got {type(priority)}.")
+
+        if tenant is not DEFAULT.VALUE and not isinstance(tenant, str):
+            raise TypeError(f"tenant must be a str, got {type(tenant)}.")
+
         if use_new_handle_api is not DEFAULT.VALUE:
             warnings.warn(
                 "Setting `use_new_handle_api` no longer has any effect. "
@@ -815,6 +847,8 @@ class DeploymentHandle(_DeploymentHandleBase):
             method_name=method_name,
             multiplexed_model_id=multiplexed_model_id,
             stream=stream,
+            priority=priority,
+            tenant=tenant,
             _prefer_local_routing=_prefer_local_routing,
         )
 
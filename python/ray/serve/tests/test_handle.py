@@ -67,6 +67,14 @@ def test_dynamic_handle_options():
     assert set_multiple.stream is True
     assert default_options._request_protocol == RequestProtocol.UNDEFINED
 
+    # Test setting priority and tenant.
+    assert default_options.priority == 0
+    assert default_options.tenant == ""
+    set_priority = default_options.copy_and_update(priority=1, tenant="a")
+    assert set_priority.priority == 1
+    assert set_priority.tenant == "a"
+    assert set_priority.copy_and_update(tenant=DEFAULT.VALUE).tenant == "a"
+
 
 def test_init_handle_options():
     default_options = _InitHandleOptions.create()
@@ -2,9 +2,13 @@ import sys
 
 import pytest
 
+from ray.serve import autoscaling_policy
+from ray.serve._private.autoscaling_simulator import simulate_autoscaling
 from ray.serve._private.constants import CONTROL_LOOP_INTERVAL_S
 from ray.serve.autoscaling_policy import (
     _calculate_desired_num_replicas,
+    _LoadForecaster,
+    predictive_autoscaling_policy,
     replica_queue_length_autoscaling_policy,
 )
 from ray.serve.config import AutoscalingConfig
@@ -636,5 +640,104 @@ class TestReplicaQueueLengthPolicy:
         assert new_num_replicas == ongoing_requests / target_requests
 
 
+def _periodic_load(t: float) -> float:
+    # Seasons of 10s, with no load for 5s followed by 20 requests for 5s.
+    return 0 if t % 10 < 5 else 20
+
+
+class TestPredictivePolicy:
+    @pytest.fixture
+    def short_seasons(self, monkeypatch):
+        monkeypatch.setattr(
+            autoscaling_policy, "RAY_SERVE_PREDICTIVE_AUTOSCALING_SAMPLE_INTERVAL_S", 1
+        )
+        monkeypatch.setattr(
+            autoscaling_policy, "RAY_SERVE_PREDICTIVE_AUTOSCALING_SEASON_PERIOD_S", 10
+        )
+        monkeypatch.setattr(
+            autoscaling_policy, "RAY_SERVE_PREDICTIVE_AUTOSCALING_LEAD_TIME_S", 3
+        )
+
+    def test_load_forecaster(self):
+        forecaster = _LoadForecaster(sample_interval_s=1, season_length=10)
+        assert forecaster.forecast(1) is None
+
+        t = 0
+        while t < 100:
+            forecaster.observe(t, _periodic_load(t))
+            t += 0.25
+        # The current sample has no load, but the load ramps up in the next one.
+        forecaster.observe(104, 0)
+        assert forecaster.forecast(1) == pytest.approx(0, abs=2)
+        assert forecaster.forecast(2) == pytest.approx(20, abs=2)
+        # The forecast is the max over the horizon.
+        assert forecaster.forecast(5) == pytest.approx(20, abs=2)
+
+        # Samples without observations are skipped.
+        forecaster.observe(122, 0)
+        assert forecaster.forecast(1) == pytest.approx(0, abs=2)
+        assert forecaster.forecast(4) == pytest.approx(20, abs=2)
+
+    def test_scale_ahead(self, short_seasons):
+        config = AutoscalingConfig(
+            min_replicas=1,
+            max_replicas=20,
+            target_ongoing_requests=2,
+            upscale_delay_s=30,
+        )
+        policy_state = {}
+        num_replicas = 1
+        t = 0
+        while t < 103:
+            num_replicas = predictive_autoscaling_policy(
+                curr_target_num_replicas=num_replicas,
+                total_num_requests=_periodic_load(t),
+                num_running_replicas=num_replicas,
+                config=config,
+                capacity_adjusted_min_replicas=1,
+                capacity_adjusted_max_replicas=20,
+                policy_state=policy_state,
+                now=t,
+            )
+            t += CONTROL_LOOP_INTERVAL_S
+        # There's no load yet, but the policy scales up for the forecast ramp,
+        # without waiting for the upscale delay.
+        assert num_replicas == pytest.approx(10, abs=1)
+
+    def test_simulate_autoscaling(self, short_seasons):
+        # Requests of 1s that keep 20 requests ongoing for 5s of every 10s.
+        trace = [
+            (season * 10 + 5 + i * 0.1, 1.0)
+            for season in range(8)
+            for i in range(50)
+            for _ in range(2)
+        ]
+        config = AutoscalingConfig(
+            min_replicas=1,
+            max_replicas=20,
+            target_ongoing_requests=2,
+            upscale_delay_s=3,
+            downscale_delay_s=5,
+            look_back_period_s=1,
+        )
+
+        reactive = simulate_autoscaling(
+            trace,
+            config,
+            policy=replica_queue_length_autoscaling_policy,
+            replica_startup_s=2,
+        )
+        predictive = simulate_autoscaling(
+            trace,
+            config,
+            policy=predictive_autoscaling_policy,
+            replica_startup_s=2,
+        )
+        assert reactive.max_num_replicas == 10
+        # Scaling ahead of the ramps starts the replicas before the requests
+        # arrive, so the deployment is overloaded for less time.
+        assert predictive.overloaded_s < reactive.overloaded_s / 2
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", "-s", __file__]))
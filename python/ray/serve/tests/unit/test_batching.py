@@ -11,7 +11,7 @@ from ray._private.utils import get_or_create_event_loop
 from ray.serve._private.common import DeploymentID, ReplicaID
 from ray.serve._private.config import DeploymentConfig
 from ray.serve._private.constants import SERVE_LOGGER_NAME
-from ray.serve.batching import _BatchQueue
+from ray.serve.batching import _AdaptiveBatchController, _BatchQueue
 from ray.serve.exceptions import RayServeException
 
 # Setup the global replica context for the test.
@@ -119,6 +119,25 @@ async def test_decorator_validation():
             async def method(self, requests):
                 pass
 
+    class TargetLatency:
+        @serve.batch(target_latency_s=0.1)
+        async def method(self, requests):
+            pass
+
+    with pytest.raises(ValueError):
+
+        class ZeroTargetLatency:
+            @serve.batch(target_latency_s=0)
+            async def method(self, requests):
+                pass
+
+    with pytest.raises(TypeError):
+
+        class NonTargetLatency:
+            @serve.batch(target_latency_s="a")
+            async def method(self, requests):
+                pass
+
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize("use_class", [True, False])
@@ -845,6 +864,79 @@ def test_warn_if_max_batch_size_exceeds_max_ongoing_requests():
         stream.reset_message()
 
 
+def test_adaptive_batch_controller():
+    controller = _AdaptiveBatchController(
+        "test", max_batch_size=64, max_batch_wait_timeout_s=0.25, target_latency_s=1
+    )
+    assert controller.batch_size == 64
+    assert controller.batch_wait_timeout_s == 0.25
+
+    def execution_time_s(batch_size: int) -> float:
+        return 0.125 + batch_size / 64
+
+    def adjust(latency_s: float):
+        """Run batches of the current size until the settings are adjusted."""
+        batch_size = controller.batch_size
+        while True:
+            controller.on_batch_finished(
+                execution_time_s(batch_size), [latency_s] * batch_size
+            )
+            if not controller._latencies_s:
+                return
+
+    # The latency exceeds the target, so the batch size is decreased.
+    adjust(2.0)
+    assert controller.batch_size == 48
+    # No time is left in the target after executing a batch of the last size.
+    assert controller.batch_wait_timeout_s == 0
+    adjust(2.0)
+    assert controller.batch_size == 36
+
+    # The latency is below the target, so the batch size is increased, up to the
+    # largest batch size whose predicted execution time fits in the target.
+    adjust(0.1)
+    assert controller.batch_size == 45
+    for _ in range(3):
+        adjust(0.1)
+    assert 45 < controller.batch_size < 64
+    assert execution_time_s(controller.batch_size) <= 1
+    # Half of the time left in the target is spent waiting for the batch to fill.
+    assert controller.batch_wait_timeout_s == pytest.approx(
+        0.5 * (1 - execution_time_s(controller.batch_size))
+    )
+
+    # The settings are bounded by the configured ones.
+    controller.set_max_batch_size(32)
+    assert controller.batch_size == 32
+    controller.set_max_batch_wait_timeout_s(0)
+    assert controller.batch_wait_timeout_s == 0
+    adjust(0.1)
+    assert controller.batch_size == 32
+    assert controller.batch_wait_timeout_s == 0
+
+
+@pytest.mark.asyncio
+async def test_adaptive_batching():
+    """The batch size is decreased if the batches take too long to meet the
+    latency target."""
+
+    @serve.batch(max_batch_size=32, batch_wait_timeout_s=0.01, target_latency_s=0.05)
+    async def handler(requests):
+        await asyncio.sleep(0.005 * len(requests))
+        return requests
+
+    assert handler._get_effective_batch_settings() == (32, 0.01)
+
+    for _ in range(10):
+        results = await asyncio.gather(*[handler(i) for i in range(32)])
+        assert results == list(range(32))
+
+    max_batch_size, batch_wait_timeout_s = handler._get_effective_batch_settings()
+    assert max_batch_size < 32
+    assert batch_wait_timeout_s <= 0.01
+    assert handler._get_max_batch_size() == 32
+
+
 if __name__ == "__main__":
     import sys
 
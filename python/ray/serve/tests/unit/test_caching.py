@@ -0,0 +1,223 @@
+import asyncio
+import gc
+
+import pytest
+
+import ray
+from ray import serve
+from ray._private.utils import get_or_create_event_loop
+from ray.serve._private.common import DeploymentID, ReplicaID
+from ray.serve._private.config import DeploymentConfig
+
+# Setup the global replica context for the test.
+ray.serve.context._set_internal_replica_context(
+    replica_id=ReplicaID(unique_id="test", deployment_id=DeploymentID(name="test")),
+    servable_object=None,
+    _deployment_config=DeploymentConfig(),
+)
+
+
+# We use a single event loop for the entire test session. Without this
+# fixture, the event loop is sometimes prematurely terminated by pytest.
+@pytest.fixture(scope="session")
+def event_loop():
+    loop = get_or_create_event_loop()
+    yield loop
+    loop.close()
+
+
+def test_decorator_validation():
+    with pytest.raises(TypeError, match="async def"):
+
+        @serve.cache
+        def sync_function(x):
+            pass
+
+    with pytest.raises(TypeError, match="async def"):
+
+        @serve.cache
+        async def generator_function(x):
+            yield x
+
+    with pytest.raises(ValueError, match="max_bytes"):
+        serve.cache(max_bytes=0)
+
+    with pytest.raises(ValueError, match="ttl_s"):
+        serve.cache(ttl_s=-1)
+
+    with pytest.raises(TypeError, match="key_fn"):
+        serve.cache(key_fn="key")
+
+
+@pytest.mark.asyncio
+async def test_cache_function():
+    calls = []
+
+    @serve.cache
+    async def double(x, y=0):
+        calls.append((x, y))
+        return 2 * x + y
+
+    assert await double(1) == 2
+    assert await double(1) == 2
+    assert await double(1, y=1) == 3
+    assert await double(2) == 4
+    assert calls == [(1, 0), (1, 1), (2, 0)]
+
+    double.cache_clear()
+    assert await double(1) == 2
+    assert calls == [(1, 0), (1, 1), (2, 0), (1, 0)]
+
+
+@pytest.mark.asyncio
+async def test_cache_method_key_fn():
+    class Model:
+        def __init__(self):
+            self.num_calls = 0
+
+        @serve.cache(key_fn=lambda request: request["prompt"])
+        async def generate(self, request):
+            self.num_calls += 1
+            return request["prompt"].upper()
+
+    model = Model()
+    assert await model.generate({"prompt": "hi", "id": 1}) == "HI"
+    assert await model.generate({"prompt": "hi", "id": 2}) == "HI"
+    assert model.num_calls == 1
+
+    # Each instance has its own cache.
+    other_model = Model()
+    assert await other_model.generate({"prompt": "hi", "id": 3}) == "HI"
+    assert other_model.num_calls == 1
+    assert len(Model.generate._get_cache(model)) == 1
+    assert len(Model.generate._get_cache(other_model)) == 1
+
+    Model.generate.cache_clear()
+    assert len(Model.generate._get_cache(model)) == 0
+    assert len(Model.generate._get_cache(other_model)) == 0
+
+    @serve.cache
+    async def unhashable(request):
+        return request
+
+    with pytest.raises(TypeError, match="key_fn"):
+        await unhashable({"prompt": "hi"})
+
+
+@pytest.mark.asyncio
+async def test_cache_lru_eviction():
+    calls = []
+
+    @serve.cache(max_bytes=10)
+    async def get(key):
+        calls.append(key)
+        return "x" * 4
+
+    await get("a")
+    await get("b")
+    # Make "a" the most recently used, so that "b" is evicted.
+    await get("a")
+    await get("c")
+    assert get._get_cache().size_bytes == 8
+
+    await get("a")
+    await get("b")
+    assert calls == ["a", "b", "c", "b"]
+
+    # Responses larger than the cache aren't cached.
+    @serve.cache(max_bytes=2)
+    async def get_large(key):
+        calls.append(key)
+        return "x" * 4
+
+    await get_large("d")
+    await get_large("d")
+    assert calls == ["a", "b", "c", "b", "d", "d"]
+    assert len(get_large._get_cache()) == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_ttl():
+    num_calls = 0
+
+    @serve.cache(ttl_s=0.1)
+    async def get(key):
+        nonlocal num_calls
+        num_calls += 1
+        return key
+
+    await get("a")
+    await get("a")
+    assert num_calls == 1
+
+    await asyncio.sleep(0.2)
+    await get("a")
+    assert num_calls == 2
+    await get("a")
+    assert num_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_coalescing():
+    num_calls = 0
+    event = asyncio.Event()
+
+    @serve.cache
+    async def get(key):
+        nonlocal num_calls
+        num_calls += 1
+        await event.wait()
+        return key
+
+    tasks = [asyncio.ensure_future(get("a")) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    # Cancelling one of the callers doesn't cancel the pending call.
+    tasks[0].cancel()
+    event.set()
+    assert await asyncio.gather(*tasks[1:]) == ["a"] * 4
+    assert num_calls == 1
+
+    # Exceptions are propagated to all the coalesced callers, and aren't cached.
+    event.clear()
+
+    @serve.cache
+    async def fail(key):
+        nonlocal num_calls
+        num_calls += 1
+        await event.wait()
+        raise ValueError(key)
+
+    tasks = [asyncio.ensure_future(fail("b")) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    event.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+    assert num_calls == 2
+
+    with pytest.raises(ValueError):
+        await fail("b")
+    assert num_calls == 3
+
+    # The exception is retrieved even if the only caller was cancelled.
+    event.clear()
+    loop = asyncio.get_running_loop()
+    unhandled_errors = []
+    loop.set_exception_handler(lambda _, context: unhandled_errors.append(context))
+    try:
+        task = asyncio.ensure_future(fail("c"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        event.set()
+        await asyncio.sleep(0.01)
+        del task
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+    assert num_calls == 4
+    assert unhandled_errors == []
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s", __file__]))
@@ -27,7 +27,11 @@ from ray.serve._private.replica_scheduler import (
     PowerOfTwoChoicesReplicaScheduler,
     ReplicaWrapper,
 )
-from ray.serve._private.replica_scheduler.pow_2_scheduler import ReplicaQueueLengthCache
+from ray.serve._private.replica_scheduler.pow_2_scheduler import (
+    PendingRequestQueue,
+    ReplicaLatencyTracker,
+    ReplicaQueueLengthCache,
+)
 from ray.serve._private.test_utils import MockTimer
 
 TIMER = MockTimer()
@@ -149,6 +153,9 @@ def pow_2_scheduler(request) -> PowerOfTwoChoicesReplicaScheduler:
             use_replica_queue_len_cache=request.param.get(
                 "use_replica_queue_len_cache", False
             ),
+            use_latency_aware_scheduling=request.param.get(
+                "use_latency_aware_scheduling", False
+            ),
             get_curr_time_s=TIMER.time,
         )
         scheduler.backoff_sequence_s = [0, 0.001, 0.001, 0.001, 0.001, 0.001, 0.001]
@@ -175,7 +182,11 @@ def pow_2_scheduler(request) -> PowerOfTwoChoicesReplicaScheduler:
 
 
 def fake_pending_request(
-    *, created_at: Optional[float] = None, model_id: str = ""
+    *,
+    created_at: Optional[float] = None,
+    model_id: str = "",
+    priority: int = 0,
+    tenant: str = "",
 ) -> PendingRequest:
     if created_at is not None:
         return PendingRequest(
@@ -186,6 +197,8 @@ def fake_pending_request(
                 internal_request_id=str(uuid.uuid4()),
                 endpoint="endpoint",
                 multiplexed_model_id=model_id,
+                priority=priority,
+                tenant=tenant,
             ),
             created_at=created_at,
         )
@@ -198,6 +211,8 @@ def fake_pending_request(
                 internal_request_id=str(uuid.uuid4()),
                 endpoint="endpoint",
                 multiplexed_model_id=model_id,
+                priority=priority,
+                tenant=tenant,
             ),
         )
 
@@ -1803,5 +1818,198 @@ async def test_replicas_actor_unavailable_error(
         assert (await s.choose_replica_for_request(fake_pending_request())) == r1
 
 
+def test_replica_latency_tracker():
+    t = ReplicaLatencyTracker(alpha=0.5)
+
+    d_id = DeploymentID(name="TEST_DEPLOYMENT")
+    replica_id_1 = ReplicaID("r1", deployment_id=d_id)
+    replica_id_2 = ReplicaID("r2", deployment_id=d_id)
+    assert t.get(replica_id_1) is None
+    assert t.get_mean() is None
+
+    # The first latency initializes the average.
+    t.update(replica_id_1, 1.0)
+    assert t.get(replica_id_1) == 1.0
+    t.update(replica_id_1, 2.0)
+    assert t.get(replica_id_1) == 1.5
+    t.update(replica_id_2, 0.5)
+    assert t.get(replica_id_2) == 0.5
+    assert t.get_mean() == 1.0
+
+    t.remove_inactive_replicas(active_replica_ids={replica_id_2})
+    assert t.get(replica_id_1) is None
+    assert t.get_mean() == 0.5
+
+    with pytest.raises(ValueError):
+        ReplicaLatencyTracker(alpha=0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "pow_2_scheduler",
+    [
+        {"use_latency_aware_scheduling": False},
+        {"use_latency_aware_scheduling": True},
+    ],
+    indirect=True,
+)
+async def test_latency_aware_scheduling(pow_2_scheduler):
+    """
+    Verify that with latency-aware scheduling, a replica with a longer queue is
+    chosen if its expected completion time is lower.
+    """
+    s = pow_2_scheduler
+    latency_aware = s.use_latency_aware_scheduling
+
+    r1 = FakeReplicaWrapper("r1")
+    r1.set_queue_len_response(1)
+    r2 = FakeReplicaWrapper("r2")
+    r2.set_queue_len_response(3)
+    s.update_replicas([r1, r2])
+
+    # No latencies are known yet, so the queue lengths are compared.
+    assert (await s.choose_replica_for_request(fake_pending_request())) == r1
+
+    # Average service times: r1: 1.0s, r2: 0.1s.
+    # Expected completion times: r1: 2 * 1.0s, r2: 4 * 0.1s.
+    s.on_request_completed(r1.replica_id, 1.0)
+    s.on_request_completed(r2.replica_id, 0.1)
+    for _ in range(10):
+        replica = await s.choose_replica_for_request(fake_pending_request())
+        assert replica == (r2 if latency_aware else r1)
+
+    # A replica whose service time is unknown is assumed to have the mean one.
+    r3 = FakeReplicaWrapper("r3")
+    r3.set_queue_len_response(0)
+    score = s._get_scheduling_score(r3.replica_id, 1)
+    assert score == pytest.approx(2 * 0.55 if latency_aware else 1)
+
+    # Service times of replicas that were removed are dropped.
+    s.update_replicas([r2, r3])
+    s.on_request_completed(r1.replica_id, 1.0)
+    assert s.replica_latency_tracker.get(r1.replica_id) is None
+    if latency_aware:
+        assert s.replica_latency_tracker.get(r2.replica_id) == 0.1
+    else:
+        assert s.replica_latency_tracker.get(r2.replica_id) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "pow_2_scheduler",
+    [{"use_latency_aware_scheduling": True}],
+    indirect=True,
+)
+async def test_latency_aware_scheduling_accounts_for_queue(pow_2_scheduler):
+    """
+    Verify that with latency-aware scheduling, a fast replica with a deep queue
+    loses to an idle, slightly slower one.
+    """
+    s = pow_2_scheduler
+
+    fast = FakeReplicaWrapper("fast")
+    fast.set_queue_len_response(8)
+    slow = FakeReplicaWrapper("slow")
+    slow.set_queue_len_response(0)
+    s.update_replicas([fast, slow])
+
+    # The latency is divided by the number of requests sharing the replica when it
+    # was sent to estimate the service time of a single request.
+    s.on_request_completed(fast.replica_id, 1.0, num_requests_ahead=9)
+    s.on_request_completed(slow.replica_id, 0.12)
+    assert s.replica_latency_tracker.get(fast.replica_id) == pytest.approx(0.1)
+    assert s.replica_latency_tracker.get(slow.replica_id) == pytest.approx(0.12)
+
+    # Expected completion times: fast: 9 * 0.1s, slow: 1 * 0.12s.
+    for _ in range(10):
+        replica = await s.choose_replica_for_request(fake_pending_request())
+        assert replica == slow
+
+    # Once the queue of the fast replica drains, it's preferred again.
+    fast.set_queue_len_response(0)
+    for _ in range(10):
+        replica = await s.choose_replica_for_request(fake_pending_request())
+        assert replica == fast
+
+
+@pytest.mark.asyncio
+async def test_pending_request_queue():
+    q = PendingRequestQueue()
+    assert len(q) == 0
+    assert q.peek() is None
+    with pytest.raises(IndexError):
+        q.popleft()
+
+    # A single flow is popped in FIFO order, retried requests are inserted in
+    # creation order.
+    start = time.time()
+    prs = [fake_pending_request(created_at=start + i) for i in range(3)]
+    q.append(prs[0])
+    q.append(prs[2])
+    q.insert_in_creation_order(prs[1])
+    assert list(q) == prs
+    assert q.peek() == prs[0]
+    assert [q.popleft() for _ in range(3)] == prs
+
+    # Tenants of the same priority are popped in turns.
+    a = [fake_pending_request(created_at=start + i, tenant="a") for i in range(3)]
+    b = [fake_pending_request(created_at=start + 3 + i, tenant="b") for i in range(3)]
+    for pr in a + b:
+        q.append(pr)
+    assert [q.popleft() for _ in range(6)] == [a[0], b[0], a[1], b[1], a[2], b[2]]
+
+    # Higher priorities get a larger share of the popped requests, but the lower
+    # priorities aren't starved.
+    low = [fake_pending_request(created_at=start + i, priority=0) for i in range(10)]
+    high = [fake_pending_request(created_at=start + i, priority=1) for i in range(10)]
+    for pr in low + high:
+        q.append(pr)
+    assert len(q) == 20
+    popped = [q.popleft() for _ in range(10)]
+    assert popped == high[:3] + low[:1] + high[3:7] + low[1:2] + high[7:8]
+
+    # Removed requests aren't popped.
+    q.remove(low[2])
+    q.remove(low[2])
+    assert len(q) == 9
+    assert low[2] not in list(q)
+
+
+@pytest.mark.asyncio
+async def test_shed_lower_priority_request(pow_2_scheduler):
+    """
+    Verify that the newest pending request of the lowest priority is shed, and that
+    requests of the same or higher priority are never shed.
+    """
+    s = pow_2_scheduler
+    loop = get_or_create_event_loop()
+
+    start = time.time()
+    prs = [
+        fake_pending_request(created_at=start, priority=0),
+        fake_pending_request(created_at=start + 1, priority=0),
+        fake_pending_request(created_at=start + 2, priority=1),
+    ]
+    tasks = [loop.create_task(s.choose_replica_for_request(pr)) for pr in prs]
+    done, _ = await asyncio.wait(tasks, timeout=0.01)
+    assert len(done) == 0
+
+    error = RuntimeError("shed")
+    assert not s.shed_lower_priority_request(0, error)
+    assert s.shed_lower_priority_request(2, error)
+    with pytest.raises(RuntimeError, match="shed"):
+        await tasks[1]
+    assert s.shed_lower_priority_request(1, error)
+    with pytest.raises(RuntimeError, match="shed"):
+        await tasks[0]
+    assert not s.shed_lower_priority_request(1, error)
+    assert s.num_pending_requests == 1
+
+    r1 = FakeReplicaWrapper("r1")
+    r1.set_queue_len_response(0)
+    s.update_replicas([r1])
+    assert (await tasks[2]) == r1
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", "-s", __file__]))
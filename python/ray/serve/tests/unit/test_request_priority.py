@@ -0,0 +1,117 @@
+import sys
+import uuid
+
+import pytest
+
+from ray.serve._private.common import RequestMetadata
+from ray.serve._private.request_priority import (
+    FairShareAdmissionController,
+    clamp_http_request_priority,
+    get_priority_weight,
+    get_request_flow,
+)
+from ray.serve._private.test_utils import MockTimer
+
+
+def fake_request_metadata(*, priority: int = 0, tenant: str = "") -> RequestMetadata:
+    return RequestMetadata(
+        request_id=str(uuid.uuid4()),
+        internal_request_id=str(uuid.uuid4()),
+        endpoint="endpoint",
+        priority=priority,
+        tenant=tenant,
+    )
+
+
+def test_get_request_flow():
+    assert get_request_flow(fake_request_metadata()) == (0, "")
+    assert get_request_flow(fake_request_metadata(priority=1, tenant="a")) == (1, "a")
+
+    assert get_priority_weight(0) == 1
+    assert get_priority_weight(1) > get_priority_weight(0)
+    assert get_priority_weight(-1) < get_priority_weight(0)
+    # Large priorities don't overflow.
+    assert get_priority_weight(10**6) == get_priority_weight(10**7)
+
+
+def test_clamp_http_request_priority():
+    # By default, HTTP clients can only lower the priority of their requests.
+    assert clamp_http_request_priority(64) == 0
+    assert clamp_http_request_priority(0) == 0
+    assert clamp_http_request_priority(-1) == -1
+    assert clamp_http_request_priority(-100) == -64
+
+    assert clamp_http_request_priority(64, min_priority=0, max_priority=2) == 2
+    assert clamp_http_request_priority(-1, min_priority=0, max_priority=2) == 0
+
+
+class TestFairShareAdmissionController:
+    def test_single_flow(self):
+        c = FairShareAdmissionController(get_curr_time_s=MockTimer().time)
+        metadata = fake_request_metadata()
+
+        # A single flow can use the whole replica.
+        for num_ongoing_requests in range(4):
+            assert c.try_admit(metadata, num_ongoing_requests, 4)
+        assert not c.try_admit(metadata, 4, 4)
+
+    def test_priorities(self):
+        c = FairShareAdmissionController(get_curr_time_s=MockTimer().time)
+        high = fake_request_metadata(priority=1)
+        low = fake_request_metadata(priority=0)
+
+        for num_ongoing_requests in range(3):
+            assert c.try_admit(low, num_ongoing_requests, 4)
+
+        # The high priority requests are below their share of the replica.
+        assert c.try_admit(high, 3, 4)
+        assert not c.try_admit(low, 4, 4)
+
+        # The capacity that is released by a low priority request is reserved for
+        # the high priority requests, which are entitled to ceil(4 * 4 / 5) of it.
+        c.on_request_finished(low)
+        assert not c.try_admit(low, 3, 4)
+        assert c.try_admit(high, 3, 4)
+
+    def test_tenants(self):
+        c = FairShareAdmissionController(get_curr_time_s=MockTimer().time)
+        a = fake_request_metadata(tenant="a")
+        b = fake_request_metadata(tenant="b")
+
+        assert c.try_admit(a, 0, 4)
+        assert c.try_admit(b, 1, 4)
+        assert c.try_admit(a, 2, 4)
+        # Tenant "a" is at its share, so the rest is reserved for tenant "b".
+        assert not c.try_admit(a, 3, 4)
+        assert c.try_admit(b, 3, 4)
+
+    def test_inactive_flows(self):
+        timer = MockTimer()
+        c = FairShareAdmissionController(
+            active_flow_timeout_s=1, get_curr_time_s=timer.time
+        )
+        a = fake_request_metadata(tenant="a")
+        b = fake_request_metadata(tenant="b")
+
+        assert c.try_admit(b, 0, 4)
+        assert c.try_admit(a, 1, 4)
+        assert c.try_admit(a, 2, 4)
+        assert not c.try_admit(a, 3, 4)
+
+        # Tenant "b" stays active while it has ongoing requests.
+        timer.advance(2)
+        assert not c.try_admit(a, 3, 4)
+        assert c.try_admit(b, 3, 4)
+
+        # Once its requests finish, tenant "b" is active until the timeout after
+        # its last request.
+        c.on_request_finished(b)
+        c.on_request_finished(b)
+        assert not c.try_admit(a, 2, 4)
+        timer.advance(2)
+        assert c.try_admit(a, 2, 4)
+        assert c.try_admit(a, 3, 4)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", "-s", __file__]))
@@ -26,7 +26,11 @@ from ray.serve._private.replica_scheduler import (
     ReplicaScheduler,
     ReplicaWrapper,
 )
-from ray.serve._private.replica_scheduler.pow_2_scheduler import ReplicaQueueLengthCache
+from ray.serve._private.replica_scheduler.pow_2_scheduler import (
+    PowerOfTwoChoicesReplicaScheduler,
+    ReplicaQueueLengthCache,
+)
+from ray.serve._private.request_priority import FairShareAdmissionController
 from ray.serve._private.router import QUEUED_REQUESTS_KEY, Router, RouterMetricsManager
 from ray.serve._private.test_utils import FakeCounter, FakeGauge, MockTimer
 from ray.serve._private.utils import get_random_string
@@ -106,6 +110,73 @@ class FakeReplica(ReplicaWrapper):
         )
 
 
+class FairShareFakeReplica(ReplicaWrapper):
+    """Fake replica that admits requests with a `FairShareAdmissionController`."""
+
+    def __init__(self, replica_id: ReplicaID, *, max_ongoing_requests: int):
+        self._replica_id = replica_id
+        self._max_ongoing_requests = max_ongoing_requests
+        self._admission_controller = FairShareAdmissionController()
+        self.num_ongoing_requests = 0
+        self.num_rejections = 0
+
+    @property
+    def replica_id(self) -> ReplicaID:
+        return self._replica_id
+
+    @property
+    def node_id(self) -> str:
+        return ""
+
+    @property
+    def availability_zone(self) -> Optional[str]:
+        return None
+
+    @property
+    def multiplexed_model_ids(self) -> Set[str]:
+        return set()
+
+    @property
+    def max_ongoing_requests(self) -> int:
+        return self._max_ongoing_requests
+
+    @property
+    def is_cross_language(self) -> bool:
+        return False
+
+    async def get_queue_len(self, *, deadline_s: float) -> int:
+        return self.num_ongoing_requests
+
+    def send_request(self, pr: PendingRequest) -> FakeReplicaResult:
+        raise NotImplementedError
+
+    async def send_request_with_rejection(
+        self, pr: PendingRequest
+    ) -> Tuple[Optional[FakeReplicaResult], ReplicaQueueLengthInfo]:
+        if not self._admission_controller.try_admit(
+            pr.metadata, self.num_ongoing_requests, self._max_ongoing_requests
+        ):
+            self.num_rejections += 1
+            return None, ReplicaQueueLengthInfo(
+                accepted=False,
+                num_ongoing_requests=self.num_ongoing_requests,
+                rejected_for_fair_share=(
+                    self.num_ongoing_requests < self._max_ongoing_requests
+                ),
+            )
+
+        self.num_ongoing_requests += 1
+        return FakeReplicaResult(
+            self._replica_id, is_generator_object=False
+        ), ReplicaQueueLengthInfo(
+            accepted=True, num_ongoing_requests=self.num_ongoing_requests
+        )
+
+    def finish_request(self, request_metadata: RequestMetadata):
+        self.num_ongoing_requests -= 1
+        self._admission_controller.on_request_finished(request_metadata)
+
+
 class FakeReplicaScheduler(ReplicaScheduler):
     def __init__(self, use_queue_len_cache: bool):
         self._block_requests = False
@@ -665,6 +736,67 @@ class TestAssignRequest:
         assert fake_replica_scheduler.replica_queue_len_cache.get(r1_id) is None
         assert fake_replica_scheduler.replica_queue_len_cache.get(r2_id) == 15
 
+    async def test_fair_share_rejection_backoff(self):
+        """A replica that rejects a flow for fair share isn't sent the requests of
+        the flow in a loop, and stays available to the other flows."""
+        loop = get_or_create_event_loop()
+        d_id = DeploymentID(name="test-deployment")
+        scheduler = PowerOfTwoChoicesReplicaScheduler(
+            loop,
+            d_id,
+            DeploymentHandleSource.UNKNOWN,
+            use_replica_queue_len_cache=True,
+        )
+        replica = FairShareFakeReplica(
+            ReplicaID(unique_id="r1", deployment_id=d_id), max_ongoing_requests=4
+        )
+        scheduler.update_replicas([replica])
+        router = Router(
+            controller_handle=Mock(),
+            deployment_id=d_id,
+            handle_id="test-handle-id",
+            self_actor_id="test-node-id",
+            handle_source=DeploymentHandleSource.UNKNOWN,
+            event_loop=loop,
+            enable_strict_max_ongoing_requests=True,
+            replica_scheduler=scheduler,
+        )
+
+        def request_metadata(request_id: str, priority: int) -> RequestMetadata:
+            return RequestMetadata(
+                request_id=request_id,
+                internal_request_id=request_id,
+                endpoint="",
+                priority=priority,
+                tenant=f"tenant-{priority}",
+            )
+
+        # The high priority flow is entitled to all the 4 slots of the replica, and
+        # the low priority flow to 1.
+        low_0 = request_metadata("low-0", priority=0)
+        await router.assign_request(low_0)
+        await router.assign_request(request_metadata("high-0", priority=1))
+
+        # The replica has free slots, but rejects the next low priority request to
+        # hold them for the high priority flow.
+        low_task = loop.create_task(
+            router.assign_request(request_metadata("low-1", priority=0))
+        )
+        await asyncio.sleep(0.5)
+        assert not low_task.done()
+        assert 1 <= replica.num_rejections <= 10
+
+        # The high priority flow is still admitted.
+        await asyncio.wait_for(
+            router.assign_request(request_metadata("high-1", priority=1)), timeout=5
+        )
+        assert replica.num_ongoing_requests == 3
+
+        # Once the low priority flow is below its share, its request is admitted.
+        replica.finish_request(low_0)
+        await asyncio.wait_for(low_task, timeout=5)
+        assert replica.num_ongoing_requests == 3
+
 
 def running_replica_info(replica_id: ReplicaID) -> RunningReplicaInfo:
     return RunningReplicaInfo(
@@ -0,0 +1,157 @@
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import numpy as np
+
+import ray
+from ray.data.random_access_dataset import RandomAccessDataset
+
+from benchmark import Benchmark, BenchmarkMetric
+
+
+def sample_keys(num_rows: int, num_keys: int, zipf_alpha: float) -> List[int]:
+    """Sample keys uniformly, or skewed towards hot keys if `zipf_alpha` is set."""
+    if zipf_alpha > 0:
+        keys = np.random.zipf(zipf_alpha, num_keys) - 1
+        return (keys % num_rows).tolist()
+    return np.random.randint(0, num_rows, num_keys).tolist()
+
+
+def run_lookups(
+    rad: RandomAccessDataset,
+    num_rows: int,
+    num_clients: int,
+    num_threads_per_client: int,
+    batch_size: int,
+    zipf_alpha: float,
+    run_time_s: float,
+) -> Dict[str, float]:
+    @ray.remote(scheduling_strategy="SPREAD")
+    def multiget_client(start: float) -> int:
+        total = 0
+        while time.time() - start < run_time_s:
+            rad.multiget(sample_keys(num_rows, batch_size, zipf_alpha))
+            total += batch_size
+        return total
+
+    @ray.remote(scheduling_strategy="SPREAD")
+    def get_client(start: float) -> int:
+        # Call `get_async()` from several threads, so that concurrent calls can be
+        # coalesced if `batch_wait_timeout_s` is set.
+        def get_thread() -> int:
+            total = 0
+            while time.time() - start < run_time_s:
+                keys = sample_keys(num_rows, 100, zipf_alpha)
+                ray.get([rad.get_async(key) for key in keys])
+                total += len(keys)
+            return total
+
+        with ThreadPoolExecutor(max_workers=num_threads_per_client) as executor:
+            futures = [
+                executor.submit(get_thread) for _ in range(num_threads_per_client)
+            ]
+            return sum(future.result() for future in futures)
+
+    start = time.time()
+    total = sum(ray.get([multiget_client.remote(start) for _ in range(num_clients)]))
+    multiget_qps = total / (time.time() - start)
+
+    start = time.time()
+    total = sum(ray.get([get_client.remote(start) for _ in range(num_clients)]))
+    get_qps = total / (time.time() - start)
+
+    return {
+        BenchmarkMetric.THROUGHPUT: multiget_qps,
+        "multiget_qps": multiget_qps,
+        "get_qps": get_qps,
+    }
+
+
+def run_random_access_benchmark(benchmark: Benchmark, args: argparse.Namespace):
+    ds = ray.data.range(
+        args.num_rows, override_num_blocks=args.num_blocks
+    ).materialize()
+
+    for num_workers in args.num_workers:
+        for batch_wait_timeout_s in args.batch_wait_timeouts_s:
+            rad = ds.to_random_access_dataset(
+                "id",
+                num_workers=num_workers,
+                replication_factor=args.replication_factor,
+                cache_size=args.cache_size,
+                batch_wait_timeout_s=batch_wait_timeout_s,
+            )
+            benchmark.run_fn(
+                f"random-access-{num_workers}-workers-batch-wait-"
+                f"{batch_wait_timeout_s}s",
+                run_lookups,
+                rad,
+                args.num_rows,
+                args.num_clients,
+                args.num_threads_per_client,
+                args.batch_size,
+                args.zipf_alpha,
+                args.run_time_s,
+            )
+            print(rad.stats())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark of the lookups/sec of RandomAccessDataset versus the "
+        "number of workers."
+    )
+    parser.add_argument("--num-rows", type=int, default=100_000_000)
+    parser.add_argument("--num-blocks", type=int, default=200)
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8, 16],
+        help="The numbers of workers to benchmark.",
+    )
+    parser.add_argument("--replication-factor", type=int, default=1)
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=0,
+        help="The max number of records cached by each worker.",
+    )
+    parser.add_argument("--num-clients", type=int, default=4)
+    parser.add_argument(
+        "--num-threads-per-client",
+        type=int,
+        default=16,
+        help="The number of threads of each client that call get_async.",
+    )
+    parser.add_argument(
+        "--batch-wait-timeouts-s",
+        type=float,
+        nargs="+",
+        default=[0, 0.001],
+        help="The batch_wait_timeout_s values to benchmark. 0 disables batching "
+        "of concurrent get_async calls.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="The number of keys of each multiget call.",
+    )
+    parser.add_argument(
+        "--zipf-alpha",
+        type=float,
+        default=0,
+        help="If set, sample keys from a Zipf distribution with this parameter, "
+        "to benchmark hot keys. Otherwise, sample keys uniformly.",
+    )
+    parser.add_argument("--run-time-s", type=float, default=15)
+    args = parser.parse_args()
+
+    ray.init(address="auto")
+
+    benchmark = Benchmark("random-access")
+    run_random_access_benchmark(benchmark, args)
+    benchmark.write_result()
@@ -0,0 +1,78 @@
+import argparse
+import os
+import tempfile
+import time
+from typing import Dict
+
+import ray
+from ray.data.dataset import Dataset
+
+from benchmark import Benchmark, BenchmarkMetric
+
+
+def iter_batches(ds: Dataset, batch_size: int) -> Dict[str, float]:
+    start = time.perf_counter()
+    num_rows = 0
+    for batch in ds.iter_batches(batch_size=batch_size, batch_format="pyarrow"):
+        num_rows += len(batch)
+    return {BenchmarkMetric.THROUGHPUT: num_rows / (time.perf_counter() - start)}
+
+
+def run_read_arrow_ipc_benchmark(benchmark: Benchmark, args: argparse.Namespace):
+    ds = ray.data.read_parquet(
+        "s3://anonymous@air-example-data/ursa-labs-taxi-data/by_year/2018/01"
+    ).repartition(args.num_files)
+    # Materialize the input once, so that both writes get the same blocks without
+    # running the read and repartition again.
+    ds = ds.materialize()
+
+    # Write the data to node-local scratch space in both formats, and compare the
+    # throughput of reading and iterating over it.
+    scratch_dir = tempfile.mkdtemp(dir=args.scratch_dir)
+    parquet_dir = os.path.join(scratch_dir, "parquet")
+    arrow_ipc_dir = os.path.join(scratch_dir, "arrow_ipc")
+    ds.write_parquet(f"local://{parquet_dir}")
+    ds.write_arrow_ipc(f"local://{arrow_ipc_dir}")
+
+    for batch_size in args.batch_sizes:
+        benchmark.run_fn(
+            f"iter-batches-parquet-{batch_size}",
+            iter_batches,
+            ray.data.read_parquet(f"local://{parquet_dir}"),
+            batch_size,
+        )
+        for memory_map in [True, False]:
+            benchmark.run_fn(
+                f"iter-batches-arrow-ipc-memory-map-{memory_map}-{batch_size}",
+                iter_batches,
+                ray.data.read_arrow_ipc(
+                    f"local://{arrow_ipc_dir}", memory_map=memory_map
+                ),
+                batch_size,
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark of iter_batches over Arrow IPC files versus Parquet "
+        "files on local disk."
+    )
+    parser.add_argument("--num-files", type=int, default=12)
+    parser.add_argument(
+        "--batch-sizes",
+        type=int,
+        nargs="+",
+        default=[4 * 1024, 64 * 1024],
+    )
+    parser.add_argument(
+        "--scratch-dir",
+        type=str,
+        default=None,
+        help="The local directory to write the files to. Defaults to a temporary "
+        "directory.",
+    )
+    args = parser.parse_args()
+
+    benchmark = Benchmark("read-arrow-ipc")
+    run_read_arrow_ipc_benchmark(benchmark, args)
+    benchmark.write_result()